@@ -0,0 +1,547 @@
+import io
+import threading
+import time
+import wave
+from typing import Dict, List, Optional
+
+import pygame
+from mutagen import File
+
+# Kinds of end events, see AudioBackend.poll_end_events
+MUSIC_END = 'music'
+CHANNEL_END = 'channel'
+
+# Mixer settings: sample rate, frames per buffer and output channels.
+# Small buffers answer fast but crackle when a callback comes late on a
+# busy machine, large ones survive load at the cost of delay.
+MIXER_PROFILES = {
+    'low-latency': {'frequency': 48000, 'buffer': 256, 'channels': 2},
+    'balanced': {'frequency': 44100, 'buffer': 512, 'channels': 2},  # The pygame defaults
+    'robust': {'frequency': 44100, 'buffer': 4096, 'channels': 2},
+}
+DEFAULT_PROFILE = 'balanced'
+
+
+class AudioBackend:
+    """The audio output the player and the SRT maker use.
+
+    A music stream plays one track and can queue the next one to follow
+    without a gap. Two channels play decoded sounds, for crossfades. Times
+    are seconds, ticks() is the millisecond clock everything is timed on.
+    """
+
+    # Ticks per real millisecond, timers of the caller are scaled by it
+    speed = 1.0
+    profile = DEFAULT_PROFILE
+    # Seconds from play() until the sound is heard, what the clock runs ahead of the ears
+    latency = 0.0
+
+    def init(self):
+        raise NotImplementedError
+
+    def set_profile(self, name: str):
+        """Use the mixer profile name (see MIXER_PROFILES) from the next init on"""
+        if name not in MIXER_PROFILES:
+            raise ValueError(f"Unknown mixer profile: {name}")
+        self.profile = name
+
+    def calibrate(self, seconds: float = 2.0) -> Dict[str, float]:
+        """Measure the output: latency (seconds), underruns (share of buffers that came too late) and period.
+
+        Plays silence on the music stream, so nothing else may play meanwhile.
+        """
+        raise NotImplementedError
+
+    def quit(self):
+        raise NotImplementedError
+
+    def ticks(self) -> int:
+        raise NotImplementedError
+
+    # Music stream, source is a path or a file object (namehint: its extension)
+
+    def load(self, source, namehint: str = ''):
+        raise NotImplementedError
+
+    def play(self, start: float = 0.0):
+        raise NotImplementedError
+
+    def queue(self, source, namehint: str = ''):
+        """Start source the moment the current track ends, load, play and stop drop it"""
+        raise NotImplementedError
+
+    def stop(self):
+        raise NotImplementedError
+
+    def pause(self):
+        raise NotImplementedError
+
+    def unpause(self):
+        raise NotImplementedError
+
+    def seek(self, seconds: float):
+        raise NotImplementedError
+
+    def busy(self) -> bool:
+        """True while the stream plays, False when paused or stopped"""
+        raise NotImplementedError
+
+    def stream_position(self) -> float:
+        """Seconds since the playing track started, a queued track counts from its own start"""
+        raise NotImplementedError
+
+    def set_volume(self, volume: float):
+        raise NotImplementedError
+
+    def get_volume(self) -> float:
+        raise NotImplementedError
+
+    # Decoded sounds on two channels
+
+    def decode(self, source):
+        """A sound for channel(), with get_length() and set_volume()"""
+        raise NotImplementedError
+
+    def sound_from(self, sound, seconds: float):
+        """A sound with the part of sound after seconds"""
+        raise NotImplementedError
+
+    def sound_size(self, sound) -> int:
+        """Bytes of memory a decoded sound takes"""
+        raise NotImplementedError
+
+    def samples(self, sound):
+        """The samples of a decoded sound as a numpy array (frames, channels), without a copy.
+
+        None if the backend has no samples.
+        """
+        raise NotImplementedError
+
+    def channel(self, index: int):
+        """Channel 0 or 1, with play(sound, fade_ms), fadeout, stop, pause, unpause, get_busy and get_sound"""
+        raise NotImplementedError
+
+    # End events
+
+    def poll_end_events(self) -> List[str]:
+        """MUSIC_END or CHANNEL_END for each track that ended or was stopped since the last call.
+
+        Safe to call from another thread than the one that plays.
+        """
+        raise NotImplementedError
+
+    def clear_end_events(self):
+        raise NotImplementedError
+
+
+class PygameBackend(AudioBackend):
+    """The pygame mixer, end events go through the SDL event queue"""
+
+    def __init__(self, music_end_event=pygame.USEREVENT, channel_end_event=pygame.USEREVENT + 1,
+                 profile=DEFAULT_PROFILE):
+        self.music_end_event = music_end_event
+        self.channel_end_event = channel_end_event
+        self._channels = None
+        self._paused = False
+        self.set_profile(profile)
+
+    def init(self):
+        # The video subsystem has to be up for the mixer to post its events
+        pygame.init()
+        settings = MIXER_PROFILES[self.profile]
+        pygame.mixer.init(frequency=settings['frequency'], size=-16, channels=settings['channels'],
+                          buffer=settings['buffer'])
+        pygame.mixer.music.set_endevent(self.music_end_event)
+        self._channels = None
+
+    def set_profile(self, name):
+        super().set_profile(name)
+        # Until it is measured: the buffer being played when a new one is asked for
+        settings = MIXER_PROFILES[name]
+        self.latency = settings['buffer'] / settings['frequency']
+
+    def calibrate(self, seconds=2.0, starts=4):
+        """Measure the output on the music stream, starting silence a few times.
+
+        The mixer fills a buffer when the output asks for one, while it plays
+        the buffer before. pygame's music position jumps to the mixed total
+        at every callback and runs on the clock in between, so position minus
+        the time since play() is how far the mixer is ahead of the clock (the
+        lead). A track started at play() waits for the next callback and the
+        buffer in front of it: two buffers minus the lead, averaged over the
+        starts. A callback that comes late leaves the output empty and makes
+        the lead drop, a drop of half a buffer or more counts as an underrun.
+        Buffering after the mixer (a sound server, the device) is not seen.
+        """
+        frequency, size, channels = pygame.mixer.get_init()
+        period = MIXER_PROFILES[self.profile]['buffer'] / frequency
+        segment = seconds / starts
+        silence = io.BytesIO()
+        with wave.open(silence, 'wb') as writer:
+            writer.setnchannels(channels)
+            writer.setsampwidth(2)
+            writer.setframerate(frequency)
+            writer.writeframes(bytes(int(frequency * (segment + 1)) * channels * 2))
+        silence = silence.getvalue()
+        pygame.mixer.music.set_endevent()
+        latencies = []
+        drops = 0
+        try:
+            for _ in range(starts):
+                # The mixer closes the file object it gets when the next one is loaded
+                pygame.mixer.music.load(io.BytesIO(silence), 'wav')
+                leads = []
+                start = time.perf_counter()
+                pygame.mixer.music.play()
+                while True:
+                    elapsed = time.perf_counter() - start
+                    if elapsed >= segment:
+                        break
+                    leads.append((elapsed, pygame.mixer.music.get_pos() / 1000.0 - elapsed))
+                    time.sleep(0.0005)
+                pygame.mixer.music.stop()
+                drops += sum(1 for (_, before), (_, after) in zip(leads, leads[1:]) if before - after >= period / 2)
+                # Past the first callbacks, before clock drift adds up
+                early = sorted(lead for elapsed, lead in leads if 2 * period <= elapsed <= 2 * period + 0.2)
+                if early:
+                    latencies.append(max(0.0, 2 * period - early[len(early) // 2]))
+        finally:
+            pygame.mixer.music.unload()
+            pygame.mixer.music.set_endevent(self.music_end_event)
+            self.clear_end_events()
+        return {'latency': sum(latencies) / len(latencies) if latencies else 2 * period,
+                'underruns': drops / max(1.0, seconds / period),
+                'period': period}
+
+    def quit(self):
+        pygame.mixer.quit()
+        self._channels = None
+
+    def ticks(self):
+        return pygame.time.get_ticks()
+
+    def load(self, source, namehint=''):
+        pygame.mixer.music.load(source, namehint)
+        self._paused = False
+
+    def play(self, start=0.0):
+        pygame.mixer.music.play(start=start)
+        self._paused = False
+
+    def queue(self, source, namehint=''):
+        pygame.mixer.music.queue(source, namehint)
+
+    def stop(self):
+        pygame.mixer.music.stop()
+        self._paused = False
+
+    def pause(self):
+        pygame.mixer.music.pause()
+        self._paused = True
+
+    def unpause(self):
+        pygame.mixer.music.unpause()
+        self._paused = False
+
+    def seek(self, seconds):
+        try:
+            pygame.mixer.music.set_pos(seconds)
+        except pygame.error:
+            # Not every format can seek in place, start it again from there
+            paused = self._paused
+            self.play(seconds)
+            if paused:
+                self.pause()
+
+    def busy(self):
+        return pygame.mixer.music.get_busy()
+
+    def stream_position(self):
+        return max(0, pygame.mixer.music.get_pos()) / 1000.0
+
+    def set_volume(self, volume):
+        pygame.mixer.music.set_volume(volume)
+
+    def get_volume(self):
+        return pygame.mixer.music.get_volume()
+
+    def decode(self, source):
+        return pygame.mixer.Sound(source)
+
+    def sound_from(self, sound, seconds):
+        frequency, size, channel_count = pygame.mixer.get_init()
+        frame = abs(size) // 8 * channel_count
+        raw = sound.get_raw()
+        return pygame.mixer.Sound(buffer=raw[min(len(raw), int(seconds * frequency) * frame):])
+
+    def sound_size(self, sound):
+        frequency, size, channel_count = pygame.mixer.get_init()
+        return int(sound.get_length() * frequency) * (abs(size) // 8) * channel_count
+
+    def samples(self, sound):
+        samples = pygame.sndarray.samples(sound)
+        return samples if samples.ndim == 2 else samples[:, None]
+
+    def channel(self, index):
+        if self._channels is None:
+            # Reserved channels are never picked by Sound.play elsewhere
+            pygame.mixer.set_reserved(2)
+            self._channels = [pygame.mixer.Channel(0), pygame.mixer.Channel(1)]
+            for channel in self._channels:
+                channel.set_endevent(self.channel_end_event)
+        return self._channels[index]
+
+    def poll_end_events(self):
+        try:
+            # Without pumping, window events stay for the GUI thread
+            events = pygame.event.get([self.music_end_event, self.channel_end_event], pump=False)
+        except pygame.error:
+            return []
+        return [MUSIC_END if event.type == self.music_end_event else CHANNEL_END for event in events]
+
+    def clear_end_events(self):
+        try:
+            pygame.event.clear([self.music_end_event, self.channel_end_event])
+        except pygame.error:
+            pass
+
+
+def _header_length(source) -> Optional[float]:
+    """Length in seconds from the file header, None if it has none"""
+    if hasattr(source, 'seek'):
+        source.seek(0)
+    try:
+        audio = File(source)
+        return getattr(getattr(audio, 'info', None), 'length', None) or None
+    except Exception:
+        return None
+    finally:
+        if hasattr(source, 'seek'):
+            source.seek(0)
+
+
+class NullSound:
+    """A sound of the null backend: only a length"""
+
+    def __init__(self, length):
+        self.length = length
+        self.volume = 1.0
+
+    def get_length(self):
+        return self.length
+
+    def set_volume(self, volume):
+        self.volume = volume
+
+    def get_volume(self):
+        return self.volume
+
+
+class NullChannel:
+    """A channel of the null backend, its sound ends on the virtual clock"""
+
+    def __init__(self, backend):
+        self._backend = backend
+        self.sound = None
+        self.end = 0  # Tick the sound (or its fade out) ends at
+        self.paused_at = None
+
+    def play(self, sound, fade_ms=0):
+        with self._backend.lock:
+            self._backend.update()
+            if self.sound is not None:
+                self._backend.events.append(CHANNEL_END)
+            self.sound = sound
+            self.end = self._backend.ticks() + int(sound.get_length() * 1000)
+            self.paused_at = None
+
+    def fadeout(self, ms):
+        with self._backend.lock:
+            self._backend.update()
+            if self.sound is not None:
+                self.end = min(self.end, (self.paused_at or self._backend.ticks()) + ms)
+
+    def stop(self):
+        with self._backend.lock:
+            self._backend.update()
+            if self.sound is not None:
+                self.sound = None
+                self._backend.events.append(CHANNEL_END)
+
+    def pause(self):
+        with self._backend.lock:
+            self._backend.update()
+            if self.sound is not None and self.paused_at is None:
+                self.paused_at = self._backend.ticks()
+
+    def unpause(self):
+        with self._backend.lock:
+            if self.paused_at is not None:
+                self.end += self._backend.ticks() - self.paused_at
+                self.paused_at = None
+
+    def get_busy(self):
+        with self._backend.lock:
+            self._backend.update()
+            return self.sound is not None
+
+    def get_sound(self):
+        return self.sound
+
+
+class NullBackend(AudioBackend):
+    """Plays nothing, on a virtual clock that can run faster than real time.
+
+    Lengths come from the file headers. Tracks end, queued tracks follow
+    and fades finish on the virtual clock, with the same end events as the
+    mixer, so playlists, crossfades and end handling can be tested and
+    timed without a sound card. A speed of 50 plays a 5 minute track in 6 seconds.
+    """
+
+    def __init__(self, speed=1.0):
+        self.speed = speed
+        self.lock = threading.RLock()
+        self.events = []
+        self._origin = time.perf_counter()
+        self._volume = 1.0
+        self._length = None  # Length of the loaded track, None if nothing is loaded
+        self._queued = None  # Length of the queued track
+        self._started = None  # Tick the stream position counts from, None when stopped
+        self._paused_at = None
+        self._channels = [NullChannel(self), NullChannel(self)]
+
+    def init(self):
+        pass
+
+    def quit(self):
+        self.stop()
+
+    def calibrate(self, seconds=2.0):
+        # Nothing is played, so nothing is late
+        return {'latency': 0.0, 'underruns': 0.0, 'period': 0.0}
+
+    def ticks(self):
+        return int((time.perf_counter() - self._origin) * 1000 * self.speed)
+
+    def update(self):
+        """Play on up to now: end tracks, start the queued one, end channel sounds"""
+        with self.lock:
+            now = self.ticks()
+            while self._started is not None and self._paused_at is None:
+                end = self._started + int(self._length * 1000)
+                if now < end:
+                    break
+                self.events.append(MUSIC_END)
+                if self._queued is None:
+                    self._started = None
+                    break
+                # The queued track starts exactly where the previous one ended
+                self._length, self._queued, self._started = self._queued, None, end
+            for channel in self._channels:
+                if channel.sound is not None and channel.paused_at is None and now >= channel.end:
+                    channel.sound = None
+                    self.events.append(CHANNEL_END)
+
+    def _source_length(self, source):
+        length = _header_length(source)
+        if length is None:
+            raise pygame.error("Cannot read the length of this file")
+        return length
+
+    def load(self, source, namehint=''):
+        length = self._source_length(source)
+        with self.lock:
+            self.update()
+            self._length, self._queued, self._started, self._paused_at = length, None, None, None
+
+    def play(self, start=0.0):
+        with self.lock:
+            if self._length is None:
+                raise pygame.error("music not loaded")
+            self._started = self.ticks() - int(start * 1000)
+            self._paused_at = None
+
+    def queue(self, source, namehint=''):
+        length = self._source_length(source)
+        with self.lock:
+            self._queued = length
+
+    def stop(self):
+        with self.lock:
+            self.update()
+            if self._started is not None:
+                self.events.append(MUSIC_END)
+            self._started, self._queued, self._paused_at = None, None, None
+
+    def pause(self):
+        with self.lock:
+            self.update()
+            if self._started is not None and self._paused_at is None:
+                self._paused_at = self.ticks()
+
+    def unpause(self):
+        with self.lock:
+            if self._paused_at is not None:
+                self._started += self.ticks() - self._paused_at
+                self._paused_at = None
+
+    def seek(self, seconds):
+        with self.lock:
+            if self._started is not None:
+                now = self._paused_at if self._paused_at is not None else self.ticks()
+                self._started = now - int(seconds * 1000)
+
+    def busy(self):
+        with self.lock:
+            self.update()
+            return self._started is not None and self._paused_at is None
+
+    def stream_position(self):
+        with self.lock:
+            self.update()
+            if self._started is None:
+                return 0.0
+            now = self._paused_at if self._paused_at is not None else self.ticks()
+            return (now - self._started) / 1000.0
+
+    def set_volume(self, volume):
+        self._volume = volume
+
+    def get_volume(self):
+        return self._volume
+
+    def decode(self, source):
+        return NullSound(self._source_length(source))
+
+    def sound_from(self, sound, seconds):
+        return NullSound(max(0.0, sound.get_length() - seconds))
+
+    def sound_size(self, sound):
+        return 0
+
+    def samples(self, sound):
+        return None
+
+    def channel(self, index):
+        return self._channels[index]
+
+    def poll_end_events(self):
+        with self.lock:
+            self.update()
+            events, self.events = self.events, []
+        return events
+
+    def clear_end_events(self):
+        with self.lock:
+            self.update()
+            self.events = []
+
+
+def create_backend(name: str = 'pygame') -> AudioBackend:
+    """Backend by name: 'pygame', or 'null' with an optional speed such as 'null:50'"""
+    kind, _, speed = name.partition(':')
+    if kind == 'null':
+        return NullBackend(float(speed) if speed else 1.0)
+    if kind == 'pygame':
+        return PygameBackend()
+    raise ValueError(f"Unknown audio backend: {name}")
@@ -0,0 +1,666 @@
+import heapq
+import os
+import pickle
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from library_query import is_relative, is_structured, parse_query
+
+# Per track columns for field queries. Categorical columns hold codes into
+# LibraryIndex.categories (-1 when unknown), numeric columns are NaN when unknown.
+CATEGORY_COLUMNS = ('ext', 'dir', 'artist', 'album')
+NUMBER_COLUMNS = {'duration': np.float32, 'mtime': np.float64, 'added': np.float64}
+# ReplayGain per track, see set_loudness: gain in dB, peak NaN until analysed
+LOUDNESS_COLUMNS = {'gain': np.float32, 'peak': np.float32}
+
+
+class SearchCancelled(Exception):
+    """Raised by LibraryIndex.search when its cancelled callback returns True"""
+
+
+def _trigram_keys(texts: List[str], first_id: int) -> np.ndarray:
+    """Sorted unique (trigram << 32 | id) keys for a run of texts with consecutive ids"""
+    blobs = [text.encode('utf-8') for text in texts]
+    if not blobs:
+        return np.empty(0, dtype=np.uint64)
+    lengths = np.fromiter(map(len, blobs), dtype=np.int64, count=len(blobs))
+    raw = np.frombuffer(b'\n'.join(blobs) + b'\n', dtype=np.uint8)
+    ids = np.repeat(np.arange(first_id, first_id + len(blobs), dtype=np.uint64), lengths + 1)
+    # Trigrams containing the separator belong to no text
+    valid = (raw[:-2] != 10) & (raw[1:-1] != 10) & (raw[2:] != 10)
+    chars = raw.astype(np.uint32)
+    codes = (chars[:-2] << 16) | (chars[1:-1] << 8) | chars[2:]
+    keys = ((codes.astype(np.uint64) << np.uint64(32)) | ids[:-2])[valid]
+    return _unique_sorted(keys)
+
+
+def _unique_sorted(keys: np.ndarray) -> np.ndarray:
+    keys.sort()
+    if len(keys) > 1:
+        keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+    return keys
+
+
+def _split_path(path: str):
+    """Lowercased folder (with '/' separators and a trailing '/') and extension of a path"""
+    path = path.lower().replace('\\', '/')
+    slash = path.rfind('/')
+    name = path[slash + 1:]
+    dot = name.rfind('.')
+    return path[:slash + 1], name[dot + 1:] if dot > 0 else ''
+
+
+def _term_codes(term: str) -> List[int]:
+    data = term.encode('utf-8')
+    return sorted({(data[i] << 16) | (data[i + 1] << 8) | data[i + 2] for i in range(len(data) - 2)})
+
+
+def _substring_distances(term: bytes, names: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Edit distance between term and its best matching substring of each row of names.
+
+    names is a zero padded (rows, width) uint8 matrix, lengths the real
+    length of each row. This is Myers' bit-parallel algorithm: a column
+    of the edit distance matrix is a 64 bit vector, and all rows advance
+    together, one column at a time. term must be at most 64 bytes.
+    """
+    size = len(term)
+    one = np.uint64(1)
+    peq = np.zeros(256, dtype=np.uint64)  # byte -> bits of the term positions holding it
+    for position, char in enumerate(term):
+        peq[char] |= one << np.uint64(position)
+    last = np.uint64(size - 1)
+    rows = len(names)
+    positive = np.full(rows, np.iinfo(np.uint64).max, dtype=np.uint64)
+    negative = np.zeros(rows, dtype=np.uint64)
+    score = np.full(rows, size, dtype=np.int64)
+    best = score.copy()
+    for column in range(names.shape[1]):
+        eq = peq[names[:, column]]
+        xv = eq | negative
+        xh = (((eq & positive) + positive) ^ positive) | eq
+        horizontal_positive = negative | ~(xh | positive)
+        horizontal_negative = positive & xh
+        score += ((horizontal_positive >> last) & one).astype(np.int64)
+        score -= ((horizontal_negative >> last) & one).astype(np.int64)
+        # A substring may start anywhere, so nothing is shifted in at the top
+        horizontal_positive <<= one
+        horizontal_negative <<= one
+        positive = horizontal_negative | ~(xv | horizontal_positive)
+        negative = horizontal_positive & xv
+        np.minimum(best, np.where(column < lengths, score, size), out=best)
+    return best
+
+
+def _contains(sorted_ids: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Boolean mask of the values that occur in sorted_ids"""
+    if not len(sorted_ids):
+        return np.zeros(len(values), dtype=bool)
+    positions = np.searchsorted(sorted_ids, values)
+    positions[positions == len(sorted_ids)] = 0
+    return sorted_ids[positions] == values
+
+
+class LibraryIndex:
+    """Trigram index over the lowercased paths and tags of every known track.
+
+    Tracks get a fixed id in the order they are added. For every trigram
+    the index keeps the sorted ids of the tracks containing it, so a
+    substring search only has to look at the tracks that contain all of
+    the trigrams of the term. Scans add tracks incrementally, small
+    updates such as tags go into a delta that is merged in batches.
+
+    Next to the text, every track has a row in a set of numpy columns
+    (extension, folder, artist, album, duration, mtime). Field queries
+    such as artist:beatles duration:>300 are evaluated over these arrays
+    for all candidates at once, see library_query.
+
+    All public methods take a lock, so searches can run on a background
+    thread while scans and metadata reads update the index.
+    """
+
+    version = 3
+    fuzzy_candidates = 5000  # Tracks scored per fuzzy search, the ones sharing most trigrams with the term
+    fuzzy_width = 96  # Bytes of tags and path end compared in a fuzzy search
+    fuzzy_chunk = 1000  # Tracks scored at once, between two cancellation checks
+    delta_limit = 100000  # Posting entries kept outside the main arrays before a merge, at least
+    check_interval = 20000  # Candidates verified between two cancellation checks
+
+    def __init__(self):
+        self.paths: List[Optional[str]] = []  # id -> path, None once removed
+        self.ids: Dict[str, int] = {}  # path -> id
+        self.texts: List[Optional[str]] = []  # id -> lowercased path and tags
+        self.tags: Dict[int, str] = {}  # id -> tag text
+        self._codes = np.empty(0, dtype=np.uint32)  # Trigrams with a posting list, sorted
+        self._starts = np.zeros(1, dtype=np.int64)  # Posting list of _codes[i] is _ids[_starts[i]:_starts[i + 1]]
+        self._ids = np.empty(0, dtype=np.uint32)
+        self._delta: Dict[int, List[int]] = {}  # Trigram -> ids not in the main arrays yet
+        self._delta_size = 0
+        self.removed = 0
+        self.changed = False  # Something to save
+        self.generation = 0  # Counts changes to tracks, see changed_since
+        self.columns: Dict[str, np.ndarray] = self._new_columns(0)  # name -> value per id
+        self.categories: Dict[str, List[str]] = {name: [] for name in CATEGORY_COLUMNS}  # code -> value
+        self._category_codes: Dict[str, Dict[str, int]] = {name: {} for name in CATEGORY_COLUMNS}
+        self._category_tables: Dict[tuple, np.ndarray] = {}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _new_columns(size: int) -> Dict[str, np.ndarray]:
+        columns = {name: np.full(size, -1, dtype=np.int32) for name in CATEGORY_COLUMNS}
+        for name, dtype in {**NUMBER_COLUMNS, **LOUDNESS_COLUMNS}.items():
+            columns[name] = np.full(size, np.nan, dtype=dtype)
+        columns['read'] = np.zeros(size, dtype=bool)  # Tags and duration were read from the file
+        columns['generation'] = np.zeros(size, dtype=np.int64)  # Index generation of the last change
+        return columns
+
+    def _reserve(self, size: int):
+        """Make room in the columns for ids below size, growing in large steps"""
+        capacity = len(self.columns['read'])
+        if size <= capacity:
+            return
+        columns = self._new_columns(max(size, capacity * 2, 1024))
+        for name, values in self.columns.items():
+            columns[name][:capacity] = values
+        self.columns = columns
+
+    def category_table(self, name: str, key: tuple, test: Callable[[str], bool]) -> np.ndarray:
+        """Lookup table code -> test(value) for a categorical column, with False for code -1 at the end.
+
+        Tables are kept per key. Categories are only ever appended, so a
+        cached table is extended with the values added since.
+        """
+        categories = self.categories[name]
+        table = self._category_tables.get((name, key))
+        done = 0 if table is None else len(table) - 1
+        if table is None or done < len(categories):
+            new = np.fromiter((test(value) for value in categories[done:]), dtype=bool,
+                              count=len(categories) - done)
+            table = np.concatenate((table[:-1] if table is not None else new[:0], new, [False]))
+            if len(self._category_tables) >= 64:
+                self._category_tables.clear()
+            self._category_tables[(name, key)] = table
+        return table
+
+    def _category_code(self, name: str, value: str) -> int:
+        codes = self._category_codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self.categories[name])
+            self.categories[name].append(value)
+        return code
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self.ids
+
+    def add_paths(self, paths: Iterable[str]) -> int:
+        """Add new tracks, paths that are already known are skipped. Returns the number added"""
+        with self._lock:
+            return self._add_paths(paths)
+
+    def _add_paths(self, paths: Iterable[str]) -> int:
+        new_paths = []
+        seen = set()
+        for path in paths:
+            if path not in self.ids and path not in seen:
+                seen.add(path)
+                new_paths.append(path)
+        if not new_paths:
+            return 0
+
+        first_id = len(self.paths)
+        texts = [path.lower() for path in new_paths]
+        for offset, path in enumerate(new_paths):
+            self.ids[path] = first_id + offset
+        self.paths.extend(new_paths)
+        self.texts.extend(texts)
+        self.changed = True
+
+        self._reserve(len(self.paths))
+        folders = self.columns['dir']
+        extensions = self.columns['ext']
+        for offset, path in enumerate(new_paths):
+            folder, extension = _split_path(path)
+            folders[first_id + offset] = self._category_code('dir', folder)
+            extensions[first_id + offset] = self._category_code('ext', extension)
+        self.columns['added'][first_id:len(self.paths)] = time.time()
+        self.generation += 1
+        self.columns['generation'][first_id:len(self.paths)] = self.generation
+
+        if len(new_paths) < 1000:
+            for offset, text in enumerate(texts):
+                self._add_to_delta(first_id + offset, text)
+        else:
+            self._merge(_trigram_keys(texts, first_id))
+        return len(new_paths)
+
+    def remove_paths(self, paths: Iterable[str]):
+        """Forget tracks, their ids stay reserved so the posting lists stay valid"""
+        with self._lock:
+            for path in paths:
+                track_id = self.ids.pop(path, None)
+                if track_id is not None:
+                    self.paths[track_id] = None
+                    self.texts[track_id] = None
+                    self.tags.pop(track_id, None)
+                    self.removed += 1
+                    self.changed = True
+                    self.generation += 1
+                    self.columns['generation'][track_id] = self.generation
+
+    def set_metadata(self, path: str, tags: Dict[str, str], duration: Optional[float] = None,
+                     mtime: Optional[float] = None):
+        """Store what was read from the file: the tags (title, artist, album), duration and mtime"""
+        with self._lock:
+            track_id = self.ids.get(path)
+            if track_id is None:
+                return
+            for name in ('artist', 'album'):
+                value = tags.get(name)
+                self.columns[name][track_id] = self._category_code(name, value.lower()) if value else -1
+            self.columns['duration'][track_id] = np.nan if duration is None else duration
+            previous_mtime = self.columns['mtime'][track_id]
+            if mtime is not None and not np.isnan(previous_mtime) and previous_mtime != mtime:
+                # The file changed, measure it again
+                self.columns['gain'][track_id] = np.nan
+                self.columns['peak'][track_id] = np.nan
+            self.columns['mtime'][track_id] = np.nan if mtime is None else mtime
+            self.columns['read'][track_id] = True
+            self.changed = True
+            self.generation += 1
+            self.columns['generation'][track_id] = self.generation
+            tag_text = " ".join(value for value in tags.values() if value)
+            if tag_text:
+                self._set_tags(track_id, tag_text)
+
+    def set_loudness(self, path: str, gain: Optional[float], peak: Optional[float]):
+        """Store the ReplayGain of a track: dB to the reference loudness and sample peak.
+
+        None for both marks a track that could not be decoded, it is not tried again.
+        Loudness is no query field, so the generation stays.
+        """
+        with self._lock:
+            track_id = self.ids.get(path)
+            if track_id is None:
+                return
+            self.columns['gain'][track_id] = np.nan if gain is None else gain
+            self.columns['peak'][track_id] = 0.0 if peak is None else peak
+            self.changed = True
+
+    def loudness(self, path: str) -> Optional[tuple]:
+        """(gain in dB, peak) of an analysed track, None if it is not analysed or could not be"""
+        with self._lock:
+            track_id = self.ids.get(path)
+            if track_id is None or np.isnan(self.columns['gain'][track_id]):
+                return None
+            return float(self.columns['gain'][track_id]), float(self.columns['peak'][track_id])
+
+    def needs_loudness(self, path: str) -> bool:
+        """True for a known track that was not analysed yet"""
+        with self._lock:
+            track_id = self.ids.get(path)
+            return track_id is not None and bool(np.isnan(self.columns['peak'][track_id]))
+
+    def unanalyzed(self, start: int = 0, limit: int = 50) -> List[tuple]:
+        """(id, path) of up to limit tracks from id start on without a loudness analysis"""
+        with self._lock:
+            found = []
+            # In windows, so a caller walking the index in batches does not rescan the rest each time
+            while start < len(self.paths) and len(found) < limit:
+                end = min(len(self.paths), start + 4096)
+                for track_id in (np.flatnonzero(np.isnan(self.columns['peak'][start:end])) + start).tolist():
+                    if self.paths[track_id] is not None:
+                        found.append((track_id, self.paths[track_id]))
+                        if len(found) == limit:
+                            break
+                start = end
+            return found
+
+    def changed_since(self, generation: int) -> np.ndarray:
+        """Sorted ids of the tracks added, removed or given new metadata after generation"""
+        with self._lock:
+            return np.flatnonzero(self.columns['generation'][:len(self.paths)] > generation).astype(np.uint32)
+
+    def live(self, ids: np.ndarray) -> np.ndarray:
+        """The ids that still belong to a track"""
+        with self._lock:
+            if not self.removed:
+                return ids
+            paths = self.paths
+            return ids[np.fromiter((paths[i] is not None for i in ids.tolist()), dtype=bool, count=len(ids))]
+
+    def unread(self, start: int = 0, limit: int = 200) -> List[tuple]:
+        """(id, path) of up to limit tracks from id start on whose file was not read yet"""
+        with self._lock:
+            read = self.columns['read'][start:len(self.paths)]
+            found = []
+            for track_id in (np.flatnonzero(~read) + start).tolist():
+                if self.paths[track_id] is not None:
+                    found.append((track_id, self.paths[track_id]))
+                    if len(found) == limit:
+                        break
+            return found
+
+    def _set_tags(self, track_id: int, tags: str):
+        """Make the tag text of a track searchable"""
+        tags = tags.lower()
+        path = self.paths[track_id]
+        if self.tags.get(track_id) != tags:
+            self.tags[track_id] = tags
+            self.texts[track_id] = f"{path.lower()}\n{tags}"
+            self.changed = True
+            # Trigrams of old tags stay in the postings, results are checked against the text
+            self._add_to_delta(track_id, tags)
+
+    def _add_to_delta(self, track_id: int, text: str):
+        for code in _term_codes(text.replace('\n', ' ')):
+            self._delta.setdefault(code, []).append(track_id)
+            self._delta_size += 1
+        # A merge rewrites the main arrays, so the delta may grow along with them
+        if self._delta_size > max(self.delta_limit, len(self._ids) // 4):
+            self._flush_delta()
+
+    def _flush_delta(self):
+        if not self._delta:
+            return
+        codes = np.fromiter(self._delta.keys(), dtype=np.uint64, count=len(self._delta))
+        counts = np.fromiter(map(len, self._delta.values()), dtype=np.int64, count=len(self._delta))
+        ids = np.fromiter((track_id for ids in self._delta.values() for track_id in ids),
+                          dtype=np.uint64, count=int(counts.sum()))
+        self._delta = {}
+        self._delta_size = 0
+        self._merge(_unique_sorted((np.repeat(codes, counts) << np.uint64(32)) | ids))
+
+    def _merge(self, keys: np.ndarray):
+        """Merge sorted (trigram << 32 | id) keys into the main posting arrays"""
+        if len(self._ids):
+            counts = np.diff(self._starts)
+            current = (np.repeat(self._codes.astype(np.uint64), counts) << np.uint64(32)) | self._ids
+            keys = _unique_sorted(np.concatenate((current, keys)))
+        codes = (keys >> np.uint64(32)).astype(np.uint32)
+        self._ids = (keys & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+        starts = np.flatnonzero(np.concatenate(([True], codes[1:] != codes[:-1]))) if len(codes) else \
+            np.empty(0, dtype=np.int64)
+        self._codes = codes[starts]
+        self._starts = np.append(starts, len(codes)).astype(np.int64)
+
+    def _posting(self, code: int) -> np.ndarray:
+        """Sorted ids of the tracks whose text contains the trigram"""
+        i = int(np.searchsorted(self._codes, code))
+        if i < len(self._codes) and self._codes[i] == code:
+            ids = self._ids[self._starts[i]:self._starts[i + 1]]
+        else:
+            ids = np.empty(0, dtype=np.uint32)
+        extra = self._delta.get(code)
+        if extra:
+            # Insert the few delta ids instead of sorting the whole list again
+            extra = np.unique(np.array(extra, dtype=np.uint32))
+            extra = extra[~_contains(ids, extra)]
+            ids = np.insert(ids, np.searchsorted(ids, extra), extra)
+        return ids
+
+    def _match(self, term: str, candidates: Optional[np.ndarray],
+               cancelled: Optional[Callable[[], bool]] = None) -> np.ndarray:
+        """Sorted ids of the tracks containing term, optionally limited to candidates"""
+        codes = _term_codes(term)
+        if codes:
+            # Start from the shortest list, the others only need membership tests
+            id_lists = [self._posting(code) for code in codes]
+            if candidates is not None:
+                id_lists.append(candidates)
+            id_lists.sort(key=len)
+            ids = id_lists[0]
+            for other in id_lists[1:]:
+                if not len(ids):
+                    break
+                if cancelled is not None and cancelled():
+                    raise SearchCancelled()
+                ids = ids[_contains(other, ids)]
+            # A single trigram is an exact match, longer terms are checked against the text
+            if len(codes) == 1 and len(term.encode('utf-8')) == 3 and not self.removed and not self.tags:
+                return ids
+        else:
+            # Too short for trigrams, check every candidate
+            ids = candidates if candidates is not None else np.arange(len(self.texts), dtype=np.uint32)
+        texts = self.texts
+        keep = np.empty(len(ids), dtype=bool)
+        for start in range(0, len(ids), self.check_interval):
+            if cancelled is not None and cancelled():
+                raise SearchCancelled()
+            chunk = ids[start:start + self.check_interval].tolist()
+            keep[start:start + len(chunk)] = [texts[i] is not None and term in texts[i] for i in chunk]
+        return ids[keep]
+
+    def _live_ids(self) -> np.ndarray:
+        if not self.removed:
+            return np.arange(len(self.paths), dtype=np.uint32)
+        return np.fromiter((track_id for track_id, path in enumerate(self.paths) if path is not None),
+                           dtype=np.uint32, count=len(self.ids))
+
+    def match(self, term: str, candidates: Optional[np.ndarray] = None,
+              cancelled: Optional[Callable[[], bool]] = None) -> np.ndarray:
+        """Sorted ids of the tracks containing the lowercased term"""
+        with self._lock:
+            return self._match(term, candidates, cancelled)
+
+    def search(self, positive: str = '', negative: str = '',
+               candidates: Optional[np.ndarray] = None,
+               cancelled: Optional[Callable[[], bool]] = None) -> np.ndarray:
+        """Sorted ids of the tracks matching positive and not containing negative.
+
+        positive is a substring, or a query (see library_query.parse_query)
+        when it uses query syntax. candidates limits the search to a sorted
+        id array, for example the result of an earlier filter. cancelled is
+        polled during long searches, SearchCancelled is raised once it
+        returns True. Invalid queries raise QueryError.
+        """
+        positive = positive.strip().lower()
+        negative = negative.strip().lower()
+        query = parse_query(positive) if is_structured(positive) else None
+        with self._lock:
+            if query is not None:
+                if candidates is None:
+                    candidates = self._live_ids()
+                ids = query.evaluate(self, candidates, cancelled)
+            elif positive:
+                ids = self._match(positive, candidates, cancelled)
+            elif candidates is not None:
+                ids = candidates
+            else:
+                ids = self._live_ids()
+            if negative and len(ids):
+                ids = ids[~_contains(self._match(negative, ids, cancelled), ids)]
+            return ids
+
+    def fuzzy_search(self, term: str, candidates: Optional[np.ndarray] = None, limit: int = 200,
+                     cancelled: Optional[Callable[[], bool]] = None) -> np.ndarray:
+        """Ids of the limit tracks whose name or tags match term best, best first.
+
+        Tracks sharing trigrams or bigrams with the term are the candidates,
+        the ones sharing the most are scored by the edit distance between
+        the term and the closest part of their tags and path end. About a
+        third of the characters may differ, so typos still match.
+        """
+        term = term.strip().lower()
+        data = term.encode('utf-8')[:64]
+        codes = _term_codes(term)
+        with self._lock:
+            if not codes:
+                # Too short to be fuzzy
+                return self._match(term, candidates, cancelled)[:limit]
+
+            # Count shared trigrams (twice) and bigrams per track, the bigrams
+            # keep short terms with a typo in the middle findable
+            pairs = sorted({(data[i] << 8) | data[i + 1] for i in range(len(data) - 1)})
+            postings = [self._posting(code) for code in codes] * 2 + [self._pair_posting(pair) for pair in pairs]
+            counts = np.bincount(np.concatenate(postings), minlength=len(self.paths))
+            if candidates is None:
+                candidates = self._live_ids()
+            counts = counts[candidates]
+            max_distance = max(1, (len(data) + 1) // 3)
+            keep = counts > 0
+            ids, counts = candidates[keep], counts[keep]
+            if len(ids) > self.fuzzy_candidates:
+                best = np.argpartition(-counts, self.fuzzy_candidates)[:self.fuzzy_candidates]
+                ids, counts = ids[best], counts[best]
+
+            heap = []  # (score, shared trigrams, -name length, id), the worst kept result on top
+            texts = self.texts
+            for start in range(0, len(ids), self.fuzzy_chunk):
+                if cancelled is not None and cancelled():
+                    raise SearchCancelled()
+                chunk = ids[start:start + self.fuzzy_chunk].tolist()
+                names = [self._fuzzy_name(texts[i]) for i in chunk]
+                lengths = np.fromiter(map(len, names), dtype=np.int64, count=len(names))
+                matrix = np.frombuffer(b''.join(name.ljust(self.fuzzy_width, b'\0') for name in names),
+                                       dtype=np.uint8).reshape(len(names), self.fuzzy_width)
+                distances = _substring_distances(data, matrix, lengths)
+                for offset in np.flatnonzero(distances <= max_distance).tolist():
+                    entry = (-int(distances[offset]), int(counts[start + offset]), -int(lengths[offset]), chunk[offset])
+                    if len(heap) < limit:
+                        heapq.heappush(heap, entry)
+                    elif entry > heap[0]:
+                        heapq.heapreplace(heap, entry)
+            return np.array([entry[3] for entry in sorted(heap, reverse=True)], dtype=np.uint32)
+
+    def _pair_posting(self, pair: int) -> np.ndarray:
+        """Ids of the tracks containing the bigram followed by any byte, ids may repeat"""
+        first, last = np.searchsorted(self._codes, [pair << 8, (pair + 1) << 8])
+        ids = self._ids[self._starts[first]:self._starts[last]]
+        extra = [track_id for code in range(pair << 8, (pair + 1) << 8) for track_id in self._delta.get(code, ())]
+        if extra:
+            ids = np.concatenate((ids, np.array(extra, dtype=np.uint32)))
+        return ids
+
+    def _fuzzy_name(self, text: Optional[str]) -> bytes:
+        """Tags and the end of the path (file name and parent folders), the part a fuzzy search compares"""
+        if text is None:
+            return b''
+        path, _, tags = text.partition('\n')
+        data = f"{tags} {path}".encode('utf-8') if tags else path.encode('utf-8')
+        if len(data) <= self.fuzzy_width:
+            return data
+        tags = tags.encode('utf-8')[:self.fuzzy_width // 2]
+        return tags + path.encode('utf-8')[len(tags) - self.fuzzy_width:]
+
+    def ids_of(self, paths: Iterable[str]) -> np.ndarray:
+        """Sorted ids of the known paths"""
+        with self._lock:
+            ids = self.ids
+            found = np.fromiter((ids[path] for path in paths if path in ids), dtype=np.uint32)
+        found.sort()
+        return found
+
+    def paths_of(self, ids: np.ndarray) -> List[str]:
+        with self._lock:
+            paths = self.paths
+            return [paths[i] for i in ids.tolist()]
+
+    def save(self, file_path: str):
+        """Write the index to disk, pending updates included"""
+        with self._lock:
+            self._flush_delta()
+            state = {
+                'version': self.version,
+                'paths': self.paths,
+                'tags': self.tags,
+                'codes': self._codes,
+                'starts': self._starts,
+                'ids': self._ids,
+                'columns': {name: values[:len(self.paths)] for name, values in self.columns.items()},
+                'categories': self.categories,
+                'generation': self.generation,
+            }
+            tmp_path = file_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, file_path)
+            self.changed = False
+
+    @classmethod
+    def load(cls, file_path: str) -> 'LibraryIndex':
+        """Read an index written by save, or start an empty one"""
+        index = cls()
+        if not os.path.exists(file_path):
+            return index
+        try:
+            with open(file_path, 'rb') as f:
+                state = pickle.load(f)
+            if state.get('version') != cls.version:
+                return index
+            index.paths = state['paths']
+            index.tags = state['tags']
+            index.texts = [path.lower() if path is not None else None for path in index.paths]
+            for track_id, tags in index.tags.items():
+                index.texts[track_id] = f"{index.texts[track_id]}\n{tags}"
+            index.ids = {path: track_id for track_id, path in enumerate(index.paths) if path is not None}
+            index.removed = len(index.paths) - len(index.ids)
+            index._codes = state['codes']
+            index._starts = state['starts']
+            index._ids = state['ids']
+            index.columns = state['columns']
+            # Columns added since the index was saved start out unknown
+            for name, values in cls._new_columns(len(index.paths)).items():
+                index.columns.setdefault(name, values)
+            index.categories = state['categories']
+            index.generation = state['generation']
+            index._category_codes = {name: {value: code for code, value in enumerate(values)}
+                                     for name, values in index.categories.items()}
+        except Exception as e:
+            print(f"Error loading library index: {str(e)}")
+            index = cls()
+        return index
+
+
+class SmartPlaylist:
+    """A playlist stored as filter steps, its tracks are looked up in the library index.
+
+    Each step is a (positive, negative) pair as in LibraryIndex.search,
+    applied to the result of the step before. The result is kept with
+    the index generation it belongs to, later evaluations only look at
+    the tracks that changed since. Queries with a relative time such as
+    added:>30d move with the clock and are evaluated in full.
+    """
+
+    def __init__(self, steps: List[tuple]):
+        self.steps = [tuple(step) for step in steps]
+        self.ids: Optional[np.ndarray] = None
+        self.generation = -1
+        self.relative_time = any(is_relative(positive) for positive, _ in self.steps)
+
+    def _run_steps(self, index: LibraryIndex, candidates: Optional[np.ndarray],
+                   cancelled: Optional[Callable[[], bool]]) -> np.ndarray:
+        ids = candidates
+        for positive, negative in self.steps:
+            ids = index.search(positive, negative, ids, cancelled)
+        return ids
+
+    def evaluate(self, index: LibraryIndex, cancelled: Optional[Callable[[], bool]] = None) -> np.ndarray:
+        """Sorted ids of the matching tracks, brought up to date with the index"""
+        with index._lock:
+            generation = index.generation
+            if self.ids is None or self.relative_time:
+                self.ids = self._run_steps(index, None, cancelled)
+            elif generation != self.generation:
+                # Changed tracks leave the result and come back if they still match
+                changed = index.changed_since(self.generation)
+                kept = self.ids[~_contains(changed, self.ids)]
+                matched = self._run_steps(index, index.live(changed), cancelled)
+                self.ids = np.union1d(kept, matched).astype(np.uint32)
+            self.generation = generation
+            return self.ids
+
+    def to_json(self) -> dict:
+        return {'type': 'smart', 'steps': [list(step) for step in self.steps]}
+
+    @classmethod
+    def from_json(cls, data) -> Optional['SmartPlaylist']:
+        """The smart playlist stored in a playlist file, None for a plain list of paths"""
+        if isinstance(data, dict) and data.get('type') == 'smart':
+            return cls(data.get('steps', []))
+        return None
@@ -0,0 +1,271 @@
+import re
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+class QueryError(ValueError):
+    """Raised for a filter query that cannot be parsed"""
+
+
+# Fields with a column in the library index, see LibraryIndex.columns
+TEXT_FIELDS = ('artist', 'album', 'dir')
+EXACT_FIELDS = ('ext',)
+NUMBER_FIELDS = ('duration', 'mtime', 'added')
+FIELDS = TEXT_FIELDS + EXACT_FIELDS + NUMBER_FIELDS
+
+_TOKEN = re.compile(r'"[^"]*"|\(|\)|[^\s()"]+(?:"[^"]*")?')
+_COMPARISON = re.compile(r'^(>=|<=|>|<|=)?(.*)$')
+_AGE = re.compile(r'^(\d+(?:\.\d+)?)([hdwy])$')
+_AGE_SECONDS = {'h': 3600, 'd': 86400, 'w': 7 * 86400, 'y': 365 * 86400}
+
+
+class Node:
+    """A predicate over tracks, evaluated for a whole array of track ids at once"""
+
+    # And evaluates cheap, narrowing nodes first: index lookups, columns, then the rest
+    cost = 2
+
+    def evaluate(self, index, ids: np.ndarray, cancelled=None) -> np.ndarray:
+        """The ids (sorted) of the tracks in ids that match"""
+        raise NotImplementedError
+
+
+class TextTerm(Node):
+    """Substring of the path or tags, looked up in the trigram index"""
+    cost = 0
+
+    def __init__(self, term: str):
+        self.term = term
+
+    def evaluate(self, index, ids, cancelled=None):
+        return index.match(self.term, ids, cancelled)
+
+
+class CategoryTerm(Node):
+    """Substring (or exact value) of a categorical column such as artist or ext.
+
+    The test runs once per distinct value, the tracks are then selected
+    with a lookup table indexed by their value codes.
+    """
+    cost = 1
+
+    def __init__(self, field: str, values: List[str], exact: bool):
+        self.field = field
+        self.values = values
+        self.exact = exact
+
+    def test(self, category: str) -> bool:
+        if self.exact:
+            return category in self.values
+        return any(value in category for value in self.values)
+
+    def evaluate(self, index, ids, cancelled=None):
+        codes = index.columns[self.field][ids]
+        if len(ids) < len(index.categories[self.field]):
+            # Fewer tracks than values, only test the values these tracks have
+            present, positions = np.unique(codes, return_inverse=True)
+            categories = index.categories[self.field]
+            table = np.array([code >= 0 and self.test(categories[code]) for code in present.tolist()],
+                             dtype=bool)
+            return ids[table[positions.reshape(-1)]] if len(present) else ids[:0]
+        table = index.category_table(self.field, (tuple(self.values), self.exact), self.test)
+        # Code -1 (unknown) picks the False at the end
+        return ids[table[codes]]
+
+
+class NumberTerm(Node):
+    """Comparison or range on a numeric column, unknown values never match"""
+    cost = 1
+
+    def __init__(self, field: str, low: float, high: float):
+        self.field = field
+        self.low = low
+        self.high = high
+
+    def evaluate(self, index, ids, cancelled=None):
+        values = index.columns[self.field][ids]
+        return ids[(values >= self.low) & (values <= self.high)]
+
+
+class And(Node):
+    def __init__(self, children: List[Node]):
+        self.children = sorted(children, key=lambda child: child.cost)
+        self.cost = self.children[0].cost
+
+    def evaluate(self, index, ids, cancelled=None):
+        for child in self.children:
+            if not len(ids):
+                break
+            ids = child.evaluate(index, ids, cancelled)
+        return ids
+
+
+class Or(Node):
+    def __init__(self, children: List[Node]):
+        self.children = children
+
+    def evaluate(self, index, ids, cancelled=None):
+        matched = [child.evaluate(index, ids, cancelled) for child in self.children]
+        return np.unique(np.concatenate(matched)).astype(ids.dtype)
+
+
+class Not(Node):
+    def __init__(self, child: Node):
+        self.child = child
+
+    def evaluate(self, index, ids, cancelled=None):
+        excluded = self.child.evaluate(index, ids, cancelled)
+        return ids[~np.isin(ids, excluded, assume_unique=True)]
+
+
+def is_structured(text: str) -> bool:
+    """True if text uses query syntax, plain text stays a single substring like before"""
+    for token in _TOKEN.findall(text):
+        if token in ('(', ')', '|') or token.startswith(('-', '"')):
+            return True
+        field = token.split(':', 1)[0].lower()
+        if ':' in token and field in FIELDS:
+            return True
+    return False
+
+
+def is_relative(text: str) -> bool:
+    """True if text is a query with a time relative to now, such as added:>30d"""
+    if not is_structured(text):
+        return False
+    parser = _Parser(_TOKEN.findall(text), time.time())
+    parser.parse_or()
+    return parser.relative_time
+
+
+def parse_query(text: str, now: Optional[float] = None) -> Node:
+    """Compile a filter query into a predicate tree.
+
+    Terms are combined with AND, "or" (or "|") between terms gives OR,
+    parentheses group and a leading "-" negates. A term is either text
+    that must occur in the path or tags, or field:value:
+
+        artist:beatles album:"abbey road" ext:flac,mp3 dir:/live/
+        duration:>300 duration:3:00..5:00 mtime:>2024-01-01 added:>30d
+
+    Durations are seconds or m:ss. Times (mtime: file changed, added:
+    first seen by a scan) are dates (YYYY-MM-DD) or ages such as 12h,
+    30d, 4w or 1y, so added:>30d means added in the last 30 days.
+    """
+    tokens = _TOKEN.findall(text)
+    if not tokens:
+        raise QueryError("Empty query")
+    parser = _Parser(tokens, time.time() if now is None else now)
+    node = parser.parse_or()
+    if parser.position < len(tokens):
+        raise QueryError(f"Unexpected '{tokens[parser.position]}'")
+    return node
+
+
+class _Parser:
+    def __init__(self, tokens: List[str], now: float):
+        self.tokens = tokens
+        self.position = 0
+        self.now = now
+        self.relative_time = False
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def parse_or(self) -> Node:
+        children = [self.parse_and()]
+        while self._peek() is not None and self._peek().lower() in ('or', '|'):
+            self.position += 1
+            children.append(self.parse_and())
+        return children[0] if len(children) == 1 else Or(children)
+
+    def parse_and(self) -> Node:
+        children = []
+        while self._peek() is not None and self._peek() != ')' and self._peek().lower() not in ('or', '|'):
+            children.append(self.parse_unary())
+        if not children:
+            raise QueryError("Missing search term")
+        return children[0] if len(children) == 1 else And(children)
+
+    def parse_unary(self) -> Node:
+        token = self.tokens[self.position]
+        if token.startswith('-'):
+            if token == '-':
+                self.position += 1
+                if self._peek() is None:
+                    raise QueryError("Nothing to exclude after '-'")
+            else:
+                self.tokens[self.position] = token[1:]
+            return Not(self.parse_unary())
+        if token == '(':
+            self.position += 1
+            node = self.parse_or()
+            if self._peek() != ')':
+                raise QueryError("Missing ')'")
+            self.position += 1
+            return node
+        self.position += 1
+        return self.parse_term(token)
+
+    def parse_term(self, token: str) -> Node:
+        field, separator, value = token.partition(':')
+        field = field.lower()
+        if not separator or field not in FIELDS:
+            term = _unquote(token).lower()
+            if not term:
+                raise QueryError("Empty search term")
+            return TextTerm(term)
+        value = _unquote(value).lower()
+        if not value:
+            raise QueryError(f"No value for {field}:")
+        if field in TEXT_FIELDS:
+            if field == 'dir':
+                value = value.replace('\\', '/')
+            return CategoryTerm(field, value.split(','), exact=False)
+        if field in EXACT_FIELDS:
+            return CategoryTerm(field, [ext.lstrip('.') for ext in value.split(',')], exact=True)
+        low, high = self.parse_range(field, value)
+        return NumberTerm(field, low, high)
+
+    def parse_range(self, field: str, value: str) -> Tuple[float, float]:
+        """Inclusive bounds for a comparison (>300), range (a..b) or single value"""
+        if '..' in value:
+            start, end = value.split('..', 1)
+            low = self.parse_number(field, start)[0] if start else -np.inf
+            high = self.parse_number(field, end)[1] if end else np.inf
+            return low, high
+        operator, value = _COMPARISON.match(value).groups()
+        low, high = self.parse_number(field, value)
+        if operator == '>':
+            return np.nextafter(high, np.inf), np.inf
+        if operator == '>=':
+            return low, np.inf
+        if operator == '<':
+            return -np.inf, np.nextafter(low, -np.inf)
+        if operator == '<=':
+            return -np.inf, high
+        return low, high
+
+    def parse_number(self, field: str, value: str) -> Tuple[float, float]:
+        """The (first, last) value a written value stands for, a date covers the whole day"""
+        try:
+            if field == 'duration':
+                seconds = 0.0
+                for part in value.split(':'):
+                    seconds = seconds * 60 + float(part)
+                return seconds, seconds
+            age = _AGE.match(value)
+            if age:
+                self.relative_time = True
+                moment = self.now - float(age.group(1)) * _AGE_SECONDS[age.group(2)]
+                return moment, moment
+            start = time.mktime(time.strptime(value, '%Y-%m-%d'))
+            return start, start + 86399.999
+        except ValueError:
+            raise QueryError(f"Invalid value for {field}: '{value}'")
+
+
+def _unquote(value: str) -> str:
+    return value.replace('"', '')
@@ -1,4129 +1,6115 @@
-import sys
-import os
-import json
-import pygame
-from odf import text, teletype
-from odf.opendocument import OpenDocumentText, load
-from mutagen import File
-from PyQt6.QtWidgets import (QApplication, QMainWindow, QLabel, QPushButton,
-                             QTreeView, QVBoxLayout, QHBoxLayout, QWidget,
-                             QLineEdit, QMessageBox, QProgressDialog, QStatusBar,
-                             QComboBox, QFileDialog, QGroupBox, QFormLayout,
-                             QDialog, QDialogButtonBox, QProgressBar, QScrollArea,
-                             QTextEdit, QSplitter, QCheckBox, QFrame, QMenu,
-                             QStyledItemDelegate)
-from PyQt6.QtCore import Qt, QDir, QTimer, QEvent, QTime, QRect
-from PyQt6.QtGui import QStandardItemModel, QStandardItem, QPixmap, QFont, QPainter, QColor
-
-# Import the language system
-try:
-    from languages_db import get_text, get_language_name, get_available_languages, add_language
-except ImportError:
-    # Fallback if languages_db.py is not found
-    def get_text(key, language='nl', **kwargs):
-        return key
-    def get_language_name(language_code):
-        return language_code
-    def get_available_languages():
-        return ['nl', 'en']
-    def add_language(language_code, language_name, translations):
-        pass
-
-
-class PlaylistNameDialog(QDialog):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Save Playlist")
-        self.setModal(True)
-
-        layout = QVBoxLayout(self)
-
-        # Create input field
-        self.name_input = QLineEdit()
-        self.name_input.setPlaceholderText("Enter playlist name")
-        layout.addWidget(self.name_input)
-
-        # Create buttons
-        buttons = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
-        )
-        buttons.accepted.connect(self.accept)
-        buttons.rejected.connect(self.reject)
-        layout.addWidget(buttons)
-
-    def get_name(self):
-        return self.name_input.text().strip()
-
-
-class HelpDialog(QDialog):
-    def __init__(self, parent=None, language='nl'):
-        super().__init__(parent)
-        self.language = language
-        self.setWindowTitle(get_text('help_title', self.language))
-        self.setModal(True)
-        self.setMinimumSize(800, 600)
-
-        # Create help images directory if it doesn't exist
-        self.help_images_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "help_images")
-        if not os.path.exists(self.help_images_dir):
-            os.makedirs(self.help_images_dir)
-
-        layout = QVBoxLayout(self)
-
-        # Create scroll area for content
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        content = QWidget()
-        content_layout = QVBoxLayout(content)
-
-        # Add title
-        title = QLabel(get_text('help_title', self.language))
-        title.setStyleSheet("font-size: 18px; font-weight: bold;")
-        content_layout.addWidget(title)
-
-        # Add sections (dynamically from language file)
-        for i in range(1, 12):
-            section_title = get_text(f'help_section_{i}_title', self.language)
-            section_text = get_text(f'help_section_{i}_text', self.language)
-            image_name = [
-                "scan_drives.png", "read_files.png", "toggle_view.png", "tree_view.png", "filter.png",
-                "playback.png", "favorites.png", "lyrics.png", "playlists.png", "file_types.png", "config.png"
-            ][i-1]
-
-            # Add section title
-            section_title_label = QLabel(section_title)
-            section_title_label.setStyleSheet("font-size: 14px; font-weight: bold; margin-top: 20px;")
-            content_layout.addWidget(section_title_label)
-
-            # Add section text
-            section_text_label = QLabel(section_text)
-            section_text_label.setWordWrap(True)
-            content_layout.addWidget(section_text_label)
-
-            # Add section image
-            image_path = os.path.join(self.help_images_dir, image_name)
-            if os.path.exists(image_path):
-                pixmap = QPixmap(image_path)
-                # Scale image if it's too large
-                if pixmap.width() > 700:
-                    pixmap = pixmap.scaled(700, 400, Qt.AspectRatioMode.KeepAspectRatio)
-                image_label = QLabel()
-                image_label.setPixmap(pixmap)
-                image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                content_layout.addWidget(image_label)
-            else:
-                # Show placeholder if image doesn't exist
-                placeholder = QLabel(get_text('image_not_found', self.language, image=image_name))
-                placeholder.setStyleSheet("font-style: italic; color: gray;")
-                content_layout.addWidget(placeholder)
-
-        # Add close button
-        close_button = QPushButton(get_text('close_button', self.language))
-        close_button.clicked.connect(self.accept)
-        content_layout.addWidget(close_button, alignment=Qt.AlignmentFlag.AlignCenter)
-
-        scroll.setWidget(content)
-        layout.addWidget(scroll)
-
-
-class LyricsDialog(QDialog):
-    def __init__(self, parent=None, language='nl'):
-        super().__init__(parent)
-        self.language = language
-        self.setWindowTitle(get_text('lyrics_title', self.language))
-        self.setModal(True)
-        self.setMinimumSize(600, 400)
-
-        layout = QVBoxLayout(self)
-
-        # Create text edit for lyrics
-        self.lyrics_text = QTextEdit()
-        self.lyrics_text.setReadOnly(False)  # Allow editing
-        layout.addWidget(self.lyrics_text)
-
-        # Create buttons
-        button_layout = QHBoxLayout()
-        save_button = QPushButton(get_text('save_button', self.language))
-        save_button.clicked.connect(self.save_lyrics)
-        close_button = QPushButton(get_text('close_button', self.language))
-        close_button.clicked.connect(self.accept)
-        button_layout.addWidget(save_button)
-        button_layout.addWidget(close_button)
-        layout.addLayout(button_layout)
-
-    def set_lyrics(self, lyrics):
-        self.lyrics_text.setText(lyrics)
-
-    def get_lyrics(self):
-        return self.lyrics_text.toPlainText()
-
-    def save_lyrics(self):
-        self.accept()
-
-
-class LyricsMappingDialog(QDialog):
-    def __init__(self, parent=None, music_file=None, current_text_file=None, current_srt_file=None, language='nl'):
-        super().__init__(parent)
-        self.language = language
-        self.setWindowTitle(get_text('lyrics_mapping_title', self.language))
-        self.setModal(True)
-
-        self.music_file = music_file
-        self.current_text_file = current_text_file
-        self.current_srt_file = current_srt_file
-
-        layout = QVBoxLayout(self)
-
-        # Add labels
-        music_label = QLabel(get_text('music_file_label', self.language, file=os.path.basename(music_file)))
-        layout.addWidget(music_label)
-
-        # Add text lyrics section
-        text_group = QGroupBox(get_text('text_lyrics_group', self.language))
-        text_layout = QVBoxLayout()
-
-        self.text_path = QLineEdit()
-        self.text_path.setReadOnly(True)
-        if current_text_file:
-            self.text_path.setText(current_text_file)
-
-        text_button_layout = QHBoxLayout()
-        text_browse_button = QPushButton(get_text('browse_button', self.language))
-        text_browse_button.clicked.connect(self.browse_text)
-        text_clear_button = QPushButton(get_text('clear_button', self.language))
-        text_clear_button.clicked.connect(lambda: self.text_path.clear())
-        text_button_layout.addWidget(text_browse_button)
-        text_button_layout.addWidget(text_clear_button)
-
-        text_layout.addWidget(self.text_path)
-        text_layout.addLayout(text_button_layout)
-        text_group.setLayout(text_layout)
-        layout.addWidget(text_group)
-
-        # Add SRT section
-        srt_group = QGroupBox(get_text('karaoke_group', self.language))
-        srt_layout = QVBoxLayout()
-
-        self.srt_path = QLineEdit()
-        self.srt_path.setReadOnly(True)
-        if current_srt_file:
-            self.srt_path.setText(current_srt_file)
-
-        srt_button_layout = QHBoxLayout()
-        srt_browse_button = QPushButton(get_text('browse_button', self.language))
-        srt_browse_button.clicked.connect(self.browse_srt)
-        srt_clear_button = QPushButton(get_text('clear_button', self.language))
-        srt_clear_button.clicked.connect(lambda: self.srt_path.clear())
-        srt_button_layout.addWidget(srt_browse_button)
-        srt_button_layout.addWidget(srt_clear_button)
-
-        srt_layout.addWidget(self.srt_path)
-        srt_layout.addLayout(srt_button_layout)
-        srt_group.setLayout(srt_layout)
-        layout.addWidget(srt_group)
-
-        # Add buttons
-        buttons = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
-        )
-        buttons.accepted.connect(self.accept)
-        buttons.rejected.connect(self.reject)
-        layout.addWidget(buttons)
-
-    def browse_text(self):
-        """Browse for text lyrics file (TXT or ODT)"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            get_text('select_lyrics', self.language),
-            self.parent().lyrics_dir,
-            "Text Files (*.txt);;ODT Files (*.odt)"
-        )
-
-        if file_path:
-            self.text_path.setText(file_path)
-
-    def browse_srt(self):
-        """Browse for SRT file"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            get_text('select_karaoke', self.language),
-            self.parent().lyrics_dir,
-            "SRT Files (*.srt)"
-        )
-
-        if file_path:
-            self.srt_path.setText(file_path)
-
-    def get_text_path(self):
-        return self.text_path.text()
-
-    def get_srt_path(self):
-        return self.srt_path.text()
-
-    def load_lyrics(self, music_file):
-        """Load lyrics for a music file with improved error handling"""
-        if not music_file:
-            self.show_error("Fout", "Geen muziekbestand geselecteerd")
-            return
-
-        print(f"Loading lyrics for: {music_file}")  # Debug logging
-
-        try:
-            # Clear current lyrics display first
-            self._clear_lyrics_display()
-
-            # Get current mappings
-            mapping = self.lyrics_mapping.get(music_file, {})
-            text_path = None
-            srt_path = None
-
-            if isinstance(mapping, dict):
-                text_path = mapping.get('text_path')
-                srt_path = mapping.get('srt_path')
-            else:
-                # Handle old format
-                if mapping and isinstance(mapping, str):  # Ensure mapping is a string
-                    ext = os.path.splitext(mapping)[1].lower()
-                    if ext == '.srt':
-                        srt_path = mapping
-                    else:
-                        text_path = mapping
-
-            # Try to load text lyrics first
-            text_loaded = False
-            if text_path and isinstance(text_path, str) and os.path.exists(text_path):
-                ext = os.path.splitext(text_path)[1].lower()
-                if ext == '.odt':
-                    text_loaded = self._load_odt_file(text_path)
-                else:
-                    text_loaded = self._load_txt_file(text_path)
-
-            # If no text lyrics found from mapping, try to find one with same name
-            if not text_loaded:
-                text_loaded = self._try_load_text_lyrics(music_file)
-
-            # Handle SRT display
-            if self.srt_display and self.srt_display.isVisible():
-                # Try to load SRT from mapping first
-                if srt_path and isinstance(srt_path, str) and os.path.exists(srt_path):
-                    self._load_srt_file(srt_path)
-                else:
-                    # Try to find SRT with same name
-                    base_name = os.path.splitext(os.path.basename(music_file))[0]
-                    srt_path = os.path.join(self.lyrics_dir, f"{base_name}.srt")
-                    if os.path.exists(srt_path):
-                        self._load_srt_file(srt_path)
-                    else:
-                        # No SRT file found, clear the display
-                        self.srt_display.stop_display()
-                        self.srt_display.subtitle_label.clear()
-
-            # If no lyrics found at all, show a message
-            if not text_loaded and not (self.srt_display and self.srt_display.isVisible()):
-                print("No lyrics found for this track")  # Debug logging
-                if hasattr(self, 'lyrics_display'):
-                    self.lyrics_display.setText("Geen songtekst gevonden")
-                self.statusBar.showMessage("Geen songtekst gevonden voor dit nummer")
-
-        except Exception as e:
-            self.show_error("Onverwachte fout", "Fout bij laden songtekst", str(e))
-            if hasattr(self, 'lyrics_display'):
-                self.lyrics_display.setText("Fout bij laden songtekst")
-
-
-class SRTParser:
-    def __init__(self):
-        self.subtitles = []
-
-    def parse_srt(self, file_path):
-        """Parse an SRT file and return a list of subtitle entries"""
-        self.subtitles = []
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Split into subtitle blocks
-            blocks = content.strip().split('\n\n')
-
-            for block in blocks:
-                lines = block.strip().split('\n')
-                if len(lines) >= 3:
-                    # Parse time
-                    time_line = lines[1]
-                    start_time, end_time = time_line.split(' --> ')
-
-                    # Convert time to seconds
-                    start_seconds = self.time_to_seconds(start_time)
-                    end_seconds = self.time_to_seconds(end_time)
-
-                    # Get text (can be multiple lines)
-                    text = '\n'.join(lines[2:])
-
-                    self.subtitles.append({
-                        'start': start_seconds,
-                        'end': end_seconds,
-                        'text': text
-                    })
-
-            # Sort by start time
-            self.subtitles.sort(key=lambda x: x['start'])
-            return True
-        except Exception as e:
-            print(f"Error parsing SRT file: {str(e)}")
-            return False
-
-    def time_to_seconds(self, time_str):
-        """Convert SRT time format (HH:MM:SS,mmm) to seconds"""
-        try:
-            hours, minutes, seconds = time_str.replace(',', '.').split(':')
-            return float(hours) * 3600 + float(minutes) * 60 + float(seconds)
-        except:
-            return 0.0
-
-    def get_subtitle_at_time(self, current_time):
-        """Get the subtitle text for the current time"""
-        for subtitle in self.subtitles:
-            if subtitle['start'] <= current_time <= subtitle['end']:
-                return subtitle['text']
-        return ""
-
-
-class LyricsDisplay(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setup_ui()
-        self.srt_parser = SRTParser()
-        self.current_subtitle = ""
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_subtitle)
-        self.update_timer.setInterval(100)  # Update every 100ms
-
-    def setup_ui(self):
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-
-        # Create label for subtitle display
-        self.subtitle_label = QLabel()
-        self.subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.subtitle_label.setWordWrap(True)
-        self.subtitle_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                background-color: rgba(0, 0, 0, 0.7);
-                padding: 20px;
-                border-radius: 10px;
-            }
-        """)
-
-        # Set large font
-        font = QFont()
-        font.setPointSize(24)  # Large font size
-        font.setBold(True)
-        self.subtitle_label.setFont(font)
-
-        layout.addWidget(self.subtitle_label)
-
-    def load_srt(self, file_path):
-        """Load and parse an SRT file"""
-        if self.srt_parser.parse_srt(file_path):
-            self.start_display()
-            return True
-        return False
-
-    def start_display(self):
-        """Start the subtitle display timer"""
-        self.update_timer.start()
-
-    def stop_display(self):
-        """Stop the subtitle display timer"""
-        self.update_timer.stop()
-        self.subtitle_label.clear()
-
-    def update_subtitle(self):
-        """Update the displayed subtitle based on current playback time"""
-        if not self.parent() or not self.parent().is_playing:
-            return
-
-        current_time = pygame.mixer.music.get_pos() / 1000.0
-        if self.parent().pause_position > 0:
-            current_time = self.parent().pause_position
-
-        subtitle = self.srt_parser.get_subtitle_at_time(current_time)
-        if subtitle != self.current_subtitle:
-            self.current_subtitle = subtitle
-            self.subtitle_label.setText(subtitle)
-
-
-class SRTDisplayDialog(QDialog):
-    def __init__(self, parent=None, language='nl'):
-        super().__init__(parent)
-        self.language = language
-        self.setWindowTitle(get_text('karaoke_title', self.language))
-        self.setModal(False)  # Non-modal so it can stay open while using main window
-        self.is_fullscreen = False  # Track fullscreen state
-
-        # Set window flags for a frameless window that stays on top
-        self.setWindowFlags(
-            Qt.WindowType.FramelessWindowHint |  # No window frame
-            Qt.WindowType.Tool |  # Tool window
-            Qt.WindowType.WindowStaysOnTopHint  # Always on top
-        )
-
-        # Create main layout with no margins in fullscreen
-        self.main_layout = QVBoxLayout(self)
-        self.main_layout.setContentsMargins(20, 20, 20, 20)
-        self.main_layout.setSpacing(10)
-
-        # Create container widget for the label to control its size
-        self.label_container = QWidget()
-        self.label_container.setStyleSheet("background-color: transparent;")
-        label_container_layout = QVBoxLayout(self.label_container)
-        label_container_layout.setContentsMargins(0, 0, 0, 0)
-        label_container_layout.setSpacing(0)
-
-        # Create label for subtitle display with larger font and better wrapping
-        self.subtitle_label = QLabel()
-        self.subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.subtitle_label.setWordWrap(True)
-        self.subtitle_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                background-color: rgba(0, 0, 0, 0.8);
-                padding: 30px;
-                border-radius: 15px;
-                font-size: 48px;
-                font-weight: bold;
-                min-height: 200px;
-                max-width: 1200px;
-            }
-        """)
-
-        # Set large font with better line spacing
-        font = QFont()
-        font.setPointSize(48)
-        font.setBold(True)
-        font.setStyleStrategy(QFont.StyleStrategy.PreferAntialias)
-        self.subtitle_label.setFont(font)
-
-        # Set text format for better wrapping
-        text_format = Qt.TextFormat.RichText
-        self.subtitle_label.setTextFormat(text_format)
-
-        # Add label to container
-        label_container_layout.addWidget(self.subtitle_label)
-
-        # Add container to main layout
-        self.main_layout.addWidget(self.label_container)
-
-        # Create button container widget
-        self.button_container = QWidget()
-        self.button_container.setObjectName("button_container")
-        button_layout = QHBoxLayout(self.button_container)
-        button_layout.setContentsMargins(0, 0, 0, 0)
-
-        # Add fullscreen toggle button
-        self.fullscreen_button = QPushButton(get_text('fullscreen_button', self.language))
-        self.fullscreen_button.clicked.connect(self.toggle_fullscreen)
-        self.fullscreen_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3b3b3b;
-                color: white;
-                border: 1px solid #555555;
-                padding: 10px;
-                border-radius: 5px;
-                min-width: 120px;
-                margin-top: 10px;
-                font-size: 16px;
-            }
-            QPushButton:hover {
-                background-color: #4b4b4b;
-            }
-        """)
-        button_layout.addWidget(self.fullscreen_button)
-
-        # Add close button
-        self.close_button = QPushButton(get_text('close_karaoke', self.language))
-        self.close_button.clicked.connect(self.close)
-        self.close_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3b3b3b;
-                color: white;
-                border: 1px solid #555555;
-                padding: 10px;
-                border-radius: 5px;
-                min-width: 100px;
-                margin-top: 10px;
-                font-size: 16px;
-            }
-            QPushButton:hover {
-                background-color: #4b4b4b;
-            }
-        """)
-        button_layout.addWidget(self.close_button)
-
-        self.main_layout.addWidget(self.button_container)
-
-        # Initialize SRT parser and timer
-        self.srt_parser = SRTParser()
-        self.current_subtitle = ""
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_subtitle)
-        self.update_timer.setInterval(100)
-
-        # Store original geometry
-        self.normal_geometry = None
-
-        # Calculate initial window size and position
-        screen = QApplication.primaryScreen().geometry()
-        window_width = min(int(screen.width() * 0.9), 1200)
-        window_height = int(screen.height() * 0.4)
-        window_x = (screen.width() - window_width) // 2
-        window_y = int(screen.height() * 0.5)
-
-        # Set initial size and position
-        self.setFixedSize(window_width, window_height)
-        self.move(window_x, window_y)
-
-        # Make window draggable
-        self.old_pos = None
-
-    def toggle_fullscreen(self):
-        """Toggle between normal and fullscreen mode"""
-        try:
-            if not self.is_fullscreen:
-                # Store current geometry before going fullscreen
-                self.normal_geometry = self.geometry()
-
-                # Get screen geometry
-                screen = QApplication.primaryScreen().geometry()
-
-                # Hide button container
-                self.button_container.hide()
-
-                # Remove margins in fullscreen
-                self.main_layout.setContentsMargins(0, 0, 0, 0)
-                self.main_layout.setSpacing(0)
-
-                # Adjust label container and label style for fullscreen
-                self.label_container.setStyleSheet("""
-                    QWidget {
-                        background-color: rgba(0, 0, 0, 0.8);
-                        width: 100%;
-                        height: 100%;
-                    }
-                """)
-                self.subtitle_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        background-color: transparent;
-                        padding: 50px;
-                        border-radius: 0px;
-                        font-size: 72px;
-                        font-weight: bold;
-                        min-height: 300px;
-                        max-width: none;
-                        width: 90%;
-                        margin: 0 auto;
-                        qproperty-alignment: AlignCenter;
-                    }
-                """)
-
-                # Set fullscreen geometry and ensure label takes full width
-                self.setFixedSize(screen.width(), screen.height())
-                self.move(0, 0)
-                self.label_container.setFixedWidth(screen.width())
-                self.subtitle_label.setFixedWidth(int(screen.width() * 0.9))
-
-                # Update button text
-                self.fullscreen_button.setText(get_text('normal_screen_button', self.language))
-                self.is_fullscreen = True
-
-            else:
-                # Restore normal geometry
-                if self.normal_geometry:
-                    self.setFixedSize(self.normal_geometry.width(), self.normal_geometry.height())
-                    self.move(self.normal_geometry.x(), self.normal_geometry.y())
-
-                # Restore margins and spacing
-                self.main_layout.setContentsMargins(20, 20, 20, 20)
-                self.main_layout.setSpacing(10)
-
-                # Show button container again
-                self.button_container.show()
-
-                # Restore label container and label style
-                self.label_container.setStyleSheet("background-color: transparent;")
-                self.label_container.setFixedWidth(self.normal_geometry.width())
-                self.subtitle_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        background-color: rgba(0, 0, 0, 0.8);
-                        padding: 30px;
-                        border-radius: 15px;
-                        font-size: 48px;
-                        font-weight: bold;
-                        min-height: 200px;
-                        max-width: 1200px;
-                        margin: 0 auto;
-                        qproperty-alignment: AlignCenter;
-                    }
-                """)
-                self.subtitle_label.setFixedWidth(1200)
-
-                # Update button text
-                self.fullscreen_button.setText(get_text('fullscreen_button', self.language))
-                self.is_fullscreen = False
-
-        except Exception as e:
-            print(f"Error in toggle_fullscreen: {str(e)}")
-            # Try to recover normal state
-            self.is_fullscreen = False
-            if self.normal_geometry:
-                self.setFixedSize(self.normal_geometry.width(), self.normal_geometry.height())
-                self.move(self.normal_geometry.x(), self.normal_geometry.y())
-            self.main_layout.setContentsMargins(20, 20, 20, 20)
-            self.main_layout.setSpacing(10)
-            self.button_container.show()
-            self.label_container.setStyleSheet("background-color: transparent;")
-            self.subtitle_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    background-color: rgba(0, 0, 0, 0.8);
-                    padding: 30px;
-                    border-radius: 15px;
-                    font-size: 48px;
-                    font-weight: bold;
-                    min-height: 200px;
-                    max-width: 1200px;
-                    margin: 0 auto;
-                    qproperty-alignment: AlignCenter;
-                }
-            """)
-            self.fullscreen_button.setText(get_text('fullscreen_button', self.language))
-
-    def update_subtitle(self):
-        """Update the displayed subtitle based on current playback time"""
-        if not self.parent() or not self.parent().is_playing:
-            return
-
-        current_time = pygame.mixer.music.get_pos() / 1000.0
-        if self.parent().pause_position > 0:
-            current_time = self.parent().pause_position
-
-        subtitle = self.srt_parser.get_subtitle_at_time(current_time)
-        if subtitle != self.current_subtitle:
-            self.current_subtitle = subtitle
-            # Format text with HTML for better wrapping and line breaks
-            formatted_text = subtitle.replace('\n', '<br>')
-            # Add extra line height and center alignment in HTML
-            self.subtitle_label.setText(f"<div style='line-height: 1.4; text-align: center;'>{formatted_text}</div>")
-
-    def keyPressEvent(self, event):
-        """Handle keyboard events"""
-        try:
-            if event.key() == Qt.Key.Key_Escape and self.is_fullscreen:
-                self.toggle_fullscreen()
-            else:
-                super().keyPressEvent(event)
-        except Exception as e:
-            print(f"Error in keyPressEvent: {str(e)}")
-            super().keyPressEvent(event)
-
-    def closeEvent(self, event):
-        """Handle window close event"""
-        try:
-            # Stop the display timer
-            self.update_timer.stop()
-            # Accept the close event
-            event.accept()
-        except Exception as e:
-            print(f"Error in closeEvent: {str(e)}")
-            event.accept()
-
-    def showEvent(self, event):
-        """Ensure dialog stays centered when shown"""
-        try:
-            super().showEvent(event)
-            if not self.is_fullscreen and self.parent():
-                parent_geometry = self.parent().geometry()
-                dialog_geometry = self.geometry()
-                x = parent_geometry.x() + (parent_geometry.width() - dialog_geometry.width()) // 2
-                y = parent_geometry.y() + (parent_geometry.height() - dialog_geometry.height()) // 2
-                self.move(x, y)
-        except Exception as e:
-            print(f"Error in showEvent: {str(e)}")
-
-    def mousePressEvent(self, event):
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.old_pos = event.globalPosition().toPoint()
-
-    def mouseMoveEvent(self, event):
-        if self.old_pos:
-            delta = event.globalPosition().toPoint() - self.old_pos
-            self.move(self.pos() + delta)
-            self.old_pos = event.globalPosition().toPoint()
-
-    def mouseReleaseEvent(self, event):
-        self.old_pos = None
-
-    def load_srt(self, file_path):
-        """Load and parse an SRT file"""
-        if self.srt_parser.parse_srt(file_path):
-            self.start_display()
-            return True
-        return False
-
-    def start_display(self):
-        """Start the subtitle display timer"""
-        self.update_timer.start()
-
-    def stop_display(self):
-        """Stop the subtitle display timer"""
-        self.update_timer.stop()
-        self.subtitle_label.clear()
-
-    def update_subtitle(self):
-        """Update the displayed subtitle based on current playback time"""
-        if not self.parent() or not self.parent().is_playing:
-            return
-
-        current_time = pygame.mixer.music.get_pos() / 1000.0
-        if self.parent().pause_position > 0:
-            current_time = self.parent().pause_position
-
-        subtitle = self.srt_parser.get_subtitle_at_time(current_time)
-        if subtitle != self.current_subtitle:
-            self.current_subtitle = subtitle
-            # Format text with HTML for better wrapping and line breaks
-            formatted_text = subtitle.replace('\n', '<br>')
-            # Add extra line height and center alignment in HTML
-            self.subtitle_label.setText(f"<div style='line-height: 1.4; text-align: center;'>{formatted_text}</div>")
-
-
-class TreeViewDelegate(QStyledItemDelegate):
-    def paint(self, painter, option, index):
-        # Check if this item has children and is a branch
-        model = index.model()
-        if model.hasChildren(index):
-            # Get the item rect
-            rect = option.rect
-            
-            # Calculate arrow position (further to the left)
-            arrow_x = rect.left() - 15  # Move arrow further left
-            arrow_y = rect.center().y()
-            
-            # Set up painter for drawing
-            painter.setPen(QColor(255, 255, 255))  # White color
-            painter.setFont(QFont("Arial", 10))
-            
-            # Draw arrow based on expansion state
-            tree_view = self.parent()
-            if tree_view and tree_view.isExpanded(index):
-                # Draw down arrow (▼) for expanded
-                painter.drawText(arrow_x, arrow_y + 5, "▼")
-            else:
-                # Draw right arrow (▶) for collapsed
-                painter.drawText(arrow_x, arrow_y + 5, "▶")
-        
-        # Call the parent paint method to draw the text
-        super().paint(painter, option, index)
-
-
-class MusicPlayer(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        
-        # Debug: Print database info
-        import os
-        db_path = "languages.db"
-        print(f"DEBUG: Looking for database at: {os.path.abspath(db_path)}")
-        print(f"DEBUG: Database exists: {os.path.exists(db_path)}")
-        print(f"DEBUG: Current working directory: {os.getcwd()}")
-        
-        # Laad eerst de config zodat de taal bekend is
-        self.config_file = 'music_player_config.json'
-        self.current_language = 'nl'  # fallback, wordt direct overschreven
-        self.config = {}
-        self.lyrics_dir = ''
-        self.playlist_dir = ''
-        self.favorites = set()
-        self.play_history = []
-        self.lyrics_mapping = {}
-        self.max_history_items = 100
-        self.is_muted = False
-        self.previous_volume = 1.0
-        self.metadata_cache = {}
-        self.metadata_cache_size_limit = 1000
-        self.drive_file_counts = {}
-        self.pause_position = 0
-        self.start_time = 0
-        self.pause_time = 0
-        self.total_play_time = 0
-        self.last_update_time = 0
-        self.show_full_path = True
-        self.srt_display = None
-        self.current_track = None
-        self.playlist = []
-        self.current_index = 0
-        self.is_playing = False
-        self.filtered_files = []
-        self.saved_files = {}
-        self.available_drives = []
-        self.current_drive = None
-        self.original_files = []
-        self.track_length = 0
-        self.current_lyrics = ""
-        self.lyrics_dialog = None
-        
-        # Add language status tracking
-        self.language_status_text = ""
-        self.last_status_update = 0
-        self.status_restore_timer = QTimer()
-        self.status_restore_timer.timeout.connect(self.restore_language_status)
-        self.status_restore_timer.setInterval(2000)  # Restore every 2 seconds
-        
-        # Laad config en zet self.current_language
-        self.load_config()
-        # Nu is de taal bekend, bouw de UI op met de juiste taal
-        self.setWindowTitle(get_text('window_title', self.current_language))
-
-        # Calculate window size based on screen resolution (80%)
-        screen = QApplication.primaryScreen().geometry()
-        window_width = int(screen.width() * 0.8)
-        window_height = int(screen.height() * 0.8)
-        window_x = (screen.width() - window_width) // 2
-        window_y = (screen.height() - window_height) // 2
-
-        # Set window size and position
-        self.setGeometry(window_x, window_y, window_width, window_height)
-
-        # Initialize new variables for history and favorites
-        self.play_history = []  # List of recently played tracks
-        self.favorites = set()  # Set of favorite tracks
-        self.max_history_items = 100  # Maximum number of history items to keep
-        self.is_muted = False
-        self.previous_volume = 1.0  # Store volume before muting
-
-        # Create status bar first
-        self.statusBar = QStatusBar()
-        self.setStatusBar(self.statusBar)
-        self.update_language_status()
-
-        # Add file count label to status bar
-        self.file_count_label = QLabel(get_text('files_label', self.current_language))
-        self.statusBar.addPermanentWidget(self.file_count_label)
-
-        # Initialize variables
-        self.current_track = None
-        self.playlist = []
-        self.current_index = 0
-        self.is_playing = False
-        self.filtered_files = []
-        self.saved_files = {}
-        self.available_drives = []
-        self.current_drive = None
-        self.original_files = []
-        self.track_length = 0
-        self.current_lyrics = ""
-        self.lyrics_dialog = None
-        self.metadata_cache = {}
-        self.metadata_cache_size_limit = 1000  # Maximum number of cached metadata entries
-        self.drive_file_counts = {}
-        self.pause_position = 0
-        self.start_time = 0
-        self.pause_time = 0
-        self.total_play_time = 0
-        self.last_update_time = 0
-        self.show_full_path = True
-        self.srt_display = None
-
-        # Create main widget and layout
-        main_widget = QWidget()
-        self.setCentralWidget(main_widget)
-        layout = QVBoxLayout(main_widget)
-        layout.setSpacing(5)
-        layout.setContentsMargins(5, 5, 5, 5)
-
-        # Create splitter for main content
-        splitter = QSplitter(Qt.Orientation.Horizontal)
-        layout.addWidget(splitter)
-
-        # Create left panel for file browser
-        left_panel = QWidget()
-        left_layout = QVBoxLayout(left_panel)
-        left_layout.setSpacing(5)
-        left_layout.setContentsMargins(0, 0, 0, 0)
-
-        # Create title and help button layout
-        title_layout = QHBoxLayout()
-        title_label = QLabel(get_text('title_label', self.current_language))
-        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("font-size: 24px; font-weight: bold;")
-        title_layout.addWidget(title_label)
-        
-        # Add language switch button
-        self.language_button = QPushButton("🌐")
-        self.language_button.setToolTip(get_text('language_tooltip', self.current_language))
-        self.language_button.clicked.connect(self.switch_language)
-        self.language_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3b3b3b;
-                color: #ffffff;
-                border: 1px solid #555555;
-                padding: 5px;
-                border-radius: 3px;
-                min-width: 40px;
-                font-size: 16px;
-            }
-            QPushButton:hover {
-                background-color: #4b4b4b;
-            }
-        """)
-        title_layout.addWidget(self.language_button)
-        
-        help_button = QPushButton(get_text('help_button', self.current_language))
-        help_button.clicked.connect(self.show_help)
-        title_layout.addWidget(help_button)
-        left_layout.addLayout(title_layout)
-        
-        # Store help button as instance variable
-        self.help_button = help_button
-
-        # Create drive selection and scan controls
-        drive_layout = QHBoxLayout()
-        drive_layout.setSpacing(5)
-        self.drive_combo = QComboBox()
-        self.drive_combo.setPlaceholderText(get_text('select_drive', self.current_language))
-        self.drive_combo.setStyleSheet("color: #90EE90;")
-        self.drive_combo.activated.connect(self.on_drive_selected)
-        self.refresh_button = QPushButton(get_text('refresh_drives', self.current_language))
-        self.refresh_button.clicked.connect(self.refresh_drives)
-        self.read_button = QPushButton(get_text('read_files', self.current_language))
-        self.read_button.clicked.connect(self.read_saved_files)
-        self.read_button.setStyleSheet("color: #90EE90;")
-        self.toggle_view_button = QPushButton(get_text('toggle_view', self.current_language))
-        self.toggle_view_button.clicked.connect(self.toggle_path_display)
-        self.scan_button = QPushButton(get_text('scan_drive', self.current_language))
-        self.scan_button.clicked.connect(self.scan_selected_drive)
-        
-        # Add cleanup button
-        self.cleanup_button = QPushButton(get_text('cleanup_files', self.current_language))
-        self.cleanup_button.clicked.connect(self.manual_cleanup)
-        self.cleanup_button.setToolTip(get_text('cleanup_files', self.current_language))
-        
-        drive_layout.addWidget(self.drive_combo)
-        drive_layout.addWidget(self.refresh_button)
-        drive_layout.addWidget(self.read_button)
-        drive_layout.addWidget(self.toggle_view_button)
-        drive_layout.addWidget(self.scan_button)
-        drive_layout.addWidget(self.cleanup_button)
-        left_layout.addLayout(drive_layout)
-
-        # Add lyrics directory selection
-        lyrics_dir_layout = QHBoxLayout()
-        lyrics_dir_layout.setSpacing(5)
-        self.lyrics_dir_label = QLabel(get_text('lyrics_dir_label', self.current_language))
-        self.lyrics_dir_path = QLineEdit()
-        self.lyrics_dir_path.setReadOnly(True)
-        self.lyrics_dir_button = QPushButton(get_text('change_lyrics_dir', self.current_language))
-        self.lyrics_dir_button.clicked.connect(self.change_lyrics_dir)
-        lyrics_dir_layout.addWidget(self.lyrics_dir_label)
-        lyrics_dir_layout.addWidget(self.lyrics_dir_path)
-        lyrics_dir_layout.addWidget(self.lyrics_dir_button)
-        left_layout.addLayout(lyrics_dir_layout)
-
-        # Create tree view for drives and files
-        self.tree_view = QTreeView()
-        self.tree_view.setRootIsDecorated(True)  # Ensure expand/collapse arrows are visible
-        self.tree_model = QStandardItemModel()
-        self.tree_model.setHorizontalHeaderLabels([""])  # Add empty header
-        self.tree_view.setModel(self.tree_model)
-        self.tree_view.setHeaderHidden(True)  # Hide the header
-        self.tree_view.doubleClicked.connect(self.play_selected_track)
-        self.tree_view.clicked.connect(self.play_on_click)
-        self.tree_view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.tree_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.tree_view.setFrameShape(QFrame.Shape.NoFrame)
-        self.tree_view.setFrameShadow(QFrame.Shadow.Plain)
-        self.tree_view.setLineWidth(0)
-        self.tree_view.setMidLineWidth(0)
-        self.tree_view.setContentsMargins(0, 0, 0, 0)
-
-        # Set custom delegate for visible arrows
-        delegate = TreeViewDelegate(self.tree_view)
-        self.tree_view.setItemDelegate(delegate)
-
-        # Enable context menu
-        self.tree_view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.tree_view.customContextMenuRequested.connect(self.show_context_menu)
-
-        left_layout.addWidget(self.tree_view)
-
-        # Create playlist controls
-        playlist_layout = QHBoxLayout()
-        playlist_layout.setSpacing(0)
-        playlist_layout.setContentsMargins(0, 0, 0, 0)
-        self.playlist_combo = QComboBox()
-        self.playlist_combo.setPlaceholderText("Select Playlist")
-        self.playlist_combo.activated.connect(self.on_playlist_selected)
-        load_playlist_button = QPushButton("Load Playlist")
-        load_playlist_button.clicked.connect(self.load_playlist)
-        playlist_layout.addWidget(self.playlist_combo)
-        playlist_layout.addWidget(load_playlist_button)
-        left_layout.addLayout(playlist_layout)
-
-        # Create filter section
-        filter_group = QGroupBox("Filter Options")
-        filter_layout = QFormLayout()
-        filter_layout.setSpacing(0)
-        filter_layout.setContentsMargins(5, 5, 5, 5)
-
-        self.positive_filter = QLineEdit()
-        self.positive_filter.setPlaceholderText("Enter text that must be in filename")
-        filter_layout.addRow("Wel:", self.positive_filter)
-
-        self.negative_filter = QLineEdit()
-        self.negative_filter.setPlaceholderText("Enter text that must NOT be in filename")
-        filter_layout.addRow("Niet:", self.negative_filter)
-
-        button_layout = QHBoxLayout()
-        button_layout.setSpacing(5)
-        filter_button = QPushButton("Filter")
-        filter_button.clicked.connect(self.apply_filter)
-        reset_filter_button = QPushButton("Reset Filter")
-        reset_filter_button.clicked.connect(self.reset_filter)
-        save_list_button = QPushButton("Save Filtered List")
-        save_list_button.clicked.connect(self.save_filtered_list)
-        button_layout.addWidget(filter_button)
-        button_layout.addWidget(reset_filter_button)
-        button_layout.addWidget(save_list_button)
-        filter_layout.addRow(button_layout)
-
-        filter_group.setLayout(filter_layout)
-        left_layout.addWidget(filter_group)
-
-        # Create playback controls
-        control_layout = QHBoxLayout()
-        control_layout.setSpacing(5)
-        self.play_button = QPushButton("Play")
-        self.play_button.clicked.connect(self.play_pause)
-        self.stop_button = QPushButton("Stop")
-        self.stop_button.clicked.connect(self.stop_playback)
-        self.prev_button = QPushButton("Vorige")
-        self.prev_button.clicked.connect(self.play_previous_track)
-        self.next_button = QPushButton("Volgende")
-        self.next_button.clicked.connect(self.play_next_track)
-        self.favorite_button = QPushButton("Favoriet")
-        self.favorite_button.setCheckable(True)  # Make button checkable
-        self.favorite_button.clicked.connect(self.toggle_favorite)
-        self.favorite_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3b3b3b;
-                color: #ffffff;
-                border: 1px solid #555555;
-                padding: 5px;
-                border-radius: 3px;
-                min-width: 80px;
-            }
-            QPushButton:checked {
-                background-color: #ffd700;
-                color: #000000;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #4b4b4b;
-            }
-            QPushButton:checked:hover {
-                background-color: #ffed4a;
-            }
-            QPushButton:pressed {
-                background-color: #2b2b2b;
-            }
-        """)
-
-        self.append_checkbox = QCheckBox("Lijsten aanvullen in plaats van vervangen")
-        self.append_checkbox.setChecked(False)
-
-        control_layout.addWidget(self.prev_button)
-        control_layout.addWidget(self.play_button)
-        control_layout.addWidget(self.stop_button)
-        control_layout.addWidget(self.next_button)
-        control_layout.addWidget(self.favorite_button)
-        control_layout.addWidget(self.append_checkbox)
-        left_layout.addLayout(control_layout)
-
-        # Create playback time indicator
-        time_layout = QHBoxLayout()
-        time_layout.setSpacing(5)
-
-        self.current_time_label = QLabel("00:00")
-        self.current_time_label.setAlignment(Qt.AlignmentFlag.AlignRight)
-        time_layout.addWidget(self.current_time_label)
-
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setRange(0, 1000)
-        time_layout.addWidget(self.progress_bar)
-
-        self.total_time_label = QLabel("00:00")
-        self.total_time_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        time_layout.addWidget(self.total_time_label)
-
-        left_layout.addLayout(time_layout)
-
-        # Create right panel for lyrics
-        right_panel = QWidget()
-        right_layout = QVBoxLayout(right_panel)
-        right_layout.setContentsMargins(0, 0, 0, 0)
-
-        self.lyrics_title = QLabel(get_text('lyrics_title', self.current_language))
-        self.lyrics_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.lyrics_title.setStyleSheet("font-size: 18px; font-weight: bold;")
-        right_layout.addWidget(self.lyrics_title)
-
-        self.lyrics_display = QTextEdit()
-        self.lyrics_display.setReadOnly(True)
-        self.lyrics_display.setStyleSheet("font-size: 14px;")
-        right_layout.addWidget(self.lyrics_display)
-
-        button_layout = QHBoxLayout()
-
-        self.edit_button = QPushButton(get_text('edit_lyrics_button', self.current_language))
-        self.edit_button.clicked.connect(self.edit_lyrics)
-        button_layout.addWidget(self.edit_button)
-
-        self.srt_button = QPushButton(get_text('show_karaoke_button', self.current_language))
-        self.srt_button.clicked.connect(self.toggle_srt_display)
-        button_layout.addWidget(self.srt_button)
-
-        right_layout.addLayout(button_layout)
-
-        # Add panels to splitter
-        splitter.addWidget(left_panel)
-        splitter.addWidget(right_panel)
-        splitter.setSizes([600, 400])
-
-        # Create timer for updating playback position
-        self.position_timer = QTimer()
-        self.position_timer.timeout.connect(self.update_position)
-        self.position_timer.setInterval(200)  # Increased from 100ms to 200ms
-
-        # Initialize pygame
-        pygame.init()
-        pygame.mixer.init()
-
-        # Add track end event
-        self.track_end_event = pygame.USEREVENT
-        pygame.mixer.music.set_endevent(self.track_end_event)
-
-        # Load configuration
-        self.config_file = 'music_player_config.json'
-        self.load_config()
-
-        # Create directories if they don't exist
-        for directory in [self.playlist_dir, self.lyrics_dir]:
-            if not os.path.exists(directory):
-                os.makedirs(directory)
-
-        # Clean up saved files to remove references to non-existent drives
-        # Commented out to prevent startup delays - can be run manually if needed
-        # self.cleanup_saved_files()
-
-        # Update lyrics directory path display
-        self.lyrics_dir_path.setText(self.lyrics_dir)
-
-        # Load saved files if they exist
-        try:
-            if os.path.exists('saved_files.json'):
-                with open('saved_files.json', 'r') as f:
-                    loaded_saved_files = json.load(f)
-                
-                # Load saved files without validation to prevent startup delays
-                # Validation can be done manually using the Cleanup Files button
-                self.saved_files = loaded_saved_files
-                self.statusBar.showMessage(f"Loaded {len(self.saved_files)} saved drives (not validated)")
-        except Exception as e:
-            self.statusBar.showMessage(f"Error loading saved files: {str(e)}")
-            self.saved_files = {}
-
-        # Initial drive scan
-        self.refresh_drives()
-
-        # Load playlists
-        self.refresh_playlists()
-
-        # Update file count status
-        self.update_file_count_status()
-
-        # Set dark theme
-        self.setStyleSheet("""
-            QMainWindow, QWidget {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QPushButton {
-                background-color: #3b3b3b;
-                color: #ffffff;
-                border: 1px solid #555555;
-                padding: 5px;
-                border-radius: 3px;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #4b4b4b;
-            }
-            QPushButton:pressed {
-                background-color: #2b2b2b;
-            }
-            QLineEdit {
-                background-color: #3b3b3b;
-                color: #ffffff;
-                border: 1px solid #555555;
-                padding: 5px;
-                border-radius: 3px;
-            }
-            QComboBox {
-                background-color: #3b3b3b;
-                color: #ffffff;
-                border: 1px solid #555555;
-                padding: 5px;
-                border-radius: 3px;
-                min-width: 100px;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border: none;
-            }
-            QTreeView {
-                background-color: #2b2b2b;
-                color: #ffffff;
-                border: none;
-                padding: 0px;
-                margin: 0px;
-            }
-            QTreeView::item {
-                padding: 5px;
-                border: none;
-                background-color: #2b2b2b;
-                margin: 0px;
-                spacing: 0px;
-                height: 25px;
-            }
-            QTreeView::item:selected {
-                background-color: #4b4b4b;
-                height: 25px;
-            }
-            QTreeView::branch {
-                background-color: #2b2b2b;
-                margin: 0px;
-                padding: 0px;
-                color: white;
-            }
-            QTreeView::branch:has-siblings:!adjoins-item {
-                background-color: #2b2b2b;
-                margin: 0px;
-                padding: 0px;
-                color: white;
-            }
-            QTreeView::branch:has-siblings:adjoins-item {
-                background-color: #2b2b2b;
-                margin: 0px;
-                padding: 0px;
-                color: white;
-            }
-            QTreeView::branch:!has-children:!has-siblings:adjoins-item {
-                background-color: #2b2b2b;
-                margin: 0px;
-                padding: 0px;
-                color: white;
-            }
-            QTreeView::branch:has-children:!has-siblings:closed,
-            QTreeView::branch:closed:has-children:has-siblings {
-                background-color: #2b2b2b;
-                margin: 0px;
-                padding: 0px;
-                color: white;
-                image: none;
-            }
-            QTreeView::branch:open:has-children:!has-siblings,
-            QTreeView::branch:open:has-children:has-siblings {
-                background-color: #2b2b2b;
-                margin: 0px;
-                padding: 0px;
-                color: white;
-                image: none;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background-color: #2b2b2b;
-                width: 10px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #4b4b4b;
-                min-height: 20px;
-                border-radius: 5px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background-color: #2b2b2b;
-            }
-            QScrollBar:horizontal {
-                border: none;
-                background-color: #2b2b2b;
-                height: 10px;
-                margin: 0px;
-            }
-            QScrollBar::handle:horizontal {
-                background-color: #4b4b4b;
-                min-width: 20px;
-                border-radius: 5px;
-            }
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-                width: 0px;
-            }
-            QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
-                background-color: #2b2b2b;
-            }
-            QAbstractItemView {
-                background-color: #2b2b2b;
-                alternate-background-color: #2b2b2b;
-                padding: 0px;
-                margin: 0px;
-            }
-            QAbstractScrollArea {
-                background-color: #2b2b2b;
-                padding: 0px;
-                margin: 0px;
-            }
-            QAbstractItemView::item {
-                background-color: #2b2b2b;
-                padding: 0px;
-                margin: 0px;
-                min-height: 25px;
-            }
-            QAbstractItemView::item:selected {
-                background-color: #4b4b4b;
-                min-height: 25px;
-            }
-            QStatusBar {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QStatusBar::item {
-                border: none;
-            }
-        """)
-
-        # Enable drag and drop for tree view
-        self.tree_view.setDragEnabled(True)
-        self.tree_view.setAcceptDrops(True)
-        self.tree_view.setDropIndicatorShown(True)
-        self.tree_view.setDragDropMode(QTreeView.DragDropMode.InternalMove)
-        self.tree_view.setSelectionMode(QTreeView.SelectionMode.ExtendedSelection)
-
-        # Add tooltips to buttons
-        self.play_button.setToolTip("Afspelen/Pauzeren (Spatiebalk)")
-        self.stop_button.setToolTip("Stoppen (S)")
-        self.prev_button.setToolTip("Vorige nummer (Pijltje Links)")
-        self.next_button.setToolTip("Volgende nummer (Pijltje Rechts)")
-        self.favorite_button.setToolTip(get_text('favorite_tooltip', self.current_language))
-        self.toggle_view_button.setToolTip("Wisselen tussen bestandsnaam en pad weergave (V)")
-        self.scan_button.setToolTip("Scan geselecteerde schijf voor muziekbestanden")
-        self.read_button.setToolTip("Laad opgeslagen bestanden van geselecteerde schijf")
-        self.refresh_button.setToolTip("Ververs lijst met beschikbare schijven")
-
-        # Add status bar widgets for more information
-        self.statusBar.setStyleSheet("""
-            QStatusBar {
-                background-color: #2b2b2b;
-                color: #ffffff;
-                padding: 2px;
-            }
-            QStatusBar QLabel {
-                padding: 2px 5px;
-                border-right: 1px solid #555555;
-            }
-        """)
-
-        # Add status labels
-        self.current_track_label = QLabel("")
-        self.next_track_label = QLabel("")
-        self.playlist_info_label = QLabel("")
-
-        # Add permanent widgets to status bar
-        self.statusBar.addPermanentWidget(self.playlist_info_label)
-        self.statusBar.addPermanentWidget(self.next_track_label)
-        self.statusBar.addPermanentWidget(self.current_track_label)
-        self.statusBar.addPermanentWidget(self.file_count_label)
-
-        # Voeg deze toe aan het einde van __init__:
-        self.update_favorites_display()
-        self.update_history_display()
-        
-        # Start the status restore timer
-        self.status_restore_timer.start()
-
-    def load_config(self):
-        """Load configuration from file"""
-        default_config = {
-            'lyrics_dir': os.path.join(os.path.dirname(os.path.abspath(__file__)), "lyrics"),
-            'playlist_dir': os.path.join(os.path.dirname(os.path.abspath(__file__)), "playlists"),
-            'lyrics_mapping': {},
-            'favorites': [],  # Add favorites to config
-            'play_history': [],  # Add play history to config
-            'language': 'nl'  # Add language preference
-        }
-
-        try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    self.config = json.load(f)
-                    self.lyrics_dir = self.config.get('lyrics_dir', default_config['lyrics_dir'])
-                    self.playlist_dir = self.config.get('playlist_dir', default_config['playlist_dir'])
-                    self.favorites = set(self.config.get('favorites', []))  # Load favorites
-                    self.play_history = self.config.get('play_history', [])  # Load history
-                    
-                    # Load language preference
-                    saved_language = self.config.get('language', 'nl')
-                    if saved_language in get_available_languages():
-                        self.current_language = saved_language
-                    else:
-                        self.current_language = 'nl'  # Fallback to Dutch
-
-                # (Verplaatst) self.update_favorites_display()
-                # (Verplaatst) self.update_history_display()
-
-            # Load and validate lyrics mappings
-            self.lyrics_mapping = {}
-            saved_mappings = self.config.get('lyrics_mapping', {})
-
-            for music_file, mapping in saved_mappings.items():
-                # Convert old format to new format
-                if isinstance(mapping, str):
-                    # Old format: just a path string
-                    ext = os.path.splitext(mapping)[1].lower()
-                    if ext == '.srt':
-                        self.lyrics_mapping[music_file] = {
-                            'text_path': None,
-                            'srt_path': mapping
-                        }
-                    else:
-                        self.lyrics_mapping[music_file] = {
-                            'text_path': mapping,
-                            'srt_path': None
-                        }
-                elif isinstance(mapping, dict):
-                    # New format: check if it has the new structure
-                    if 'text_path' in mapping or 'srt_path' in mapping:
-                        self.lyrics_mapping[music_file] = {
-                            'text_path': mapping.get('text_path'),
-                            'srt_path': mapping.get('srt_path')
-                        }
-                    else:
-                        # Old format with type: convert to new format
-                        path = mapping.get('path')
-                        file_type = mapping.get('type')
-                        if path:
-                            if file_type == 'SRT':
-                                self.lyrics_mapping[music_file] = {
-                                    'text_path': None,
-                                    'srt_path': path
-                                }
-                            else:
-                                self.lyrics_mapping[music_file] = {
-                                    'text_path': path,
-                                    'srt_path': None
-                                }
-
-                # Validate that files exist
-                if music_file in self.lyrics_mapping:
-                    mapping = self.lyrics_mapping[music_file]
-                    if mapping['text_path'] and not os.path.exists(mapping['text_path']):
-                        mapping['text_path'] = None
-                    if mapping['srt_path'] and not os.path.exists(mapping['srt_path']):
-                        mapping['srt_path'] = None
-                    # Remove mapping if both paths are None
-                    if not mapping['text_path'] and not mapping['srt_path']:
-                        del self.lyrics_mapping[music_file]
-        except Exception as e:
-            print(f"Error loading config: {str(e)}")
-            self.config = default_config
-            self.lyrics_dir = default_config['lyrics_dir']
-            self.playlist_dir = default_config['playlist_dir']
-            self.lyrics_mapping = {}
-            self.current_language = 'nl'  # Fallback to Dutch
-            if hasattr(self, 'statusBar'):
-                self.statusBar.showMessage(get_text('error_loading_config', self.current_language, error=str(e)))
-
-        # Save the validated mappings
-        self.save_config()
-
-    def format_time(self, seconds):
-        """Convert seconds to MM:SS format"""
-        minutes = int(seconds // 60)
-        seconds = int(seconds % 60)
-        return f"{minutes:02d}:{seconds:02d}"
-
-    def update_position(self):
-        """Update the playback position display"""
-        if not self.is_playing:  # Only check is_playing, remove track_length check
-            return
-
-        try:
-            # Process pygame events
-            pygame.event.pump()
-
-            # Get current position in seconds
-            current_pos = pygame.mixer.music.get_pos() / 1000.0
-
-            # If we're paused, use the stored position
-            if current_pos == 0 and self.pause_position > 0:
-                current_pos = self.pause_position
-
-            # Calculate progress based on time since start
-            if self.track_length > 0:  # Prevent division by zero
-                elapsed_time = (pygame.time.get_ticks() - self.start_time) / 1000.0
-                progress = int((elapsed_time / self.track_length) * 1000)
-
-                # Check if track has ended (progress >= 100% or current_pos == 0)
-                if (progress >= 1000 or (
-                        current_pos == 0 and self.pause_position == 0)) and not pygame.mixer.music.get_busy():
-                    # Reset progress bar
-                    self.progress_bar.setValue(0)
-                    self.current_time_label.setText("00:00")
-
-                    # Play next track
-                    self.play_next_track()
-                    return
-
-                # Update progress bar
-                self.progress_bar.setValue(min(progress, 1000))  # Ensure we don't exceed 1000
-
-                # Update time labels
-                self.current_time_label.setText(self.format_time(current_pos))
-                remaining = max(0, self.track_length - current_pos)
-                self.total_time_label.setText(f"-{self.format_time(remaining)}")
-
-        except Exception as e:
-            print(f"Error updating position: {str(e)}")
-
-    def play_previous_track(self):
-        """Play the previous track in the playlist"""
-        if not self.filtered_files:
-            return
-
-        # Find current track index
-        current_index = self.filtered_files.index(
-            self.current_track) if self.current_track in self.filtered_files else -1
-
-        # Get previous track index
-        prev_index = current_index - 1
-        if prev_index < 0:
-            prev_index = len(self.filtered_files) - 1  # Loop to end
-
-        # Play previous track
-        prev_track = self.filtered_files[prev_index]
-        self.play_selected_track_by_path(prev_track)
-
-    def play_next_track(self):
-        """Play the next track in the playlist"""
-        if not self.filtered_files:
-            return
-
-        # Find current track index
-        current_index = self.filtered_files.index(
-            self.current_track) if self.current_track in self.filtered_files else -1
-
-        # Get next track index
-        next_index = current_index + 1
-        if next_index >= len(self.filtered_files):
-            next_index = 0  # Loop back to start
-
-        # Stop current SRT display if it exists
-        if self.srt_display and self.srt_display.isVisible():
-            self.srt_display.stop_display()
-            self.srt_display.close()
-            self.srt_display = None
-
-        # Play next track
-        next_track = self.filtered_files[next_index]
-        self.play_selected_track_by_path(next_track)
-
-        # Update status bar
-        self.statusBar.showMessage(f"Playing next track: {os.path.basename(next_track)}")
-
-    def play_selected_track_by_path(self, file_path):
-        """Play a track by its file path"""
-        if not file_path:
-            return
-
-        try:
-            # Update favorite button state
-            self.favorite_button.setChecked(file_path in self.favorites)
-
-            # Add to history
-            self.add_to_history(file_path)
-
-            # Stop any current playback and timer
-            if pygame.mixer.music.get_busy():
-                pygame.mixer.music.stop()
-            self.position_timer.stop()
-
-            # Reset all playback state
-            self.current_track = file_path
-            self.is_playing = False
-            self.pause_position = 0
-            self.progress_bar.setValue(0)
-            self.current_time_label.setText("00:00")
-
-            # Initialize pygame mixer if needed
-            if not pygame.mixer.get_init():
-                pygame.mixer.init()
-
-            # Load the track and get its length
-            sound = pygame.mixer.Sound(file_path)
-            self.track_length = sound.get_length()
-
-            # Update total time label
-            self.total_time_label.setText(self.format_time(self.track_length))
-
-            # Load lyrics before starting playback
-            self.load_lyrics(file_path)
-
-            # Start playback
-            pygame.mixer.music.load(file_path)
-            pygame.mixer.music.play()
-
-            # Record start time and update UI
-            self.start_time = pygame.time.get_ticks()
-            self.play_button.setText("Pause")
-            self.is_playing = True
-            self.statusBar.showMessage(f"Playing: {os.path.basename(file_path)}")
-
-            # Update favorites display if this is a favorite
-            if file_path in self.favorites:
-                self.statusBar.showMessage(f"Playing favorite: {os.path.basename(file_path)}")
-
-            # Ensure timer is properly initialized and started
-            if not self.position_timer.isActive():
-                self.position_timer = QTimer()
-                self.position_timer.timeout.connect(self.update_position)
-                self.position_timer.setInterval(200)  # Increased from 100ms to 200ms
-
-            # Start timer with a small delay to ensure pygame is ready
-            QTimer.singleShot(50, self._start_timer)
-
-            # Update current track label
-            if hasattr(self, 'current_track_label'):
-                metadata = self.get_metadata(file_path)
-                self.current_track_label.setText(f"Nu: {metadata['artist']} - {metadata['title']}")
-
-            # Update playlist info
-            self.update_playlist_info()
-
-        except Exception as e:
-            self.statusBar.showMessage(f"Error playing track: {str(e)}")
-            try:
-                pygame.mixer.quit()
-                pygame.mixer.init()
-            except:
-                pass
-
-    def _start_timer(self):
-        """Start the position timer with a small delay"""
-        try:
-            if self.is_playing:  # Only start if we're still playing
-                self.position_timer.start()
-                # Force an immediate position update
-                self.update_position()
-        except Exception as e:
-            self.statusBar.showMessage(f"Error starting timer: {str(e)}")
-
-    def refresh_playlists(self):
-        """Load all playlists from the playlist directory"""
-        self.playlist_combo.clear()
-        try:
-            playlists = [f for f in os.listdir(self.playlist_dir) if f.endswith('.json')]
-            if playlists:
-                self.playlist_combo.addItems(playlists)
-                self.statusBar.showMessage(f"Loaded {len(playlists)} playlists")
-            else:
-                self.statusBar.showMessage("No playlists found")
-        except Exception as e:
-            self.statusBar.showMessage(f"Error loading playlists: {str(e)}")
-
-    def on_playlist_selected(self, index):
-        """Handle playlist selection"""
-        selected_playlist = self.playlist_combo.currentText()
-        if selected_playlist:
-            # Load the playlist immediately when selected
-            self.load_playlist()
-
-    def load_playlist(self):
-        """Load the selected playlist"""
-        selected_playlist = self.playlist_combo.currentText()
-        if not selected_playlist:
-            QMessageBox.warning(self, "Warning", "Please select a playlist first")
-            return
-
-        try:
-            # Get the playlist path
-            playlist_path = os.path.join(self.playlist_dir, selected_playlist)
-            if not os.path.exists(playlist_path):
-                self.statusBar.showMessage(f"Playlist file not found: {selected_playlist}")
-                return
-
-            # Load the playlist files
-            with open(playlist_path, 'r') as f:
-                files = json.load(f)
-
-            # Create a new model to rebuild the tree
-            new_model = QStandardItemModel()
-            new_model.setHorizontalHeaderLabels([""])
-
-            # Add favorites and history items first
-            favorites_item = QStandardItem(get_text('favorites', self.current_language))
-            favorites_item.setEditable(False)
-            favorites_item.setData(get_text('favorites', self.current_language), Qt.ItemDataRole.UserRole)
-            new_model.appendRow(favorites_item)
-
-            history_item = QStandardItem(get_text('play_history', self.current_language))
-            history_item.setEditable(False)
-            history_item.setData(get_text('play_history', self.current_language), Qt.ItemDataRole.UserRole)
-            new_model.appendRow(history_item)
-
-            # Add favorite items
-            for track in sorted(self.favorites):
-                if os.path.exists(track):
-                    metadata = self.get_metadata(track)
-                    display_text = f"{metadata['artist']} - {metadata['title']}"
-                    if self.show_full_path:
-                        display_text += f" ({track})"
-                    file_item = QStandardItem(display_text)
-                    file_item.setData(track, Qt.ItemDataRole.UserRole)
-                    file_item.setEditable(False)
-                    favorites_item.appendRow(file_item)
-
-            # Add history items
-            for track in self.play_history:
-                if os.path.exists(track):
-                    metadata = self.get_metadata(track)
-                    display_text = f"{metadata['artist']} - {metadata['title']}"
-                    if self.show_full_path:
-                        display_text += f" ({track})"
-                    file_item = QStandardItem(display_text)
-                    file_item.setData(track, Qt.ItemDataRole.UserRole)
-                    file_item.setEditable(False)
-                    history_item.appendRow(file_item)
-
-            # Add playlist item
-            playlist_item = QStandardItem(selected_playlist)
-            new_model.appendRow(playlist_item)
-
-            # Add files to playlist
-            for file in files:
-                if os.path.exists(file):  # Only add files that still exist
-                    file_item = QStandardItem(file if self.show_full_path else os.path.basename(file))
-                    file_item.setData(file, Qt.ItemDataRole.UserRole)
-                    playlist_item.appendRow(file_item)
-
-            # Replace the old model with the new one
-            self.tree_view.setModel(new_model)
-            self.tree_model = new_model
-
-            # Expand only drive/playlist sections, not favorites and history
-            for i in range(self.tree_model.rowCount()):
-                item = self.tree_model.item(i)
-                if item and item.text() not in [get_text('favorites', self.current_language), get_text('play_history', self.current_language)]:
-                    index = self.tree_model.indexFromItem(item)
-                    self.tree_view.expand(index)
-
-            # Update filtered files
-            self.filtered_files = files
-            self.statusBar.showMessage(f"Loaded {len(files)} tracks from {selected_playlist}")
-
-            # Update file count
-            self.update_file_count()
-
-        except Exception as e:
-            self.statusBar.showMessage(f"Error loading playlist: {str(e)}")
-            print(f"Error in load_playlist: {str(e)}")
-
-    def refresh_drives(self):
-        """Quick scan for available drives"""
-        # Get currently available drives with simple error handling
-        self.available_drives = []
-        
-        for drive in range(65, 91):  # A-Z
-            drive_letter = f"{chr(drive)}:"
-            try:
-                if os.path.exists(drive_letter):
-                    self.available_drives.append(drive_letter)
-            except Exception as e:
-                print(f"Error checking drive {drive_letter}: {str(e)}")
-                continue
-
-        # Update combo box with both saved and available drives
-        self.drive_combo.clear()
-
-        # Add saved drives first
-        saved_drives = list(self.saved_files.keys())
-        if saved_drives:
-            self.drive_combo.addItem("--- Saved Drives ---")
-            for drive in saved_drives:
-                status = "✓" if drive in self.available_drives else "✗"
-                self.drive_combo.addItem(f"{drive} {status}")
-
-        # Add available drives that aren't saved
-        new_drives = [d for d in self.available_drives if d not in self.saved_files]
-        if new_drives:
-            self.drive_combo.addItem("--- Available Drives ---")
-            for drive in new_drives:
-                self.drive_combo.addItem(f"{drive} (New)")
-
-        self.statusBar.showMessage(f"Found {len(self.available_drives)} available drives")
-
-    def on_drive_selected(self, index):
-        """Handle drive selection"""
-        selected_text = self.drive_combo.currentText()
-        if selected_text and not selected_text.startswith("---"):
-            # Extract drive letter from the display text
-            drive = selected_text.split()[0]
-            self.current_drive = drive
-
-            # Check if drive has saved files
-            if drive in self.saved_files:
-                # Count file types
-                file_types = {}
-                for file in self.saved_files[drive]:
-                    ext = os.path.splitext(file)[1].lower()
-                    file_types[ext] = file_types.get(ext, 0) + 1
-
-                # Create type info string
-                type_info = []
-                for ext, count in file_types.items():
-                    type_info.append(f"{ext}: {count}")
-
-                # Update status bar
-                self.statusBar.showMessage(
-                    f"Drive {drive} heeft {len(self.saved_files[drive])} bestanden - {', '.join(type_info)}")
-            else:
-                self.statusBar.showMessage(f"Drive {drive} heeft geen opgeslagen bestanden")
-
-    def read_saved_files(self):
-        selected_text = self.drive_combo.currentText()
-        if not selected_text or selected_text.startswith("---"):
-            QMessageBox.warning(self, "Warning", "Please select a drive first")
-            return
-
-        # Extract drive letter from the display text
-        selected_drive = selected_text.split()[0]
-        self.current_drive = selected_drive
-
-        try:
-            # Create a new model to rebuild the tree
-            new_model = QStandardItemModel()
-            new_model.setHorizontalHeaderLabels([""])
-
-            # Add favorites and history items first
-            favorites_item = QStandardItem(get_text('favorites', self.current_language))
-            favorites_item.setEditable(False)
-            favorites_item.setData(get_text('favorites', self.current_language), Qt.ItemDataRole.UserRole)
-            new_model.appendRow(favorites_item)
-
-            history_item = QStandardItem(get_text('play_history', self.current_language))
-            history_item.setEditable(False)
-            history_item.setData(get_text('play_history', self.current_language), Qt.ItemDataRole.UserRole)
-            new_model.appendRow(history_item)
-
-            # Add favorite items
-            for track in sorted(self.favorites):
-                if os.path.exists(track):
-                    metadata = self.get_metadata(track)
-                    display_text = f"{metadata['artist']} - {metadata['title']}"
-                    if self.show_full_path:
-                        display_text += f" ({track})"
-                    file_item = QStandardItem(display_text)
-                    file_item.setData(track, Qt.ItemDataRole.UserRole)
-                    file_item.setEditable(False)
-                    favorites_item.appendRow(file_item)
-
-            # Add history items
-            for track in self.play_history:
-                if os.path.exists(track):
-                    metadata = self.get_metadata(track)
-                    display_text = f"{metadata['artist']} - {metadata['title']}"
-                    if self.show_full_path:
-                        display_text += f" ({track})"
-                    file_item = QStandardItem(display_text)
-                    file_item.setData(track, Qt.ItemDataRole.UserRole)
-                    file_item.setEditable(False)
-                    history_item.appendRow(file_item)
-
-            # Create drive item
-            drive_item = QStandardItem(selected_drive)
-            new_model.appendRow(drive_item)
-
-            if selected_drive in self.saved_files:
-                # Store original files if this is the first time loading this drive
-                if not self.append_checkbox.isChecked():
-                    self.original_files = self.saved_files[selected_drive].copy()
-                    self.filtered_files = self.original_files.copy()
-                else:
-                    # Add new files to original_files and filtered_files
-                    new_files = [f for f in self.saved_files[selected_drive] if f not in self.original_files]
-                    self.original_files.extend(new_files)
-                    self.filtered_files.extend(new_files)
-
-                # Add files to the tree view in batches
-                existing_files = set()
-                for j in range(drive_item.rowCount()):
-                    child = drive_item.child(j)
-                    if child:
-                        existing_files.add(child.data(Qt.ItemDataRole.UserRole))
-
-                files_to_add = [f for f in self.saved_files[selected_drive] if f not in existing_files]
-
-                # Process in batches of 100
-                batch_size = 100
-                total_files = len(files_to_add)
-
-                for i in range(0, total_files, batch_size):
-                    batch = files_to_add[i:i + batch_size]
-                    for file in batch:
-                        try:
-                            file_item = QStandardItem(file if self.show_full_path else os.path.basename(file))
-                            file_item.setData(file, Qt.ItemDataRole.UserRole)
-                            drive_item.appendRow(file_item)
-                        except Exception as e:
-                            print(f"Error adding file {file}: {str(e)}")
-                            continue
-
-                    # Update status bar with progress
-                    progress = min(i + batch_size, total_files)
-                    self.statusBar.showMessage(f"Loading files... {progress}/{total_files}")
-                    QApplication.processEvents()
-
-                # Update drive item text with file count
-                drive_item.setText(f"{selected_drive} ({drive_item.rowCount()} bestanden)")
-
-                self.statusBar.showMessage(
-                    f"Loaded {len(self.saved_files[selected_drive])} files from {selected_drive}")
-
-                # Replace the old model with the new one
-                self.tree_view.setModel(new_model)
-                self.tree_model = new_model
-
-                # Expand only drive/playlist sections, not favorites and history
-                for i in range(self.tree_model.rowCount()):
-                    item = self.tree_model.item(i)
-                    if item and item.text() not in [get_text('favorites', self.current_language), get_text('play_history', self.current_language)]:
-                        index = self.tree_model.indexFromItem(item)
-                        self.tree_view.expand(index)
-
-                # After loading files, reload lyrics mappings
-                self.load_lyrics_mappings()
-
-                # Update file count
-                self.update_file_count()
-            else:
-                self.statusBar.showMessage(f"No saved files found for {selected_drive}")
-
-        except Exception as e:
-            self.statusBar.showMessage(f"Error loading files: {str(e)}")
-            print(f"Error in read_saved_files: {str(e)}")
-            # Try to recover by clearing the tree
-            self.tree_model.clear()
-            self.filtered_files = []
-            self.original_files = []
-            self.update_file_count()
-
-    def scan_selected_drive(self):
-        """Scan only the selected drive for audio files"""
-        selected_text = self.drive_combo.currentText()
-        if not selected_text or selected_text.startswith("---"):
-            QMessageBox.warning(self, "Warning", "Please select a drive first")
-            return
-
-        # Extract drive letter from the display text
-        drive = selected_text.split()[0]
-
-        # Show scanning popup
-        scanning_dialog = ScanningDialog(self, drive, self.current_language)
-        scanning_dialog.show()
-        QApplication.processEvents()
-
-        try:
-            # Clear existing items if not appending
-            if not self.append_checkbox.isChecked():
-                self._clear_drive_items(drive)
-
-            # Create progress dialog
-            progress = QProgressDialog(f"Scanning drive {drive}...", "Cancel", 0, 100, self)
-            progress.setWindowModality(Qt.WindowModality.WindowModal)
-            progress.setWindowTitle("Scanning Progress")
-            progress.setAutoClose(True)
-
-            # Create drive item
-            drive_item = QStandardItem(drive)
-            self.tree_model.appendRow(drive_item)
-
-            # Scan for audio files
-            audio_files = self._scan_drive_for_audio_files(drive, progress)
-
-            if not progress.wasCanceled():
-                self._process_scan_results(drive, drive_item, audio_files)
-
-        except Exception as e:
-            self.show_error("Scanning Error", f"Error scanning drive {drive}", str(e))
-        finally:
-            # Always close the scanning dialog
-            scanning_dialog.close()
-            scanning_dialog.deleteLater()
-            QApplication.processEvents()
-
-    def _clear_drive_items(self, drive):
-        """Clear existing items for a drive while preserving favorites and history"""
-        # Store favorites and history items
-        favorites_item = None
-        history_item = None
-        for i in range(self.tree_model.rowCount()):
-            item = self.tree_model.item(i)
-            if item.text() == get_text('favorites', self.current_language):
-                favorites_item = item
-            elif item.text() == get_text('play_history', self.current_language):
-                history_item = item
-
-        # Remove existing drive item if it exists
-        for i in range(self.tree_model.rowCount()):
-            item = self.tree_model.item(i)
-            if item and item.text().startswith(drive):
-                self.tree_model.removeRow(i)
-                break
-
-        # Restore favorites and history items if they existed
-        if favorites_item and not any(
-                self.tree_model.item(i).text() == get_text('favorites', self.current_language) for i in range(self.tree_model.rowCount())):
-            self.tree_model.insertRow(0, favorites_item)
-        if history_item and not any(
-                self.tree_model.item(i).text() == get_text('play_history', self.current_language) for i in range(self.tree_model.rowCount())):
-            self.tree_model.insertRow(1 if favorites_item else 0, history_item)
-
-        self.drive_file_counts.pop(drive, None)
-        self.filtered_files = [f for f in self.filtered_files if not f.startswith(drive)]
-        QApplication.processEvents()
-
-    def _scan_drive_for_audio_files(self, drive, progress):
-        """Scan drive for audio files with progress updates"""
-        audio_files = []
-        total_files = 0
-        scanned_files = 0
-
-        try:
-            # First count total files for progress bar
-            for root, _, files in os.walk(drive):
-                for file in files:
-                    if file.lower().endswith(('.mp3', '.wav', '.ogg', '.flac', '.m4a', '.aac')):
-                        total_files += 1
-                        if total_files % 100 == 0:  # Update UI periodically
-                            QApplication.processEvents()
-
-            # Now scan and add files
-            for root, _, files in os.walk(drive):
-                if progress.wasCanceled():
-                    break
-
-                for file in files:
-                    if file.lower().endswith(('.mp3', '.wav', '.ogg', '.flac', '.m4a', '.aac')):
-                        file_path = os.path.join(root, file)
-                        audio_files.append(file_path)
-                        scanned_files += 1
-
-                        # Update progress
-                        progress_value = int((scanned_files / total_files) * 100)
-                        progress.setValue(progress_value)
-                        progress.setLabelText(f"Scanning drive {drive}... ({scanned_files}/{total_files} files)")
-
-                        # Update UI periodically
-                        if scanned_files % 50 == 0:
-                            QApplication.processEvents()
-
-        except Exception as e:
-            print(f"Error scanning drive {drive}: {str(e)}")
-            # Return whatever files we found before the error
-            return audio_files
-
-        return audio_files
-
-    def _process_scan_results(self, drive, drive_item, audio_files):
-        """Process and display scan results"""
-        # Update file counts
-        file_types = {}
-        for file in audio_files:
-            ext = os.path.splitext(file)[1].lower()
-            file_types[ext] = file_types.get(ext, 0) + 1
-
-        # Update drive_file_counts
-        self.drive_file_counts[drive] = {
-            'total': len(audio_files),
-            'types': file_types
-        }
-
-        # Update drive item text
-        type_info = []
-        for ext, count in file_types.items():
-            type_info.append(f"{ext}: {count}")
-        drive_item.setText(f"{drive} ({len(audio_files)} bestanden) - {', '.join(type_info)}")
-
-        # Add files to tree view in batches
-        batch_size = 100
-        total_files = len(audio_files)
-
-        for i in range(0, total_files, batch_size):
-            batch = audio_files[i:i + batch_size]
-            for file in batch:
-                try:
-                    file_item = QStandardItem(file if self.show_full_path else os.path.basename(file))
-                    file_item.setData(file, Qt.ItemDataRole.UserRole)
-                    drive_item.appendRow(file_item)
-                    self.filtered_files.append(file)
-                except Exception as e:
-                    print(f"Error adding file {file}: {str(e)}")
-                    continue
-
-            # Update status bar with progress
-            progress = min(i + batch_size, total_files)
-            self.statusBar.showMessage(f"Loading files... {progress}/{total_files}")
-            QApplication.processEvents()
-
-        # Save the scanned files
-        self.saved_files[drive] = audio_files
-        self.save_files()
-
-        # Update status
-        self.statusBar.showMessage(get_text('scanning_complete', self.current_language, count=len(audio_files), drive=drive))
-
-        # Automatically expand the drive item
-        index = self.tree_model.indexFromItem(drive_item)
-        self.tree_view.expand(index)
-
-        # Update file count
-        self.update_file_count_status()
-
-    def update_file_count(self):
-        """Update the file count in the status bar"""
-        count = len(self.filtered_files)
-        self.file_count_label.setText(get_text('files_label', self.current_language).replace('0', str(count)))
-
-    def apply_filter(self):
-        if not self.current_drive:
-            QMessageBox.warning(self, "Warning", "Please select a drive first")
-            return
-
-        # Get filter terms
-        positive_term = self.positive_filter.text().strip().lower()
-        negative_term = self.negative_filter.text().strip().lower()
-
-        if not positive_term and not negative_term:
-            QMessageBox.warning(self, "Warning", "Please enter at least one filter term")
-            return
-
-        try:
-            # Create a new model
-            new_model = QStandardItemModel()
-            new_model.setHorizontalHeaderLabels([""])
-
-            # Create new favorites and history items
-            favorites_item = QStandardItem(get_text('favorites', self.current_language))
-            favorites_item.setEditable(False)
-            favorites_item.setData(get_text('favorites', self.current_language), Qt.ItemDataRole.UserRole)
-            new_model.appendRow(favorites_item)
-
-            history_item = QStandardItem(get_text('play_history', self.current_language))
-            history_item.setEditable(False)
-            history_item.setData(get_text('play_history', self.current_language), Qt.ItemDataRole.UserRole)
-            new_model.appendRow(history_item)
-
-            # Add favorite items
-            for track in sorted(self.favorites):
-                if os.path.exists(track):
-                    metadata = self.get_metadata(track)
-                    display_text = f"{metadata['artist']} - {metadata['title']}"
-                    if self.show_full_path:
-                        display_text += f" ({track})"
-                    file_item = QStandardItem(display_text)
-                    file_item.setData(track, Qt.ItemDataRole.UserRole)
-                    file_item.setEditable(False)
-                    favorites_item.appendRow(file_item)
-
-            # Add history items
-            for track in self.play_history:
-                if os.path.exists(track):
-                    metadata = self.get_metadata(track)
-                    display_text = f"{metadata['artist']} - {metadata['title']}"
-                    if self.show_full_path:
-                        display_text += f" ({track})"
-                    file_item = QStandardItem(display_text)
-                    file_item.setData(track, Qt.ItemDataRole.UserRole)
-                    file_item.setEditable(False)
-                    history_item.appendRow(file_item)
-
-            # Apply filter logic
-            drive_item = QStandardItem(self.current_drive)
-
-            # If this is the first filter, start with original files
-            if not self.filtered_files and self.original_files:
-                self.filtered_files = self.original_files.copy()
-
-            # Apply new filter to current filtered files
-            new_filtered_files = []
-            for file in self.filtered_files:
-                file_lower = file.lower()
-                # Check both positive and negative conditions
-                if (not positive_term or positive_term in file_lower) and \
-                        (not negative_term or negative_term not in file_lower):
-                    file_item = QStandardItem(file if self.show_full_path else os.path.basename(file))
-                    file_item.setData(file, Qt.ItemDataRole.UserRole)  # Store full path
-                    drive_item.appendRow(file_item)
-                    new_filtered_files.append(file)
-
-            self.filtered_files = new_filtered_files
-
-            if drive_item.rowCount() > 0:
-                new_model.appendRow(drive_item)
-                self.statusBar.showMessage(f"Filter applied. Found {len(self.filtered_files)} matching files")
-
-                # Replace the old model with the new one
-                self.tree_view.setModel(new_model)
-                self.tree_model = new_model
-
-                # Automatically expand all items
-                for i in range(self.tree_model.rowCount()):
-                    index = self.tree_model.indexFromItem(self.tree_model.item(i))
-                    self.tree_view.expand(index)
-            else:
-                self.statusBar.showMessage("No files match the filter criteria")
-
-            # Update file count
-            self.update_file_count()
-
-        except Exception as e:
-            self.statusBar.showMessage(f"Error applying filter: {str(e)}")
-            print(f"Error in apply_filter: {str(e)}")
-            # Try to recover by resetting the filter
-            self.reset_filter()
-
-    def reset_filter(self):
-        """Reset the filter to show all files from the current drive"""
-        if not self.current_drive:
-            QMessageBox.warning(self, "Warning", "Please select a drive first")
-            return
-
-        try:
-            # Create a new model to rebuild the tree safely
-            new_model = QStandardItemModel()
-            new_model.setHorizontalHeaderLabels([""])
-
-            # Add favorites and history items first
-            favorites_item = QStandardItem(get_text('favorites', self.current_language))
-            favorites_item.setEditable(False)
-            favorites_item.setData(get_text('favorites', self.current_language), Qt.ItemDataRole.UserRole)
-            new_model.appendRow(favorites_item)
-
-            history_item = QStandardItem(get_text('play_history', self.current_language))
-            history_item.setEditable(False)
-            history_item.setData(get_text('play_history', self.current_language), Qt.ItemDataRole.UserRole)
-            new_model.appendRow(history_item)
-
-            # Add favorite items
-            for track in sorted(self.favorites):
-                if os.path.exists(track):
-                    metadata = self.get_metadata(track)
-                    display_text = f"{metadata['artist']} - {metadata['title']}"
-                    if self.show_full_path:
-                        display_text += f" ({track})"
-                    file_item = QStandardItem(display_text)
-                    file_item.setData(track, Qt.ItemDataRole.UserRole)
-                    file_item.setEditable(False)
-                    favorites_item.appendRow(file_item)
-
-            # Add history items
-            for track in self.play_history:
-                if os.path.exists(track):
-                    metadata = self.get_metadata(track)
-                    display_text = f"{metadata['artist']} - {metadata['title']}"
-                    if self.show_full_path:
-                        display_text += f" ({track})"
-                    file_item = QStandardItem(display_text)
-                    file_item.setData(track, Qt.ItemDataRole.UserRole)
-                    file_item.setEditable(False)
-                    history_item.appendRow(file_item)
-
-            # Create drive item
-            drive_item = QStandardItem(self.current_drive)
-
-            if self.current_drive in self.saved_files:
-                self.filtered_files = self.saved_files[self.current_drive].copy()
-                for file in self.filtered_files:
-                    file_item = QStandardItem(file if self.show_full_path else os.path.basename(file))
-                    file_item.setData(file, Qt.ItemDataRole.UserRole)  # Store full path
-                    drive_item.appendRow(file_item)
-                self.statusBar.showMessage(f"Reset filter. Showing all {len(self.filtered_files)} files")
-            else:
-                self.statusBar.showMessage("No files found for current drive")
-
-            new_model.appendRow(drive_item)
-            self.positive_filter.clear()
-            self.negative_filter.clear()
-
-            # Replace the old model with the new one
-            self.tree_view.setModel(new_model)
-            self.tree_model = new_model
-
-            # Expand only drive/playlist sections, not favorites and history
-            for i in range(self.tree_model.rowCount()):
-                item = self.tree_model.item(i)
-                if item and item.text() not in [get_text('favorites', self.current_language), get_text('play_history', self.current_language)]:
-                    index = self.tree_model.indexFromItem(item)
-                    self.tree_view.expand(index)
-
-            # Update file count
-            self.update_file_count()
-
-        except Exception as e:
-            self.statusBar.showMessage(f"Error resetting filter: {str(e)}")
-            print(f"Error in reset_filter: {str(e)}")
-            # Try to recover by creating a minimal model
-            try:
-                self.tree_model.clear()
-                self.filtered_files = []
-                self.update_file_count()
-            except:
-                pass
-
-    def save_filtered_list(self):
-        if not self.filtered_files:
-            QMessageBox.warning(self, "Warning", "No filtered list to save")
-            return
-
-        # Create and show the dialog
-        dialog = PlaylistNameDialog(self)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            name = dialog.get_name()
-            if not name:
-                QMessageBox.warning(self, "Warning", "Please enter a playlist name")
-                return
-
-            # Ensure .json extension
-            if not name.endswith('.json'):
-                name += '.json'
-
-            # Ask for save location
-            playlist_path, _ = QFileDialog.getSaveFileName(
-                self,
-                "Save Playlist",
-                os.path.join(self.playlist_dir, name),
-                "JSON Files (*.json)"
-            )
-
-            if playlist_path:
-                try:
-                    # Update playlist directory to the directory of the saved file
-                    self.playlist_dir = os.path.dirname(playlist_path)
-                    self.save_config()
-
-                    with open(playlist_path, 'w') as f:
-                        json.dump(self.filtered_files, f)
-                    self.statusBar.showMessage(f"Playlist '{name}' saved successfully")
-                    # Refresh playlist list
-                    self.refresh_playlists()
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"Error saving playlist: {str(e)}")
-                    self.statusBar.showMessage(f"Error saving playlist: {str(e)}")
-
-    def play_selected_track(self, index):
-        """Handle double click on track"""
-        item = self.tree_model.itemFromIndex(index)
-        if not item:  # Skip if no item
-            return
-
-        # Handle double click on favorites or history section
-        if not item.parent() and item.text() in [get_text('favorites', self.current_language), get_text('play_history', self.current_language)]:
-            # Toggle expansion state
-            if self.tree_view.isExpanded(index):
-                self.tree_view.collapse(index)
-            else:
-                self.tree_view.expand(index)
-            return
-
-        if not item.parent():  # Skip if not a file
-            return
-
-        # Get the full path from the item's data
-        file_path = item.data(Qt.ItemDataRole.UserRole)
-        if not file_path:  # Fallback to text if no data
-            file_path = item.text()
-
-        # Play the selected track
-        self.play_selected_track_by_path(file_path)
-
-    def play_pause(self):
-        if not self.current_track:
-            return
-
-        if self.is_playing:
-            # Store current position before pausing
-            self.pause_position = pygame.mixer.music.get_pos() / 1000.0
-            pygame.mixer.music.pause()
-            self.play_button.setText("Play")
-            self.is_playing = False
-            self.statusBar.showMessage("Playback paused")
-            self.position_timer.stop()
-        else:
-            # Use play_selected_track_by_path for consistency
-            if self.pause_position > 0:
-                # Resume from pause position
-                self.play_selected_track_by_path(self.current_track)
-            else:
-                # Start from beginning
-                self.play_selected_track_by_path(self.current_track)
-
-    def stop_playback(self):
-        """Stop the current playback"""
-        try:
-            # Stop the music
-            pygame.mixer.music.stop()
-
-            # Reset playback state
-            self.play_button.setText("Play")
-            self.is_playing = False
-            self.statusBar.showMessage("Playback stopped")
-            self.position_timer.stop()
-            self.progress_bar.setValue(0)
-            self.current_time_label.setText("00:00")
-            self.total_time_label.setText("00:00")
-            self.pause_position = 0
-
-            # Clear lyrics display
-            if hasattr(self, 'lyrics_display'):
-                self.lyrics_display.clear()
-
-            # Stop SRT display if open
-            if self.srt_display and self.srt_display.isVisible():
-                self.srt_display.stop_display()
-                self.srt_display.close()
-                self.srt_display = None
-
-        except Exception as e:
-            self.statusBar.showMessage(f"Error stopping playback: {str(e)}")
-            print(f"Error in stop_playback: {str(e)}")
-
-    def closeEvent(self, event):
-        """Handle application close"""
-        try:
-            # Stop playback and cleanup
-            self.stop_playback()
-
-            # Stop timers
-            self.position_timer.stop()
-            self.status_restore_timer.stop()
-
-            # Close pygame mixer
-            pygame.mixer.quit()
-
-            # Close any open ODT documents
-            if hasattr(self, 'lyrics_dialog') and self.lyrics_dialog:
-                self.lyrics_dialog.close()
-
-            # Close SRT display if open
-            if hasattr(self, 'srt_display') and self.srt_display:
-                self.srt_display.close()
-
-            # Save configuration
-            self.save_config()
-
-            # Accept the close event
-            event.accept()
-
-        except Exception as e:
-            print(f"Error during application close: {str(e)}")
-            event.accept()  # Still close the application even if there's an error
-
-    def show_help(self):
-        """Show the help dialog"""
-        dialog = HelpDialog(self, self.current_language)
-        dialog.exec()
-
-    def get_lyrics_path(self, music_file, extension='.txt'):
-        """Get the path for the lyrics file corresponding to a music file"""
-        # First check if there's a mapping for this music file
-        if music_file in self.lyrics_mapping:
-            return self.lyrics_mapping[music_file]
-
-        # If no mapping, use the default naming convention
-        base_name = os.path.splitext(os.path.basename(music_file))[0]
-        return os.path.join(self.lyrics_dir, f"{base_name}{extension}")
-
-    def get_metadata(self, file_path):
-        """Get metadata from audio file with cache size management"""
-        if file_path in self.metadata_cache:
-            # Move to end of dict (most recently used)
-            metadata = self.metadata_cache.pop(file_path)
-            self.metadata_cache[file_path] = metadata
-            return metadata
-
-        try:
-            audio = File(file_path)
-            metadata = {}
-
-            # Try to get metadata from ID3 tags
-            if audio is not None:
-                metadata = {
-                    "title": audio.get("title", [""])[0],
-                    "artist": audio.get("artist", [""])[0],
-                    "album": audio.get("album", [""])[0]
-                }
-
-            # If title or artist is missing, try to parse from filename
-            filename = os.path.splitext(os.path.basename(file_path))[0]
-            if not metadata.get("title") or not metadata.get("artist"):
-                # Try to split on common separators
-                for separator in [" - ", "-", "_", " – "]:
-                    if separator in filename:
-                        parts = filename.split(separator, 1)
-                        if len(parts) == 2:
-                            if not metadata.get("artist"):
-                                metadata["artist"] = parts[0].strip()
-                            if not metadata.get("title"):
-                                metadata["title"] = parts[1].strip()
-                            break
-
-            # If still no title, use filename
-            if not metadata.get("title"):
-                metadata["title"] = filename
-
-            # If still no artist, use Unknown
-            if not metadata.get("artist"):
-                metadata["artist"] = get_text('unknown_artist', self.current_language)
-
-            # Ensure album is set
-            if not metadata.get("album"):
-                metadata["album"] = get_text('unknown_album', self.current_language)
-
-            # Manage cache size
-            if len(self.metadata_cache) >= self.metadata_cache_size_limit:
-                # Remove oldest entry (first in dict)
-                self.metadata_cache.pop(next(iter(self.metadata_cache)))
-
-            # Store in cache
-            self.metadata_cache[file_path] = metadata
-            return metadata
-
-        except Exception as e:
-            error_msg = f"Fout bij lezen metadata: {str(e)}"
-            print(error_msg)  # Log for debugging
-            self.statusBar.showMessage(error_msg)  # Show to user
-
-            # Try to parse from filename as fallback
-            filename = os.path.splitext(os.path.basename(file_path))[0]
-            for separator in [" - ", "-", "_", " – "]:
-                if separator in filename:
-                    parts = filename.split(separator, 1)
-                    if len(parts) == 2:
-                        return {
-                            "title": parts[1].strip(),
-                            "artist": parts[0].strip(),
-                            "album": get_text('unknown_album', self.current_language)
-                        }
-            return {
-                "title": filename,
-                "artist": get_text('unknown_artist', self.current_language),
-                "album": get_text('unknown_album', self.current_language)
-            }
-
-    def show_error(self, title, message, details=None):
-        """Show error message to user with optional details"""
-        error_dialog = QMessageBox(self)
-        error_dialog.setIcon(QMessageBox.Icon.Critical)
-        error_dialog.setWindowTitle(title)
-        error_dialog.setText(message)
-        if details:
-            error_dialog.setDetailedText(details)
-        error_dialog.exec()
-        self.statusBar.showMessage(message)
-
-    def load_lyrics(self, music_file):
-        """Load lyrics for a music file with improved error handling"""
-        if not music_file:
-            self.show_error("Fout", "Geen muziekbestand geselecteerd")
-            return
-
-        try:
-            # Clear current lyrics display first
-            self._clear_lyrics_display()
-
-            # Get current mappings
-            mapping = self.lyrics_mapping.get(music_file, {})
-            text_path = None
-            srt_path = None
-
-            if isinstance(mapping, dict):
-                text_path = mapping.get('text_path')
-                srt_path = mapping.get('srt_path')
-            else:
-                # Handle old format
-                if mapping and isinstance(mapping, str):  # Ensure mapping is a string
-                    ext = os.path.splitext(mapping)[1].lower()
-                    if ext == '.srt':
-                        srt_path = mapping
-                    else:
-                        text_path = mapping
-
-            # Try to load text lyrics first
-            text_loaded = False
-            if text_path and isinstance(text_path, str) and os.path.exists(text_path):
-                ext = os.path.splitext(text_path)[1].lower()
-                if ext == '.odt':
-                    text_loaded = self._load_odt_file(text_path)
-                else:
-                    text_loaded = self._load_txt_file(text_path)
-
-            # If no text lyrics found from mapping, try to find one with same name
-            if not text_loaded:
-                text_loaded = self._try_load_text_lyrics(music_file)
-
-            # Handle SRT display
-            if self.srt_display and self.srt_display.isVisible():
-                # Try to load SRT from mapping first
-                if srt_path and isinstance(srt_path, str) and os.path.exists(srt_path):
-                    self._load_srt_file(srt_path)
-                else:
-                    # Try to find SRT with same name
-                    base_name = os.path.splitext(os.path.basename(music_file))[0]
-                    srt_path = os.path.join(self.lyrics_dir, f"{base_name}.srt")
-                    if os.path.exists(srt_path):
-                        self._load_srt_file(srt_path)
-                    else:
-                        # No SRT file found, clear the display
-                        self.srt_display.stop_display()
-                        self.srt_display.subtitle_label.clear()
-
-            # If no lyrics found at all, show a message
-            if not text_loaded and not (self.srt_display and self.srt_display.isVisible()):
-                if hasattr(self, 'lyrics_display'):
-                    self.lyrics_display.setText("Geen songtekst gevonden")
-                self.statusBar.showMessage("Geen songtekst gevonden voor dit nummer")
-
-        except Exception as e:
-            self.show_error("Onverwachte fout", "Fout bij laden songtekst", str(e))
-            if hasattr(self, 'lyrics_display'):
-                self.lyrics_display.setText("Fout bij laden songtekst")
-
-    def _clear_lyrics_display(self):
-        """Clear the current lyrics display"""
-        self.current_lyrics = ""
-        if hasattr(self, 'lyrics_display'):
-            self.lyrics_display.clear()
-
-    def _try_load_mapped_lyrics(self, music_file):
-        """Try to load lyrics from mapping"""
-        if music_file not in self.lyrics_mapping:
-            return False
-
-        mapping = self.lyrics_mapping[music_file]
-        lyrics_path = None
-        file_type = None
-
-        if isinstance(mapping, dict):
-            lyrics_path = mapping.get('path')
-            file_type = mapping.get('type')
-        else:
-            lyrics_path = mapping
-            # Determine file type from extension
-            ext = os.path.splitext(lyrics_path)[1].lower()
-            if ext == '.odt':
-                file_type = "ODT"
-            elif ext == '.srt':
-                file_type = "SRT"
-            else:
-                file_type = "TXT"
-
-        if not lyrics_path:
-            self.show_error("Fout", "Geen songtekst pad gevonden in mapping")
-            return False
-
-        if not os.path.exists(lyrics_path):
-            self.show_error("Fout", f"Songtekst bestand niet gevonden: {os.path.basename(lyrics_path)}")
-            return False
-
-        try:
-            if file_type == "SRT":
-                # For SRT files, only load in the main display if no karaoke window is open
-                if not self.srt_display or not self.srt_display.isVisible():
-                    return self._load_srt_file(lyrics_path)
-                return True
-            elif file_type == "ODT":
-                return self._load_odt_file(lyrics_path)
-            elif file_type == "TXT":
-                return self._load_txt_file(lyrics_path)
-        except Exception as e:
-            self.show_error("Fout", "Fout bij laden songtekst", str(e))
-            return False
-
-    def _load_odt_file(self, odt_path):
-        """Load and display ODT file"""
-        try:
-            doc = load(odt_path)
-            text_content = []
-            for para in doc.getElementsByType(text.P):
-                text_content.append(teletype.extractText(para))
-            self.current_lyrics = '\n'.join(text_content)
-            if hasattr(self, 'lyrics_display'):
-                self.lyrics_display.setText(self.current_lyrics)
-            self.statusBar.showMessage(f"ODT bestand geladen: {os.path.basename(odt_path)}")
-            return True
-        except Exception as e:
-            self.show_error("Fout", f"Fout bij laden ODT bestand: {str(e)}")
-            return False
-
-    def _load_txt_file(self, txt_path):
-        """Load and display TXT file"""
-        try:
-            # Try UTF-8 first
-            try:
-                with open(txt_path, 'r', encoding='utf-8') as f:
-                    self.current_lyrics = f.read()
-                    if hasattr(self, 'lyrics_display'):
-                        self.lyrics_display.setText(self.current_lyrics)
-                    self.statusBar.showMessage(f"TXT bestand geladen: {os.path.basename(txt_path)}")
-                    return True
-            except UnicodeDecodeError:
-                with open(txt_path, 'r', encoding='latin-1') as f:
-                    self.current_lyrics = f.read()
-                    if hasattr(self, 'lyrics_display'):
-                        self.lyrics_display.setText(self.current_lyrics)
-                    self.statusBar.showMessage(f"TXT bestand geladen (latin-1): {os.path.basename(txt_path)}")
-                    return True
-        except Exception as e:
-            self.show_error("Fout", f"Fout bij laden TXT bestand: {str(e)}")
-            return False
-
-    def _try_load_text_lyrics(self, music_file):
-        """Try to load text lyrics (ODT or TXT) for a music file"""
-        base_name = os.path.splitext(os.path.basename(music_file))[0]
-
-        # Try ODT first
-        odt_path = os.path.join(self.lyrics_dir, f"{base_name}.odt")
-        if os.path.exists(odt_path):
-            return self._load_odt_file(odt_path)
-
-        # Try TXT
-        txt_path = os.path.join(self.lyrics_dir, f"{base_name}.txt")
-        if os.path.exists(txt_path):
-            return self._load_txt_file(txt_path)
-
-        return False
-
-    def edit_lyrics(self):
-        """Open dialog to edit lyrics"""
-        if not self.current_track:
-            QMessageBox.warning(self, "Waarschuwing", "Selecteer eerst een nummer")
-            return
-
-        try:
-            # Get current mappings for this track
-            current_mappings = self.lyrics_mapping.get(self.current_track, {})
-            if isinstance(current_mappings, dict):
-                current_text_file = current_mappings.get('text_path')
-                current_srt_file = current_mappings.get('srt_path')
-            else:
-                # Convert old format to new format
-                current_text_file = current_mappings if current_mappings else None
-                current_srt_file = None
-                if current_text_file:
-                    ext = os.path.splitext(current_text_file)[1].lower()
-                    if ext == '.srt':
-                        current_srt_file = current_text_file
-                        current_text_file = None
-
-            # Show mapping dialog
-            mapping_dialog = LyricsMappingDialog(self, self.current_track, current_text_file, current_srt_file, self.current_language)
-            if mapping_dialog.exec() == QDialog.DialogCode.Accepted:
-                new_text_path = mapping_dialog.get_text_path()
-                new_srt_path = mapping_dialog.get_srt_path()
-
-                # Update mapping with both paths
-                if new_text_path or new_srt_path:
-                    self.lyrics_mapping[self.current_track] = {
-                        'text_path': new_text_path,
-                        'srt_path': new_srt_path
-                    }
-                    # Update lyrics directory to the directory of the selected file
-                    if new_text_path:
-                        self.lyrics_dir = os.path.dirname(new_text_path)
-                    elif new_srt_path:
-                        self.lyrics_dir = os.path.dirname(new_srt_path)
-                    self.save_config()
-
-                    # Load and display the lyrics immediately
-                    self.load_lyrics(self.current_track)
-                    return  # Exit after successful mapping and loading
-
-            # If we get here, either the mapping dialog was cancelled or no file was selected
-            # Show edit dialog for existing lyrics
-            self.lyrics_dialog = LyricsDialog(self, self.current_language)
-
-            # If we have current lyrics, show them in the dialog
-            if hasattr(self, 'lyrics_display'):
-                current_text = self.lyrics_display.toPlainText()
-                if current_text and current_text != "Geen songtekst gevonden":
-                    self.lyrics_dialog.set_lyrics(current_text)
-
-            if self.lyrics_dialog.exec() == QDialog.DialogCode.Accepted:
-                new_lyrics = self.lyrics_dialog.get_lyrics()
-                self.current_lyrics = new_lyrics
-
-                # Ask user which format to save in
-                format_dialog = QMessageBox(self)
-                format_dialog.setWindowTitle("Opslaan als")
-                format_dialog.setText("In welk formaat wil je de songtekst opslaan?")
-                format_dialog.addButton("TXT", QMessageBox.ButtonRole.AcceptRole)
-                format_dialog.addButton("ODT", QMessageBox.ButtonRole.AcceptRole)
-                format_dialog.addButton("Annuleren", QMessageBox.ButtonRole.RejectRole)
-
-                result = format_dialog.exec()
-
-                if result == 0:  # TXT
-                    try:
-                        lyrics_path = self.get_lyrics_path(self.current_track, '.txt')
-                        with open(lyrics_path, 'w', encoding='utf-8') as f:
-                            f.write(new_lyrics)
-                            # Update mapping while preserving SRT path if it exists
-                            current_mapping = self.lyrics_mapping.get(self.current_track, {})
-                            if isinstance(current_mapping, dict):
-                                current_mapping['text_path'] = lyrics_path
-                            else:
-                                current_mapping = {'text_path': lyrics_path}
-                            self.lyrics_mapping[self.current_track] = current_mapping
-                            self.save_config()
-                            if hasattr(self, 'lyrics_display'):
-                                self.lyrics_display.setText(new_lyrics)
-                        self.statusBar.showMessage("Songtekst opgeslagen als TXT")
-                    except Exception as e:
-                        self.statusBar.showMessage(f"Fout bij opslaan TXT: {str(e)}")
-
-                elif result == 1:  # ODT
-                    try:
-                        lyrics_path = self.get_lyrics_path(self.current_track, '.odt')
-                        doc = OpenDocumentText()
-                        para = text.P()
-                        para.addText(new_lyrics)
-                        doc.text.addElement(para)
-                        doc.save(lyrics_path)
-                        # Update mapping while preserving SRT path if it exists
-                        current_mapping = self.lyrics_mapping.get(self.current_track, {})
-                        if isinstance(current_mapping, dict):
-                            current_mapping['text_path'] = lyrics_path
-                        else:
-                            current_mapping = {'text_path': lyrics_path}
-                        self.lyrics_mapping[self.current_track] = current_mapping
-                        self.save_config()
-                        if hasattr(self, 'lyrics_display'):
-                            self.lyrics_display.setText(new_lyrics)
-                        self.statusBar.showMessage("Songtekst opgeslagen als ODT")
-                    except Exception as e:
-                        self.statusBar.showMessage(f"Fout bij opslaan ODT: {str(e)}")
-
-        except Exception as e:
-            self.statusBar.showMessage(f"Fout bij bewerken songtekst: {str(e)}")
-            print(f"Error in edit_lyrics: {str(e)}")
-
-    def toggle_path_display(self):
-        """Toggle between showing full path and filename only"""
-        # Update button text first
-        self.show_full_path = not self.show_full_path
-        self.toggle_view_button.setText("Toon Bestandsnaam" if self.show_full_path else "Toon Pad")
-
-        # Show status message
-        self.statusBar.showMessage("Moment geduld, lijst wordt bijgewerkt...")
-        QApplication.processEvents()  # Force UI update
-
-        # Update all items in the tree view
-        self.update_tree_view_display()
-
-        # Clear status message
-        self.statusBar.showMessage("Lijst bijgewerkt")
-
-    def update_tree_view_display(self):
-        """Update the display of all items in the tree view while preserving favorites and history"""
-        try:
-            # Create a new model instead of clearing the old one
-            new_model = QStandardItemModel()
-            new_model.setHorizontalHeaderLabels([""])
-
-            # Copy all items to the new model
-            root = self.tree_model.invisibleRootItem()
-            for i in range(root.rowCount()):
-                old_item = root.child(i)
-                if not old_item:
-                    continue
-
-                # Create new item with same text
-                new_item = QStandardItem(old_item.text())
-                new_item.setData(old_item.data(Qt.ItemDataRole.UserRole), Qt.ItemDataRole.UserRole)
-                new_item.setEditable(False)
-
-                # Copy all child items
-                for j in range(old_item.rowCount()):
-                    old_child = old_item.child(j)
-                    if not old_child:
-                        continue
-
-                    # Get the file path from data
-                    file_path = old_child.data(Qt.ItemDataRole.UserRole)
-                    if not file_path:
-                        file_path = old_child.text()
-                    
-                    # Create new child item
-                    new_child = QStandardItem()
-                    new_child.setData(file_path, Qt.ItemDataRole.UserRole)
-                    new_child.setEditable(False)
-                    
-                    # For main list items (not favorites/history), use the original display text
-                    if old_item.text() not in [get_text('favorites', self.current_language), get_text('play_history', self.current_language)]:
-                        # For main list, just use the filename without path
-                        if self.show_full_path:
-                            new_child.setText(f"{os.path.basename(file_path)} ({file_path})")
-                        else:
-                            new_child.setText(os.path.basename(file_path))
-                    else:
-                        # For favorites and history, use the artist - title format
-                        display_text = old_child.text()
-                        if " - " in display_text:
-                            # If it's already in artist - title format, extract just that part
-                            display_text = display_text.split(" (")[0]
-                        
-                        if self.show_full_path:
-                            new_child.setText(f"{display_text} ({file_path})")
-                        else:
-                            new_child.setText(display_text)
-
-                    new_item.appendRow(new_child)
-
-                    # Process events periodically to keep UI responsive
-                    if j % 100 == 0:  # Update every 100 items
-                        QApplication.processEvents()
-
-                new_model.appendRow(new_item)
-
-            # Replace the old model with the new one
-            self.tree_view.setModel(new_model)
-            self.tree_model = new_model
-
-            # Expand all items
-            for i in range(self.tree_model.rowCount()):
-                index = self.tree_model.indexFromItem(self.tree_model.item(i))
-                self.tree_view.expand(index)
-
-        except Exception as e:
-            self.show_error("Fout", "Fout bij bijwerken weergave", str(e))
-            self.statusBar.showMessage("Fout bij bijwerken weergave")
-
-    def scan_drives(self):
-        """Scan all available drives for audio files"""
-        # Clear existing items if not appending
-        if not self.append_checkbox.isChecked():
-            self.tree_model.clear()
-            self.drive_file_counts.clear()
-            self.filtered_files = []
-
-        # Get available drives with error handling
-        drives = []
-        for drive in range(65, 91):  # A-Z
-            drive_letter = f"{chr(drive)}:"
-            try:
-                if os.path.exists(drive_letter):
-                    drives.append(drive_letter)
-            except Exception as e:
-                print(f"Error checking drive {drive_letter}: {str(e)}")
-                continue
-
-        for drive in drives:
-            try:
-                # Check if drive already exists in the tree
-                drive_item = None
-                for i in range(self.tree_model.rowCount()):
-                    item = self.tree_model.item(i)
-                    if item.text().startswith(drive):
-                        drive_item = item
-                        break
-
-                # If drive doesn't exist, create new item
-                if not drive_item:
-                    drive_item = QStandardItem(drive)
-                    self.tree_model.appendRow(drive_item)
-
-                # Scan de schijf voor audio bestanden
-                audio_files = []
-                try:
-                    for root, _, files in os.walk(drive):
-                        for file in files:
-                            if file.lower().endswith(('.mp3', '.wav', '.ogg', '.flac', '.m4a', '.aac')):
-                                audio_files.append(os.path.join(root, file))
-                except Exception as e:
-                    print(f"Error scanning drive {drive}: {str(e)}")
-                    continue
-
-                # Update bestandsaantallen per type
-                file_types = {}
-                for file in audio_files:
-                    ext = os.path.splitext(file)[1].lower()
-                    file_types[ext] = file_types.get(ext, 0) + 1
-
-                # Update of voeg toe aan drive_file_counts
-                if drive in self.drive_file_counts:
-                    # Update existing counts
-                    self.drive_file_counts[drive]['total'] += len(audio_files)
-                    for ext, count in file_types.items():
-                        self.drive_file_counts[drive]['types'][ext] = self.drive_file_counts[drive]['types'].get(ext,
-                                                                                                                 0) + count
-                else:
-                    # Add new drive counts
-                    self.drive_file_counts[drive] = {
-                        'total': len(audio_files),
-                        'types': file_types
-                    }
-
-                # Update de drive item tekst met aantallen
-                type_info = []
-                for ext, count in self.drive_file_counts[drive]['types'].items():
-                    type_info.append(f"{ext}: {count}")
-                drive_item.setText(
-                    f"{drive} ({self.drive_file_counts[drive]['total']} bestanden) - {', '.join(type_info)}")
-
-                # Voeg bestanden toe aan de tree
-                for file in audio_files:
-                    # Check if file already exists under this drive
-                    file_exists = False
-                    for j in range(drive_item.rowCount()):
-                        child_item = drive_item.child(j)
-                        if child_item.data(Qt.ItemDataRole.UserRole) == file:
-                            file_exists = True
-                            break
-
-                    if not file_exists:
-                        file_item = QStandardItem(file if self.show_full_path else os.path.basename(file))
-                        file_item.setData(file, Qt.ItemDataRole.UserRole)
-                        drive_item.appendRow(file_item)
-                        self.filtered_files.append(file)
-
-                # Update status bar
-                self.update_file_count_status()
-
-            except Exception as e:
-                print(f"Fout bij scannen van {drive}: {e}")
-                continue
-
-        # Automatically expand all drive items
-        for i in range(self.tree_model.rowCount()):
-            index = self.tree_model.indexFromItem(self.tree_model.item(i))
-            self.tree_view.expand(index)
-
-        self.statusBar.showMessage("Scanning complete")
-
-    def update_file_count_status(self):
-        total_files = sum(counts['total'] for counts in self.drive_file_counts.values())
-        type_counts = {}
-
-        for drive_counts in self.drive_file_counts.values():
-            for ext, count in drive_counts['types'].items():
-                type_counts[ext] = type_counts.get(ext, 0) + count
-
-        type_info = []
-        for ext, count in type_counts.items():
-            type_info.append(f"{ext}: {count}")
-
-        self.file_count_label.setText(f"Totaal: {total_files} bestanden - {', '.join(type_info)}")
-
-    def save_files(self):
-        """Save the current file list to disk"""
-        try:
-            with open('saved_files.json', 'w') as f:
-                json.dump(self.saved_files, f)
-            self.statusBar.showMessage("Files saved successfully")
-        except Exception as e:
-            self.statusBar.showMessage(f"Error saving files: {str(e)}")
-
-    def save_config(self):
-        """Save configuration to file"""
-        try:
-            self.config.update({
-                'lyrics_dir': self.lyrics_dir,
-                'playlist_dir': self.playlist_dir,
-                'lyrics_mapping': self.lyrics_mapping,
-                'favorites': list(self.favorites),  # Save favorites
-                'play_history': self.play_history,  # Save history
-                'language': self.current_language  # Save language preference
-            })
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f)
-        except Exception as e:
-            self.statusBar.showMessage(get_text('error_saving_config', self.current_language, error=str(e)))
-
-    def change_lyrics_dir(self):
-        """Change the lyrics directory"""
-        new_dir = QFileDialog.getExistingDirectory(
-            self,
-            "Selecteer Songteksten Map",
-            self.lyrics_dir
-        )
-        if new_dir:
-            self.lyrics_dir = new_dir
-            self.lyrics_dir_path.setText(new_dir)
-            self.save_config()
-
-    def load_lyrics_mappings(self):
-        """Load lyrics mappings from config file with improved error handling"""
-        try:
-            if not os.path.exists(self.config_file):
-                print("Config file not found, starting with empty mappings")
-                self.lyrics_mapping = {}
-                return
-
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
-
-            # Get mappings with fallback to empty dict
-            mappings = config.get('lyrics_mapping', {})
-            if not isinstance(mappings, dict):
-                print("Invalid mappings format in config, resetting to empty dict")
-                self.lyrics_mapping = {}
-                return
-
-            # Validate and clean up mappings
-            valid_mappings = {}
-            for music_file, mapping in mappings.items():
-                try:
-                    # Skip if music file doesn't exist
-                    if not os.path.exists(music_file):
-                        print(f"Skipping mapping for non-existent music file: {music_file}")
-                        continue
-
-                    # Handle both old and new mapping formats
-                    if isinstance(mapping, dict):
-                        # New format: {'text_path': path, 'srt_path': path}
-                        text_path = mapping.get('text_path')
-                        srt_path = mapping.get('srt_path')
-                        
-                        # Validate paths if they exist
-                        if text_path and not os.path.exists(text_path):
-                            print(f"Text file not found: {text_path}")
-                            text_path = None
-                        if srt_path and not os.path.exists(srt_path):
-                            print(f"SRT file not found: {srt_path}")
-                            srt_path = None
-                            
-                        # Only keep mapping if at least one valid path exists
-                        if text_path or srt_path:
-                            valid_mappings[music_file] = {
-                                'text_path': text_path,
-                                'srt_path': srt_path
-                            }
-                    elif isinstance(mapping, str):
-                        # Old format: direct path string
-                        if os.path.exists(mapping):
-                            ext = os.path.splitext(mapping)[1].lower()
-                            if ext == '.srt':
-                                valid_mappings[music_file] = {'srt_path': mapping}
-                            else:
-                                valid_mappings[music_file] = {'text_path': mapping}
-                        else:
-                            print(f"Lyrics file not found: {mapping}")
-                    else:
-                        print(f"Invalid mapping format for {music_file}: {mapping}")
-
-                except Exception as e:
-                    print(f"Error processing mapping for {music_file}: {str(e)}")
-                    continue
-
-            # Update mappings with validated data
-            self.lyrics_mapping = valid_mappings
-            print(f"Successfully loaded {len(valid_mappings)} valid lyrics mappings")
-
-            # Save the cleaned up mappings
-            self.save_config()
-
-        except json.JSONDecodeError as e:
-            print(f"Error decoding config file: {str(e)}")
-            self.lyrics_mapping = {}
-            # Create backup of corrupted config
-            try:
-                backup_path = f"{self.config_file}.bak"
-                if os.path.exists(self.config_file):
-                    import shutil
-                    shutil.copy2(self.config_file, backup_path)
-                    print(f"Created backup of corrupted config at: {backup_path}")
-            except Exception as backup_error:
-                print(f"Failed to create config backup: {str(backup_error)}")
-        except Exception as e:
-            print(f"Unexpected error loading lyrics mappings: {str(e)}")
-            self.lyrics_mapping = {}
-
-    def show_context_menu(self, position):
-        """Show context menu for tree view items"""
-        index = self.tree_view.indexAt(position)
-        if not index.isValid():
-            return
-
-        item = self.tree_model.itemFromIndex(index)
-        if not item:
-            return
-
-        # Create context menu
-        menu = QMenu(self)
-
-        if not item.parent():  # This is a playlist or drive item
-            if item.text().endswith('.json'):  # This is a playlist
-                delete_playlist_action = menu.addAction("Verwijder playlist")
-                action = menu.exec(self.tree_view.viewport().mapToGlobal(position))
-                if action == delete_playlist_action:
-                    self.delete_playlist(item.text())
-        else:  # This is a file item
-            delete_action = menu.addAction("Verwijder uit playlist")
-            action = menu.exec(self.tree_view.viewport().mapToGlobal(position))
-            if action == delete_action:
-                self.delete_track_from_playlist(item)
-
-    def delete_playlist(self, playlist_name):
-        """Delete a playlist file"""
-        try:
-            # Show confirmation dialog
-            reply = QMessageBox.question(
-                self,
-                "Bevestig verwijderen",
-                f"Weet je zeker dat je de playlist '{playlist_name}' wilt verwijderen?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No
-            )
-
-            if reply == QMessageBox.StandardButton.Yes:
-                # Get full path to playlist file
-                playlist_path = os.path.join(self.playlist_dir, playlist_name)
-
-                # Delete the file
-                if os.path.exists(playlist_path):
-                    os.remove(playlist_path)
-
-                    # Remove from combo box
-                    index = self.playlist_combo.findText(playlist_name)
-                    if index >= 0:
-                        self.playlist_combo.removeItem(index)
-
-                    # Remove from tree view
-                    for i in range(self.tree_model.rowCount()):
-                        item = self.tree_model.item(i)
-                        if item and item.text() == playlist_name:
-                            self.tree_model.removeRow(i)
-                            break
-
-                    # Clear filtered files if this was the current playlist
-                    if self.current_track and playlist_name == self.playlist_combo.currentText():
-                        self.filtered_files = []
-                        self.update_file_count()
-
-                    self.statusBar.showMessage(f"Playlist '{playlist_name}' verwijderd")
-                else:
-                    self.statusBar.showMessage(f"Playlist '{playlist_name}' niet gevonden")
-
-        except Exception as e:
-            self.show_error("Fout", f"Fout bij verwijderen playlist: {str(e)}")
-
-    def delete_track_from_playlist(self, item):
-        """Delete a track from the playlist"""
-        if not item or not item.parent():
-            return
-
-        # Get the file path
-        file_path = item.data(Qt.ItemDataRole.UserRole)
-        if not file_path:
-            file_path = item.text()
-
-        # Show confirmation dialog
-        reply = QMessageBox.question(
-            self,
-            "Bevestig verwijderen",
-            f"Weet je zeker dat je '{os.path.basename(file_path)}' uit de playlist wilt verwijderen?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
-        )
-
-        if reply == QMessageBox.StandardButton.Yes:
-            # Remove from filtered files
-            if file_path in self.filtered_files:
-                self.filtered_files.remove(file_path)
-
-            # Remove from tree view
-            parent = item.parent()
-            parent.removeRow(item.row())
-
-            # Update status
-            self.statusBar.showMessage(f"Nummer verwijderd uit playlist")
-
-            # Update file count
-            self.update_file_count()
-
-            # If this was the current track, stop playback
-            if file_path == self.current_track:
-                self.stop_playback()
-
-    def play_on_click(self, index):
-        """Handle single click on track"""
-        item = self.tree_model.itemFromIndex(index)
-        if not item or not item.parent():  # Skip if not a file
-            return
-
-        # Get the full path from the item's data
-        file_path = item.data(Qt.ItemDataRole.UserRole)
-        if not file_path:  # Fallback to text if no data
-            file_path = item.text()
-
-        # Update current track and load lyrics immediately
-        self.current_track = file_path
-        self.load_lyrics(file_path)  # Load lyrics immediately on selection
-        self.statusBar.showMessage(f"Selected: {os.path.basename(file_path)}")
-
-        # If we're already playing, start the new track
-        if self.is_playing:
-            self.play_selected_track_by_path(file_path)
-        else:
-            # Just update the UI to show it's selected
-            self.progress_bar.setValue(0)
-            self.current_time_label.setText("00:00")
-            self.total_time_label.setText("00:00")
-
-    def toggle_srt_display(self):
-        """Toggle the SRT display window"""
-        if not self.current_track:
-            QMessageBox.warning(self, "Waarschuwing", "Selecteer eerst een nummer")
-            return
-
-        try:
-            if self.srt_display is None or not self.srt_display.isVisible():
-                # Create and show SRT display
-                self.srt_display = SRTDisplayDialog(self, self.current_language)
-
-                # Try to load SRT file
-                srt_loaded = False
-
-                # First try mapping
-                if self.current_track in self.lyrics_mapping:
-                    mapping = self.lyrics_mapping[self.current_track]
-                    if isinstance(mapping, dict):
-                        srt_path = mapping.get('srt_path')
-                        if srt_path and isinstance(srt_path, str) and os.path.exists(srt_path):
-                            srt_loaded = self.srt_display.load_srt(srt_path)
-                    elif isinstance(mapping, str) and mapping.lower().endswith('.srt'):
-                        if os.path.exists(mapping):
-                            srt_loaded = self.srt_display.load_srt(mapping)
-
-                # If not loaded from mapping, try to find SRT file with same name
-                if not srt_loaded:
-                    base_name = os.path.splitext(os.path.basename(self.current_track))[0]
-                    srt_path = os.path.join(self.lyrics_dir, f"{base_name}.srt")
-                    if os.path.exists(srt_path):
-                        srt_loaded = self.srt_display.load_srt(srt_path)
-
-                if srt_loaded:
-                    self.srt_display.show()
-                    self.statusBar.showMessage("Karaoke venster geopend")
-                else:
-                    # Clean up SRT display if no file was found
-                    if self.srt_display:
-                        self.srt_display.close()
-                        self.srt_display.deleteLater()
-                        self.srt_display = None
-                    QMessageBox.information(self, "Geen karaoke bestand",
-                                            "Er is geen SRT bestand gevonden voor dit nummer.\n\n"
-                                            "Je kunt een SRT bestand maken via 'Bewerk Songtekst' en dan 'Koppelen'.")
-            else:
-                # Hide SRT display
-                if self.srt_display:
-                    self.srt_display.stop_display()
-                    self.srt_display.close()
-                    self.srt_display.deleteLater()
-                    self.srt_display = None
-                self.statusBar.showMessage("Karaoke venster gesloten")
-
-        except Exception as e:
-            # Clean up in case of error
-            if self.srt_display:
-                try:
-                    self.srt_display.stop_display()
-                    self.srt_display.close()
-                    self.srt_display.deleteLater()
-                except:
-                    pass
-                self.srt_display = None
-            self.show_error("Fout", "Fout bij openen karaoke venster", str(e))
-            self.statusBar.showMessage("Fout bij openen karaoke venster")
-
-    def keyPressEvent(self, event):
-        """Handle keyboard shortcuts"""
-        try:
-            key = event.key()
-
-            # Space bar for play/pause
-            if key == Qt.Key.Key_Space:
-                self.play_pause()
-
-            # Left/Right arrows for previous/next
-            elif key == Qt.Key.Key_Left:
-                self.play_previous_track()
-            elif key == Qt.Key.Key_Right:
-                self.play_next_track()
-
-            # F for favorite
-            elif key == Qt.Key.Key_F:
-                self.toggle_favorite()
-
-            # H for help
-            elif key == Qt.Key.Key_H:
-                self.show_help()
-
-            # L for language switch
-            elif key == Qt.Key.Key_L:
-                self.switch_language()
-
-            # M for mute
-            elif key == Qt.Key.Key_M:
-                self.toggle_mute()
-
-            # S for stop
-            elif key == Qt.Key.Key_S:
-                self.stop_playback()
-
-            # V for toggle view
-            elif key == Qt.Key.Key_V:
-                self.toggle_path_display()
-
-            # +/- for volume
-            elif key == Qt.Key.Key_Plus or key == Qt.Key.Key_Equal:
-                self.adjust_volume(0.1)  # Increase volume
-            elif key == Qt.Key.Key_Minus:
-                self.adjust_volume(-0.1)  # Decrease volume
-
-            else:
-                super().keyPressEvent(event)
-
-        except Exception as e:
-            print(f"Error in keyPressEvent: {str(e)}")
-            super().keyPressEvent(event)
-
-    def toggle_favorite(self):
-        """Toggle favorite status of current track"""
-        if not self.current_track:
-            return
-
-        if self.current_track in self.favorites:
-            self.favorites.remove(self.current_track)
-            self.statusBar.showMessage(get_text('favorite_removed', self.current_language))
-            self.favorite_button.setChecked(False)
-        else:
-            self.favorites.add(self.current_track)
-            self.statusBar.showMessage(get_text('favorite_added', self.current_language))
-            self.favorite_button.setChecked(True)
-
-        self.save_config()  # Save changes
-        self.update_favorites_display()
-
-    def toggle_mute(self):
-        """Toggle mute state"""
-        try:
-            if self.is_muted:
-                # Unmute
-                pygame.mixer.music.set_volume(self.previous_volume)
-                self.is_muted = False
-                self.statusBar.showMessage(f"Geluid aan (volume: {int(self.previous_volume * 100)}%)")
-            else:
-                # Mute
-                self.previous_volume = pygame.mixer.music.get_volume()
-                pygame.mixer.music.set_volume(0)
-                self.is_muted = True
-                self.statusBar.showMessage("Geluid uit")
-        except Exception as e:
-            print(f"Error in toggle_mute: {str(e)}")
-
-    def adjust_volume(self, delta):
-        """Adjust volume by delta (-1.0 to 1.0)"""
-        try:
-            current_volume = pygame.mixer.music.get_volume()
-            new_volume = max(0.0, min(1.0, current_volume + delta))
-            pygame.mixer.music.set_volume(new_volume)
-            self.is_muted = False
-            self.previous_volume = new_volume
-            self.statusBar.showMessage(f"Volume: {int(new_volume * 100)}%")
-        except Exception as e:
-            print(f"Error in adjust_volume: {str(e)}")
-
-    def add_to_history(self, track):
-        """Add track to play history"""
-        if track in self.play_history:
-            self.play_history.remove(track)  # Remove if already exists
-        self.play_history.insert(0, track)  # Add to front
-        if len(self.play_history) > self.max_history_items:
-            self.play_history.pop()  # Remove oldest if too many
-        self.save_config()
-        self.update_history_display()
-
-    def update_history_display(self):
-        """Update the history display in the tree view"""
-        # Verzamel alle mogelijke vertalingen van 'play_history'
-        history_names = [get_text('play_history', lang) for lang in get_available_languages()]
-        # Verwijder alle bestaande geschiedenis-secties ongeacht de taal
-        root = self.tree_model.invisibleRootItem()
-        rows_to_remove = []
-        for i in range(root.rowCount()):
-            item = root.child(i)
-            if item and item.text() in history_names:
-                rows_to_remove.append(i)
-        for i in reversed(rows_to_remove):
-            root.removeRow(i)
-        # Voeg de geschiedenis-sectie toe in de huidige taal
-        history_item = QStandardItem(get_text('play_history', self.current_language))
-        history_item.setEditable(False)
-        history_item.setData(get_text('play_history', self.current_language), Qt.ItemDataRole.UserRole)
-        # Voeg toe na favorieten (indien aanwezig)
-        fav_index = 0
-        for i in range(root.rowCount()):
-            item = root.child(i)
-            if item and item.text() == get_text('favorites', self.current_language):
-                fav_index = i + 1
-        root.insertRow(fav_index, history_item)
-        # Voeg geschiedenis-items toe
-        for track in self.play_history:
-            if os.path.exists(track):
-                metadata = self.get_metadata(track)
-                display_text = f"{metadata['artist']} - {metadata['title']}"
-                if self.show_full_path:
-                    display_text += f" ({track})"
-                file_item = QStandardItem(display_text)
-                file_item.setData(track, Qt.ItemDataRole.UserRole)
-                file_item.setEditable(False)
-                history_item.appendRow(file_item)
-
-    def update_favorites_display(self):
-        """Update the favorites display in the tree view"""
-        # Verzamel alle mogelijke vertalingen van 'favorites'
-        favorite_names = [get_text('favorites', lang) for lang in get_available_languages()]
-        # Verwijder alle bestaande favorieten-secties ongeacht de taal
-        root = self.tree_model.invisibleRootItem()
-        rows_to_remove = []
-        for i in range(root.rowCount()):
-            item = root.child(i)
-            if item and item.text() in favorite_names:
-                rows_to_remove.append(i)
-        for i in reversed(rows_to_remove):
-            root.removeRow(i)
-        # Voeg de favorieten-sectie toe in de huidige taal
-        favorites_item = QStandardItem(get_text('favorites', self.current_language))
-        favorites_item.setEditable(False)
-        favorites_item.setData(get_text('favorites', self.current_language), Qt.ItemDataRole.UserRole)
-        root.insertRow(0, favorites_item)
-        # Voeg favoriete items toe
-        for track in sorted(self.favorites):
-            if os.path.exists(track):
-                metadata = self.get_metadata(track)
-                display_text = f"{metadata['artist']} - {metadata['title']}"
-                if self.show_full_path:
-                    display_text += f" ({track})"
-                file_item = QStandardItem(display_text)
-                file_item.setData(track, Qt.ItemDataRole.UserRole)
-                file_item.setEditable(False)
-                favorites_item.appendRow(file_item)
-
-    def dragEnterEvent(self, event):
-        """Handle drag enter event"""
-        if event.source() == self.tree_view:
-            event.acceptProposedAction()
-
-    def dropEvent(self, event):
-        """Handle drop event"""
-        if event.source() == self.tree_view:
-            # Get the source and target items
-            source_index = self.tree_view.currentIndex()
-            target_index = self.tree_view.indexAt(event.pos())
-
-            if not source_index.isValid() or not target_index.isValid():
-                return
-
-            source_item = self.tree_model.itemFromIndex(source_index)
-            target_item = self.tree_model.itemFromIndex(target_index)
-
-            # Only allow moving items within the same playlist
-            if source_item.parent() and target_item.parent() and source_item.parent() == target_item.parent():
-                # Get the playlist name
-                playlist_name = source_item.parent().text()
-
-                # Get the file paths
-                source_path = source_item.data(Qt.ItemDataRole.UserRole)
-                target_path = target_item.data(Qt.ItemDataRole.UserRole)
-
-                if source_path and target_path:
-                    # Update the filtered files list
-                    source_idx = self.filtered_files.index(source_path)
-                    target_idx = self.filtered_files.index(target_path)
-
-                    # Move the item
-                    self.filtered_files.insert(target_idx, self.filtered_files.pop(source_idx))
-
-                    # Update the tree view
-                    source_row = source_item.row()
-                    target_row = target_item.row()
-
-                    # Move the item in the tree
-                    source_item.parent().takeChild(source_row)
-                    source_item.parent().insertRow(target_row, source_item)
-
-                    # Save the updated playlist
-                    self.save_playlist(playlist_name)
-
-                    # Update status
-                    self.statusBar.showMessage(f"Nummer verplaatst in {playlist_name}")
-
-                    # Update playlist info
-                    self.update_playlist_info()
-
-    def save_playlist(self, playlist_name):
-        """Save the current playlist to file"""
-        try:
-            playlist_path = os.path.join(self.playlist_dir, playlist_name)
-            with open(playlist_path, 'w') as f:
-                json.dump(self.filtered_files, f)
-            self.statusBar.showMessage(f"Playlist '{playlist_name}' opgeslagen")
-        except Exception as e:
-            self.statusBar.showMessage(f"Fout bij opslaan playlist: {str(e)}")
-
-    def update_playlist_info(self):
-        """Update the playlist information in the status bar"""
-        if self.current_track and self.filtered_files:
-            current_idx = self.filtered_files.index(self.current_track)
-            total_tracks = len(self.filtered_files)
-            self.playlist_info_label.setText(f"Track {current_idx + 1} van {total_tracks}")
-
-            # Update next track info
-            if current_idx < total_tracks - 1:
-                next_track = self.filtered_files[current_idx + 1]
-                metadata = self.get_metadata(next_track)
-                self.next_track_label.setText(f"Volgende: {metadata['artist']} - {metadata['title']}")
-            else:
-                self.next_track_label.setText("Volgende: Einde afspeellijst")
-        else:
-            self.playlist_info_label.setText("")
-            self.next_track_label.setText("")
-
-    def cleanup_saved_files(self):
-        """Clean up saved_files.json to remove references to non-existent drives and files"""
-        try:
-            if not os.path.exists('saved_files.json'):
-                return
-            
-            with open('saved_files.json', 'r') as f:
-                loaded_saved_files = json.load(f)
-            
-            # Filter out non-existent drives and files
-            cleaned_saved_files = {}
-            for drive, files in loaded_saved_files.items():
-                try:
-                    if os.path.exists(drive):
-                        # Only keep files that still exist
-                        valid_files = [f for f in files if os.path.exists(f)]
-                        if valid_files:
-                            cleaned_saved_files[drive] = valid_files
-                        else:
-                            print(f"Drive {drive} exists but no valid files found, removing from saved files")
-                    else:
-                        print(f"Drive {drive} not found, removing from saved files")
-                except Exception as e:
-                    print(f"Error validating drive {drive}: {str(e)}")
-                    continue
-            
-            # Save cleaned version back to file
-            with open('saved_files.json', 'w') as f:
-                json.dump(cleaned_saved_files, f)
-            
-            print(f"Cleaned saved_files.json: {len(loaded_saved_files)} drives -> {len(cleaned_saved_files)} drives")
-            
-        except Exception as e:
-            print(f"Error cleaning up saved_files.json: {str(e)}")
-
-    def check_path_exists_with_timeout(self, path, timeout=1.0):
-        """Check if a path exists with a timeout"""
-        import threading
-        
-        path_exists = [False]
-        path_error = [None]
-        
-        def check_path():
-            try:
-                path_exists[0] = os.path.exists(path)
-            except Exception as e:
-                path_error[0] = e
-        
-        # Start path check in separate thread
-        thread = threading.Thread(target=check_path)
-        thread.daemon = True
-        thread.start()
-        
-        # Wait for the specified timeout
-        thread.join(timeout=timeout)
-        
-        if thread.is_alive():
-            print(f"Timeout checking path: {path}")
-            return False
-        
-        if path_error[0]:
-            print(f"Error checking path {path}: {str(path_error[0])}")
-            return False
-        
-        return path_exists[0]
-
-    def manual_cleanup(self):
-        """Manually clean up saved files with user confirmation and progress"""
-        try:
-            # Check if saved_files.json exists
-            if not os.path.exists('saved_files.json'):
-                QMessageBox.information(self, "Cleanup", "No saved files to clean up.")
-                return
-            
-            # Show confirmation dialog
-            reply = QMessageBox.question(
-                self,
-                "Cleanup Confirmation",
-                "This will remove references to non-existent drives and files.\n"
-                "This process may take some time if you have network drives.\n\n"
-                "Do you want to continue?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No
-            )
-            
-            if reply == QMessageBox.StandardButton.No:
-                return
-            
-            # Load saved files
-            with open('saved_files.json', 'r') as f:
-                loaded_saved_files = json.load(f)
-            
-            # Create progress dialog
-            progress = QProgressDialog("Cleaning up saved files...", "Cancel", 0, len(loaded_saved_files), self)
-            progress.setWindowModality(Qt.WindowModality.WindowModal)
-            progress.setWindowTitle("Cleanup Progress")
-            progress.setAutoClose(True)
-            
-            # Filter out non-existent drives and files
-            cleaned_saved_files = {}
-            processed_drives = 0
-            
-            for drive, files in loaded_saved_files.items():
-                if progress.wasCanceled():
-                    break
-                
-                try:
-                    progress.setLabelText(f"Checking drive {drive}...")
-                    progress.setValue(processed_drives)
-                    QApplication.processEvents()
-                    
-                    if os.path.exists(drive):
-                        # Check files with progress updates
-                        valid_files = []
-                        for i, file in enumerate(files):
-                            if progress.wasCanceled():
-                                break
-                            
-                            # Update progress every 10 files
-                            if i % 10 == 0:
-                                progress.setLabelText(f"Checking drive {drive}... ({i}/{len(files)} files)")
-                                QApplication.processEvents()
-                            
-                            if os.path.exists(file):
-                                valid_files.append(file)
-                        
-                        if valid_files:
-                            cleaned_saved_files[drive] = valid_files
-                            print(f"Drive {drive}: {len(valid_files)} valid files kept")
-                        else:
-                            print(f"Drive {drive}: no valid files found, removing")
-                    else:
-                        print(f"Drive {drive}: not found, removing")
-                        
-                except Exception as e:
-                    print(f"Error processing drive {drive}: {str(e)}")
-                    continue
-                
-                processed_drives += 1
-            
-            progress.setValue(len(loaded_saved_files))
-            
-            if not progress.wasCanceled():
-                # Save cleaned version back to file
-                with open('saved_files.json', 'w') as f:
-                    json.dump(cleaned_saved_files, f)
-                
-                # Show results
-                removed_drives = len(loaded_saved_files) - len(cleaned_saved_files)
-                total_files_before = sum(len(files) for files in loaded_saved_files.values())
-                total_files_after = sum(len(files) for files in cleaned_saved_files.values())
-                
-                QMessageBox.information(
-                    self,
-                    "Cleanup Complete",
-                    f"Cleanup completed successfully!\n\n"
-                    f"Drives removed: {removed_drives}\n"
-                    f"Files removed: {total_files_before - total_files_after}\n"
-                    f"Remaining drives: {len(cleaned_saved_files)}\n"
-                    f"Remaining files: {total_files_after}"
-                )
-                
-                # Refresh the drive list
-                self.refresh_drives()
-            else:
-                QMessageBox.information(self, "Cleanup Cancelled", "Cleanup was cancelled by user.")
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Cleanup Error", f"Error during cleanup: {str(e)}")
-            print(f"Error in manual_cleanup: {str(e)}")
-
-    def switch_language(self):
-        """Switch to the next available language"""
-        available_languages = get_available_languages()
-        current_index = available_languages.index(self.current_language)
-        next_index = (current_index + 1) % len(available_languages)
-        new_language = available_languages[next_index]
-        
-        self.current_language = new_language
-        
-        # Update window title
-        self.setWindowTitle(get_text('window_title', self.current_language))
-        
-        # Update all other UI elements (including help button)
-        self.update_ui_language()
-        
-        # Save language preference
-        self.save_config()
-        
-        # Update language status
-        self.update_language_status()
-
-    def update_ui_language(self):
-        """Update all UI elements to use the current language"""
-        try:
-            # Update window title
-            self.setWindowTitle(get_text('window_title', self.current_language))
-            
-            # Update language button (always use globe emoji)
-            self.language_button.setText("🌐")
-            self.language_button.setToolTip(get_text('language_tooltip', self.current_language))
-            
-            # Update help button
-            if hasattr(self, 'help_button'):
-                self.help_button.setText(get_text('help_button', self.current_language))
-            
-            # Update basic controls directly
-            self.drive_combo.setPlaceholderText(get_text('select_drive', self.current_language))
-            self.refresh_button.setText(get_text('refresh_drives', self.current_language))
-            self.read_button.setText(get_text('read_files', self.current_language))
-            self.toggle_view_button.setText(get_text('toggle_view', self.current_language))
-            self.scan_button.setText(get_text('scan_drive', self.current_language))
-            self.cleanup_button.setText(get_text('cleanup_files', self.current_language))
-            
-            # Update lyrics directory controls
-            self.lyrics_dir_label.setText(get_text('lyrics_dir_label', self.current_language))
-            self.lyrics_dir_button.setText(get_text('change_lyrics_dir', self.current_language))
-            
-            # Update lyrics panel
-            self.lyrics_title.setText(get_text('lyrics_title', self.current_language))
-            self.edit_button.setText(get_text('edit_lyrics_button', self.current_language))
-            self.srt_button.setText(get_text('show_karaoke_button', self.current_language))
-            
-            # Update tooltips
-            self.toggle_view_button.setToolTip(get_text('toggle_view_tooltip', self.current_language))
-            self.scan_button.setToolTip(get_text('scan_button_tooltip', self.current_language))
-            self.read_button.setToolTip(get_text('read_button_tooltip', self.current_language))
-            self.refresh_button.setToolTip(get_text('refresh_button_tooltip', self.current_language))
-            
-            # Update playlist controls
-            self.playlist_combo.setPlaceholderText(get_text('select_playlist', self.current_language))
-            
-            # Update filter placeholders
-            self.positive_filter.setPlaceholderText(get_text('positive_filter', self.current_language))
-            self.negative_filter.setPlaceholderText(get_text('negative_filter', self.current_language))
-            
-            # Update append checkbox
-            self.append_checkbox.setText(get_text('append_checkbox', self.current_language))
-            
-            # Update playback controls
-            self.play_button.setText(get_text('play_button', self.current_language))
-            self.stop_button.setText(get_text('stop_button', self.current_language))
-            self.prev_button.setText(get_text('prev_button', self.current_language))
-            self.next_button.setText(get_text('next_button', self.current_language))
-            self.favorite_button.setText(get_text('favorite_button', self.current_language))
-            
-            # Update tooltips
-            self.play_button.setToolTip(get_text('play_tooltip', self.current_language))
-            self.stop_button.setToolTip(get_text('stop_tooltip', self.current_language))
-            self.prev_button.setToolTip(get_text('prev_tooltip', self.current_language))
-            self.next_button.setToolTip(get_text('next_tooltip', self.current_language))
-            self.favorite_button.setToolTip(get_text('favorite_tooltip', self.current_language))
-            
-            # Update file count label
-            current_count = self.file_count_label.text().split(': ')[-1] if ': ' in self.file_count_label.text() else '0'
-            self.file_count_label.setText(get_text('files_label', self.current_language).replace('0', current_count))
-            
-            # Update status bar
-            try:
-                language_text = get_text('current_language', self.current_language, 
-                                       language_name=get_language_name(self.current_language))
-                # Fallback als placeholder niet vervangen is
-                if '{language_name}' in language_text:
-                    language_name = get_language_name(self.current_language)
-                    language_text = language_text.replace('{language_name}', language_name)
-                self.statusBar.showMessage(language_text)
-            except Exception as e:
-                print(f"Error formatting current language: {e}")
-                # Simpele fallback
-                language_name = get_language_name(self.current_language)
-                self.statusBar.showMessage(f"Current language: {language_name}")
-            
-            # Update tree view favorites and history section names
-            self.update_favorites_display()
-            self.update_history_display()
-            
-        except Exception as e:
-            print(f"Error updating UI language: {str(e)}")
-            # Continue with basic updates even if some fail
-            pass
-
-    def restore_language_status(self):
-        """Restore the language status text if no other important status is shown"""
-        if self.language_status_text:
-            current_status = self.statusBar.currentMessage()
-            # Only restore if current status is empty or contains language-related text
-            if not current_status or any(keyword in current_status.lower() for keyword in ['language', 'taal', 'sprache', 'langue']):
-                self.statusBar.showMessage(self.language_status_text)
-    
-    def update_language_status(self):
-        """Update the language status text and start the restore timer"""
-        # Eenvoudige mapping van taal codes naar namen
-        language_names = {
-            'nl': 'Nederlands',
-            'en': 'English', 
-            'de': 'Deutsch',
-            'fr': 'Français'
-        }
-        
-        # Haal de taalnaam op uit de mapping
-        language_name = language_names.get(self.current_language, self.current_language)
-        
-        # Maak de status tekst
-        status_texts = {
-            'nl': f'Huidige taal: {language_name}',
-            'en': f'Current language: {language_name}',
-            'de': f'Aktuelle Sprache: {language_name}',
-            'fr': f'Langue actuelle: {language_name}'
-        }
-        
-        # Kies de juiste status tekst voor de huidige taal
-        status_text = status_texts.get(self.current_language, status_texts['en'])
-        
-        # Update de status
-        self.language_status_text = status_text
-        self.statusBar.showMessage(status_text)
-        
-        # Start de restore timer
-        self.status_restore_timer.start()
-
-
-class ScanningDialog(QDialog):
-    def __init__(self, parent=None, drive=None, language='nl'):
-        super().__init__(parent)
-        self.language = language
-        self.setWindowTitle(get_text('scanning_title', self.language))
-        self.setModal(True)
-
-        # Create layout
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(20, 20, 20, 20)  # Add some padding
-
-        # Create and style the label
-        label = QLabel(get_text('scanning_message', self.language, drive=drive))
-        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(label)
-
-        # Remove window frame and set window flags
-        self.setWindowFlags(
-            Qt.WindowType.FramelessWindowHint |  # No window frame
-            Qt.WindowType.Tool |  # Tool window (stays on top)
-            Qt.WindowType.WindowStaysOnTopHint  # Always on top
-        )
-
-        # Set background color
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                border: 2px solid #555555;
-                border-radius: 10px;
-            }
-        """)
-
-        # Size the dialog based on content
-        self.adjustSize()
-
-        # Center the dialog in the parent window
-        if parent:
-            parent_geometry = parent.geometry()
-            dialog_geometry = self.geometry()
-            x = parent_geometry.x() + (parent_geometry.width() - dialog_geometry.width()) // 2
-            y = parent_geometry.y() + (parent_geometry.height() - dialog_geometry.height()) // 2
-            self.move(x, y)
-
-    def closeEvent(self, event):
-        event.accept()
-
-    def showEvent(self, event):
-        """Ensure dialog stays centered when shown"""
-        super().showEvent(event)
-        if self.parent():
-            parent_geometry = self.parent().geometry()
-            dialog_geometry = self.geometry()
-            x = parent_geometry.x() + (parent_geometry.width() - dialog_geometry.width()) // 2
-            y = parent_geometry.y() + (parent_geometry.height() - dialog_geometry.height()) // 2
-            self.move(x, y)
-
-
-if __name__ == "__main__":
-    try:
-        app = QApplication(sys.argv)
-        player = MusicPlayer()
-        player.show()
-        sys.exit(app.exec())
-    except Exception as e:
-        print(f"Error starting application: {str(e)}")
-        # Try to show a simple error dialog if possible
-        try:
-            import tkinter as tk
-            from tkinter import messagebox
-            root = tk.Tk()
-            root.withdraw()  # Hide the main window
-            messagebox.showerror("Startup Error", f"Error starting HAL's Music Player:\n{str(e)}\n\nPlease check that all required files are present.")
-            root.destroy()
-        except:
-            # If tkinter is not available, just print to console
-            print("Failed to show error dialog. Please check the console for error details.")
+import sys
+import os
+import io
+import json
+import queue
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing
+import threading
+import time
+import numpy as np
+from odf import text, teletype
+from odf.opendocument import OpenDocumentText, load
+from mutagen import File
+from audio_backend import DEFAULT_PROFILE, MIXER_PROFILES, PygameBackend, create_backend
+from library_index import LibraryIndex, SearchCancelled, SmartPlaylist
+from library_query import QueryError, is_structured, parse_query
+from loudness import analyze_track, init_worker
+from play_queue import REPEAT_ALL, REPEAT_MODES, PlayQueue
+from waveform import WaveformCache, peaks, resample
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QLabel, QPushButton,
+                             QTreeView, QVBoxLayout, QHBoxLayout, QWidget,
+                             QLineEdit, QMessageBox, QProgressDialog, QStatusBar,
+                             QComboBox, QFileDialog, QGroupBox, QFormLayout,
+                             QDialog, QDialogButtonBox, QProgressBar, QScrollArea,
+                             QTextEdit, QSplitter, QCheckBox, QFrame, QMenu,
+                             QStyledItemDelegate, QSpinBox)
+from PyQt6.QtCore import (Qt, QDir, QTimer, QEvent, QTime, QRect, QPoint, QSortFilterProxyModel,
+                          QModelIndex, QItemSelectionModel, QObject, pyqtSignal, QLineF)
+from PyQt6.QtGui import QStandardItemModel, QStandardItem, QPixmap, QFont, QPainter, QColor, QPalette
+
+# Import the language system
+try:
+    from languages_db import get_text, get_language_name, get_available_languages, add_language
+except ImportError:
+    # Fallback if languages_db.py is not found
+    def get_text(key, language='nl', **kwargs):
+        return key
+    def get_language_name(language_code):
+        return language_code
+    def get_available_languages():
+        return ['nl', 'en']
+    def add_language(language_code, language_name, translations):
+        pass
+
+# Item data role that marks the favorites and history section headers
+SECTION_ROLE = Qt.ItemDataRole.UserRole + 1
+# Item data role with the "artist - title" label of favorites and history rows
+TRACK_LABEL_ROLE = Qt.ItemDataRole.UserRole + 2
+
+
+class PlaylistNameDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Save Playlist")
+        self.setModal(True)
+
+        layout = QVBoxLayout(self)
+
+        # Create input field
+        self.name_input = QLineEdit()
+        self.name_input.setPlaceholderText("Enter playlist name")
+        layout.addWidget(self.name_input)
+
+        # Create buttons
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
+        )
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    def get_name(self):
+        return self.name_input.text().strip()
+
+
+class HelpDialog(QDialog):
+    def __init__(self, parent=None, language='nl'):
+        super().__init__(parent)
+        self.language = language
+        self.setWindowTitle(get_text('help_title', self.language))
+        self.setModal(True)
+        self.setMinimumSize(800, 600)
+
+        # Create help images directory if it doesn't exist
+        self.help_images_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "help_images")
+        if not os.path.exists(self.help_images_dir):
+            os.makedirs(self.help_images_dir)
+
+        layout = QVBoxLayout(self)
+
+        # Create scroll area for content
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        content = QWidget()
+        content_layout = QVBoxLayout(content)
+
+        # Add title
+        title = QLabel(get_text('help_title', self.language))
+        title.setStyleSheet("font-size: 18px; font-weight: bold;")
+        content_layout.addWidget(title)
+
+        # Add sections (dynamically from language file)
+        for i in range(1, 12):
+            section_title = get_text(f'help_section_{i}_title', self.language)
+            section_text = get_text(f'help_section_{i}_text', self.language)
+            image_name = [
+                "scan_drives.png", "read_files.png", "toggle_view.png", "tree_view.png", "filter.png",
+                "playback.png", "favorites.png", "lyrics.png", "playlists.png", "file_types.png", "config.png"
+            ][i-1]
+
+            # Add section title
+            section_title_label = QLabel(section_title)
+            section_title_label.setStyleSheet("font-size: 14px; font-weight: bold; margin-top: 20px;")
+            content_layout.addWidget(section_title_label)
+
+            # Add section text
+            section_text_label = QLabel(section_text)
+            section_text_label.setWordWrap(True)
+            content_layout.addWidget(section_text_label)
+
+            # Add section image
+            image_path = os.path.join(self.help_images_dir, image_name)
+            if os.path.exists(image_path):
+                pixmap = QPixmap(image_path)
+                # Scale image if it's too large
+                if pixmap.width() > 700:
+                    pixmap = pixmap.scaled(700, 400, Qt.AspectRatioMode.KeepAspectRatio)
+                image_label = QLabel()
+                image_label.setPixmap(pixmap)
+                image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                content_layout.addWidget(image_label)
+            else:
+                # Show placeholder if image doesn't exist
+                placeholder = QLabel(get_text('image_not_found', self.language, image=image_name))
+                placeholder.setStyleSheet("font-style: italic; color: gray;")
+                content_layout.addWidget(placeholder)
+
+        # Add close button
+        close_button = QPushButton(get_text('close_button', self.language))
+        close_button.clicked.connect(self.accept)
+        content_layout.addWidget(close_button, alignment=Qt.AlignmentFlag.AlignCenter)
+
+        scroll.setWidget(content)
+        layout.addWidget(scroll)
+
+
+class LyricsDialog(QDialog):
+    def __init__(self, parent=None, language='nl'):
+        super().__init__(parent)
+        self.language = language
+        self.setWindowTitle(get_text('lyrics_title', self.language))
+        self.setModal(True)
+        self.setMinimumSize(600, 400)
+
+        layout = QVBoxLayout(self)
+
+        # Create text edit for lyrics
+        self.lyrics_text = QTextEdit()
+        self.lyrics_text.setReadOnly(False)  # Allow editing
+        layout.addWidget(self.lyrics_text)
+
+        # Create buttons
+        button_layout = QHBoxLayout()
+        save_button = QPushButton(get_text('save_button', self.language))
+        save_button.clicked.connect(self.save_lyrics)
+        close_button = QPushButton(get_text('close_button', self.language))
+        close_button.clicked.connect(self.accept)
+        button_layout.addWidget(save_button)
+        button_layout.addWidget(close_button)
+        layout.addLayout(button_layout)
+
+    def set_lyrics(self, lyrics):
+        self.lyrics_text.setText(lyrics)
+
+    def get_lyrics(self):
+        return self.lyrics_text.toPlainText()
+
+    def save_lyrics(self):
+        self.accept()
+
+
+class LyricsMappingDialog(QDialog):
+    def __init__(self, parent=None, music_file=None, current_text_file=None, current_srt_file=None, language='nl'):
+        super().__init__(parent)
+        self.language = language
+        self.setWindowTitle(get_text('lyrics_mapping_title', self.language))
+        self.setModal(True)
+
+        self.music_file = music_file
+        self.current_text_file = current_text_file
+        self.current_srt_file = current_srt_file
+
+        layout = QVBoxLayout(self)
+
+        # Add labels
+        music_label = QLabel(get_text('music_file_label', self.language, file=os.path.basename(music_file)))
+        layout.addWidget(music_label)
+
+        # Add text lyrics section
+        text_group = QGroupBox(get_text('text_lyrics_group', self.language))
+        text_layout = QVBoxLayout()
+
+        self.text_path = QLineEdit()
+        self.text_path.setReadOnly(True)
+        if current_text_file:
+            self.text_path.setText(current_text_file)
+
+        text_button_layout = QHBoxLayout()
+        text_browse_button = QPushButton(get_text('browse_button', self.language))
+        text_browse_button.clicked.connect(self.browse_text)
+        text_clear_button = QPushButton(get_text('clear_button', self.language))
+        text_clear_button.clicked.connect(lambda: self.text_path.clear())
+        text_button_layout.addWidget(text_browse_button)
+        text_button_layout.addWidget(text_clear_button)
+
+        text_layout.addWidget(self.text_path)
+        text_layout.addLayout(text_button_layout)
+        text_group.setLayout(text_layout)
+        layout.addWidget(text_group)
+
+        # Add SRT section
+        srt_group = QGroupBox(get_text('karaoke_group', self.language))
+        srt_layout = QVBoxLayout()
+
+        self.srt_path = QLineEdit()
+        self.srt_path.setReadOnly(True)
+        if current_srt_file:
+            self.srt_path.setText(current_srt_file)
+
+        srt_button_layout = QHBoxLayout()
+        srt_browse_button = QPushButton(get_text('browse_button', self.language))
+        srt_browse_button.clicked.connect(self.browse_srt)
+        srt_clear_button = QPushButton(get_text('clear_button', self.language))
+        srt_clear_button.clicked.connect(lambda: self.srt_path.clear())
+        srt_button_layout.addWidget(srt_browse_button)
+        srt_button_layout.addWidget(srt_clear_button)
+
+        srt_layout.addWidget(self.srt_path)
+        srt_layout.addLayout(srt_button_layout)
+        srt_group.setLayout(srt_layout)
+        layout.addWidget(srt_group)
+
+        # Add buttons
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
+        )
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    def browse_text(self):
+        """Browse for text lyrics file (TXT or ODT)"""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            get_text('select_lyrics', self.language),
+            self.parent().lyrics_dir,
+            "Text Files (*.txt);;ODT Files (*.odt)"
+        )
+
+        if file_path:
+            self.text_path.setText(file_path)
+
+    def browse_srt(self):
+        """Browse for SRT file"""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            get_text('select_karaoke', self.language),
+            self.parent().lyrics_dir,
+            "SRT Files (*.srt)"
+        )
+
+        if file_path:
+            self.srt_path.setText(file_path)
+
+    def get_text_path(self):
+        return self.text_path.text()
+
+    def get_srt_path(self):
+        return self.srt_path.text()
+
+    def load_lyrics(self, music_file):
+        """Load lyrics for a music file with improved error handling"""
+        if not music_file:
+            self.show_error("Fout", "Geen muziekbestand geselecteerd")
+            return
+
+        print(f"Loading lyrics for: {music_file}")  # Debug logging
+
+        try:
+            # Clear current lyrics display first
+            self._clear_lyrics_display()
+
+            # Get current mappings
+            mapping = self.lyrics_mapping.get(music_file, {})
+            text_path = None
+            srt_path = None
+
+            if isinstance(mapping, dict):
+                text_path = mapping.get('text_path')
+                srt_path = mapping.get('srt_path')
+            else:
+                # Handle old format
+                if mapping and isinstance(mapping, str):  # Ensure mapping is a string
+                    ext = os.path.splitext(mapping)[1].lower()
+                    if ext == '.srt':
+                        srt_path = mapping
+                    else:
+                        text_path = mapping
+
+            # Try to load text lyrics first
+            text_loaded = False
+            if text_path and isinstance(text_path, str) and os.path.exists(text_path):
+                ext = os.path.splitext(text_path)[1].lower()
+                if ext == '.odt':
+                    text_loaded = self._load_odt_file(text_path)
+                else:
+                    text_loaded = self._load_txt_file(text_path)
+
+            # If no text lyrics found from mapping, try to find one with same name
+            if not text_loaded:
+                text_loaded = self._try_load_text_lyrics(music_file)
+
+            # Handle SRT display
+            if self.srt_display and self.srt_display.isVisible():
+                # Try to load SRT from mapping first
+                if srt_path and isinstance(srt_path, str) and os.path.exists(srt_path):
+                    self._load_srt_file(srt_path)
+                else:
+                    # Try to find SRT with same name
+                    base_name = os.path.splitext(os.path.basename(music_file))[0]
+                    srt_path = os.path.join(self.lyrics_dir, f"{base_name}.srt")
+                    if os.path.exists(srt_path):
+                        self._load_srt_file(srt_path)
+                    else:
+                        # No SRT file found, clear the display
+                        self.srt_display.stop_display()
+                        self.srt_display.subtitle_label.clear()
+
+            # If no lyrics found at all, show a message
+            if not text_loaded and not (self.srt_display and self.srt_display.isVisible()):
+                print("No lyrics found for this track")  # Debug logging
+                if hasattr(self, 'lyrics_display'):
+                    self.lyrics_display.setText("Geen songtekst gevonden")
+                self.statusBar.showMessage("Geen songtekst gevonden voor dit nummer")
+
+        except Exception as e:
+            self.show_error("Onverwachte fout", "Fout bij laden songtekst", str(e))
+            if hasattr(self, 'lyrics_display'):
+                self.lyrics_display.setText("Fout bij laden songtekst")
+
+
+class SRTParser:
+    def __init__(self):
+        self.subtitles = []
+
+    def parse_srt(self, file_path):
+        """Parse an SRT file and return a list of subtitle entries"""
+        self.subtitles = []
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+
+            # Split into subtitle blocks
+            blocks = content.strip().split('\n\n')
+
+            for block in blocks:
+                lines = block.strip().split('\n')
+                if len(lines) >= 3:
+                    # Parse time
+                    time_line = lines[1]
+                    start_time, end_time = time_line.split(' --> ')
+
+                    # Convert time to seconds
+                    start_seconds = self.time_to_seconds(start_time)
+                    end_seconds = self.time_to_seconds(end_time)
+
+                    # Get text (can be multiple lines)
+                    text = '\n'.join(lines[2:])
+
+                    self.subtitles.append({
+                        'start': start_seconds,
+                        'end': end_seconds,
+                        'text': text
+                    })
+
+            # Sort by start time
+            self.subtitles.sort(key=lambda x: x['start'])
+            return True
+        except Exception as e:
+            print(f"Error parsing SRT file: {str(e)}")
+            return False
+
+    def time_to_seconds(self, time_str):
+        """Convert SRT time format (HH:MM:SS,mmm) to seconds"""
+        try:
+            hours, minutes, seconds = time_str.replace(',', '.').split(':')
+            return float(hours) * 3600 + float(minutes) * 60 + float(seconds)
+        except:
+            return 0.0
+
+    def get_subtitle_at_time(self, current_time):
+        """Get the subtitle text for the current time"""
+        for subtitle in self.subtitles:
+            if subtitle['start'] <= current_time <= subtitle['end']:
+                return subtitle['text']
+        return ""
+
+    def ms_until_change(self, current_time, speed=1.0):
+        """Milliseconds until a subtitle starts or ends, checked at least every second"""
+        changes = [moment for subtitle in self.subtitles
+                   for moment in (subtitle['start'], subtitle['end']) if moment > current_time]
+        if not changes:
+            return 1000
+        # Just past the boundary, the end of a subtitle is still part of it
+        return min(1000, int((min(changes) - current_time) * 1000 / speed) + 5)
+
+
+class LyricsDisplay(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setup_ui()
+        self.srt_parser = SRTParser()
+        self.current_subtitle = ""
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        # Create label for subtitle display
+        self.subtitle_label = QLabel()
+        self.subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.subtitle_label.setWordWrap(True)
+        self.subtitle_label.setStyleSheet("""
+            QLabel {
+                color: white;
+                background-color: rgba(0, 0, 0, 0.7);
+                padding: 20px;
+                border-radius: 10px;
+            }
+        """)
+
+        # Set large font
+        font = QFont()
+        font.setPointSize(24)  # Large font size
+        font.setBold(True)
+        self.subtitle_label.setFont(font)
+
+        layout.addWidget(self.subtitle_label)
+
+    def load_srt(self, file_path):
+        """Load and parse an SRT file"""
+        if self.srt_parser.parse_srt(file_path):
+            self.start_display()
+            return True
+        return False
+
+    def start_display(self):
+        """Follow the playback, update_subtitle runs on the player's frame scheduler"""
+        scheduler = getattr(self.parent(), 'frame_scheduler', None)
+        if scheduler is not None:
+            scheduler.add(self, self.update_subtitle)
+
+    def stop_display(self):
+        """Stop following the playback"""
+        scheduler = getattr(self.parent(), 'frame_scheduler', None)
+        if scheduler is not None:
+            scheduler.remove(self)
+        self.subtitle_label.clear()
+
+    def update_subtitle(self):
+        """Update the displayed subtitle, returns the ms until it can change (None: wait to be woken)"""
+        if not self.parent() or not self.parent().is_playing or not self.isVisible():
+            return None
+
+        current_time = self.parent().heard_position()
+
+        subtitle = self.srt_parser.get_subtitle_at_time(current_time)
+        if subtitle != self.current_subtitle:
+            self.current_subtitle = subtitle
+            self.subtitle_label.setText(subtitle)
+        return self.srt_parser.ms_until_change(current_time, self.parent().audio.speed)
+
+
+class SRTDisplayDialog(QDialog):
+    def __init__(self, parent=None, language='nl'):
+        super().__init__(parent)
+        self.language = language
+        self.setWindowTitle(get_text('karaoke_title', self.language))
+        self.setModal(False)  # Non-modal so it can stay open while using main window
+        self.is_fullscreen = False  # Track fullscreen state
+
+        # Set window flags for a frameless window that stays on top
+        self.setWindowFlags(
+            Qt.WindowType.FramelessWindowHint |  # No window frame
+            Qt.WindowType.Tool |  # Tool window
+            Qt.WindowType.WindowStaysOnTopHint  # Always on top
+        )
+
+        # Create main layout with no margins in fullscreen
+        self.main_layout = QVBoxLayout(self)
+        self.main_layout.setContentsMargins(20, 20, 20, 20)
+        self.main_layout.setSpacing(10)
+
+        # Create container widget for the label to control its size
+        self.label_container = QWidget()
+        self.label_container.setStyleSheet("background-color: transparent;")
+        label_container_layout = QVBoxLayout(self.label_container)
+        label_container_layout.setContentsMargins(0, 0, 0, 0)
+        label_container_layout.setSpacing(0)
+
+        # Create label for subtitle display with larger font and better wrapping
+        self.subtitle_label = QLabel()
+        self.subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.subtitle_label.setWordWrap(True)
+        self.subtitle_label.setStyleSheet("""
+            QLabel {
+                color: white;
+                background-color: rgba(0, 0, 0, 0.8);
+                padding: 30px;
+                border-radius: 15px;
+                font-size: 48px;
+                font-weight: bold;
+                min-height: 200px;
+                max-width: 1200px;
+            }
+        """)
+
+        # Set large font with better line spacing
+        font = QFont()
+        font.setPointSize(48)
+        font.setBold(True)
+        font.setStyleStrategy(QFont.StyleStrategy.PreferAntialias)
+        self.subtitle_label.setFont(font)
+
+        # Set text format for better wrapping
+        text_format = Qt.TextFormat.RichText
+        self.subtitle_label.setTextFormat(text_format)
+
+        # Add label to container
+        label_container_layout.addWidget(self.subtitle_label)
+
+        # Add container to main layout
+        self.main_layout.addWidget(self.label_container)
+
+        # Create button container widget
+        self.button_container = QWidget()
+        self.button_container.setObjectName("button_container")
+        button_layout = QHBoxLayout(self.button_container)
+        button_layout.setContentsMargins(0, 0, 0, 0)
+
+        # Add fullscreen toggle button
+        self.fullscreen_button = QPushButton(get_text('fullscreen_button', self.language))
+        self.fullscreen_button.clicked.connect(self.toggle_fullscreen)
+        self.fullscreen_button.setStyleSheet("""
+            QPushButton {
+                background-color: #3b3b3b;
+                color: white;
+                border: 1px solid #555555;
+                padding: 10px;
+                border-radius: 5px;
+                min-width: 120px;
+                margin-top: 10px;
+                font-size: 16px;
+            }
+            QPushButton:hover {
+                background-color: #4b4b4b;
+            }
+        """)
+        button_layout.addWidget(self.fullscreen_button)
+
+        # Add close button
+        self.close_button = QPushButton(get_text('close_karaoke', self.language))
+        self.close_button.clicked.connect(self.close)
+        self.close_button.setStyleSheet("""
+            QPushButton {
+                background-color: #3b3b3b;
+                color: white;
+                border: 1px solid #555555;
+                padding: 10px;
+                border-radius: 5px;
+                min-width: 100px;
+                margin-top: 10px;
+                font-size: 16px;
+            }
+            QPushButton:hover {
+                background-color: #4b4b4b;
+            }
+        """)
+        button_layout.addWidget(self.close_button)
+
+        self.main_layout.addWidget(self.button_container)
+
+        # Initialize SRT parser, the player's frame scheduler updates the subtitle
+        self.srt_parser = SRTParser()
+        self.current_subtitle = ""
+
+        # Store original geometry
+        self.normal_geometry = None
+
+        # Calculate initial window size and position
+        screen = QApplication.primaryScreen().geometry()
+        window_width = min(int(screen.width() * 0.9), 1200)
+        window_height = int(screen.height() * 0.4)
+        window_x = (screen.width() - window_width) // 2
+        window_y = int(screen.height() * 0.5)
+
+        # Set initial size and position
+        self.setFixedSize(window_width, window_height)
+        self.move(window_x, window_y)
+
+        # Make window draggable
+        self.old_pos = None
+
+    def toggle_fullscreen(self):
+        """Toggle between normal and fullscreen mode"""
+        try:
+            if not self.is_fullscreen:
+                # Store current geometry before going fullscreen
+                self.normal_geometry = self.geometry()
+
+                # Get screen geometry
+                screen = QApplication.primaryScreen().geometry()
+
+                # Hide button container
+                self.button_container.hide()
+
+                # Remove margins in fullscreen
+                self.main_layout.setContentsMargins(0, 0, 0, 0)
+                self.main_layout.setSpacing(0)
+
+                # Adjust label container and label style for fullscreen
+                self.label_container.setStyleSheet("""
+                    QWidget {
+                        background-color: rgba(0, 0, 0, 0.8);
+                        width: 100%;
+                        height: 100%;
+                    }
+                """)
+                self.subtitle_label.setStyleSheet("""
+                    QLabel {
+                        color: white;
+                        background-color: transparent;
+                        padding: 50px;
+                        border-radius: 0px;
+                        font-size: 72px;
+                        font-weight: bold;
+                        min-height: 300px;
+                        max-width: none;
+                        width: 90%;
+                        margin: 0 auto;
+                        qproperty-alignment: AlignCenter;
+                    }
+                """)
+
+                # Set fullscreen geometry and ensure label takes full width
+                self.setFixedSize(screen.width(), screen.height())
+                self.move(0, 0)
+                self.label_container.setFixedWidth(screen.width())
+                self.subtitle_label.setFixedWidth(int(screen.width() * 0.9))
+
+                # Update button text
+                self.fullscreen_button.setText(get_text('normal_screen_button', self.language))
+                self.is_fullscreen = True
+
+            else:
+                # Restore normal geometry
+                if self.normal_geometry:
+                    self.setFixedSize(self.normal_geometry.width(), self.normal_geometry.height())
+                    self.move(self.normal_geometry.x(), self.normal_geometry.y())
+
+                # Restore margins and spacing
+                self.main_layout.setContentsMargins(20, 20, 20, 20)
+                self.main_layout.setSpacing(10)
+
+                # Show button container again
+                self.button_container.show()
+
+                # Restore label container and label style
+                self.label_container.setStyleSheet("background-color: transparent;")
+                self.label_container.setFixedWidth(self.normal_geometry.width())
+                self.subtitle_label.setStyleSheet("""
+                    QLabel {
+                        color: white;
+                        background-color: rgba(0, 0, 0, 0.8);
+                        padding: 30px;
+                        border-radius: 15px;
+                        font-size: 48px;
+                        font-weight: bold;
+                        min-height: 200px;
+                        max-width: 1200px;
+                        margin: 0 auto;
+                        qproperty-alignment: AlignCenter;
+                    }
+                """)
+                self.subtitle_label.setFixedWidth(1200)
+
+                # Update button text
+                self.fullscreen_button.setText(get_text('fullscreen_button', self.language))
+                self.is_fullscreen = False
+
+        except Exception as e:
+            print(f"Error in toggle_fullscreen: {str(e)}")
+            # Try to recover normal state
+            self.is_fullscreen = False
+            if self.normal_geometry:
+                self.setFixedSize(self.normal_geometry.width(), self.normal_geometry.height())
+                self.move(self.normal_geometry.x(), self.normal_geometry.y())
+            self.main_layout.setContentsMargins(20, 20, 20, 20)
+            self.main_layout.setSpacing(10)
+            self.button_container.show()
+            self.label_container.setStyleSheet("background-color: transparent;")
+            self.subtitle_label.setStyleSheet("""
+                QLabel {
+                    color: white;
+                    background-color: rgba(0, 0, 0, 0.8);
+                    padding: 30px;
+                    border-radius: 15px;
+                    font-size: 48px;
+                    font-weight: bold;
+                    min-height: 200px;
+                    max-width: 1200px;
+                    margin: 0 auto;
+                    qproperty-alignment: AlignCenter;
+                }
+            """)
+            self.fullscreen_button.setText(get_text('fullscreen_button', self.language))
+
+    def keyPressEvent(self, event):
+        """Handle keyboard events"""
+        try:
+            if event.key() == Qt.Key.Key_Escape and self.is_fullscreen:
+                self.toggle_fullscreen()
+            else:
+                super().keyPressEvent(event)
+        except Exception as e:
+            print(f"Error in keyPressEvent: {str(e)}")
+            super().keyPressEvent(event)
+
+    def closeEvent(self, event):
+        """Handle window close event"""
+        try:
+            # Stop following the playback
+            scheduler = getattr(self.parent(), 'frame_scheduler', None)
+            if scheduler is not None:
+                scheduler.remove(self)
+            # Accept the close event
+            event.accept()
+        except Exception as e:
+            print(f"Error in closeEvent: {str(e)}")
+            event.accept()
+
+    def showEvent(self, event):
+        """Ensure dialog stays centered when shown"""
+        try:
+            super().showEvent(event)
+            scheduler = getattr(self.parent(), 'frame_scheduler', None)
+            if scheduler is not None:
+                scheduler.wake(self)
+            if not self.is_fullscreen and self.parent():
+                parent_geometry = self.parent().geometry()
+                dialog_geometry = self.geometry()
+                x = parent_geometry.x() + (parent_geometry.width() - dialog_geometry.width()) // 2
+                y = parent_geometry.y() + (parent_geometry.height() - dialog_geometry.height()) // 2
+                self.move(x, y)
+        except Exception as e:
+            print(f"Error in showEvent: {str(e)}")
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.old_pos = event.globalPosition().toPoint()
+
+    def mouseMoveEvent(self, event):
+        if self.old_pos:
+            delta = event.globalPosition().toPoint() - self.old_pos
+            self.move(self.pos() + delta)
+            self.old_pos = event.globalPosition().toPoint()
+
+    def mouseReleaseEvent(self, event):
+        self.old_pos = None
+
+    def load_srt(self, file_path):
+        """Load and parse an SRT file"""
+        if self.srt_parser.parse_srt(file_path):
+            self.start_display()
+            return True
+        return False
+
+    def start_display(self):
+        """Follow the playback, update_subtitle runs on the player's frame scheduler"""
+        scheduler = getattr(self.parent(), 'frame_scheduler', None)
+        if scheduler is not None:
+            scheduler.add(self, self.update_subtitle)
+
+    def stop_display(self):
+        """Stop following the playback"""
+        scheduler = getattr(self.parent(), 'frame_scheduler', None)
+        if scheduler is not None:
+            scheduler.remove(self)
+        self.subtitle_label.clear()
+
+    def update_subtitle(self):
+        """Update the displayed subtitle, returns the ms until it can change (None: wait to be woken)"""
+        if not self.parent() or not self.parent().is_playing or not self.isVisible():
+            return None
+
+        current_time = self.parent().heard_position()
+
+        subtitle = self.srt_parser.get_subtitle_at_time(current_time)
+        if subtitle != self.current_subtitle:
+            self.current_subtitle = subtitle
+            # Format text with HTML for better wrapping and line breaks
+            formatted_text = subtitle.replace('\n', '<br>')
+            # Add extra line height and center alignment in HTML
+            self.subtitle_label.setText(f"<div style='line-height: 1.4; text-align: center;'>{formatted_text}</div>")
+        return self.srt_parser.ms_until_change(current_time, self.parent().audio.speed)
+
+
+class TreeViewDelegate(QStyledItemDelegate):
+    """Draws the branch arrows and the track labels.
+
+    Track rows only store their path, the label is built here from the
+    path and the display mode, so switching modes is just a repaint.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.show_full_path = True
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        file_path = index.data(Qt.ItemDataRole.UserRole)
+        if isinstance(file_path, str) and index.parent().isValid():
+            label = index.data(TRACK_LABEL_ROLE)
+            if label:
+                option.text = f"{label} ({file_path})" if self.show_full_path else label
+            else:
+                option.text = file_path if self.show_full_path else os.path.basename(file_path)
+
+    def paint(self, painter, option, index):
+        # Check if this item has children and is a branch
+        model = index.model()
+        if model.hasChildren(index):
+            # Get the item rect
+            rect = option.rect
+            
+            # Calculate arrow position (further to the left)
+            arrow_x = rect.left() - 15  # Move arrow further left
+            arrow_y = rect.center().y()
+            
+            # Set up painter for drawing
+            painter.setPen(QColor(255, 255, 255))  # White color
+            painter.setFont(QFont("Arial", 10))
+            
+            # Draw arrow based on expansion state
+            tree_view = self.parent()
+            if tree_view and tree_view.isExpanded(index):
+                # Draw down arrow (▼) for expanded
+                painter.drawText(arrow_x, arrow_y + 5, "▼")
+            else:
+                # Draw right arrow (▶) for collapsed
+                painter.drawText(arrow_x, arrow_y + 5, "▶")
+        
+        # Call the parent paint method to draw the text
+        super().paint(painter, option, index)
+
+
+class TrackFilterProxyModel(QSortFilterProxyModel):
+    """Filter the tree through a row mask instead of rebuilding the model"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.accepted_paths = None  # None means no filter is active
+        # Filter on the path, so label changes never trigger a refilter
+        self.setFilterRole(Qt.ItemDataRole.UserRole)
+
+    def set_accepted_paths(self, paths):
+        """Show only tracks whose path is in paths, or everything for None"""
+        self.accepted_paths = paths
+        # Paged nodes and folder trees only create rows for accepted paths
+        model = self.sourceModel()
+        if model is not None:
+            for row in range(model.rowCount()):
+                item = model.item(row)
+                if isinstance(item, TrackListItem):
+                    item.set_mask(paths)
+        self.invalidateRowsFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self.accepted_paths is None:
+            return True
+
+        model = self.sourceModel()
+        index = model.index(source_row, 0, source_parent)
+
+        # Paged nodes already leave out what the mask rejects
+        item = model.itemFromIndex(index)
+        if isinstance(item, TrackListItem):
+            return item.has_child_rows()
+
+        if not source_parent.isValid():
+            # Favorites and history are never filtered, other top-level
+            # rows are only shown while they still contain a match
+            if index.data(SECTION_ROLE):
+                return True
+            return any(model.index(row, 0, index).data(Qt.ItemDataRole.UserRole) in self.accepted_paths
+                       for row in range(model.rowCount(index)))
+
+        # Favorites and history are never filtered
+        if source_parent.data(SECTION_ROLE):
+            return True
+
+        return index.data(Qt.ItemDataRole.UserRole) in self.accepted_paths
+
+
+class LazyNodeItem(QStandardItem):
+    """Tree node whose children are only created when it is first expanded"""
+
+    def __init__(self, text, loader, has_rows=None):
+        super().__init__(text)
+        self.setEditable(False)
+        self.loader = loader  # Returns the list of child items
+        self.has_rows = has_rows  # Cheap check used for the expand arrow
+        self.loaded = False
+
+    def reset(self):
+        """Drop the children so they are rebuilt on the next expansion"""
+        if self.rowCount():
+            self.removeRows(0, self.rowCount())
+        self.loaded = False
+
+    def has_child_rows(self):
+        if not self.loaded:
+            return self.has_rows() if self.has_rows else True
+        return self.rowCount() > 0
+
+    def can_fetch_more(self):
+        return not self.loaded
+
+    def fetch_more(self):
+        if self.loaded:
+            return
+        self.loaded = True
+        rows = self.loader()
+        if rows:
+            self.appendRows(rows)
+
+
+def read_file_metadata(file_path):
+    """Tags (title, artist, album; None if the file has no tag support), duration and mtime of an audio file"""
+    audio = File(file_path, easy=True)
+    tags = None
+    duration = None
+    if audio is not None:
+        tags = {name: (audio.get(name) or [""])[0] for name in ("title", "artist", "album")}
+        duration = getattr(getattr(audio, 'info', None), 'length', None)
+    return tags, duration, os.path.getmtime(file_path)
+
+
+def read_duration(file_path, data=None):
+    """Length in seconds from the file header, None when the header has none"""
+    try:
+        audio = File(io.BytesIO(data) if data is not None else file_path)
+        return getattr(getattr(audio, 'info', None), 'length', None) or None
+    except Exception:
+        return None
+
+
+def read_lyrics_text(lyrics_path):
+    """Text of an ODT or TXT lyrics file, TXT files that are not UTF-8 are read as latin-1"""
+    if os.path.splitext(lyrics_path)[1].lower() == '.odt':
+        doc = load(lyrics_path)
+        return '\n'.join(teletype.extractText(para) for para in doc.getElementsByType(text.P))
+    try:
+        with open(lyrics_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except UnicodeDecodeError:
+        with open(lyrics_path, 'r', encoding='latin-1') as f:
+            return f.read()
+
+
+class PreparedTrack:
+    """A track read ahead of playing it: file contents, length and the lyrics it will show"""
+
+    def __init__(self, path, data, duration, lyrics, sound=None):
+        self.path = path
+        self.data = data
+        self.duration = duration
+        self.lyrics = lyrics  # lyrics path -> (mtime, text)
+        self.sound = sound  # Decoded sound of the audio backend, only when crossfading
+        self.sound_size = 0  # Bytes the decoded sound takes
+        self.namehint = os.path.splitext(path)[1].lstrip('.').lower()
+
+    def source(self):
+        """A new file object over the contents, the mixer keeps the one it gets"""
+        return io.BytesIO(self.data)
+
+    def memory_size(self):
+        """Bytes held for the contents and the decoded sound"""
+        return len(self.data) + (self.sound_size if self.sound is not None else 0)
+
+
+class TrackCache:
+    """Recently played tracks kept in memory, the least recently used go first to stay within a byte budget.
+
+    Going back to a track or playing it again then needs no disk or network.
+    The preload thread reads it too, so access is locked.
+    """
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.size = 0
+        self._entries = OrderedDict()  # path -> (PreparedTrack, size), most recently used last
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None:
+                return None
+            self._entries.move_to_end(path)
+            return entry[0]
+
+    def put(self, prepared):
+        """Keep a track, or update its size after its sound was decoded"""
+        size = prepared.memory_size()
+        with self._lock:
+            old = self._entries.pop(prepared.path, None)
+            if old is not None:
+                self.size -= old[1]
+            if size > self.budget:
+                return
+            self._entries[prepared.path] = (prepared, size)
+            self.size += size
+            while self.size > self.budget:
+                _, (_, dropped) = self._entries.popitem(last=False)
+                self.size -= dropped
+
+    def set_budget(self, budget):
+        with self._lock:
+            self.budget = budget
+            while self._entries and self.size > self.budget:
+                _, (_, dropped) = self._entries.popitem(last=False)
+                self.size -= dropped
+
+
+class CrossfadeDecks:
+    """The two channels of the audio backend, playing decoded tracks and fading from one into the other.
+
+    The mixer runs the fades itself, sample by sample, so only their start
+    has to be timed, from the playback clock.
+    """
+
+    def __init__(self, audio):
+        self.audio = audio
+        self.current = 0  # Index of the channel with the current track
+        self.sound = None  # Sound of the current track, None when the decks are not used
+        self.paused = False
+        self.volume = 1.0
+        self.gains = [1.0, 1.0]  # ReplayGain factor of the track on each channel
+
+    @property
+    def active(self):
+        return self.sound is not None
+
+    def _channels(self):
+        return [self.audio.channel(0), self.audio.channel(1)]
+
+    def play(self, sound, fade_ms=0, gain=1.0):
+        """Start sound on the free channel, the playing one fades out over the same time"""
+        channels = self._channels()
+        outgoing = channels[self.current]
+        if fade_ms:
+            outgoing.fadeout(fade_ms)
+        else:
+            outgoing.stop()
+        self.current = 1 - self.current
+        self.gains[self.current] = gain
+        sound.set_volume(self.volume * gain)
+        channels[self.current].play(sound, fade_ms=fade_ms)
+        self.sound = sound
+        self.paused = False
+
+    def seek(self, seconds):
+        """Play the current track from seconds on, a copy of the rest since a sound always starts at its beginning"""
+        rest = self.audio.sound_from(self.sound, seconds)
+        rest.set_volume(self.volume * self.gains[self.current])
+        channels = self._channels()
+        channels[1 - self.current].stop()
+        channels[self.current].play(rest)
+        if self.paused:
+            channels[self.current].pause()
+
+    def busy(self):
+        return self.sound is not None and self.audio.channel(self.current).get_busy()
+
+    def pause(self):
+        if self.sound is not None and not self.paused:
+            self.paused = True
+            for channel in self._channels():
+                channel.pause()
+
+    def unpause(self):
+        if self.paused:
+            self.paused = False
+            for channel in self._channels():
+                channel.unpause()
+
+    def stop(self):
+        if self.sound is not None:
+            for channel in self._channels():
+                channel.stop()
+        self.sound = None
+        self.paused = False
+
+    def set_volume(self, volume):
+        """Volume of both tracks (times their gain), fades scale the channel volume on top of this"""
+        self.volume = volume
+        if self.sound is not None:
+            for channel, gain in zip(self._channels(), self.gains):
+                sound = channel.get_sound()
+                if sound is not None:
+                    sound.set_volume(volume * gain)
+
+    def reset(self):
+        """Forget the current track after the mixer was closed and opened again"""
+        self.sound = None
+        self.paused = False
+
+
+class PlaybackClock:
+    """The one position in the current track, in seconds.
+
+    The position is an offset plus the mixer ticks since the clock started.
+    Pausing folds the running time into the offset, seeking replaces it.
+    The progress bar, the karaoke views and the crossfade all read it here.
+    """
+
+    def __init__(self, audio):
+        self.audio = audio
+        self.offset = 0.0
+        self.started = None  # Mixer ticks since which the clock runs, None while paused or stopped
+        self.active = False  # A track is playing or paused
+
+    def start(self, offset=0.0, started=None):
+        self.offset = offset
+        self.started = self.audio.ticks() if started is None else started
+        self.active = True
+
+    def pause(self):
+        if self.started is not None:
+            self.offset = self.position()
+            self.started = None
+
+    def resume(self):
+        if self.active and self.started is None:
+            self.started = self.audio.ticks()
+
+    def seek(self, offset):
+        self.offset = offset
+        if self.started is not None:
+            self.started = self.audio.ticks()
+
+    def stop(self):
+        self.offset = 0.0
+        self.started = None
+        self.active = False
+
+    def position(self):
+        if self.started is None:
+            return self.offset
+        return self.offset + (self.audio.ticks() - self.started) / 1000.0
+
+
+class WaveformProgressBar(QProgressBar):
+    """Progress bar with the waveform of the track behind the position, a click seeks there.
+
+    Without peaks it is a plain progress bar. The peaks are brought to one
+    line per pixel once per size, a new position only repaints those lines.
+    """
+    seek_requested = pyqtSignal(float)  # Part of the track clicked, 0.0 - 1.0
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.peaks = None  # (buckets, 2) lows and highs, see waveform.peaks
+        self._lines = None  # (width, height) -> the lines the peaks are drawn with
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+
+    def set_peaks(self, peaks):
+        self.peaks = peaks
+        self._lines = None
+        self.update()
+
+    def _waveform_lines(self, rect):
+        size = (rect.width(), rect.height())
+        if self._lines is None or self._lines[0] != size:
+            middle = rect.top() + rect.height() / 2
+            half = rect.height() / 2
+            lines = [QLineF(rect.left() + x + 0.5, middle - high * half, rect.left() + x + 0.5, middle - low * half)
+                     for x, (low, high) in enumerate(resample(self.peaks, rect.width()).tolist())]
+            self._lines = (size, lines)
+        return self._lines[1]
+
+    def paintEvent(self, event):
+        if self.peaks is None or not len(self.peaks):
+            super().paintEvent(event)
+            return
+        painter = QPainter(self)
+        palette = self.palette()
+        rect = self.rect().adjusted(1, 1, -1, -1)
+        painter.fillRect(self.rect(), palette.color(QPalette.ColorRole.Base))
+        lines = self._waveform_lines(rect)
+        painter.setPen(palette.color(QPalette.ColorRole.Mid))
+        painter.drawLines(lines)
+
+        # The played part in the highlight colour
+        span = max(1, self.maximum() - self.minimum())
+        played = int(rect.width() * max(0, self.value() - self.minimum()) / span)
+        painter.setClipRect(QRect(rect.left(), rect.top(), played, rect.height()))
+        highlight = palette.color(QPalette.ColorRole.Highlight)
+        shade = QColor(highlight)
+        shade.setAlpha(50)
+        painter.fillRect(rect, shade)
+        painter.setPen(highlight)
+        painter.drawLines(lines)
+        painter.end()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton and self.width() > 0:
+            self.seek_requested.emit(max(0.0, min(1.0, event.position().x() / self.width())))
+            event.accept()
+            return
+        super().mousePressEvent(event)
+
+
+def make_track_item(file_path, label=None):
+    """Create a tree row for a track, its label follows the delegate's display mode"""
+    file_item = QStandardItem()
+    file_item.setData(file_path, Qt.ItemDataRole.UserRole)
+    if label:
+        file_item.setData(label, TRACK_LABEL_ROLE)
+    file_item.setEditable(False)
+    return file_item
+
+
+class TrackListItem(QStandardItem):
+    """Drive or playlist node that creates its track rows a page at a time.
+
+    The node keeps the plain list of paths, rows only exist for the part
+    the view has scrolled to. A filter mask narrows the paths that get rows.
+    """
+    page_size = 500
+
+    def __init__(self, text, paths=()):
+        super().__init__(text)
+        self.setEditable(False)
+        self.drive = None  # Set for drive nodes
+        self.paths = list(paths)
+        self.mask = None  # Set of accepted paths, None shows everything
+        self.visible_paths = self.paths  # Track rows mirror the start of this list
+        self.first_track_row = 0  # Rows before this one are not tracks
+
+    def add_paths(self, paths):
+        """Add tracks at the end, rows follow when the view asks for them"""
+        self.paths.extend(paths)
+        if self.mask is not None:
+            self.visible_paths.extend(path for path in paths if path in self.mask)
+
+    def set_mask(self, mask):
+        """Only give rows to paths in mask (None for all), starting over from the first page"""
+        if mask is None and self.mask is None:
+            return
+        if self.rowCount():
+            self.removeRows(0, self.rowCount())
+        self.mask = mask
+        self.visible_paths = self.paths if mask is None else [path for path in self.paths if path in mask]
+
+    def take_track_row(self, row):
+        """Remove a track row together with its path"""
+        path = self.visible_paths.pop(row - self.first_track_row)
+        if self.visible_paths is not self.paths:
+            self.paths.remove(path)
+        return self.takeRow(row)
+
+    def move_track_row(self, source_row, target_row):
+        """Move a track row and its path to another position"""
+        target_path = self.visible_paths[target_row - self.first_track_row]
+        path = self.visible_paths[source_row - self.first_track_row]
+        row_items = self.take_track_row(source_row)
+        self.visible_paths.insert(target_row - self.first_track_row, path)
+        if self.visible_paths is not self.paths:
+            self.paths.insert(self.paths.index(target_path), path)
+        self.insertRow(target_row, row_items)
+
+    def has_child_rows(self):
+        return bool(self.visible_paths)
+
+    def can_fetch_more(self):
+        return self.rowCount() - self.first_track_row < len(self.visible_paths)
+
+    def fetch_more(self):
+        start = self.rowCount() - self.first_track_row
+        page = self.visible_paths[start:start + self.page_size]
+        if page:
+            self.appendRows([make_track_item(path) for path in page])
+
+
+class FolderIndex:
+    """Folder table of a drive, built from its scanned paths.
+
+    Keeps the tracks directly in each folder, the subfolders of each
+    folder and the number of tracks in each folder including subfolders.
+    """
+
+    def __init__(self, root, paths=()):
+        self.root = root
+        self.paths = []
+        self.files = {}  # folder -> tracks directly in it
+        self.subfolders = {}  # folder -> set of child folders
+        self.counts = {}  # folder -> tracks in it and below it
+        self.add_paths(paths)
+
+    def _folder_key(self, folder):
+        # The drive root and everything above it all map onto the root
+        if len(folder.rstrip('\\/')) <= len(self.root.rstrip('\\/')):
+            return self.root
+        return folder
+
+    def folder_name(self, folder):
+        return os.path.basename(folder.rstrip('\\/')) or folder
+
+    def _parent(self, folder):
+        return self._folder_key(os.path.dirname(folder.rstrip('\\/')))
+
+    def add_paths(self, paths):
+        """Add tracks to the table and their folders to the counts"""
+        direct_counts = {}
+        for path in paths:
+            folder = self._folder_key(os.path.dirname(path))
+            files = self.files.get(folder)
+            if files is None:
+                files = self.files[folder] = []
+                self._link(folder)
+            files.append(path)
+            direct_counts[folder] = direct_counts.get(folder, 0) + 1
+        self.paths.extend(paths)
+        self._add_counts(self.counts, direct_counts)
+
+    def _link(self, folder):
+        """Register folder with its parents up to the root"""
+        while folder != self.root:
+            parent = self._parent(folder)
+            children = self.subfolders.setdefault(parent, set())
+            if folder in children:
+                return
+            children.add(folder)
+            folder = parent
+
+    def _add_counts(self, counts, direct_counts):
+        for folder, count in direct_counts.items():
+            while True:
+                counts[folder] = counts.get(folder, 0) + count
+                if folder == self.root:
+                    break
+                folder = self._parent(folder)
+
+    def remove_path(self, path, position=None):
+        """Remove a track (the one at position in its folder, else the first copy) and take it off the counts"""
+        folder = self._folder_key(os.path.dirname(path))
+        files = self.files.get(folder)
+        if not files or path not in files:
+            return
+        if position is not None and files[position] == path:
+            del files[position]
+        else:
+            files.remove(path)
+        if files is not self.paths:
+            self.paths.remove(path)
+        self._add_counts(self.counts, {folder: -1})
+
+    def move_path(self, path, target_path):
+        """Move a track before another track of the same folder"""
+        files = self.files.get(self._folder_key(os.path.dirname(path)))
+        if not files or path not in files or target_path not in files:
+            return
+        files.remove(path)
+        files.insert(files.index(target_path), path)
+        if files is not self.paths:
+            self.paths.remove(path)
+            self.paths.insert(self.paths.index(target_path), path)
+
+    def count_paths(self, paths):
+        """Per-folder counts of the given paths, for a filtered folder tree"""
+        direct_counts = {}
+        for path in paths:
+            folder = self._folder_key(os.path.dirname(path))
+            if folder in self.files:
+                direct_counts[folder] = direct_counts.get(folder, 0) + 1
+        counts = {}
+        self._add_counts(counts, direct_counts)
+        return counts
+
+
+class FolderItem(TrackListItem):
+    """Folder node of the folder view, subfolders first and then its own tracks.
+
+    Subfolder nodes are created on expansion and share the counts of
+    their parent, so only the open folders ever get rows.
+    """
+
+    def __init__(self, text, folder_index, folder, mask=None, counts=None):
+        super().__init__(text)
+        self.folder_index = folder_index
+        self.folder = folder
+        if folder == folder_index.root:
+            self.paths = folder_index.paths
+        self._select(mask, counts)
+
+    def _select(self, mask, counts=None):
+        """Pick the subfolders and tracks that have rows under mask"""
+        self.mask = mask
+        if counts is None:
+            counts = self.folder_index.counts if mask is None else self.folder_index.count_paths(mask)
+        self.counts = counts
+        self.folders = sorted(folder for folder in self.folder_index.subfolders.get(self.folder, ())
+                              if counts.get(folder))
+        files = self.folder_index.files.get(self.folder, [])
+        self.visible_paths = files if mask is None else [path for path in files if path in mask]
+        self.first_track_row = len(self.folders)
+        self.folders_loaded = False
+
+    def add_paths(self, paths):
+        self.folder_index.add_paths(paths)
+        self._rebuild(self.mask)
+
+    def _own_files(self):
+        return self.visible_paths is self.folder_index.files.get(self.folder)
+
+    def take_track_row(self, row):
+        """Remove a track row, from the folder table and the counts of this folder and those above it"""
+        position = row - self.first_track_row
+        path = self.visible_paths[position]
+        if self._own_files():
+            self.folder_index.remove_path(path, position)
+        else:
+            del self.visible_paths[position]
+            self.folder_index.remove_path(path)
+        row_items = self.takeRow(row)
+        self._count_removed()
+        return row_items
+
+    def move_track_row(self, source_row, target_row):
+        """Move a track row and its path in the folder table"""
+        path = self.visible_paths[source_row - self.first_track_row]
+        target_path = self.visible_paths[target_row - self.first_track_row]
+        if not self._own_files():
+            self.visible_paths.remove(path)
+            self.visible_paths.insert(target_row - self.first_track_row, path)
+        self.folder_index.move_path(path, target_path)
+        self.insertRow(target_row, self.takeRow(source_row))
+
+    def _count_removed(self):
+        """After a track left this folder: lower the filtered counts, relabel the folders up to the
+        drive and drop the folders that became empty"""
+        lowered = set()
+        item = self
+        while isinstance(item, FolderItem):
+            # A filtered tree has its own counts, shared by all the folders below the filtered node
+            if item.counts is not self.folder_index.counts and id(item.counts) not in lowered:
+                lowered.add(id(item.counts))
+                folder = self.folder
+                while True:
+                    item.counts[folder] = item.counts.get(folder, 0) - 1
+                    if folder == self.folder_index.root:
+                        break
+                    folder = self.folder_index._parent(folder)
+            item = item.parent()
+
+        item = self
+        while isinstance(item, FolderItem) and item.folder != self.folder_index.root:
+            parent = item.parent()
+            count = item.counts.get(item.folder, 0)
+            if count <= 0 and isinstance(parent, FolderItem):
+                parent.folders.remove(item.folder)
+                parent.first_track_row -= 1
+                parent.removeRow(item.row())
+            else:
+                item.setText(f"{self.folder_index.folder_name(item.folder)} ({count})")
+            item = parent
+
+    def set_mask(self, mask):
+        if mask is None and self.mask is None:
+            return
+        self._rebuild(mask)
+
+    def _rebuild(self, mask):
+        if self.rowCount():
+            self.removeRows(0, self.rowCount())
+        self._select(mask)
+
+    def has_child_rows(self):
+        return bool(self.folders) or bool(self.visible_paths)
+
+    def can_fetch_more(self):
+        return not self.folders_loaded or super().can_fetch_more()
+
+    def fetch_more(self):
+        if not self.folders_loaded:
+            self.folders_loaded = True
+            if self.folders:
+                self.appendRows([
+                    FolderItem(f"{self.folder_index.folder_name(folder)} ({self.counts[folder]})",
+                               self.folder_index, folder, self.mask, self.counts)
+                    for folder in self.folders])
+        super().fetch_more()
+
+
+class TrackTreeModel(QStandardItemModel):
+    """Item model that lets LazyNodeItem and TrackListItem nodes fill themselves through fetchMore"""
+
+    def _fetching_item(self, parent):
+        if not parent.isValid():
+            return None
+        item = self.itemFromIndex(parent)
+        return item if isinstance(item, (LazyNodeItem, TrackListItem)) else None
+
+    def hasChildren(self, parent=QModelIndex()):
+        item = self._fetching_item(parent)
+        if item is not None:
+            return item.has_child_rows()
+        return super().hasChildren(parent)
+
+    def canFetchMore(self, parent):
+        item = self._fetching_item(parent)
+        if item is not None:
+            return item.can_fetch_more()
+        return super().canFetchMore(parent)
+
+    def fetchMore(self, parent):
+        item = self._fetching_item(parent)
+        if item is None:
+            return super().fetchMore(parent)
+        item.fetch_more()
+
+
+class ViewStateKeeper:
+    """Snapshot and restore of the expansion, selection and scroll position of the track tree.
+
+    Rows are remembered by key: a name for the nodes and the node plus path
+    for tracks, so the state can be put back after the model or a row mask
+    has been replaced. Only node rows are walked, tracks are looked up by path.
+    """
+
+    max_fetch_rows = 10000  # Tracks further down than this are not paged in to restore them
+
+    def __init__(self, view, proxy_model):
+        self.view = view
+        self.proxy_model = proxy_model
+
+    @staticmethod
+    def node_key(item):
+        if isinstance(item, FolderItem):
+            return ('folder', item.folder)
+        if isinstance(item, TrackListItem):
+            return ('drive', item.drive) if item.drive else ('list', item.text())
+        if item.data(SECTION_ROLE):
+            return ('section', item.data(SECTION_ROLE))
+        return ('node', item.text())
+
+    def _item(self, view_index):
+        if not view_index.isValid():
+            return None
+        model = self.proxy_model.sourceModel()
+        return model.itemFromIndex(self.proxy_model.mapToSource(view_index))
+
+    def _view_index(self, item):
+        return self.proxy_model.mapFromSource(item.index())
+
+    def _row_key(self, view_index):
+        item = self._item(view_index)
+        if item is None:
+            return None
+        path = item.data(Qt.ItemDataRole.UserRole)
+        if item.parent() is not None and isinstance(path, str) and not isinstance(item, TrackListItem):
+            return ('track', self.node_key(item.parent()), path)
+        return self.node_key(item)
+
+    def _nodes(self, on_node=None):
+        """Walk the node rows breadth first, on_node may open a node before its children are read"""
+        model = self.proxy_model.sourceModel()
+        pending = [model.item(row) for row in range(model.rowCount())]
+        while pending:
+            item = pending.pop(0)
+            if item is None:
+                continue
+            if on_node is not None:
+                on_node(item)
+            yield item
+            if isinstance(item, FolderItem) and item.folders_loaded:
+                pending.extend(item.child(row) for row in range(item.first_track_row))
+
+    def snapshot(self):
+        """Remember the current state of the view"""
+        nodes = set()
+        expanded = set()
+        for item in self._nodes():
+            key = self.node_key(item)
+            nodes.add(key)
+            if self.view.isExpanded(self._view_index(item)):
+                expanded.add(key)
+        return {
+            'nodes': nodes,
+            'expanded': expanded,
+            'selected': [self._row_key(index) for index in self.view.selectionModel().selectedRows()],
+            'current': self._row_key(self.view.currentIndex()),
+            'top': self._row_key(self.view.indexAt(QPoint(0, 0))),
+        }
+
+    def restore(self, state):
+        """Put a snapshot back on the current model, rows that no longer exist are skipped"""
+        model = self.proxy_model.sourceModel()
+        node_items = {}
+
+        def restore_node(item):
+            key = self.node_key(item)
+            node_items[key] = item
+            view_index = self._view_index(item)
+            if key in state['expanded']:
+                self.view.expand(view_index)
+                # Folders have to be filled to walk into their subfolders
+                if model.canFetchMore(item.index()) and not item.rowCount():
+                    model.fetchMore(item.index())
+            elif key in state['nodes']:
+                self.view.collapse(view_index)
+
+        for _ in self._nodes(restore_node):
+            pass
+
+        positions = {}
+
+        def find(key):
+            if not key:
+                return QModelIndex()
+            if key[0] != 'track':
+                item = node_items.get(key)
+                return self._view_index(item) if item is not None else QModelIndex()
+            parent = node_items.get(key[1])
+            if parent is None:
+                return QModelIndex()
+            if not isinstance(parent, TrackListItem):
+                for row in range(parent.rowCount()):
+                    if parent.child(row).data(Qt.ItemDataRole.UserRole) == key[2]:
+                        return self._view_index(parent.child(row))
+                return QModelIndex()
+            # Page the node in up to the track
+            if key[1] not in positions:
+                positions[key[1]] = {path: pos for pos, path in enumerate(parent.visible_paths)}
+            pos = positions[key[1]].get(key[2])
+            if pos is None:
+                return QModelIndex()
+            row = parent.first_track_row + pos
+            if row - parent.rowCount() > self.max_fetch_rows:
+                return QModelIndex()
+            while parent.rowCount() <= row and model.canFetchMore(parent.index()):
+                model.fetchMore(parent.index())
+            return self._view_index(parent.child(row)) if parent.rowCount() > row else QModelIndex()
+
+        selection_model = self.view.selectionModel()
+        current = find(state['current'])
+        if current.isValid():
+            selection_model.setCurrentIndex(current, QItemSelectionModel.SelectionFlag.NoUpdate)
+        for key in state['selected']:
+            index = find(key)
+            if index.isValid():
+                selection_model.select(index, QItemSelectionModel.SelectionFlag.Select |
+                                       QItemSelectionModel.SelectionFlag.Rows)
+        top = find(state['top'])
+        if top.isValid():
+            self.view.scrollTo(top, QTreeView.ScrollHint.PositionAtTop)
+
+
+class PathStatusChecker(QObject):
+    """Cache whether paths exist, checking unknown paths on a background thread"""
+    status_checked = pyqtSignal(str, bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.status = {}  # path -> True/False once checked
+        self._pending = set()
+        self._queue = queue.Queue()
+        self._thread = None
+
+    def check(self, paths):
+        """Queue paths that have no cached status yet"""
+        new_paths = [path for path in paths if path not in self.status and path not in self._pending]
+        if not new_paths:
+            return
+        self._pending.update(new_paths)
+        for path in new_paths:
+            self._queue.put(path)
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            path = self._queue.get()
+            try:
+                exists = os.path.exists(path)
+            except Exception:
+                exists = False
+            self.status[path] = exists
+            self._pending.discard(path)
+            self.status_checked.emit(path, exists)
+
+
+class BackgroundJob(QObject):
+    """Run jobs (searches, reading ahead) on a background thread, a new job cancels the previous one.
+
+    Only the newest job is kept waiting, older ones are dropped without
+    running, and a running job is told to stop through its cancelled callback.
+    """
+    finished = pyqtSignal(int, object)  # generation, result
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.generation = 0
+        self._cancel = threading.Event()
+        self._pending = None
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def submit(self, job):
+        """Run job(cancelled) in the background, returns the generation its result is emitted with"""
+        with self._condition:
+            self._cancel.set()
+            self._cancel = threading.Event()
+            self.generation += 1
+            self._pending = (self.generation, job, self._cancel)
+            self._condition.notify()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            return self.generation
+
+    def cancel(self):
+        """Stop the running job and drop the waiting one, their results are never emitted"""
+        with self._condition:
+            self._cancel.set()
+            self._pending = None
+            self.generation += 1
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    self._condition.wait()
+                generation, job, cancel = self._pending
+                self._pending = None
+            try:
+                result = job(cancel.is_set)
+            except SearchCancelled:
+                continue
+            except Exception as e:
+                print(f"Error in background job: {str(e)}")
+                continue
+            if not cancel.is_set():
+                self.finished.emit(generation, result)
+
+
+class MixerEventPump(QObject):
+    """Pass the audio backend's end-of-track events on as a Qt signal, checked every few ms on a background thread.
+
+    The mixer posts them from its audio thread, the backend can be asked
+    for them from any thread. The signal carries the ticks the event was seen at.
+    """
+    track_ended = pyqtSignal(int)
+
+    def __init__(self, audio, interval=0.002, parent=None):
+        super().__init__(parent)
+        self.audio = audio
+        self.interval = interval
+        self._running = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._running.set()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop checking, events that arrive meanwhile wait in the queue"""
+        self._running.clear()
+
+    def _run(self):
+        while True:
+            self._running.wait()
+            try:
+                events = self.audio.poll_end_events()
+            except Exception:
+                events = []
+            if events:
+                self.track_ended.emit(self.audio.ticks())
+            time.sleep(self.interval)
+
+
+class FrameScheduler(QObject):
+    """One timer for everything on screen that follows the playback.
+
+    A job is a callback that returns the milliseconds until it wants to
+    run again, or None when there is nothing to show until it is woken
+    (paused, hidden, minimized). The timer is set for the nearest job and
+    stops when no job waits, so an idle player gets no timer events at all.
+    Playback jobs are the ones wake() without a key starts again.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.jobs = {}  # key -> (callback, follows playback)
+        self.due = {}  # key -> time.monotonic() the job runs at
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self._run)
+
+    def add(self, key, callback, playback=True):
+        self.jobs[key] = (callback, playback)
+        self.wake(key)
+
+    def remove(self, key):
+        self.jobs.pop(key, None)
+        self.due.pop(key, None)
+        self._arm()
+
+    def wake(self, key=None, delay_ms=0):
+        """Run a job soon, without key all playback jobs"""
+        if key is None:
+            keys = [key for key, (callback, playback) in self.jobs.items() if playback]
+        else:
+            keys = [key] if key in self.jobs else []
+        at = time.monotonic() + delay_ms / 1000
+        for key in keys:
+            self.due[key] = min(self.due.get(key, at), at)
+        self._arm()
+
+    def wake_all(self):
+        for key in list(self.jobs):
+            self.wake(key)
+
+    def sleep(self, key):
+        self.due.pop(key, None)
+        self._arm()
+
+    def _arm(self):
+        if not self.due:
+            self.timer.stop()
+            return
+        delay = (min(self.due.values()) - time.monotonic()) * 1000
+        self.timer.start(max(0, int(delay + 0.999)))
+
+    def _run(self):
+        now = time.monotonic()
+        for key in [key for key, at in self.due.items() if at <= now]:
+            self.due.pop(key, None)
+            try:
+                delay = self.jobs[key][0]()
+            except Exception as e:
+                print(f"Error in scheduled update {key}: {str(e)}")
+                delay = None
+            # A job may have removed itself or been woken again meanwhile
+            if delay is not None and key in self.jobs and key not in self.due:
+                self.due[key] = now + max(delay, 10) / 1000
+        self._arm()
+
+
+class FilterStage:
+    """A filter result in the filter history.
+
+    The stage keeps its files, their sorted index ids and the row mask, so
+    going back to it, or refining it in another direction, needs no search.
+    """
+    __slots__ = ('label', 'terms', 'parent', 'files', 'ids', 'mask')
+
+    def __init__(self, label, terms, parent, files, ids, mask):
+        self.label = label
+        self.terms = terms  # (positive, negative, fuzzy) of the filter, None for the unfiltered list
+        self.parent = parent  # Stage this one narrowed, None for the unfiltered list
+        self.files = files
+        self.ids = ids  # None for the unfiltered list
+        self.mask = mask
+
+    def depth(self):
+        depth = 0
+        stage = self.parent
+        while stage is not None:
+            depth += 1
+            stage = stage.parent
+        return depth
+
+
+class MetadataReader:
+    """Read tags, duration and mtime of the indexed tracks on a background thread.
+
+    This fills the library index columns that field queries such as
+    artist: and duration: look at. Files that cannot be read now, for
+    example on a drive that is not connected, are tried again on the
+    next wake.
+    """
+    batch_size = 200
+    pause = 0.05  # Seconds between batches, leaves the GUI thread room
+
+    def __init__(self, get_index):
+        self._get_index = get_index
+        self._wake = threading.Event()
+        self._thread = None
+
+    def wake(self):
+        """Look for unread tracks, for example after a scan added some"""
+        self._wake.set()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            try:
+                index = self._get_index()
+                start = 0
+                while True:
+                    batch = index.unread(start, self.batch_size)
+                    if not batch:
+                        break
+                    for _, path in batch:
+                        try:
+                            tags, duration, mtime = read_file_metadata(path)
+                        except Exception:
+                            continue
+                        index.set_metadata(path, tags or {}, duration, mtime)
+                    start = batch[-1][0] + 1
+                    time.sleep(self.pause)
+            except Exception as e:
+                print(f"Error reading metadata: {str(e)}")
+
+
+class LoudnessAnalyzer:
+    """Measure the loudness of the indexed tracks in a process pool, for ReplayGain at play time.
+
+    Tracks with ReplayGain tags only have their tags read, the others are
+    decoded and measured in worker processes (see loudness.analyze_track),
+    so the GUI thread and the mixer keep their CPU. Results go into the
+    library index. Tracks asked for with request(), the next track to
+    play, go first. Missing files are tried again on the next wake.
+    """
+    batch_size = 50
+
+    def __init__(self, get_index, workers=None):
+        self._get_index = get_index
+        self.workers = workers or max(1, (os.cpu_count() or 2) // 2)
+        self._wake = threading.Event()
+        self._requested = deque()
+        self._thread = None
+        self._pool = None
+        self._closed = False
+
+    def wake(self):
+        """Look for tracks without loudness, for example after a scan added some"""
+        self._wake.set()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def request(self, path):
+        """Analyse path before the rest"""
+        self._requested.append(path)
+        self.wake()
+
+    def close(self):
+        self._closed = True
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait()
+            self._wake.clear()
+            try:
+                index = self._get_index()
+                start = 0
+                while not self._closed:
+                    requested = []
+                    while self._requested:
+                        path = self._requested.popleft()
+                        if index.needs_loudness(path):
+                            requested.append(path)
+                    if requested:
+                        self._analyze(index, requested)
+                        continue
+                    batch = index.unanalyzed(start, self.batch_size)
+                    if not batch:
+                        break
+                    self._analyze(index, [path for _, path in batch])
+                    start = batch[-1][0] + 1
+            except Exception as e:
+                print(f"Error analysing loudness: {str(e)}")
+
+    def _analyze(self, index, paths):
+        if self._pool is None:
+            # Spawned, a forked copy of the GUI and the mixer threads would not be safe
+            self._pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context('spawn'),
+                                             initializer=init_worker)
+        futures = [self._pool.submit(analyze_track, path) for path in paths if os.path.exists(path)]
+        for future in as_completed(futures):
+            path, gain, peak = future.result()
+            index.set_loudness(path, gain, peak)
+
+
+class MusicPlayer(QMainWindow):
+    def __init__(self, audio_backend=None):
+        super().__init__()
+
+        # Audio output, the pygame mixer unless another backend is given (see audio_backend.py)
+        self.audio = audio_backend if audio_backend is not None else PygameBackend()
+        
+        # Debug: Print database info
+        import os
+        db_path = "languages.db"
+        print(f"DEBUG: Looking for database at: {os.path.abspath(db_path)}")
+        print(f"DEBUG: Database exists: {os.path.exists(db_path)}")
+        print(f"DEBUG: Current working directory: {os.getcwd()}")
+        
+        # Laad eerst de config zodat de taal bekend is
+        self.config_file = 'music_player_config.json'
+        self.current_language = 'nl'  # fallback, wordt direct overschreven
+        self.config = {}
+        self.lyrics_dir = ''
+        self.playlist_dir = ''
+        self.favorites = set()
+        self.play_history = OrderedDict()  # Track -> None, most recently played last
+        self.lyrics_mapping = {}
+        self.max_history_items = 100
+        self.is_muted = False
+        self.previous_volume = 1.0
+        self.metadata_cache = {}
+        self.metadata_cache_size_limit = 1000
+        self.drive_file_counts = {}
+        self.pause_time = 0
+        self.total_play_time = 0
+        self.last_update_time = 0
+        self.show_full_path = True
+        self.show_folders = False  # Drives as a folder tree instead of one flat list
+        self.srt_display = None
+        self.current_track = None
+        self.playlist = []
+        self.current_index = 0
+        self.is_playing = False
+        self.filtered_files = []
+        self.play_queue = PlayQueue()  # Play order over filtered_files, see _play_queue_at_current
+        self.filter_stage = None  # (filtered_files list, its sorted index ids) of the last filter
+        self.library_index = None  # Loaded on first use
+        self.library_index_file = 'library_index.pkl'
+        self.library_index_lock = threading.Lock()
+        self.drive_library_ids = {}  # drive -> (saved file list, its length, its index ids)
+        self.saved_files = {}
+        self.available_drives = []
+        self.current_drive = None
+        self.original_files = []
+        self.track_length = 0
+        self.current_lyrics = ""
+        self.lyrics_dialog = None
+        
+        # Add language status tracking
+        self.language_status_text = ""
+        self.last_status_update = 0
+
+        # Progress, karaoke subtitles and the smart playlist refresh share one timer
+        self.frame_scheduler = FrameScheduler(self)
+
+        # Track changes save the config once things have settled down
+        self.config_save_timer = QTimer()
+        self.config_save_timer.setSingleShot(True)
+        self.config_save_timer.setInterval(2000)
+        self.config_save_timer.timeout.connect(self.save_config)
+        
+        # Laad config en zet self.current_language
+        self.load_config()
+        # Nu is de taal bekend, bouw de UI op met de juiste taal
+        self.setWindowTitle(get_text('window_title', self.current_language))
+
+        # Calculate window size based on screen resolution (80%)
+        screen = QApplication.primaryScreen().geometry()
+        window_width = int(screen.width() * 0.8)
+        window_height = int(screen.height() * 0.8)
+        window_x = (screen.width() - window_width) // 2
+        window_y = (screen.height() - window_height) // 2
+
+        # Set window size and position
+        self.setGeometry(window_x, window_y, window_width, window_height)
+
+        # Initialize new variables for history and favorites
+        self.play_history = OrderedDict()  # Recently played tracks, most recent last
+        self.favorites = set()  # Set of favorite tracks
+        self.max_history_items = 100  # Maximum number of history items to keep
+        self.is_muted = False
+        self.previous_volume = 1.0  # Store volume before muting
+        self.volume = 1.0  # Set by the user, a track plays at this times its ReplayGain factor
+        self.track_gain = 1.0
+
+        # Create status bar first
+        self.statusBar = QStatusBar()
+        self.setStatusBar(self.statusBar)
+        # When a timed message runs out the language status comes back
+        self.statusBar.messageChanged.connect(self._on_status_message_changed)
+        self.update_language_status()
+
+        # Add file count label to status bar
+        self.file_count_label = QLabel(get_text('files_label', self.current_language))
+        self.statusBar.addPermanentWidget(self.file_count_label)
+
+        # Initialize variables
+        self.current_track = None
+        self.playlist = []
+        self.current_index = 0
+        self.is_playing = False
+        self.filtered_files = []
+        self.filter_stage = None  # (filtered_files list, its sorted index ids) of the last filter
+        self.library_index = None  # Loaded on first use
+        self.library_index_file = 'library_index.pkl'
+        self.library_index_lock = threading.Lock()
+        self.drive_library_ids = {}  # drive -> (saved file list, its length, its index ids)
+        self.saved_files = {}
+        self.available_drives = []
+        self.current_drive = None
+        self.original_files = []
+        self.track_length = 0
+        self.current_lyrics = ""
+        self.lyrics_dialog = None
+        self.metadata_cache = {}
+        self.metadata_cache_size_limit = 1000  # Maximum number of cached metadata entries
+        self.drive_file_counts = {}
+        self.pause_time = 0
+        self.total_play_time = 0
+        self.last_update_time = 0
+        self.show_full_path = True
+        self.show_folders = False  # Drives as a folder tree instead of one flat list
+        self.srt_display = None
+
+        # Create main widget and layout
+        main_widget = QWidget()
+        self.setCentralWidget(main_widget)
+        layout = QVBoxLayout(main_widget)
+        layout.setSpacing(5)
+        layout.setContentsMargins(5, 5, 5, 5)
+
+        # Create splitter for main content
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        layout.addWidget(splitter)
+
+        # Create left panel for file browser
+        left_panel = QWidget()
+        left_layout = QVBoxLayout(left_panel)
+        left_layout.setSpacing(5)
+        left_layout.setContentsMargins(0, 0, 0, 0)
+
+        # Create title and help button layout
+        title_layout = QHBoxLayout()
+        title_label = QLabel(get_text('title_label', self.current_language))
+        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title_label.setStyleSheet("font-size: 24px; font-weight: bold;")
+        title_layout.addWidget(title_label)
+        
+        # Add language switch button
+        self.language_button = QPushButton("🌐")
+        self.language_button.setToolTip(get_text('language_tooltip', self.current_language))
+        self.language_button.clicked.connect(self.switch_language)
+        self.language_button.setStyleSheet("""
+            QPushButton {
+                background-color: #3b3b3b;
+                color: #ffffff;
+                border: 1px solid #555555;
+                padding: 5px;
+                border-radius: 3px;
+                min-width: 40px;
+                font-size: 16px;
+            }
+            QPushButton:hover {
+                background-color: #4b4b4b;
+            }
+        """)
+        title_layout.addWidget(self.language_button)
+
+        # Mixer buffer settings, and measuring them on this machine
+        self.mixer_profile_combo = QComboBox()
+        for profile in MIXER_PROFILES:
+            self.mixer_profile_combo.addItem(get_text(f'mixer_{profile}', self.current_language), profile)
+        self.mixer_profile_combo.setToolTip(get_text('mixer_profile_tooltip', self.current_language))
+        self.mixer_profile_combo.activated.connect(self.on_mixer_profile_selected)
+        title_layout.addWidget(self.mixer_profile_combo)
+        self.calibrate_button = QPushButton(get_text('calibrate_button', self.current_language))
+        self.calibrate_button.setToolTip(get_text('calibrate_tooltip', self.current_language))
+        self.calibrate_button.clicked.connect(self.calibrate_audio)
+        title_layout.addWidget(self.calibrate_button)
+        
+        help_button = QPushButton(get_text('help_button', self.current_language))
+        help_button.clicked.connect(self.show_help)
+        title_layout.addWidget(help_button)
+        left_layout.addLayout(title_layout)
+        
+        # Store help button as instance variable
+        self.help_button = help_button
+
+        # Create drive selection and scan controls
+        drive_layout = QHBoxLayout()
+        drive_layout.setSpacing(5)
+        self.drive_combo = QComboBox()
+        self.drive_combo.setPlaceholderText(get_text('select_drive', self.current_language))
+        self.drive_combo.setStyleSheet("color: #90EE90;")
+        self.drive_combo.activated.connect(self.on_drive_selected)
+        self.refresh_button = QPushButton(get_text('refresh_drives', self.current_language))
+        self.refresh_button.clicked.connect(self.refresh_drives)
+        self.read_button = QPushButton(get_text('read_files', self.current_language))
+        self.read_button.clicked.connect(self.read_saved_files)
+        self.read_button.setStyleSheet("color: #90EE90;")
+        self.toggle_view_button = QPushButton(get_text('toggle_view', self.current_language))
+        self.toggle_view_button.clicked.connect(self.toggle_path_display)
+        self.folder_view_button = QPushButton(get_text('folder_view', self.current_language))
+        self.folder_view_button.clicked.connect(self.toggle_folder_view)
+        self.scan_button = QPushButton(get_text('scan_drive', self.current_language))
+        self.scan_button.clicked.connect(self.scan_selected_drive)
+        
+        # Add cleanup button
+        self.cleanup_button = QPushButton(get_text('cleanup_files', self.current_language))
+        self.cleanup_button.clicked.connect(self.manual_cleanup)
+        self.cleanup_button.setToolTip(get_text('cleanup_files', self.current_language))
+        
+        drive_layout.addWidget(self.drive_combo)
+        drive_layout.addWidget(self.refresh_button)
+        drive_layout.addWidget(self.read_button)
+        drive_layout.addWidget(self.toggle_view_button)
+        drive_layout.addWidget(self.folder_view_button)
+        drive_layout.addWidget(self.scan_button)
+        drive_layout.addWidget(self.cleanup_button)
+        left_layout.addLayout(drive_layout)
+
+        # Add lyrics directory selection
+        lyrics_dir_layout = QHBoxLayout()
+        lyrics_dir_layout.setSpacing(5)
+        self.lyrics_dir_label = QLabel(get_text('lyrics_dir_label', self.current_language))
+        self.lyrics_dir_path = QLineEdit()
+        self.lyrics_dir_path.setReadOnly(True)
+        self.lyrics_dir_button = QPushButton(get_text('change_lyrics_dir', self.current_language))
+        self.lyrics_dir_button.clicked.connect(self.change_lyrics_dir)
+        lyrics_dir_layout.addWidget(self.lyrics_dir_label)
+        lyrics_dir_layout.addWidget(self.lyrics_dir_path)
+        lyrics_dir_layout.addWidget(self.lyrics_dir_button)
+        left_layout.addLayout(lyrics_dir_layout)
+
+        # Create tree view for drives and files
+        self.tree_view = QTreeView()
+        self.tree_view.setRootIsDecorated(True)  # Ensure expand/collapse arrows are visible
+        self.tree_model = TrackTreeModel()
+        self.tree_model.setHorizontalHeaderLabels([""])  # Add empty header
+
+        # Favorites and history are created once and carried over to every new model.
+        # Their rows are only built on first expansion, existence comes from a cached map.
+        self.path_status_checker = PathStatusChecker(self)
+        # Fill the index columns for field queries once the window is up
+        self.metadata_reader = MetadataReader(self._get_library_index)
+        QTimer.singleShot(3000, self.metadata_reader.wake)
+        # ReplayGain for the tracks that have none in the index yet, after the tags
+        self.loudness_analyzer = LoudnessAnalyzer(self._get_library_index)
+        QTimer.singleShot(10000, self.loudness_analyzer.wake)
+        self.path_status_checker.status_checked.connect(self._on_path_status_checked)
+        self.favorites_item = LazyNodeItem(get_text('favorites', self.current_language),
+                                           self._load_favorites_rows, lambda: bool(self.favorites))
+        self.favorites_item.setData(get_text('favorites', self.current_language), Qt.ItemDataRole.UserRole)
+        self.favorites_item.setData('favorites', SECTION_ROLE)
+        self.history_item = LazyNodeItem(get_text('play_history', self.current_language),
+                                         self._load_history_rows, lambda: bool(self.play_history))
+        self.history_item.setData(get_text('play_history', self.current_language), Qt.ItemDataRole.UserRole)
+        self.history_item.setData('history', SECTION_ROLE)
+        self.history_rows = {}  # Track -> row in the history section, once it is filled
+        self.tree_model.appendRow(self.favorites_item)
+        self.tree_model.appendRow(self.history_item)
+
+        # The view always looks at the model through the filter proxy
+        self.proxy_model = TrackFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.tree_model)
+        self.tree_view.setModel(self.proxy_model)
+        self.view_state = ViewStateKeeper(self.tree_view, self.proxy_model)
+        self.tree_view.setHeaderHidden(True)  # Hide the header
+        self.tree_view.setUniformRowHeights(True)  # All rows share the same height, skip per-row sizing
+        self.tree_view.doubleClicked.connect(self.play_selected_track)
+        self.tree_view.clicked.connect(self.play_on_click)
+        self.tree_view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.tree_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.tree_view.setFrameShape(QFrame.Shape.NoFrame)
+        self.tree_view.setFrameShadow(QFrame.Shadow.Plain)
+        self.tree_view.setLineWidth(0)
+        self.tree_view.setMidLineWidth(0)
+        self.tree_view.setContentsMargins(0, 0, 0, 0)
+
+        # Set custom delegate for visible arrows
+        self.tree_delegate = TreeViewDelegate(self.tree_view)
+        self.tree_delegate.show_full_path = self.show_full_path
+        self.tree_view.setItemDelegate(self.tree_delegate)
+
+        # Enable context menu
+        self.tree_view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.tree_view.customContextMenuRequested.connect(self.show_context_menu)
+
+        left_layout.addWidget(self.tree_view)
+
+        # Create playlist controls
+        playlist_layout = QHBoxLayout()
+        playlist_layout.setSpacing(0)
+        playlist_layout.setContentsMargins(0, 0, 0, 0)
+        self.playlist_combo = QComboBox()
+        self.playlist_combo.setPlaceholderText("Select Playlist")
+        self.playlist_combo.activated.connect(self.on_playlist_selected)
+        load_playlist_button = QPushButton("Load Playlist")
+        load_playlist_button.clicked.connect(self.load_playlist)
+        playlist_layout.addWidget(self.playlist_combo)
+        playlist_layout.addWidget(load_playlist_button)
+        left_layout.addLayout(playlist_layout)
+
+        # Create filter section
+        filter_group = QGroupBox("Filter Options")
+        filter_layout = QFormLayout()
+        filter_layout.setSpacing(0)
+        filter_layout.setContentsMargins(5, 5, 5, 5)
+
+        self.positive_filter = QLineEdit()
+        self.positive_filter.setPlaceholderText("Enter text that must be in filename")
+        self.positive_filter.setToolTip(get_text('filter_query_tooltip', self.current_language))
+        self.positive_filter.textChanged.connect(self.on_filter_text_changed)
+        filter_layout.addRow("Wel:", self.positive_filter)
+
+        self.negative_filter = QLineEdit()
+        self.negative_filter.setPlaceholderText("Enter text that must NOT be in filename")
+        self.negative_filter.textChanged.connect(self.on_filter_text_changed)
+        filter_layout.addRow("Niet:", self.negative_filter)
+
+        # Fuzzy mode ranks the best matches instead of requiring exact text
+        self.fuzzy_checkbox = QCheckBox(get_text('fuzzy_checkbox', self.current_language))
+        self.fuzzy_checkbox.toggled.connect(self.on_filter_text_changed)
+        filter_layout.addRow(self.fuzzy_checkbox)
+
+        # Filter while typing: wait for a pause, then search in the background
+        self.live_filter_base = None  # (files, ids, mask) the live filter narrows down
+        self.filter_history = []  # FilterStage list in creation order, the first is the unfiltered list
+        self.current_filter_stage = None
+        self.filter_history_limit = 20
+        self.smart_playlists = {}  # playlist path -> SmartPlaylist with its cached result
+        self.current_smart_playlist = None  # Shown smart playlist, follows library changes
+        self.frame_scheduler.add('smart_playlist', self._smart_playlist_frame, playback=False)
+        self.fuzzy_result_limit = 200
+        self.live_filter_timer = QTimer()
+        self.live_filter_timer.setSingleShot(True)
+        self.live_filter_timer.setInterval(250)
+        self.live_filter_timer.timeout.connect(self.start_live_filter)
+        self.background_search = BackgroundJob(self)
+        self.background_search.finished.connect(self._on_live_filter_finished)
+
+        button_layout = QHBoxLayout()
+        button_layout.setSpacing(5)
+        filter_button = QPushButton("Filter")
+        filter_button.clicked.connect(self.apply_filter)
+        reset_filter_button = QPushButton("Reset Filter")
+        reset_filter_button.clicked.connect(self.reset_filter)
+        save_list_button = QPushButton("Save Filtered List")
+        save_list_button.clicked.connect(self.save_filtered_list)
+        self.save_smart_button = QPushButton(get_text('save_smart_playlist', self.current_language))
+        self.save_smart_button.setToolTip(get_text('save_smart_playlist_tooltip', self.current_language))
+        self.save_smart_button.clicked.connect(self.save_smart_playlist)
+        button_layout.addWidget(filter_button)
+        button_layout.addWidget(reset_filter_button)
+        button_layout.addWidget(save_list_button)
+        button_layout.addWidget(self.save_smart_button)
+        filter_layout.addRow(button_layout)
+
+        # Earlier filter results, kept to go back to or to branch from
+        history_layout = QHBoxLayout()
+        history_layout.setSpacing(5)
+        self.filter_history_combo = QComboBox()
+        self.filter_history_combo.setToolTip(get_text('filter_history_tooltip', self.current_language))
+        self.filter_history_combo.activated.connect(self.on_filter_history_activated)
+        self.filter_undo_button = QPushButton(get_text('filter_undo', self.current_language))
+        self.filter_undo_button.clicked.connect(self.undo_filter)
+        history_layout.addWidget(self.filter_history_combo, 1)
+        history_layout.addWidget(self.filter_undo_button)
+        filter_layout.addRow(history_layout)
+        self._update_filter_history_combo()
+
+        filter_group.setLayout(filter_layout)
+        left_layout.addWidget(filter_group)
+
+        # Create playback controls
+        control_layout = QHBoxLayout()
+        control_layout.setSpacing(5)
+        self.play_button = QPushButton("Play")
+        self.play_button.clicked.connect(self.play_pause)
+        self.stop_button = QPushButton("Stop")
+        self.stop_button.clicked.connect(self.stop_playback)
+        self.prev_button = QPushButton("Vorige")
+        self.prev_button.clicked.connect(self.play_previous_track)
+        self.next_button = QPushButton("Volgende")
+        self.next_button.clicked.connect(lambda: self.play_next_track(skip=True))
+        self.shuffle_button = QPushButton(get_text('shuffle_button', self.current_language))
+        self.shuffle_button.setCheckable(True)
+        self.shuffle_button.setToolTip(get_text('shuffle_tooltip', self.current_language))
+        self.shuffle_button.toggled.connect(self.set_shuffle)
+        self.repeat_button = QPushButton(get_text('repeat_all', self.current_language))
+        self.repeat_button.setToolTip(get_text('repeat_tooltip', self.current_language))
+        self.repeat_button.clicked.connect(self.cycle_repeat)
+        self.favorite_button = QPushButton("Favoriet")
+        self.favorite_button.setCheckable(True)  # Make button checkable
+        self.favorite_button.clicked.connect(self.toggle_favorite)
+        self.favorite_button.setStyleSheet("""
+            QPushButton {
+                background-color: #3b3b3b;
+                color: #ffffff;
+                border: 1px solid #555555;
+                padding: 5px;
+                border-radius: 3px;
+                min-width: 80px;
+            }
+            QPushButton:checked {
+                background-color: #ffd700;
+                color: #000000;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #4b4b4b;
+            }
+            QPushButton:checked:hover {
+                background-color: #ffed4a;
+            }
+            QPushButton:pressed {
+                background-color: #2b2b2b;
+            }
+        """)
+
+        self.append_checkbox = QCheckBox("Lijsten aanvullen in plaats van vervangen")
+        self.append_checkbox.setChecked(False)
+
+        # Seconds the next track fades in over the end of the current one, 0 plays them back to back
+        self.crossfade_label = QLabel(get_text('crossfade_label', self.current_language))
+        self.crossfade_spinbox = QSpinBox()
+        self.crossfade_spinbox.setRange(0, 12)
+        self.crossfade_spinbox.setSuffix(" s")
+        self.crossfade_spinbox.setToolTip(get_text('crossfade_tooltip', self.current_language))
+        self.crossfade_spinbox.valueChanged.connect(self.set_crossfade)
+
+        control_layout.addWidget(self.prev_button)
+        control_layout.addWidget(self.play_button)
+        control_layout.addWidget(self.stop_button)
+        control_layout.addWidget(self.next_button)
+        control_layout.addWidget(self.shuffle_button)
+        control_layout.addWidget(self.repeat_button)
+        control_layout.addWidget(self.favorite_button)
+        control_layout.addWidget(self.crossfade_label)
+        control_layout.addWidget(self.crossfade_spinbox)
+        control_layout.addWidget(self.append_checkbox)
+        left_layout.addLayout(control_layout)
+
+        # Create playback time indicator
+        time_layout = QHBoxLayout()
+        time_layout.setSpacing(5)
+
+        self.current_time_label = QLabel("00:00")
+        self.current_time_label.setAlignment(Qt.AlignmentFlag.AlignRight)
+        time_layout.addWidget(self.current_time_label)
+
+        self.progress_bar = WaveformProgressBar()
+        self.progress_bar.setRange(0, 1000)
+        self.progress_bar.setToolTip(get_text('progress_tooltip', self.current_language))
+        self.progress_bar.seek_requested.connect(self._seek_to_fraction)
+        time_layout.addWidget(self.progress_bar)
+
+        self.total_time_label = QLabel("00:00")
+        self.total_time_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
+        time_layout.addWidget(self.total_time_label)
+
+        left_layout.addLayout(time_layout)
+
+        # Create right panel for lyrics
+        right_panel = QWidget()
+        right_layout = QVBoxLayout(right_panel)
+        right_layout.setContentsMargins(0, 0, 0, 0)
+
+        self.lyrics_title = QLabel(get_text('lyrics_title', self.current_language))
+        self.lyrics_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.lyrics_title.setStyleSheet("font-size: 18px; font-weight: bold;")
+        right_layout.addWidget(self.lyrics_title)
+
+        self.lyrics_display = QTextEdit()
+        self.lyrics_display.setReadOnly(True)
+        self.lyrics_display.setStyleSheet("font-size: 14px;")
+        right_layout.addWidget(self.lyrics_display)
+
+        button_layout = QHBoxLayout()
+
+        self.edit_button = QPushButton(get_text('edit_lyrics_button', self.current_language))
+        self.edit_button.clicked.connect(self.edit_lyrics)
+        button_layout.addWidget(self.edit_button)
+
+        self.srt_button = QPushButton(get_text('show_karaoke_button', self.current_language))
+        self.srt_button.clicked.connect(self.toggle_srt_display)
+        button_layout.addWidget(self.srt_button)
+
+        right_layout.addLayout(button_layout)
+
+        # Add panels to splitter
+        splitter.addWidget(left_panel)
+        splitter.addWidget(right_panel)
+        splitter.setSizes([600, 400])
+
+        # Create timer for updating playback position
+        self.frame_scheduler.add('position', self._position_frame)
+
+        # Read the next track ahead and queue it in the mixer, so it follows without a gap
+        self.prepared_track = None  # PreparedTrack of the next track
+        self.queued_track = None  # PreparedTrack the mixer starts when the current track ends
+        self.preloaded_lyrics = {}  # lyrics path -> (mtime, text) for the current track
+        self.track_cache = TrackCache(256 * 1024 * 1024)  # Budget from the config, track_cache_mb
+        self.track_preloader = BackgroundJob(self)
+        self.track_preloader.finished.connect(self._on_next_track_prepared)
+
+        # Waveform of the playing track behind the progress bar, decoding it once per file version
+        self.waveform_cache = WaveformCache('waveform_cache')
+        self.waveform_loader = BackgroundJob(self)
+        self.waveform_loader.finished.connect(self._on_waveform_loaded)
+        self.preload_timer = QTimer()
+        self.preload_timer.setSingleShot(True)
+        self.preload_timer.setInterval(500)
+        self.preload_timer.timeout.connect(self.preload_next_track)
+
+        # With a crossfade, tracks play decoded on two channels and the next one fades in over the end
+        self.crossfade_seconds = 0
+        self.crossfade_decks = CrossfadeDecks(self.audio)
+        self.playback_clock = PlaybackClock(self.audio)
+        self.crossfade_timer = QTimer()
+        self.crossfade_timer.setSingleShot(True)
+        self.crossfade_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.crossfade_timer.timeout.connect(self.start_crossfade)
+
+        # Initialize the audio output, it posts an end event for every track that ends
+        self.audio.init()
+
+        # The end events of the music stream and the crossfade decks advance the playlist as they arrive
+        self.mixer_events = MixerEventPump(self.audio, parent=self)
+        self.mixer_events.track_ended.connect(self.on_track_end)
+
+        # Load configuration
+        self.config_file = 'music_player_config.json'
+        self.load_config()
+        self.crossfade_seconds = max(0, min(12, int(self.config.get('crossfade_seconds', 0))))
+        self.crossfade_spinbox.blockSignals(True)
+        self.crossfade_spinbox.setValue(self.crossfade_seconds)
+        self.crossfade_spinbox.blockSignals(False)
+        mixer_profile = self.config.get('mixer_profile', DEFAULT_PROFILE)
+        if mixer_profile not in MIXER_PROFILES:
+            mixer_profile = DEFAULT_PROFILE
+        self.apply_mixer_profile(mixer_profile)
+        repeat = self.config.get('repeat', REPEAT_ALL)
+        self.play_queue.repeat = repeat if repeat in REPEAT_MODES else REPEAT_ALL
+        self.repeat_button.setText(get_text(f'repeat_{self.play_queue.repeat}', self.current_language))
+        self.shuffle_button.blockSignals(True)
+        self.shuffle_button.setChecked(bool(self.config.get('shuffle', False)))
+        self.shuffle_button.blockSignals(False)
+        self._apply_shuffle(self.play_queue)
+        self.track_cache.set_budget(max(0, int(self.config.setdefault('track_cache_mb', 256))) * 1024 * 1024)
+
+        # Create directories if they don't exist
+        for directory in [self.playlist_dir, self.lyrics_dir]:
+            if not os.path.exists(directory):
+                os.makedirs(directory)
+
+        # Clean up saved files to remove references to non-existent drives
+        # Commented out to prevent startup delays - can be run manually if needed
+        # self.cleanup_saved_files()
+
+        # Update lyrics directory path display
+        self.lyrics_dir_path.setText(self.lyrics_dir)
+
+        # Load saved files if they exist
+        try:
+            if os.path.exists('saved_files.json'):
+                with open('saved_files.json', 'r') as f:
+                    loaded_saved_files = json.load(f)
+                
+                # Load saved files without validation to prevent startup delays
+                # Validation can be done manually using the Cleanup Files button
+                self.saved_files = loaded_saved_files
+                self.statusBar.showMessage(f"Loaded {len(self.saved_files)} saved drives (not validated)")
+        except Exception as e:
+            self.statusBar.showMessage(f"Error loading saved files: {str(e)}")
+            self.saved_files = {}
+
+        # Initial drive scan
+        self.refresh_drives()
+
+        # Load playlists
+        self.refresh_playlists()
+
+        # Update file count status
+        self.update_file_count_status()
+
+        # Set dark theme
+        self.setStyleSheet("""
+            QMainWindow, QWidget {
+                background-color: #2b2b2b;
+                color: #ffffff;
+            }
+            QLabel {
+                color: #ffffff;
+            }
+            QPushButton {
+                background-color: #3b3b3b;
+                color: #ffffff;
+                border: 1px solid #555555;
+                padding: 5px;
+                border-radius: 3px;
+                min-width: 80px;
+            }
+            QPushButton:hover {
+                background-color: #4b4b4b;
+            }
+            QPushButton:pressed {
+                background-color: #2b2b2b;
+            }
+            QLineEdit {
+                background-color: #3b3b3b;
+                color: #ffffff;
+                border: 1px solid #555555;
+                padding: 5px;
+                border-radius: 3px;
+            }
+            QComboBox {
+                background-color: #3b3b3b;
+                color: #ffffff;
+                border: 1px solid #555555;
+                padding: 5px;
+                border-radius: 3px;
+                min-width: 100px;
+            }
+            QComboBox::drop-down {
+                border: none;
+            }
+            QComboBox::down-arrow {
+                image: none;
+                border: none;
+            }
+            QTreeView {
+                background-color: #2b2b2b;
+                color: #ffffff;
+                border: none;
+                padding: 0px;
+                margin: 0px;
+            }
+            QTreeView::item {
+                padding: 5px;
+                border: none;
+                background-color: #2b2b2b;
+                margin: 0px;
+                spacing: 0px;
+                height: 25px;
+            }
+            QTreeView::item:selected {
+                background-color: #4b4b4b;
+                height: 25px;
+            }
+            QTreeView::branch {
+                background-color: #2b2b2b;
+                margin: 0px;
+                padding: 0px;
+                color: white;
+            }
+            QTreeView::branch:has-siblings:!adjoins-item {
+                background-color: #2b2b2b;
+                margin: 0px;
+                padding: 0px;
+                color: white;
+            }
+            QTreeView::branch:has-siblings:adjoins-item {
+                background-color: #2b2b2b;
+                margin: 0px;
+                padding: 0px;
+                color: white;
+            }
+            QTreeView::branch:!has-children:!has-siblings:adjoins-item {
+                background-color: #2b2b2b;
+                margin: 0px;
+                padding: 0px;
+                color: white;
+            }
+            QTreeView::branch:has-children:!has-siblings:closed,
+            QTreeView::branch:closed:has-children:has-siblings {
+                background-color: #2b2b2b;
+                margin: 0px;
+                padding: 0px;
+                color: white;
+                image: none;
+            }
+            QTreeView::branch:open:has-children:!has-siblings,
+            QTreeView::branch:open:has-children:has-siblings {
+                background-color: #2b2b2b;
+                margin: 0px;
+                padding: 0px;
+                color: white;
+                image: none;
+            }
+            QScrollBar:vertical {
+                border: none;
+                background-color: #2b2b2b;
+                width: 10px;
+                margin: 0px;
+            }
+            QScrollBar::handle:vertical {
+                background-color: #4b4b4b;
+                min-height: 20px;
+                border-radius: 5px;
+            }
+            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+                height: 0px;
+            }
+            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+                background-color: #2b2b2b;
+            }
+            QScrollBar:horizontal {
+                border: none;
+                background-color: #2b2b2b;
+                height: 10px;
+                margin: 0px;
+            }
+            QScrollBar::handle:horizontal {
+                background-color: #4b4b4b;
+                min-width: 20px;
+                border-radius: 5px;
+            }
+            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+                width: 0px;
+            }
+            QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
+                background-color: #2b2b2b;
+            }
+            QAbstractItemView {
+                background-color: #2b2b2b;
+                alternate-background-color: #2b2b2b;
+                padding: 0px;
+                margin: 0px;
+            }
+            QAbstractScrollArea {
+                background-color: #2b2b2b;
+                padding: 0px;
+                margin: 0px;
+            }
+            QAbstractItemView::item {
+                background-color: #2b2b2b;
+                padding: 0px;
+                margin: 0px;
+                min-height: 25px;
+            }
+            QAbstractItemView::item:selected {
+                background-color: #4b4b4b;
+                min-height: 25px;
+            }
+            QStatusBar {
+                background-color: #2b2b2b;
+                color: #ffffff;
+            }
+            QStatusBar::item {
+                border: none;
+            }
+        """)
+
+        # Enable drag and drop for tree view
+        self.tree_view.setDragEnabled(True)
+        self.tree_view.setAcceptDrops(True)
+        self.tree_view.setDropIndicatorShown(True)
+        self.tree_view.setDragDropMode(QTreeView.DragDropMode.InternalMove)
+        self.tree_view.setSelectionMode(QTreeView.SelectionMode.ExtendedSelection)
+
+        # Add tooltips to buttons
+        self.play_button.setToolTip("Afspelen/Pauzeren (Spatiebalk)")
+        self.stop_button.setToolTip("Stoppen (S)")
+        self.prev_button.setToolTip("Vorige nummer (Pijltje Links)")
+        self.next_button.setToolTip("Volgende nummer (Pijltje Rechts)")
+        self.favorite_button.setToolTip(get_text('favorite_tooltip', self.current_language))
+        self.toggle_view_button.setToolTip("Wisselen tussen bestandsnaam en pad weergave (V)")
+        self.folder_view_button.setToolTip(get_text('folder_view_tooltip', self.current_language))
+        self.scan_button.setToolTip("Scan geselecteerde schijf voor muziekbestanden")
+        self.read_button.setToolTip("Laad opgeslagen bestanden van geselecteerde schijf")
+        self.refresh_button.setToolTip("Ververs lijst met beschikbare schijven")
+
+        # Add status bar widgets for more information
+        self.statusBar.setStyleSheet("""
+            QStatusBar {
+                background-color: #2b2b2b;
+                color: #ffffff;
+                padding: 2px;
+            }
+            QStatusBar QLabel {
+                padding: 2px 5px;
+                border-right: 1px solid #555555;
+            }
+        """)
+
+        # Add status labels
+        self.current_track_label = QLabel("")
+        self.next_track_label = QLabel("")
+        self.playlist_info_label = QLabel("")
+
+        # Add permanent widgets to status bar
+        self.statusBar.addPermanentWidget(self.playlist_info_label)
+        self.statusBar.addPermanentWidget(self.next_track_label)
+        self.statusBar.addPermanentWidget(self.current_track_label)
+        self.statusBar.addPermanentWidget(self.file_count_label)
+
+        # Voeg deze toe aan het einde van __init__:
+        self.update_favorites_display()
+        self.update_history_display()
+
+
+    def load_config(self):
+        """Load configuration from file"""
+        default_config = {
+            'lyrics_dir': os.path.join(os.path.dirname(os.path.abspath(__file__)), "lyrics"),
+            'playlist_dir': os.path.join(os.path.dirname(os.path.abspath(__file__)), "playlists"),
+            'lyrics_mapping': {},
+            'favorites': [],  # Add favorites to config
+            'play_history': [],  # Add play history to config
+            'language': 'nl'  # Add language preference
+        }
+
+        try:
+            if os.path.exists(self.config_file):
+                with open(self.config_file, 'r') as f:
+                    self.config = json.load(f)
+                    self.lyrics_dir = self.config.get('lyrics_dir', default_config['lyrics_dir'])
+                    self.playlist_dir = self.config.get('playlist_dir', default_config['playlist_dir'])
+                    self.favorites = set(self.config.get('favorites', []))  # Load favorites
+                    # The config stores the history newest first
+                    self.play_history = OrderedDict.fromkeys(reversed(self.config.get('play_history', [])))
+                    
+                    # Load language preference
+                    saved_language = self.config.get('language', 'nl')
+                    if saved_language in get_available_languages():
+                        self.current_language = saved_language
+                    else:
+                        self.current_language = 'nl'  # Fallback to Dutch
+
+                # (Verplaatst) self.update_favorites_display()
+                # (Verplaatst) self.update_history_display()
+
+            # Load and validate lyrics mappings
+            self.lyrics_mapping = {}
+            saved_mappings = self.config.get('lyrics_mapping', {})
+
+            for music_file, mapping in saved_mappings.items():
+                # Convert old format to new format
+                if isinstance(mapping, str):
+                    # Old format: just a path string
+                    ext = os.path.splitext(mapping)[1].lower()
+                    if ext == '.srt':
+                        self.lyrics_mapping[music_file] = {
+                            'text_path': None,
+                            'srt_path': mapping
+                        }
+                    else:
+                        self.lyrics_mapping[music_file] = {
+                            'text_path': mapping,
+                            'srt_path': None
+                        }
+                elif isinstance(mapping, dict):
+                    # New format: check if it has the new structure
+                    if 'text_path' in mapping or 'srt_path' in mapping:
+                        self.lyrics_mapping[music_file] = {
+                            'text_path': mapping.get('text_path'),
+                            'srt_path': mapping.get('srt_path')
+                        }
+                    else:
+                        # Old format with type: convert to new format
+                        path = mapping.get('path')
+                        file_type = mapping.get('type')
+                        if path:
+                            if file_type == 'SRT':
+                                self.lyrics_mapping[music_file] = {
+                                    'text_path': None,
+                                    'srt_path': path
+                                }
+                            else:
+                                self.lyrics_mapping[music_file] = {
+                                    'text_path': path,
+                                    'srt_path': None
+                                }
+
+                # Validate that files exist
+                if music_file in self.lyrics_mapping:
+                    mapping = self.lyrics_mapping[music_file]
+                    if mapping['text_path'] and not os.path.exists(mapping['text_path']):
+                        mapping['text_path'] = None
+                    if mapping['srt_path'] and not os.path.exists(mapping['srt_path']):
+                        mapping['srt_path'] = None
+                    # Remove mapping if both paths are None
+                    if not mapping['text_path'] and not mapping['srt_path']:
+                        del self.lyrics_mapping[music_file]
+        except Exception as e:
+            print(f"Error loading config: {str(e)}")
+            self.config = default_config
+            self.lyrics_dir = default_config['lyrics_dir']
+            self.playlist_dir = default_config['playlist_dir']
+            self.lyrics_mapping = {}
+            self.current_language = 'nl'  # Fallback to Dutch
+            if hasattr(self, 'statusBar'):
+                self.statusBar.showMessage(get_text('error_loading_config', self.current_language, error=str(e)))
+
+        # Save the validated mappings
+        self.save_config()
+
+    def format_time(self, seconds):
+        """Convert seconds to MM:SS format"""
+        minutes = int(seconds // 60)
+        seconds = int(seconds % 60)
+        return f"{minutes:02d}:{seconds:02d}"
+
+    def update_position(self):
+        """Update the playback position display"""
+        if not self.is_playing:  # Only check is_playing, remove track_length check
+            return
+
+        try:
+            # Get current position in seconds
+            current_pos = self.playback_position()
+            if self.crossfade_decks.active:
+                busy = self.crossfade_decks.busy()
+            else:
+                busy = self.audio.busy()
+
+            if self.track_length > 0:  # Prevent division by zero
+                # on_track_end advances the playlist, this only catches an end event that never came
+                if current_pos > self.track_length + 1 and not busy:
+                    self.play_next_track()
+                    return
+
+                self._show_position(current_pos)
+
+        except Exception as e:
+            print(f"Error updating position: {str(e)}")
+
+    def _show_position(self, current_pos):
+        """Show a position on the progress bar and the time labels"""
+        if self.track_length > 0:
+            self.progress_bar.setValue(min(int(current_pos / self.track_length * 1000), 1000))
+        self.current_time_label.setText(self.format_time(current_pos))
+        remaining = max(0, self.track_length - current_pos)
+        self.total_time_label.setText(f"-{self.format_time(remaining)}")
+
+    def on_track_end(self, ticks):
+        """The mixer ended a track: follow the queued track that took over, or play the next one"""
+        # Paused or stopped, the clock has no start and nothing follows
+        if not self.is_playing or self.playback_clock.started is None:
+            return
+        # Stopping a track for another one also posts the event, it came before the new start
+        if ticks <= self.playback_clock.started:
+            return
+        try:
+            if self.crossfade_decks.active:
+                # The outgoing channel ends after every fade, only the current one matters
+                if not self.crossfade_decks.busy():
+                    self.play_next_track()
+            elif self.queued_track is not None and self.audio.busy():
+                self._start_queued_track()
+            elif not self.audio.busy():
+                self.play_next_track()
+        except Exception as e:
+            print(f"Error handling track end: {str(e)}")
+
+    def playback_position(self):
+        """Seconds into the current track"""
+        return self.playback_clock.position()
+
+    def heard_position(self):
+        """Seconds into the current track that can be heard now, the clock minus the output latency.
+
+        The karaoke views follow this, so lines change with the sound and
+        not a buffer or two before it.
+        """
+        return max(0.0, self.playback_clock.position() - self.audio.latency)
+
+    def seek(self, seconds):
+        """Jump to a position in the current track, also while paused"""
+        if not self.playback_clock.active or self.track_length <= 0:
+            return
+        seconds = max(0.0, min(seconds, self.track_length))
+        try:
+            if self.crossfade_decks.active:
+                self.crossfade_decks.seek(seconds)
+            else:
+                self.audio.seek(seconds)
+            self.playback_clock.seek(seconds)
+            self._show_position(seconds)
+            self._schedule_crossfade()
+            # The subtitles count from the new position
+            self.frame_scheduler.wake()
+        except Exception as e:
+            self.statusBar.showMessage(f"Error seeking: {str(e)}")
+
+    def _seek_to_fraction(self, fraction):
+        """Seek to a click on the progress bar"""
+        self.seek(fraction * self.track_length)
+
+    def load_waveform(self, prepared):
+        """Show the waveform of a track that starts playing, from the cache or decoded on the waveform thread.
+
+        Crossfading, the decoded sound of the track is used as it is.
+        """
+        self.progress_bar.set_peaks(None)
+        path = prepared.path
+        sound = prepared.sound
+
+        def job(cancelled):
+            overview = self.waveform_cache.get(path)
+            if overview is None:
+                decoded = sound if sound is not None else self.audio.decode(prepared.source())
+                samples = self.audio.samples(decoded)
+                if samples is None or cancelled():
+                    return path, None
+                overview = peaks(samples)
+                if overview is not None:
+                    self.waveform_cache.put(path, overview)
+            return path, overview
+
+        self.waveform_loader.submit(job)
+
+    def _on_waveform_loaded(self, generation, result):
+        path, overview = result
+        if generation == self.waveform_loader.generation and path == self.current_track:
+            self.progress_bar.set_peaks(overview)
+
+    def play_previous_track(self):
+        """Play the previous track in the playlist, the last one before the first"""
+        play_queue = self._play_queue_at_current()
+        prev_track = play_queue.peek_previous()
+        if prev_track:
+            # Step back to that slot now, going forward would pick the next copy of a track listed twice
+            play_queue.move_to(prev_track, backwards=True)
+            self.play_selected_track_by_path(prev_track)
+
+    def _play_queue_at_current(self):
+        """The play queue over the shown list, its cursor moved along to the current track"""
+        self.play_queue.sync(self.filtered_files, self.current_track)
+        if self.current_track and self.play_queue.current != self.current_track:
+            self.play_queue.move_to(self.current_track)
+        return self.play_queue
+
+    def _next_track_path(self, skip=False):
+        """The track after the current one: a queued track, or the next in the play order, see PlayQueue.peek_next"""
+        return self._play_queue_at_current().peek_next(skip)
+
+    def play_next_track(self, skip=False):
+        """Play the next track in the playlist, skip: the user asked for it, repeat one moves on too"""
+        next_track = self._next_track_path(skip)
+        if not next_track:
+            # The list ended without repeat
+            if not skip and self.is_playing:
+                self.stop_playback()
+            return
+
+        # Stop current SRT display if it exists
+        self._close_srt_display()
+
+        # Play next track
+        self.play_selected_track_by_path(next_track)
+
+        # Update status bar
+        self.statusBar.showMessage(f"Playing next track: {os.path.basename(next_track)}")
+
+    def _close_srt_display(self):
+        """Stop and close the karaoke window if it is open"""
+        if self.srt_display and self.srt_display.isVisible():
+            self.srt_display.stop_display()
+            self.srt_display.close()
+            self.srt_display = None
+
+    def preload_next_track(self):
+        """Read the next track ahead on a background thread, see _on_next_track_prepared"""
+        next_track = self._next_track_path() if self.current_track else None
+        if not next_track:
+            self.track_preloader.cancel()
+            return
+        if self.library_index is not None and self.library_index.needs_loudness(next_track):
+            # Its gain is known before it starts
+            self.loudness_analyzer.request(next_track)
+        crossfade = self.crossfade_seconds > 0
+        prepared = self.queued_track or self.prepared_track
+        if prepared is not None and prepared.path == next_track and (prepared.sound is not None or not crossfade):
+            return
+
+        def job(cancelled):
+            prepared = self._prepare_track(next_track, crossfade, cancelled=cancelled)
+            prepared.lyrics = self._read_track_lyrics(next_track)
+            return prepared
+
+        self.track_preloader.submit(job)
+
+    def _prepare_track(self, path, crossfade, prepared=None, cancelled=None):
+        """The contents and length of a track, from the track cache or else read from disk.
+
+        For a crossfade the sound is decoded as well, so a fade never waits
+        for the decoder. Runs on the preload thread as well as the GUI thread.
+        """
+        if prepared is None:
+            prepared = self.track_cache.get(path)
+        if prepared is None:
+            with open(path, 'rb') as f:
+                data = f.read()
+            prepared = PreparedTrack(path, data, read_duration(path, data), {})
+        if cancelled is not None and cancelled():
+            raise SearchCancelled()
+        if (crossfade and prepared.sound is None) or prepared.duration is None:
+            # No length in the header either means decoding the whole file
+            sound = self.audio.decode(prepared.source())
+            prepared.duration = sound.get_length()
+            if crossfade:
+                prepared.sound = sound
+                prepared.sound_size = self.audio.sound_size(sound)
+        return prepared
+
+    def _read_track_lyrics(self, music_file):
+        """Read the text lyrics load_lyrics will show for a track, runs on the preload thread"""
+        mapping = self.lyrics_mapping.get(music_file, {})
+        if isinstance(mapping, dict):
+            mapped = mapping.get('text_path')
+        else:
+            mapped = mapping if isinstance(mapping, str) and not mapping.lower().endswith('.srt') else None
+
+        base_name = os.path.splitext(os.path.basename(music_file))[0]
+        candidates = [mapped] if mapped and isinstance(mapped, str) else []
+        candidates += [os.path.join(self.lyrics_dir, f"{base_name}{ext}") for ext in ('.odt', '.txt')]
+        for lyrics_path in candidates:
+            try:
+                if os.path.exists(lyrics_path):
+                    return {lyrics_path: (os.path.getmtime(lyrics_path), read_lyrics_text(lyrics_path))}
+            except Exception as e:
+                print(f"Error reading lyrics ahead: {str(e)}")
+        return {}
+
+    def _on_next_track_prepared(self, generation, prepared):
+        """Queue the prepared next track in the mixer, the decoder opens it right away"""
+        if generation != self.track_preloader.generation or prepared.path != self._next_track_path():
+            return
+        self.prepared_track = prepared
+        self.track_cache.put(prepared)
+        if not self.playback_clock.active or self.crossfade_seconds > 0 or self.crossfade_decks.active:
+            return
+        try:
+            self.audio.queue(prepared.source(), prepared.namehint)
+            self.queued_track = prepared
+        except Exception as e:
+            self.queued_track = None
+            print(f"Error queueing next track: {str(e)}")
+
+    def _start_queued_track(self):
+        """Follow the mixer to the queued track, it already plays so nothing is loaded"""
+        prepared = self.queued_track
+        self.queued_track = None
+        self.prepared_track = None
+
+        # The list changed after queueing and another track should follow, play that one instead
+        if prepared.path != self._next_track_path():
+            self.play_next_track()
+            return
+
+        # The mixer switched when the previous track ended, its position counts from there
+        self._follow_track(prepared, self.audio.ticks() - int(self.audio.stream_position() * 1000))
+
+    def set_crossfade(self, seconds):
+        """Change the crossfade length, it applies to the next track change"""
+        self.crossfade_seconds = seconds
+        self.config['crossfade_seconds'] = seconds
+        self.config_save_timer.start()
+        self._schedule_crossfade()
+        if self.current_track:
+            self.preload_next_track()
+
+    def on_mixer_profile_selected(self, index):
+        profile = self.mixer_profile_combo.itemData(index)
+        if profile == self.audio.profile:
+            return
+        self.config['mixer_profile'] = profile
+        self.config_save_timer.start()
+        self.apply_mixer_profile(profile)
+        self.statusBar.showMessage(get_text('mixer_profile_set', self.current_language).format(
+            profile=self.mixer_profile_combo.itemText(index), latency=int(self.audio.latency * 1000)))
+
+    def apply_mixer_profile(self, profile):
+        """Open the mixer with a profile, a playing track goes on from where it was.
+
+        The latency the karaoke views make up for is the one calibrate_audio
+        measured for the profile, or else the backend's estimate.
+        """
+        track = self.current_track if self.playback_clock.active else None
+        position = self.playback_position()
+        was_playing = self.is_playing
+        if track:
+            self.stop_playback()
+        reopen = profile != self.audio.profile
+        self.audio.set_profile(profile)
+        if reopen:
+            self.audio.quit()
+            self.audio.init()
+            self.crossfade_decks.reset()
+        measured = self.config.get('mixer_calibration', {}).get(profile)
+        if measured:
+            self.audio.latency = float(measured.get('latency', self.audio.latency))
+        self.mixer_profile_combo.setCurrentIndex(max(0, self.mixer_profile_combo.findData(profile)))
+        if track:
+            self.play_selected_track_by_path(track)
+            self.seek(position)
+            if not was_playing:
+                self.play_pause()
+
+    def calibrate_audio(self):
+        """Measure latency and underruns of every mixer profile and switch to the best one.
+
+        The best one is the fastest profile that kept up (under 1% late
+        buffers) on this machine as it is loaded now, robust if none did.
+        Playback stops, the mixer plays silence for a few seconds per profile.
+        """
+        if self.playback_clock.active:
+            self.stop_playback()
+        progress = QProgressDialog(get_text('calibrate_progress', self.current_language), None, 0,
+                                   len(MIXER_PROFILES), self)
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setWindowTitle(get_text('calibrate_button', self.current_language))
+        progress.setMinimumDuration(0)
+        results = {}
+        previous = self.audio.profile
+        try:
+            for step, profile in enumerate(MIXER_PROFILES):
+                progress.setValue(step)
+                QApplication.processEvents()
+                self.audio.set_profile(profile)
+                self.audio.quit()
+                self.audio.init()
+                results[profile] = self.audio.calibrate()
+        except Exception as e:
+            print(f"Error calibrating audio: {str(e)}")
+            self.statusBar.showMessage(f"Error calibrating audio: {str(e)}")
+        finally:
+            progress.setValue(len(MIXER_PROFILES))
+            self.crossfade_decks.reset()
+        if not results:
+            # Back to the mixer as it was
+            self.apply_mixer_profile(previous)
+            return
+
+        steady = [profile for profile in results if results[profile]['underruns'] < 0.01]
+        best = min(steady, key=lambda profile: results[profile]['latency']) if steady else 'robust'
+        self.config['mixer_calibration'] = {profile: {'latency': result['latency'], 'underruns': result['underruns']}
+                                            for profile, result in results.items()}
+        self.config['mixer_profile'] = best
+        self.config_save_timer.start()
+        self.apply_mixer_profile(best)
+
+        lines = [get_text('calibrate_result', self.current_language).format(
+                     profile=get_text(f'mixer_{profile}', self.current_language),
+                     latency=int(result['latency'] * 1000),
+                     underruns=f"{result['underruns'] * 100:.1f}")
+                 for profile, result in results.items()]
+        lines.append('')
+        lines.append(get_text('calibrate_chosen', self.current_language).format(
+            profile=get_text(f'mixer_{best}', self.current_language)))
+        QMessageBox.information(self, get_text('calibrate_button', self.current_language), '\n'.join(lines))
+
+    def _schedule_crossfade(self):
+        """Time the fade into the next track on the deck clock, the mixer then runs the fade itself"""
+        self.crossfade_timer.stop()
+        if not self.crossfade_decks.active or not self.is_playing:
+            return
+        fade = min(self.crossfade_seconds, self.track_length / 2)
+        delay = self.track_length - fade - self.playback_position()
+        self.crossfade_timer.start(max(0, int(delay * 1000 / self.audio.speed)))
+
+    def start_crossfade(self):
+        """Fade the next track in over the end of the current one"""
+        next_track = self._next_track_path()
+        if not self.is_playing or not self.crossfade_decks.active or not next_track:
+            return
+        try:
+            prepared = self.prepared_track
+            if prepared is None or prepared.path != next_track or prepared.sound is None:
+                # Not read ahead in time, decode it now rather than cut
+                prepared = self._prepare_track(next_track, True)
+            self.prepared_track = None
+            fade = min(self.crossfade_seconds, self.track_length / 2, prepared.duration / 2)
+            self.crossfade_decks.play(prepared.sound, int(fade * 1000), self._track_gain(prepared.path))
+            self._follow_track(prepared, self.audio.ticks())
+        except Exception as e:
+            print(f"Error starting crossfade: {str(e)}")
+            self.play_next_track()
+
+    def _follow_track(self, prepared, started):
+        """Update the player for a track the mixer already started at the given ticks"""
+        self._close_srt_display()
+
+        self.playback_clock.start(0.0, started)
+        self.current_track = prepared.path
+        self.track_length = prepared.duration
+        # A queued track took over the stream, it plays at its own gain from here
+        self.track_gain = self._track_gain(prepared.path)
+        self._apply_volume()
+        self.track_cache.put(prepared)
+        self.load_waveform(prepared)
+        self.progress_bar.setValue(0)
+        self.current_time_label.setText("00:00")
+        self.total_time_label.setText(self.format_time(self.track_length))
+        self.favorite_button.setChecked(prepared.path in self.favorites)
+        self.add_to_history(prepared.path)
+        self.preloaded_lyrics = prepared.lyrics
+        self.load_lyrics(prepared.path)
+        self.statusBar.showMessage(f"Playing next track: {os.path.basename(prepared.path)}")
+        if hasattr(self, 'current_track_label'):
+            metadata = self.get_metadata(prepared.path)
+            self.current_track_label.setText(f"Nu: {metadata['artist']} - {metadata['title']}")
+        self.update_playlist_info()
+        self.preload_next_track()
+        self._schedule_crossfade()
+
+    def play_selected_track_by_path(self, file_path):
+        """Play a track by its file path"""
+        if not file_path:
+            return
+
+        try:
+            # Update favorite button state
+            self.favorite_button.setChecked(file_path in self.favorites)
+
+            # Add to history
+            self.add_to_history(file_path)
+
+            # Stop any current playback and timer, this also drops a queued track
+            if self.audio.busy():
+                self.audio.stop()
+            self.crossfade_decks.stop()
+            self.crossfade_timer.stop()
+            self.frame_scheduler.sleep('position')
+            self.queued_track = None
+
+            # Reset all playback state
+            self.current_track = file_path
+            self.is_playing = False
+            self.playback_clock.stop()
+            self.progress_bar.setValue(0)
+            self.current_time_label.setText("00:00")
+
+            # Use the track read ahead or kept from an earlier play, otherwise read it now.
+            # Crossfading plays the whole decoded track on one of the two deck channels
+            prepared = self.prepared_track if self.prepared_track and self.prepared_track.path == file_path else None
+            self.prepared_track = None
+            prepared = self._prepare_track(file_path, self.crossfade_seconds > 0, prepared)
+            sound = prepared.sound if self.crossfade_seconds > 0 else None
+            self.track_length = prepared.duration
+            self.preloaded_lyrics = prepared.lyrics
+            self.track_cache.put(prepared)
+            self.load_waveform(prepared)
+
+            # Update total time label
+            self.total_time_label.setText(self.format_time(self.track_length))
+
+            # Load lyrics before starting playback
+            self.load_lyrics(file_path)
+
+            # Start playback
+            self.track_gain = self._track_gain(file_path)
+            if sound is not None:
+                self.crossfade_decks.play(sound, gain=self.track_gain)
+            else:
+                self.audio.load(prepared.source(), prepared.namehint)
+                self.audio.play()
+            self._apply_volume()
+            self.audio.clear_end_events()
+
+            # Start the clock and update UI
+            self.playback_clock.start()
+            self.play_button.setText("Pause")
+            self.is_playing = True
+            self.mixer_events.start()
+            self.statusBar.showMessage(f"Playing: {os.path.basename(file_path)}")
+
+            # Update favorites display if this is a favorite
+            if file_path in self.favorites:
+                self.statusBar.showMessage(f"Playing favorite: {os.path.basename(file_path)}")
+
+            # Show the position once the mixer is ready, the subtitles follow the new start
+            self.frame_scheduler.wake(delay_ms=50)
+
+            # Update current track label
+            if hasattr(self, 'current_track_label'):
+                metadata = self.get_metadata(file_path)
+                self.current_track_label.setText(f"Nu: {metadata['artist']} - {metadata['title']}")
+
+            # Update playlist info
+            self.update_playlist_info()
+
+            # Read the next track ahead while this one plays
+            self.preload_next_track()
+            self._schedule_crossfade()
+
+        except Exception as e:
+            self.statusBar.showMessage(f"Error playing track: {str(e)}")
+            try:
+                self.audio.quit()
+                self.audio.init()
+                self.crossfade_decks.reset()
+            except:
+                pass
+
+    def _position_frame(self):
+        """Frame scheduler job for the progress bar and time labels, nothing to draw while paused or minimized"""
+        if not self.is_playing or not self.isVisible() or self.isMinimized():
+            return None
+        self.update_position()
+        # The labels show seconds, the bar moves a step every length/width: no need to draw more often
+        step = self.track_length * 1000 / max(1, self.progress_bar.width())
+        return max(20, int(min(max(step, 100), 500) / self.audio.speed))
+
+    def refresh_playlists(self):
+        """Load all playlists from the playlist directory"""
+        self.playlist_combo.clear()
+        try:
+            playlists = [f for f in os.listdir(self.playlist_dir) if f.endswith('.json')]
+            if playlists:
+                self.playlist_combo.addItems(playlists)
+                self.statusBar.showMessage(f"Loaded {len(playlists)} playlists")
+            else:
+                self.statusBar.showMessage("No playlists found")
+        except Exception as e:
+            self.statusBar.showMessage(f"Error loading playlists: {str(e)}")
+
+    def on_playlist_selected(self, index):
+        """Handle playlist selection"""
+        selected_playlist = self.playlist_combo.currentText()
+        if selected_playlist:
+            # Load the playlist immediately when selected
+            self.load_playlist()
+
+    def load_playlist(self):
+        """Load the selected playlist"""
+        selected_playlist = self.playlist_combo.currentText()
+        if not selected_playlist:
+            QMessageBox.warning(self, "Warning", "Please select a playlist first")
+            return
+
+        try:
+            # Get the playlist path
+            playlist_path = os.path.join(self.playlist_dir, selected_playlist)
+            if not os.path.exists(playlist_path):
+                self.statusBar.showMessage(f"Playlist file not found: {selected_playlist}")
+                return
+
+            # Load the playlist files
+            with open(playlist_path, 'r') as f:
+                data = json.load(f)
+
+            # A smart playlist is a saved query, its tracks come from the library index
+            smart_playlist = SmartPlaylist.from_json(data)
+            if smart_playlist is not None:
+                cached = self.smart_playlists.get(playlist_path)
+                if cached is not None and cached.steps == smart_playlist.steps:
+                    smart_playlist = cached
+                self.smart_playlists[playlist_path] = smart_playlist
+                index = self._get_library_index()
+                files = index.paths_of(smart_playlist.evaluate(index))
+            else:
+                files = data
+            self._show_playlist(selected_playlist, files, smart_playlist is None)
+            self._set_smart_playlist(smart_playlist)
+
+        except Exception as e:
+            self.statusBar.showMessage(f"Error loading playlist: {str(e)}")
+            print(f"Error in load_playlist: {str(e)}")
+
+    def _set_smart_playlist(self, smart_playlist):
+        """Follow library changes (scans, tags read in the background) while a smart playlist is shown"""
+        self.current_smart_playlist = smart_playlist
+        if smart_playlist is not None:
+            self.frame_scheduler.wake('smart_playlist', 5000)
+        else:
+            self.frame_scheduler.sleep('smart_playlist')
+
+    def _smart_playlist_frame(self):
+        """Frame scheduler job: check the shown smart playlist every 5 seconds, not while minimized"""
+        if self.current_smart_playlist is None or not self.isVisible() or self.isMinimized():
+            return None
+        self.refresh_smart_playlist()
+        return 5000
+
+    def refresh_smart_playlist(self):
+        """Bring the shown smart playlist up to date with the library, only the changed tracks are evaluated"""
+        smart_playlist = self.current_smart_playlist
+        if smart_playlist is None or self.library_index is None:
+            return
+        # Leave a list the user is filtering alone
+        if self.live_filter_base is not None or (self.current_filter_stage is not None and
+                                                 self.current_filter_stage.parent is not None):
+            return
+        if smart_playlist.generation == self.library_index.generation and not smart_playlist.relative_time:
+            return
+        try:
+            previous = smart_playlist.ids
+            ids = smart_playlist.evaluate(self.library_index)
+            if previous is not None and np.array_equal(previous, ids):
+                return
+            self._show_playlist(self.playlist_combo.currentText(), self.library_index.paths_of(ids), False)
+            self._set_smart_playlist(smart_playlist)
+        except Exception as e:
+            print(f"Error in refresh_smart_playlist: {str(e)}")
+
+    def _show_playlist(self, selected_playlist, files, check_exists):
+        """Show files as the playlist node, the new play list"""
+        try:
+            # Create a new model, the favorites and history sections move along
+            view_state = self.view_state.snapshot()
+            new_model = self._new_tree_model()
+
+            # Add playlist item, only files that still exist get rows as the view scrolls
+            if check_exists:
+                playlist_item = TrackListItem(selected_playlist, [file for file in files if os.path.exists(file)])
+            else:
+                playlist_item = TrackListItem(selected_playlist, files)
+            new_model.appendRow(playlist_item)
+
+            # Replace the old model with the new one
+            self.proxy_model.set_accepted_paths(None)
+            self.proxy_model.setSourceModel(new_model)
+            self.tree_model = new_model
+
+            # Expand only drive/playlist sections, not favorites and history
+            for i in range(self.tree_model.rowCount()):
+                item = self.tree_model.item(i)
+                if item and not item.data(SECTION_ROLE):
+                    index = self._view_index_from_item(item)
+                    self.tree_view.expand(index)
+
+            # Reloading the same playlist keeps the user's place in it
+            self.view_state.restore(view_state)
+
+            # Update filtered files, a live filter on the previous list no longer applies
+            self._drop_live_filter()
+            self.filtered_files = files
+            self._reset_filter_history(files)
+            self.statusBar.showMessage(f"Loaded {len(files)} tracks from {selected_playlist}")
+
+            # Update file count
+            self.update_file_count()
+
+        except Exception as e:
+            self.statusBar.showMessage(f"Error loading playlist: {str(e)}")
+            print(f"Error in _show_playlist: {str(e)}")
+
+    def refresh_drives(self):
+        """Quick scan for available drives"""
+        # Get currently available drives with simple error handling
+        self.available_drives = []
+        
+        for drive in range(65, 91):  # A-Z
+            drive_letter = f"{chr(drive)}:"
+            try:
+                if os.path.exists(drive_letter):
+                    self.available_drives.append(drive_letter)
+            except Exception as e:
+                print(f"Error checking drive {drive_letter}: {str(e)}")
+                continue
+
+        # Update combo box with both saved and available drives
+        self.drive_combo.clear()
+
+        # Add saved drives first
+        saved_drives = list(self.saved_files.keys())
+        if saved_drives:
+            self.drive_combo.addItem("--- Saved Drives ---")
+            for drive in saved_drives:
+                status = "✓" if drive in self.available_drives else "✗"
+                self.drive_combo.addItem(f"{drive} {status}")
+
+        # Add available drives that aren't saved
+        new_drives = [d for d in self.available_drives if d not in self.saved_files]
+        if new_drives:
+            self.drive_combo.addItem("--- Available Drives ---")
+            for drive in new_drives:
+                self.drive_combo.addItem(f"{drive} (New)")
+
+        self.statusBar.showMessage(f"Found {len(self.available_drives)} available drives")
+
+    def on_drive_selected(self, index):
+        """Handle drive selection"""
+        selected_text = self.drive_combo.currentText()
+        if selected_text and not selected_text.startswith("---"):
+            # Extract drive letter from the display text
+            drive = selected_text.split()[0]
+            self.current_drive = drive
+
+            # Check if drive has saved files
+            if drive in self.saved_files:
+                # Count file types
+                file_types = {}
+                for file in self.saved_files[drive]:
+                    ext = os.path.splitext(file)[1].lower()
+                    file_types[ext] = file_types.get(ext, 0) + 1
+
+                # Create type info string
+                type_info = []
+                for ext, count in file_types.items():
+                    type_info.append(f"{ext}: {count}")
+
+                # Update status bar
+                self.statusBar.showMessage(
+                    f"Drive {drive} heeft {len(self.saved_files[drive])} bestanden - {', '.join(type_info)}")
+            else:
+                self.statusBar.showMessage(f"Drive {drive} heeft geen opgeslagen bestanden")
+
+    def read_saved_files(self):
+        selected_text = self.drive_combo.currentText()
+        if not selected_text or selected_text.startswith("---"):
+            QMessageBox.warning(self, "Warning", "Please select a drive first")
+            return
+
+        # Extract drive letter from the display text
+        selected_drive = selected_text.split()[0]
+        self.current_drive = selected_drive
+
+        try:
+            self._drop_live_filter()
+            self._set_smart_playlist(None)
+            if selected_drive in self.saved_files:
+                # Store original files if this is the first time loading this drive
+                if not self.append_checkbox.isChecked():
+                    self.original_files = self.saved_files[selected_drive].copy()
+                    self.filtered_files = self.original_files.copy()
+                else:
+                    # Add new files to original_files and filtered_files
+                    new_files = [f for f in self.saved_files[selected_drive] if f not in self.original_files]
+                    self.original_files.extend(new_files)
+                    self.filtered_files.extend(new_files)
+
+                paths = self.saved_files[selected_drive]
+                view_state = self.view_state.snapshot()
+                drive_item = self._shown_drive_item(selected_drive)
+
+                if drive_item is not None and paths[:len(drive_item.paths)] == drive_item.paths:
+                    # The drive is already shown: keep its node, only new tracks are added
+                    if len(paths) > len(drive_item.paths):
+                        drive_item.add_paths(paths[len(drive_item.paths):])
+                    self.proxy_model.set_accepted_paths(None)
+                else:
+                    # Create a new model, the favorites and history sections move along
+                    new_model = self._new_tree_model()
+
+                    # The drive node creates its rows page by page as the view scrolls
+                    drive_item = self._new_drive_item(selected_drive, paths)
+                    new_model.appendRow(drive_item)
+
+                    # Replace the old model with the new one
+                    self.proxy_model.set_accepted_paths(None)
+                    self.proxy_model.setSourceModel(new_model)
+                    self.tree_model = new_model
+
+                    # Expand only drive/playlist sections, not favorites and history
+                    for i in range(self.tree_model.rowCount()):
+                        item = self.tree_model.item(i)
+                        if item and not item.data(SECTION_ROLE):
+                            index = self._view_index_from_item(item)
+                            self.tree_view.expand(index)
+
+                # Keep the user's place in the list
+                self.view_state.restore(view_state)
+
+                # Update drive item text with file count
+                drive_item.setText(f"{selected_drive} ({len(drive_item.paths)} bestanden)")
+
+                self.statusBar.showMessage(
+                    f"Loaded {len(self.saved_files[selected_drive])} files from {selected_drive}")
+
+                # After loading files, reload lyrics mappings
+                self.load_lyrics_mappings()
+
+                # Filters start again from the loaded list
+                self._reset_filter_history(self.filtered_files)
+
+                # Update file count
+                self.update_file_count()
+            else:
+                self.statusBar.showMessage(f"No saved files found for {selected_drive}")
+
+        except Exception as e:
+            self.statusBar.showMessage(f"Error loading files: {str(e)}")
+            print(f"Error in read_saved_files: {str(e)}")
+            # Try to recover by clearing the tree
+            self._clear_tree_rows()
+            self.filtered_files = []
+            self.original_files = []
+            self.update_file_count()
+
+    def scan_selected_drive(self):
+        """Scan only the selected drive for audio files"""
+        selected_text = self.drive_combo.currentText()
+        if not selected_text or selected_text.startswith("---"):
+            QMessageBox.warning(self, "Warning", "Please select a drive first")
+            return
+
+        # Extract drive letter from the display text
+        drive = selected_text.split()[0]
+
+        # Show scanning popup
+        scanning_dialog = ScanningDialog(self, drive, self.current_language)
+        scanning_dialog.show()
+        QApplication.processEvents()
+
+        try:
+            # The scanned drive joins the tree, a shown smart playlist stops following the library
+            self._set_smart_playlist(None)
+
+            # Clear existing items if not appending
+            if not self.append_checkbox.isChecked():
+                self._clear_drive_items(drive)
+
+            # Create progress dialog
+            progress = QProgressDialog(f"Scanning drive {drive}...", "Cancel", 0, 100, self)
+            progress.setWindowModality(Qt.WindowModality.WindowModal)
+            progress.setWindowTitle("Scanning Progress")
+            progress.setAutoClose(True)
+
+            # Create drive item
+            drive_item = self._new_drive_item(drive)
+            self.tree_model.appendRow(drive_item)
+
+            # Scan for audio files
+            audio_files = self._scan_drive_for_audio_files(drive, progress)
+
+            if not progress.wasCanceled():
+                self._process_scan_results(drive, drive_item, audio_files)
+
+        except Exception as e:
+            self.show_error("Scanning Error", f"Error scanning drive {drive}", str(e))
+        finally:
+            # Always close the scanning dialog
+            scanning_dialog.close()
+            scanning_dialog.deleteLater()
+            QApplication.processEvents()
+
+    def _clear_drive_items(self, drive):
+        """Clear existing items for a drive while preserving favorites and history"""
+        # Remove existing drive item if it exists
+        for i in range(self.tree_model.rowCount()):
+            item = self.tree_model.item(i)
+            if item and not item.data(SECTION_ROLE) and item.text().startswith(drive):
+                self.tree_model.removeRow(i)
+                break
+
+        self.drive_file_counts.pop(drive, None)
+        self.filtered_files = [f for f in self.filtered_files if not f.startswith(drive)]
+        QApplication.processEvents()
+
+    def _scan_drive_for_audio_files(self, drive, progress):
+        """Scan drive for audio files with progress updates"""
+        audio_files = []
+        total_files = 0
+        scanned_files = 0
+
+        try:
+            # First count total files for progress bar
+            for root, _, files in os.walk(drive):
+                for file in files:
+                    if file.lower().endswith(('.mp3', '.wav', '.ogg', '.flac', '.m4a', '.aac')):
+                        total_files += 1
+                        if total_files % 100 == 0:  # Update UI periodically
+                            QApplication.processEvents()
+
+            # Now scan and add files
+            for root, _, files in os.walk(drive):
+                if progress.wasCanceled():
+                    break
+
+                for file in files:
+                    if file.lower().endswith(('.mp3', '.wav', '.ogg', '.flac', '.m4a', '.aac')):
+                        file_path = os.path.join(root, file)
+                        audio_files.append(file_path)
+                        scanned_files += 1
+
+                        # Update progress
+                        progress_value = int((scanned_files / total_files) * 100)
+                        progress.setValue(progress_value)
+                        progress.setLabelText(f"Scanning drive {drive}... ({scanned_files}/{total_files} files)")
+
+                        # Update UI periodically
+                        if scanned_files % 50 == 0:
+                            QApplication.processEvents()
+
+        except Exception as e:
+            print(f"Error scanning drive {drive}: {str(e)}")
+            # Return whatever files we found before the error
+            return audio_files
+
+        return audio_files
+
+    def _process_scan_results(self, drive, drive_item, audio_files):
+        """Process and display scan results"""
+        # Update file counts
+        file_types = {}
+        for file in audio_files:
+            ext = os.path.splitext(file)[1].lower()
+            file_types[ext] = file_types.get(ext, 0) + 1
+
+        # Update drive_file_counts
+        self.drive_file_counts[drive] = {
+            'total': len(audio_files),
+            'types': file_types
+        }
+
+        # Keep freshly scanned files visible while a filter is active
+        if self.proxy_model.accepted_paths is not None:
+            self.proxy_model.accepted_paths.update(audio_files)
+
+        # Rows are created page by page as the view scrolls
+        drive_item.add_paths(audio_files)
+        self.filtered_files.extend(audio_files)
+
+        # Update drive item text, this also lets the filter proxy look at the node again
+        type_info = []
+        for ext, count in file_types.items():
+            type_info.append(f"{ext}: {count}")
+        drive_item.setText(f"{drive} ({len(audio_files)} bestanden) - {', '.join(type_info)}")
+
+        # Save the scanned files
+        self.saved_files[drive] = audio_files
+        if self.library_index is not None:
+            self.library_index.add_paths(audio_files)
+        self.metadata_reader.wake()
+        self.loudness_analyzer.wake()
+        self.save_files()
+
+        # Update status
+        self.statusBar.showMessage(get_text('scanning_complete', self.current_language, count=len(audio_files), drive=drive))
+
+        # Automatically expand the drive item
+        index = self._view_index_from_item(drive_item)
+        self.tree_view.expand(index)
+
+        # Update file count
+        self.update_file_count_status()
+
+    def update_file_count(self):
+        """Update the file count in the status bar"""
+        count = len(self.filtered_files)
+        self.file_count_label.setText(get_text('files_label', self.current_language).replace('0', str(count)))
+
+        # The next track may have changed, read it ahead again once the list settles
+        if self.current_track:
+            self.preload_timer.start()
+
+    def apply_filter(self):
+        if not self.current_drive:
+            QMessageBox.warning(self, "Warning", "Please select a drive first")
+            return
+
+        # Get filter terms
+        positive_term = self.positive_filter.text().strip().lower()
+        negative_term = self.negative_filter.text().strip().lower()
+
+        if not positive_term and not negative_term:
+            QMessageBox.warning(self, "Warning", "Please enter at least one filter term")
+            return
+
+        try:
+            # Check a query before anything changes
+            if is_structured(positive_term):
+                parse_query(positive_term)
+
+            # The button applies the terms right away, a pending live search is no longer needed
+            self._stop_live_filter()
+            if self.live_filter_base is not None:
+                # The live filter already showed these terms, narrow what it started from
+                self.filtered_files = self.live_filter_base[0]
+                self.filter_stage = (self.filtered_files, self.live_filter_base[1]) \
+                    if self.live_filter_base[1] is not None else None
+                self.live_filter_base = None
+
+            # If this is the first filter, start with original files
+            if not self.filtered_files and self.original_files:
+                self.filtered_files = self.original_files.copy()
+
+            # A list replaced outside the history starts a new one
+            if self.current_filter_stage is None or self.current_filter_stage.files is not self.filtered_files:
+                self._reset_filter_history(self.filtered_files)
+
+            # Narrow the current list through the trigram index, the ids of the
+            # last filter result are reused while the list is unchanged
+            index = self._get_library_index()
+            candidates = self._filter_candidates(self.filtered_files)
+            fuzzy = self.fuzzy_checkbox.isChecked() and not is_structured(positive_term)
+            ids, files = self._search_index(index, positive_term, negative_term, candidates, fuzzy)
+            mask = set(files)
+            self._show_filter_result(files, ids, mask)
+
+            label = " ".join([positive_term] + [f"-{negative_term}"] * bool(negative_term)).strip()
+            self._push_filter_stage(FilterStage(label, (positive_term, negative_term, fuzzy),
+                                                self.current_filter_stage, files, ids, mask))
+
+        except QueryError as e:
+            # A typo in a query leaves the current list alone
+            self.statusBar.showMessage(f"Invalid query: {str(e)}")
+
+        except Exception as e:
+            self.statusBar.showMessage(f"Error applying filter: {str(e)}")
+            print(f"Error in apply_filter: {str(e)}")
+            # Try to recover by resetting the filter
+            self.reset_filter()
+
+    def _filter_candidates(self, files):
+        """Sorted index ids of files, taken from the last filter result when files is that result"""
+        if self.filter_stage and self.filter_stage[0] is files and len(self.filter_stage[1]) == len(files):
+            return self.filter_stage[1]
+        return self._library_ids(files)
+
+    def _reset_filter_history(self, files):
+        """Start a new filter history with files as the unfiltered list"""
+        root = FilterStage(get_text('filter_history_all', self.current_language), None, None, files, None, None)
+        self.filter_history = [root]
+        self.current_filter_stage = root
+        self._update_filter_history_combo()
+
+    def _push_filter_stage(self, stage):
+        """Add a filter result to the history and make it the current stage"""
+        while len(self.filter_history) >= self.filter_history_limit:
+            # Forget the oldest side branch first, else the oldest step of the current path
+            path = set()
+            current = self.current_filter_stage
+            while current is not None:
+                path.add(id(current))
+                current = current.parent
+            parents = {id(other.parent) for other in self.filter_history}
+            leaves = [other for other in self.filter_history[1:]
+                      if id(other) not in path and id(other) not in parents]
+            removed = leaves[0] if leaves else self.filter_history[1]
+            for other in self.filter_history:
+                if other.parent is removed:
+                    other.parent = removed.parent
+            self.filter_history.remove(removed)
+        self.filter_history.append(stage)
+        self.current_filter_stage = stage
+        self._update_filter_history_combo()
+
+    def _update_filter_history_combo(self):
+        """List the stages as a tree, branches below the stage they narrowed"""
+        children = {}
+        for stage in self.filter_history[1:]:
+            children.setdefault(id(stage.parent), []).append(stage)
+        self.filter_history_combo.blockSignals(True)
+        self.filter_history_combo.clear()
+        pending = list(self.filter_history[:1])
+        while pending:
+            stage = pending.pop()
+            self.filter_history_combo.addItem(f"{'   ' * stage.depth()}{stage.label} ({len(stage.files)})", stage)
+            if stage is self.current_filter_stage:
+                self.filter_history_combo.setCurrentIndex(self.filter_history_combo.count() - 1)
+            pending.extend(reversed(children.get(id(stage), [])))
+        self.filter_history_combo.blockSignals(False)
+        self.filter_undo_button.setEnabled(
+            self.current_filter_stage is not None and self.current_filter_stage.parent is not None)
+
+    def on_filter_history_activated(self, row):
+        stage = self.filter_history_combo.itemData(row)
+        if stage is not None and stage is not self.current_filter_stage:
+            self.show_filter_stage(stage)
+
+    def undo_filter(self):
+        """Go back to the list the current filter narrowed"""
+        if self.current_filter_stage is not None and self.current_filter_stage.parent is not None:
+            self.show_filter_stage(self.current_filter_stage.parent)
+
+    def show_filter_stage(self, stage):
+        """Show a stage from the filter history, new filters then narrow it"""
+        self._drop_live_filter()
+        # The fields belong to the next filter, clearing them must not start a live search
+        for field in (self.positive_filter, self.negative_filter):
+            field.blockSignals(True)
+            field.clear()
+            field.blockSignals(False)
+        self.current_filter_stage = stage
+        self._show_filter_result(stage.files, stage.ids, stage.mask)
+        self._update_filter_history_combo()
+        self.statusBar.showMessage(f"{stage.label}: {len(stage.files)} files")
+
+    def _search_index(self, index, positive_term, negative_term, candidates, fuzzy, cancelled=None):
+        """Sorted ids and paths of the candidates matching the filter terms.
+
+        In fuzzy mode (read from the checkbox by the caller, this also runs
+        on the search thread) the paths are the best matches for a plain
+        positive term, best first, so playing the list starts with the
+        closest match.
+        """
+        if fuzzy and positive_term and not is_structured(positive_term):
+            ranked = index.fuzzy_search(positive_term, candidates, self.fuzzy_result_limit, cancelled)
+            ids = index.search('', negative_term, np.sort(ranked), cancelled)
+            ranked = ranked[np.isin(ranked, ids, assume_unique=True)]
+            return ids, index.paths_of(ranked)
+        ids = index.search(positive_term, negative_term, candidates, cancelled)
+        return ids, index.paths_of(ids)
+
+    def _show_filter_result(self, files, ids, mask):
+        """Make files the play list and show them through the row mask (None for all rows)"""
+        self.filtered_files = files
+        self.filter_stage = (files, ids) if ids is not None else None
+
+        if self.filtered_files:
+            # Hide non-matching rows in the proxy, the model itself stays untouched
+            view_state = self.view_state.snapshot()
+            self.proxy_model.set_accepted_paths(mask)
+            self.statusBar.showMessage(f"Filter applied. Found {len(self.filtered_files)} matching files")
+
+            # Automatically expand all items
+            for i in range(self.proxy_model.rowCount()):
+                self.tree_view.expand(self.proxy_model.index(i, 0))
+
+            # Selected tracks that still match stay selected
+            self.view_state.restore(view_state)
+        else:
+            # Keep the view in sync with the now empty play list
+            self.proxy_model.set_accepted_paths(set())
+            self.statusBar.showMessage("No files match the filter criteria")
+
+        # Update file count
+        self.update_file_count()
+
+    def on_filter_text_changed(self, _text):
+        """Every keystroke or mode change cancels the search in flight and restarts the typing pause"""
+        self.background_search.cancel()
+        self.live_filter_timer.start()
+
+    def _stop_live_filter(self):
+        self.live_filter_timer.stop()
+        self.background_search.cancel()
+
+    def _drop_live_filter(self):
+        """Forget the live filter when the list it narrows is replaced"""
+        self._stop_live_filter()
+        self.live_filter_base = None
+
+    def start_live_filter(self):
+        """Search for the typed terms on the background thread"""
+        if not self.current_drive:
+            return
+        positive_term = self.positive_filter.text().strip().lower()
+        negative_term = self.negative_filter.text().strip().lower()
+
+        if self.live_filter_base is None:
+            if not positive_term and not negative_term:
+                return
+            if not self.filtered_files and self.original_files:
+                self.filtered_files = self.original_files.copy()
+            stage_ids = self.filter_stage[1] if self.filter_stage and \
+                self.filter_stage[0] is self.filtered_files else None
+            self.live_filter_base = (self.filtered_files, stage_ids, self.proxy_model.accepted_paths)
+        base_files, base_ids, base_mask = self.live_filter_base
+
+        if not positive_term and not negative_term:
+            # Empty fields bring back the list the live filter started from
+            self.live_filter_base = None
+            self._show_filter_result(base_files, base_ids, base_mask)
+            return
+
+        try:
+            # Half typed queries keep the last result until they parse
+            if is_structured(positive_term):
+                parse_query(positive_term)
+        except QueryError as e:
+            self.statusBar.showMessage(f"Invalid query: {str(e)}")
+            return
+
+        # Player state is read here, the job only touches the index and what it is given
+        fuzzy = self.fuzzy_checkbox.isChecked()
+        index = self._get_library_index()
+        candidates = base_ids if base_ids is not None else self._library_ids(base_files)
+
+        def job(cancelled):
+            ids, files = self._search_index(index, positive_term, negative_term, candidates, fuzzy, cancelled)
+            return candidates, ids, files, set(files)
+
+        self.background_search.submit(job)
+        self.statusBar.showMessage("Zoeken...")
+
+    def _on_live_filter_finished(self, generation, result):
+        """Show the result of the newest live search, older ones are ignored"""
+        if generation != self.background_search.generation or self.live_filter_base is None:
+            return
+        candidates, ids, files, mask = result
+        base_files, base_ids, base_mask = self.live_filter_base
+        if base_ids is None:
+            self.live_filter_base = (base_files, candidates, base_mask)
+        self._show_filter_result(files, ids, mask)
+
+    def reset_filter(self):
+        """Reset the filter to show all files from the current drive"""
+        if not self.current_drive:
+            QMessageBox.warning(self, "Warning", "Please select a drive first")
+            return
+
+        try:
+            if self.filter_history:
+                # Back to the unfiltered list without rebuilding it
+                self.show_filter_stage(self.filter_history[0])
+                self.statusBar.showMessage(f"Reset filter. Showing all {len(self.filtered_files)} files")
+                return
+
+            self._drop_live_filter()
+            if self.current_drive in self.saved_files:
+                self.filtered_files = self.saved_files[self.current_drive].copy()
+                self.statusBar.showMessage(f"Reset filter. Showing all {len(self.filtered_files)} files")
+            else:
+                self.statusBar.showMessage("No files found for current drive")
+
+            # Clearing the fields must not start a live search
+            for field in (self.positive_filter, self.negative_filter):
+                field.blockSignals(True)
+                field.clear()
+                field.blockSignals(False)
+
+            # Dropping the mask shows the existing rows again, the user keeps their place
+            view_state = self.view_state.snapshot()
+            self.proxy_model.set_accepted_paths(None)
+            self.view_state.restore(view_state)
+
+            # Update file count
+            self.update_file_count()
+
+        except Exception as e:
+            self.statusBar.showMessage(f"Error resetting filter: {str(e)}")
+            print(f"Error in reset_filter: {str(e)}")
+            # Try to recover by showing everything again
+            try:
+                self.proxy_model.set_accepted_paths(None)
+                self.filtered_files = []
+                self.update_file_count()
+            except:
+                pass
+
+    def _get_library_index(self):
+        """The search index of all saved tracks, loaded from disk and brought up to date on first use"""
+        # The live filter may ask for it from its background thread
+        with self.library_index_lock:
+            if self.library_index is None:
+                library_index = LibraryIndex.load(self.library_index_file)
+                for files in list(self.saved_files.values()):
+                    library_index.add_paths(files)
+                self.library_index = library_index
+        return self.library_index
+
+    def _library_ids(self, files):
+        """Sorted index ids of files, cached for the full list of the current drive"""
+        index = self._get_library_index()
+        drive_files = self.saved_files.get(self.current_drive)
+        cached = self.drive_library_ids.get(self.current_drive)
+        if cached and cached[0] is drive_files and cached[1] == len(drive_files) and files == drive_files:
+            return cached[2]
+        index.add_paths(files)
+        ids = index.ids_of(files)
+        if drive_files is not None and files == drive_files:
+            self.drive_library_ids[self.current_drive] = (drive_files, len(drive_files), ids)
+        return ids
+
+    def save_library_index(self):
+        """Write the search index to disk if it changed"""
+        if self.library_index is None or not self.library_index.changed:
+            return
+        try:
+            self.library_index.save(self.library_index_file)
+        except Exception as e:
+            print(f"Error saving library index: {str(e)}")
+
+    def _item_from_view_index(self, index):
+        """Get the model item behind an index coming from the tree view"""
+        if not index.isValid():
+            return None
+        return self.tree_model.itemFromIndex(self.proxy_model.mapToSource(index))
+
+    def _view_index_from_item(self, item):
+        """Get the tree view index for a model item"""
+        return self.proxy_model.mapFromSource(self.tree_model.indexFromItem(item))
+
+    def save_filtered_list(self):
+        if not self.filtered_files:
+            QMessageBox.warning(self, "Warning", "No filtered list to save")
+            return
+        self._save_playlist_file(self.filtered_files)
+
+    def save_smart_playlist(self):
+        """Save the filters leading to the current list as a playlist that follows the library"""
+        steps = []
+        stage = self.current_filter_stage
+        while stage is not None and stage.terms is not None:
+            steps.insert(0, stage.terms)
+            stage = stage.parent
+        # Terms the live filter shows but that were not applied yet
+        positive_term = self.positive_filter.text().strip().lower()
+        negative_term = self.negative_filter.text().strip().lower()
+        if self.live_filter_base is not None and (positive_term or negative_term):
+            steps.append((positive_term, negative_term,
+                          self.fuzzy_checkbox.isChecked() and not is_structured(positive_term)))
+
+        if not steps:
+            QMessageBox.warning(self, "Warning", "Apply a filter first, a smart playlist is saved as its filters")
+            return
+        if any(fuzzy for _, _, fuzzy in steps):
+            QMessageBox.warning(self, "Warning", "Fuzzy filters rank a fixed number of matches and cannot be saved as a smart playlist")
+            return
+        smart_playlist = SmartPlaylist([(positive, negative) for positive, negative, _ in steps])
+        self._save_playlist_file(smart_playlist.to_json())
+
+    def _save_playlist_file(self, data):
+        """Ask for a name and location and write the playlist data as JSON"""
+        # Create and show the dialog
+        dialog = PlaylistNameDialog(self)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            name = dialog.get_name()
+            if not name:
+                QMessageBox.warning(self, "Warning", "Please enter a playlist name")
+                return
+
+            # Ensure .json extension
+            if not name.endswith('.json'):
+                name += '.json'
+
+            # Ask for save location
+            playlist_path, _ = QFileDialog.getSaveFileName(
+                self,
+                "Save Playlist",
+                os.path.join(self.playlist_dir, name),
+                "JSON Files (*.json)"
+            )
+
+            if playlist_path:
+                try:
+                    # Update playlist directory to the directory of the saved file
+                    self.playlist_dir = os.path.dirname(playlist_path)
+                    self.save_config()
+
+                    with open(playlist_path, 'w') as f:
+                        json.dump(data, f)
+                    self.smart_playlists.pop(playlist_path, None)
+                    self.statusBar.showMessage(f"Playlist '{name}' saved successfully")
+                    # Refresh playlist list
+                    self.refresh_playlists()
+                except Exception as e:
+                    QMessageBox.critical(self, "Error", f"Error saving playlist: {str(e)}")
+                    self.statusBar.showMessage(f"Error saving playlist: {str(e)}")
+
+    def play_selected_track(self, index):
+        """Handle double click on track"""
+        item = self._item_from_view_index(index)
+        if not item:  # Skip if no item
+            return
+
+        # Handle double click on favorites or history section
+        if not item.parent() and item.data(SECTION_ROLE):
+            # Toggle expansion state
+            if self.tree_view.isExpanded(index):
+                self.tree_view.collapse(index)
+            else:
+                self.tree_view.expand(index)
+            return
+
+        if not item.parent():  # Skip if not a file
+            return
+
+        # The tree view opens and closes folders on double click by itself
+        if isinstance(item, FolderItem):
+            return
+
+        # Get the full path from the item's data
+        file_path = item.data(Qt.ItemDataRole.UserRole)
+        if not file_path:  # Fallback to text if no data
+            file_path = item.text()
+
+        # Play the selected track
+        self.play_selected_track_by_path(file_path)
+
+    def play_pause(self):
+        if not self.current_track:
+            return
+
+        if self.is_playing:
+            # Pause where we are, the clock stops with the mixer
+            self.playback_clock.pause()
+            self.audio.pause()
+            self.crossfade_decks.pause()
+            self.crossfade_timer.stop()
+            self.mixer_events.stop()
+            self.play_button.setText("Play")
+            self.is_playing = False
+            self.statusBar.showMessage("Playback paused")
+            self.frame_scheduler.sleep('position')
+        elif self.playback_clock.active:
+            # Resume from pause position, the track stays loaded
+            if self.crossfade_decks.active:
+                self.crossfade_decks.unpause()
+            else:
+                self.audio.unpause()
+            self.playback_clock.resume()
+            self.play_button.setText("Pause")
+            self.is_playing = True
+            self.statusBar.showMessage(f"Playing: {os.path.basename(self.current_track)}")
+            self.mixer_events.start()
+            self.frame_scheduler.wake()
+            self._schedule_crossfade()
+        else:
+            # Start from beginning
+            self.play_selected_track_by_path(self.current_track)
+
+    def stop_playback(self):
+        """Stop the current playback"""
+        try:
+            # Stop the music, this also drops a queued track
+            self.audio.stop()
+            self.crossfade_decks.stop()
+            self.crossfade_timer.stop()
+            self.mixer_events.stop()
+            self.playback_clock.stop()
+            self.queued_track = None
+            self.track_preloader.cancel()
+            self.waveform_loader.cancel()
+            self.progress_bar.set_peaks(None)
+
+            # Reset playback state
+            self.play_button.setText("Play")
+            self.is_playing = False
+            self.statusBar.showMessage("Playback stopped")
+            self.frame_scheduler.sleep('position')
+            self.progress_bar.setValue(0)
+            self.current_time_label.setText("00:00")
+            self.total_time_label.setText("00:00")
+
+            # Clear lyrics display
+            if hasattr(self, 'lyrics_display'):
+                self.lyrics_display.clear()
+
+            # Stop SRT display if open
+            self._close_srt_display()
+
+        except Exception as e:
+            self.statusBar.showMessage(f"Error stopping playback: {str(e)}")
+            print(f"Error in stop_playback: {str(e)}")
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.frame_scheduler.wake_all()
+
+    def changeEvent(self, event):
+        """Back from minimized, the scheduled updates catch up"""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange and not self.isMinimized():
+            self.frame_scheduler.wake_all()
+
+    def closeEvent(self, event):
+        """Handle application close"""
+        try:
+            # Stop playback and cleanup
+            self.stop_playback()
+
+            # Stop timers
+            self.frame_scheduler.timer.stop()
+            self.frame_scheduler.jobs.clear()
+
+            # Close the audio output and the analysis workers
+            self.audio.quit()
+            self.loudness_analyzer.close()
+
+            # Close any open ODT documents
+            if hasattr(self, 'lyrics_dialog') and self.lyrics_dialog:
+                self.lyrics_dialog.close()
+
+            # Close SRT display if open
+            if hasattr(self, 'srt_display') and self.srt_display:
+                self.srt_display.close()
+
+            # Save configuration
+            self.save_config()
+            self.save_library_index()
+
+            # Accept the close event
+            event.accept()
+
+        except Exception as e:
+            print(f"Error during application close: {str(e)}")
+            event.accept()  # Still close the application even if there's an error
+
+    def show_help(self):
+        """Show the help dialog"""
+        dialog = HelpDialog(self, self.current_language)
+        dialog.exec()
+
+    def get_lyrics_path(self, music_file, extension='.txt'):
+        """Get the path for the lyrics file corresponding to a music file"""
+        # First check if there's a mapping for this music file
+        if music_file in self.lyrics_mapping:
+            return self.lyrics_mapping[music_file]
+
+        # If no mapping, use the default naming convention
+        base_name = os.path.splitext(os.path.basename(music_file))[0]
+        return os.path.join(self.lyrics_dir, f"{base_name}{extension}")
+
+    def get_metadata(self, file_path):
+        """Get metadata from audio file with cache size management"""
+        if file_path in self.metadata_cache:
+            # Move to end of dict (most recently used)
+            metadata = self.metadata_cache.pop(file_path)
+            self.metadata_cache[file_path] = metadata
+            return metadata
+
+        try:
+            tags, duration, mtime = read_file_metadata(file_path)
+            metadata = dict(tags) if tags is not None else {}
+
+            # Make the real tags searchable, not the fallbacks below
+            if self.library_index is not None:
+                self.library_index.set_metadata(file_path, metadata, duration, mtime)
+
+            # If title or artist is missing, try to parse from filename
+            filename = os.path.splitext(os.path.basename(file_path))[0]
+            if not metadata.get("title") or not metadata.get("artist"):
+                # Try to split on common separators
+                for separator in [" - ", "-", "_", " – "]:
+                    if separator in filename:
+                        parts = filename.split(separator, 1)
+                        if len(parts) == 2:
+                            if not metadata.get("artist"):
+                                metadata["artist"] = parts[0].strip()
+                            if not metadata.get("title"):
+                                metadata["title"] = parts[1].strip()
+                            break
+
+            # If still no title, use filename
+            if not metadata.get("title"):
+                metadata["title"] = filename
+
+            # If still no artist, use Unknown
+            if not metadata.get("artist"):
+                metadata["artist"] = get_text('unknown_artist', self.current_language)
+
+            # Ensure album is set
+            if not metadata.get("album"):
+                metadata["album"] = get_text('unknown_album', self.current_language)
+
+            # Manage cache size
+            if len(self.metadata_cache) >= self.metadata_cache_size_limit:
+                # Remove oldest entry (first in dict)
+                self.metadata_cache.pop(next(iter(self.metadata_cache)))
+
+            # Store in cache
+            self.metadata_cache[file_path] = metadata
+            return metadata
+
+        except Exception as e:
+            error_msg = f"Fout bij lezen metadata: {str(e)}"
+            print(error_msg)  # Log for debugging
+            self.statusBar.showMessage(error_msg)  # Show to user
+
+            # Try to parse from filename as fallback
+            filename = os.path.splitext(os.path.basename(file_path))[0]
+            for separator in [" - ", "-", "_", " – "]:
+                if separator in filename:
+                    parts = filename.split(separator, 1)
+                    if len(parts) == 2:
+                        return {
+                            "title": parts[1].strip(),
+                            "artist": parts[0].strip(),
+                            "album": get_text('unknown_album', self.current_language)
+                        }
+            return {
+                "title": filename,
+                "artist": get_text('unknown_artist', self.current_language),
+                "album": get_text('unknown_album', self.current_language)
+            }
+
+    def show_error(self, title, message, details=None):
+        """Show error message to user with optional details"""
+        error_dialog = QMessageBox(self)
+        error_dialog.setIcon(QMessageBox.Icon.Critical)
+        error_dialog.setWindowTitle(title)
+        error_dialog.setText(message)
+        if details:
+            error_dialog.setDetailedText(details)
+        error_dialog.exec()
+        self.statusBar.showMessage(message)
+
+    def load_lyrics(self, music_file):
+        """Load lyrics for a music file with improved error handling"""
+        if not music_file:
+            self.show_error("Fout", "Geen muziekbestand geselecteerd")
+            return
+
+        try:
+            # Clear current lyrics display first
+            self._clear_lyrics_display()
+
+            # Get current mappings
+            mapping = self.lyrics_mapping.get(music_file, {})
+            text_path = None
+            srt_path = None
+
+            if isinstance(mapping, dict):
+                text_path = mapping.get('text_path')
+                srt_path = mapping.get('srt_path')
+            else:
+                # Handle old format
+                if mapping and isinstance(mapping, str):  # Ensure mapping is a string
+                    ext = os.path.splitext(mapping)[1].lower()
+                    if ext == '.srt':
+                        srt_path = mapping
+                    else:
+                        text_path = mapping
+
+            # Try to load text lyrics first
+            text_loaded = False
+            if text_path and isinstance(text_path, str) and os.path.exists(text_path):
+                ext = os.path.splitext(text_path)[1].lower()
+                if ext == '.odt':
+                    text_loaded = self._load_odt_file(text_path)
+                else:
+                    text_loaded = self._load_txt_file(text_path)
+
+            # If no text lyrics found from mapping, try to find one with same name
+            if not text_loaded:
+                text_loaded = self._try_load_text_lyrics(music_file)
+
+            # Handle SRT display
+            if self.srt_display and self.srt_display.isVisible():
+                # Try to load SRT from mapping first
+                if srt_path and isinstance(srt_path, str) and os.path.exists(srt_path):
+                    self._load_srt_file(srt_path)
+                else:
+                    # Try to find SRT with same name
+                    base_name = os.path.splitext(os.path.basename(music_file))[0]
+                    srt_path = os.path.join(self.lyrics_dir, f"{base_name}.srt")
+                    if os.path.exists(srt_path):
+                        self._load_srt_file(srt_path)
+                    else:
+                        # No SRT file found, clear the display
+                        self.srt_display.stop_display()
+                        self.srt_display.subtitle_label.clear()
+
+            # If no lyrics found at all, show a message
+            if not text_loaded and not (self.srt_display and self.srt_display.isVisible()):
+                if hasattr(self, 'lyrics_display'):
+                    self.lyrics_display.setText("Geen songtekst gevonden")
+                self.statusBar.showMessage("Geen songtekst gevonden voor dit nummer")
+
+        except Exception as e:
+            self.show_error("Onverwachte fout", "Fout bij laden songtekst", str(e))
+            if hasattr(self, 'lyrics_display'):
+                self.lyrics_display.setText("Fout bij laden songtekst")
+
+    def _clear_lyrics_display(self):
+        """Clear the current lyrics display"""
+        self.current_lyrics = ""
+        if hasattr(self, 'lyrics_display'):
+            self.lyrics_display.clear()
+
+    def _try_load_mapped_lyrics(self, music_file):
+        """Try to load lyrics from mapping"""
+        if music_file not in self.lyrics_mapping:
+            return False
+
+        mapping = self.lyrics_mapping[music_file]
+        lyrics_path = None
+        file_type = None
+
+        if isinstance(mapping, dict):
+            lyrics_path = mapping.get('path')
+            file_type = mapping.get('type')
+        else:
+            lyrics_path = mapping
+            # Determine file type from extension
+            ext = os.path.splitext(lyrics_path)[1].lower()
+            if ext == '.odt':
+                file_type = "ODT"
+            elif ext == '.srt':
+                file_type = "SRT"
+            else:
+                file_type = "TXT"
+
+        if not lyrics_path:
+            self.show_error("Fout", "Geen songtekst pad gevonden in mapping")
+            return False
+
+        if not os.path.exists(lyrics_path):
+            self.show_error("Fout", f"Songtekst bestand niet gevonden: {os.path.basename(lyrics_path)}")
+            return False
+
+        try:
+            if file_type == "SRT":
+                # For SRT files, only load in the main display if no karaoke window is open
+                if not self.srt_display or not self.srt_display.isVisible():
+                    return self._load_srt_file(lyrics_path)
+                return True
+            elif file_type == "ODT":
+                return self._load_odt_file(lyrics_path)
+            elif file_type == "TXT":
+                return self._load_txt_file(lyrics_path)
+        except Exception as e:
+            self.show_error("Fout", "Fout bij laden songtekst", str(e))
+            return False
+
+    def _show_preloaded_lyrics(self, lyrics_path):
+        """Show lyrics read ahead with the track, False if there are none or the file changed since"""
+        entry = self.preloaded_lyrics.get(lyrics_path)
+        try:
+            if entry is None or entry[0] != os.path.getmtime(lyrics_path):
+                return False
+        except OSError:
+            return False
+        self.current_lyrics = entry[1]
+        if hasattr(self, 'lyrics_display'):
+            self.lyrics_display.setText(self.current_lyrics)
+        self.statusBar.showMessage(f"Songtekst geladen: {os.path.basename(lyrics_path)}")
+        return True
+
+    def _load_odt_file(self, odt_path):
+        """Load and display ODT file"""
+        if self._show_preloaded_lyrics(odt_path):
+            return True
+        try:
+            doc = load(odt_path)
+            text_content = []
+            for para in doc.getElementsByType(text.P):
+                text_content.append(teletype.extractText(para))
+            self.current_lyrics = '\n'.join(text_content)
+            if hasattr(self, 'lyrics_display'):
+                self.lyrics_display.setText(self.current_lyrics)
+            self.statusBar.showMessage(f"ODT bestand geladen: {os.path.basename(odt_path)}")
+            return True
+        except Exception as e:
+            self.show_error("Fout", f"Fout bij laden ODT bestand: {str(e)}")
+            return False
+
+    def _load_txt_file(self, txt_path):
+        """Load and display TXT file"""
+        if self._show_preloaded_lyrics(txt_path):
+            return True
+        try:
+            # Try UTF-8 first
+            try:
+                with open(txt_path, 'r', encoding='utf-8') as f:
+                    self.current_lyrics = f.read()
+                    if hasattr(self, 'lyrics_display'):
+                        self.lyrics_display.setText(self.current_lyrics)
+                    self.statusBar.showMessage(f"TXT bestand geladen: {os.path.basename(txt_path)}")
+                    return True
+            except UnicodeDecodeError:
+                with open(txt_path, 'r', encoding='latin-1') as f:
+                    self.current_lyrics = f.read()
+                    if hasattr(self, 'lyrics_display'):
+                        self.lyrics_display.setText(self.current_lyrics)
+                    self.statusBar.showMessage(f"TXT bestand geladen (latin-1): {os.path.basename(txt_path)}")
+                    return True
+        except Exception as e:
+            self.show_error("Fout", f"Fout bij laden TXT bestand: {str(e)}")
+            return False
+
+    def _try_load_text_lyrics(self, music_file):
+        """Try to load text lyrics (ODT or TXT) for a music file"""
+        base_name = os.path.splitext(os.path.basename(music_file))[0]
+
+        # Try ODT first
+        odt_path = os.path.join(self.lyrics_dir, f"{base_name}.odt")
+        if os.path.exists(odt_path):
+            return self._load_odt_file(odt_path)
+
+        # Try TXT
+        txt_path = os.path.join(self.lyrics_dir, f"{base_name}.txt")
+        if os.path.exists(txt_path):
+            return self._load_txt_file(txt_path)
+
+        return False
+
+    def edit_lyrics(self):
+        """Open dialog to edit lyrics"""
+        if not self.current_track:
+            QMessageBox.warning(self, "Waarschuwing", "Selecteer eerst een nummer")
+            return
+
+        try:
+            # Get current mappings for this track
+            current_mappings = self.lyrics_mapping.get(self.current_track, {})
+            if isinstance(current_mappings, dict):
+                current_text_file = current_mappings.get('text_path')
+                current_srt_file = current_mappings.get('srt_path')
+            else:
+                # Convert old format to new format
+                current_text_file = current_mappings if current_mappings else None
+                current_srt_file = None
+                if current_text_file:
+                    ext = os.path.splitext(current_text_file)[1].lower()
+                    if ext == '.srt':
+                        current_srt_file = current_text_file
+                        current_text_file = None
+
+            # Show mapping dialog
+            mapping_dialog = LyricsMappingDialog(self, self.current_track, current_text_file, current_srt_file, self.current_language)
+            if mapping_dialog.exec() == QDialog.DialogCode.Accepted:
+                new_text_path = mapping_dialog.get_text_path()
+                new_srt_path = mapping_dialog.get_srt_path()
+
+                # Update mapping with both paths
+                if new_text_path or new_srt_path:
+                    self.lyrics_mapping[self.current_track] = {
+                        'text_path': new_text_path,
+                        'srt_path': new_srt_path
+                    }
+                    # Update lyrics directory to the directory of the selected file
+                    if new_text_path:
+                        self.lyrics_dir = os.path.dirname(new_text_path)
+                    elif new_srt_path:
+                        self.lyrics_dir = os.path.dirname(new_srt_path)
+                    self.save_config()
+
+                    # Load and display the lyrics immediately
+                    self.load_lyrics(self.current_track)
+                    return  # Exit after successful mapping and loading
+
+            # If we get here, either the mapping dialog was cancelled or no file was selected
+            # Show edit dialog for existing lyrics
+            self.lyrics_dialog = LyricsDialog(self, self.current_language)
+
+            # If we have current lyrics, show them in the dialog
+            if hasattr(self, 'lyrics_display'):
+                current_text = self.lyrics_display.toPlainText()
+                if current_text and current_text != "Geen songtekst gevonden":
+                    self.lyrics_dialog.set_lyrics(current_text)
+
+            if self.lyrics_dialog.exec() == QDialog.DialogCode.Accepted:
+                new_lyrics = self.lyrics_dialog.get_lyrics()
+                self.current_lyrics = new_lyrics
+
+                # Ask user which format to save in
+                format_dialog = QMessageBox(self)
+                format_dialog.setWindowTitle("Opslaan als")
+                format_dialog.setText("In welk formaat wil je de songtekst opslaan?")
+                format_dialog.addButton("TXT", QMessageBox.ButtonRole.AcceptRole)
+                format_dialog.addButton("ODT", QMessageBox.ButtonRole.AcceptRole)
+                format_dialog.addButton("Annuleren", QMessageBox.ButtonRole.RejectRole)
+
+                result = format_dialog.exec()
+
+                if result == 0:  # TXT
+                    try:
+                        lyrics_path = self.get_lyrics_path(self.current_track, '.txt')
+                        with open(lyrics_path, 'w', encoding='utf-8') as f:
+                            f.write(new_lyrics)
+                            # Update mapping while preserving SRT path if it exists
+                            current_mapping = self.lyrics_mapping.get(self.current_track, {})
+                            if isinstance(current_mapping, dict):
+                                current_mapping['text_path'] = lyrics_path
+                            else:
+                                current_mapping = {'text_path': lyrics_path}
+                            self.lyrics_mapping[self.current_track] = current_mapping
+                            self.save_config()
+                            if hasattr(self, 'lyrics_display'):
+                                self.lyrics_display.setText(new_lyrics)
+                        self.statusBar.showMessage("Songtekst opgeslagen als TXT")
+                    except Exception as e:
+                        self.statusBar.showMessage(f"Fout bij opslaan TXT: {str(e)}")
+
+                elif result == 1:  # ODT
+                    try:
+                        lyrics_path = self.get_lyrics_path(self.current_track, '.odt')
+                        doc = OpenDocumentText()
+                        para = text.P()
+                        para.addText(new_lyrics)
+                        doc.text.addElement(para)
+                        doc.save(lyrics_path)
+                        # Update mapping while preserving SRT path if it exists
+                        current_mapping = self.lyrics_mapping.get(self.current_track, {})
+                        if isinstance(current_mapping, dict):
+                            current_mapping['text_path'] = lyrics_path
+                        else:
+                            current_mapping = {'text_path': lyrics_path}
+                        self.lyrics_mapping[self.current_track] = current_mapping
+                        self.save_config()
+                        if hasattr(self, 'lyrics_display'):
+                            self.lyrics_display.setText(new_lyrics)
+                        self.statusBar.showMessage("Songtekst opgeslagen als ODT")
+                    except Exception as e:
+                        self.statusBar.showMessage(f"Fout bij opslaan ODT: {str(e)}")
+
+        except Exception as e:
+            self.statusBar.showMessage(f"Fout bij bewerken songtekst: {str(e)}")
+            print(f"Error in edit_lyrics: {str(e)}")
+
+    def toggle_path_display(self):
+        """Toggle between showing full path and filename only"""
+        # Update button text first
+        self.show_full_path = not self.show_full_path
+        self.toggle_view_button.setText("Toon Bestandsnaam" if self.show_full_path else "Toon Pad")
+
+        # Update all items in the tree view
+        self.update_tree_view_display()
+
+        # Show status message
+        self.statusBar.showMessage("Lijst bijgewerkt")
+
+    def toggle_folder_view(self):
+        """Toggle drives between one flat list and a folder tree"""
+        self.show_folders = not self.show_folders
+        self.folder_view_button.setText(
+            get_text('list_view' if self.show_folders else 'folder_view', self.current_language))
+
+        # Swap every drive node for one of the other kind, keeping the active filter
+        for row in range(self.tree_model.rowCount()):
+            item = self.tree_model.item(row)
+            if not isinstance(item, TrackListItem) or not item.drive:
+                continue
+            new_item = self._new_drive_item(item.drive, item.paths)
+            new_item.setText(item.text())
+            new_item.set_mask(self.proxy_model.accepted_paths)
+            self.tree_model.removeRow(row)
+            self.tree_model.insertRow(row, new_item)
+            self.tree_view.expand(self._view_index_from_item(new_item))
+
+    def _shown_drive_item(self, drive):
+        """The node of drive if the tree shows that drive and nothing else besides the sections"""
+        drive_item = None
+        for i in range(self.tree_model.rowCount()):
+            item = self.tree_model.item(i)
+            if item.data(SECTION_ROLE):
+                continue
+            if not isinstance(item, TrackListItem) or item.drive != drive or drive_item is not None:
+                return None
+            drive_item = item
+        return drive_item
+
+    def _new_drive_item(self, drive, paths=()):
+        """Create the node for a drive, as a folder tree or a flat list"""
+        if self.show_folders:
+            drive_item = FolderItem(drive, FolderIndex(drive, paths), drive)
+        else:
+            drive_item = TrackListItem(drive, paths)
+        drive_item.drive = drive
+        return drive_item
+
+    def update_tree_view_display(self):
+        """Update the labels of all items in the tree view to the current display mode"""
+        try:
+            # The labels are built by the delegate, so only the visible rows need a repaint
+            self.tree_delegate.show_full_path = self.show_full_path
+            self.tree_view.viewport().update()
+        except Exception as e:
+            self.show_error("Fout", "Fout bij bijwerken weergave", str(e))
+            self.statusBar.showMessage("Fout bij bijwerken weergave")
+
+    def scan_drives(self):
+        """Scan all available drives for audio files"""
+        self._set_smart_playlist(None)
+
+        # Clear existing items if not appending
+        if not self.append_checkbox.isChecked():
+            self._clear_tree_rows()
+            self.drive_file_counts.clear()
+            self.filtered_files = []
+            self._reset_filter_history(self.filtered_files)
+
+        # Get available drives with error handling
+        drives = []
+        for drive in range(65, 91):  # A-Z
+            drive_letter = f"{chr(drive)}:"
+            try:
+                if os.path.exists(drive_letter):
+                    drives.append(drive_letter)
+            except Exception as e:
+                print(f"Error checking drive {drive_letter}: {str(e)}")
+                continue
+
+        for drive in drives:
+            try:
+                # Check if drive already exists in the tree
+                drive_item = None
+                for i in range(self.tree_model.rowCount()):
+                    item = self.tree_model.item(i)
+                    if isinstance(item, TrackListItem) and item.drive == drive:
+                        drive_item = item
+                        break
+
+                # If drive doesn't exist, create new item
+                if not drive_item:
+                    drive_item = self._new_drive_item(drive)
+                    self.tree_model.appendRow(drive_item)
+
+                # Scan de schijf voor audio bestanden
+                audio_files = []
+                try:
+                    for root, _, files in os.walk(drive):
+                        for file in files:
+                            if file.lower().endswith(('.mp3', '.wav', '.ogg', '.flac', '.m4a', '.aac')):
+                                audio_files.append(os.path.join(root, file))
+                except Exception as e:
+                    print(f"Error scanning drive {drive}: {str(e)}")
+                    continue
+
+                # Update bestandsaantallen per type
+                file_types = {}
+                for file in audio_files:
+                    ext = os.path.splitext(file)[1].lower()
+                    file_types[ext] = file_types.get(ext, 0) + 1
+
+                # Update of voeg toe aan drive_file_counts
+                if drive in self.drive_file_counts:
+                    # Update existing counts
+                    self.drive_file_counts[drive]['total'] += len(audio_files)
+                    for ext, count in file_types.items():
+                        self.drive_file_counts[drive]['types'][ext] = self.drive_file_counts[drive]['types'].get(ext,
+                                                                                                                 0) + count
+                else:
+                    # Add new drive counts
+                    self.drive_file_counts[drive] = {
+                        'total': len(audio_files),
+                        'types': file_types
+                    }
+
+                # Update de drive item tekst met aantallen
+                type_info = []
+                for ext, count in self.drive_file_counts[drive]['types'].items():
+                    type_info.append(f"{ext}: {count}")
+                drive_item.setText(
+                    f"{drive} ({self.drive_file_counts[drive]['total']} bestanden) - {', '.join(type_info)}")
+
+                # Voeg bestanden toe aan de tree, de rijen volgen bij het scrollen
+                existing_files = set(drive_item.paths)
+                new_files = [file for file in audio_files if file not in existing_files]
+                drive_item.add_paths(new_files)
+                self.filtered_files.extend(new_files)
+                if self.library_index is not None:
+                    self.library_index.add_paths(new_files)
+                self.metadata_reader.wake()
+                self.loudness_analyzer.wake()
+
+                # Update status bar
+                self.update_file_count_status()
+
+            except Exception as e:
+                print(f"Fout bij scannen van {drive}: {e}")
+                continue
+
+        # Automatically expand all drive items
+        for i in range(self.proxy_model.rowCount()):
+            self.tree_view.expand(self.proxy_model.index(i, 0))
+
+        self.statusBar.showMessage("Scanning complete")
+
+    def update_file_count_status(self):
+        total_files = sum(counts['total'] for counts in self.drive_file_counts.values())
+        type_counts = {}
+
+        for drive_counts in self.drive_file_counts.values():
+            for ext, count in drive_counts['types'].items():
+                type_counts[ext] = type_counts.get(ext, 0) + count
+
+        type_info = []
+        for ext, count in type_counts.items():
+            type_info.append(f"{ext}: {count}")
+
+        self.file_count_label.setText(f"Totaal: {total_files} bestanden - {', '.join(type_info)}")
+
+    def save_files(self):
+        """Save the current file list to disk"""
+        try:
+            with open('saved_files.json', 'w') as f:
+                json.dump(self.saved_files, f)
+            self.save_library_index()
+            self.statusBar.showMessage("Files saved successfully")
+        except Exception as e:
+            self.statusBar.showMessage(f"Error saving files: {str(e)}")
+
+    def save_config(self):
+        """Save configuration to file"""
+        self.config_save_timer.stop()
+        try:
+            self.config.update({
+                'lyrics_dir': self.lyrics_dir,
+                'playlist_dir': self.playlist_dir,
+                'lyrics_mapping': self.lyrics_mapping,
+                'favorites': list(self.favorites),  # Save favorites
+                'play_history': list(reversed(self.play_history)),  # Save history, newest first
+                'language': self.current_language  # Save language preference
+            })
+            with open(self.config_file, 'w') as f:
+                json.dump(self.config, f)
+        except Exception as e:
+            self.statusBar.showMessage(get_text('error_saving_config', self.current_language, error=str(e)))
+
+    def change_lyrics_dir(self):
+        """Change the lyrics directory"""
+        new_dir = QFileDialog.getExistingDirectory(
+            self,
+            "Selecteer Songteksten Map",
+            self.lyrics_dir
+        )
+        if new_dir:
+            self.lyrics_dir = new_dir
+            self.lyrics_dir_path.setText(new_dir)
+            self.save_config()
+
+    def load_lyrics_mappings(self):
+        """Load lyrics mappings from config file with improved error handling"""
+        try:
+            if not os.path.exists(self.config_file):
+                print("Config file not found, starting with empty mappings")
+                self.lyrics_mapping = {}
+                return
+
+            with open(self.config_file, 'r') as f:
+                config = json.load(f)
+
+            # Get mappings with fallback to empty dict
+            mappings = config.get('lyrics_mapping', {})
+            if not isinstance(mappings, dict):
+                print("Invalid mappings format in config, resetting to empty dict")
+                self.lyrics_mapping = {}
+                return
+
+            # Validate and clean up mappings
+            valid_mappings = {}
+            for music_file, mapping in mappings.items():
+                try:
+                    # Skip if music file doesn't exist
+                    if not os.path.exists(music_file):
+                        print(f"Skipping mapping for non-existent music file: {music_file}")
+                        continue
+
+                    # Handle both old and new mapping formats
+                    if isinstance(mapping, dict):
+                        # New format: {'text_path': path, 'srt_path': path}
+                        text_path = mapping.get('text_path')
+                        srt_path = mapping.get('srt_path')
+                        
+                        # Validate paths if they exist
+                        if text_path and not os.path.exists(text_path):
+                            print(f"Text file not found: {text_path}")
+                            text_path = None
+                        if srt_path and not os.path.exists(srt_path):
+                            print(f"SRT file not found: {srt_path}")
+                            srt_path = None
+                            
+                        # Only keep mapping if at least one valid path exists
+                        if text_path or srt_path:
+                            valid_mappings[music_file] = {
+                                'text_path': text_path,
+                                'srt_path': srt_path
+                            }
+                    elif isinstance(mapping, str):
+                        # Old format: direct path string
+                        if os.path.exists(mapping):
+                            ext = os.path.splitext(mapping)[1].lower()
+                            if ext == '.srt':
+                                valid_mappings[music_file] = {'srt_path': mapping}
+                            else:
+                                valid_mappings[music_file] = {'text_path': mapping}
+                        else:
+                            print(f"Lyrics file not found: {mapping}")
+                    else:
+                        print(f"Invalid mapping format for {music_file}: {mapping}")
+
+                except Exception as e:
+                    print(f"Error processing mapping for {music_file}: {str(e)}")
+                    continue
+
+            # Update mappings with validated data
+            self.lyrics_mapping = valid_mappings
+            print(f"Successfully loaded {len(valid_mappings)} valid lyrics mappings")
+
+            # Save the cleaned up mappings
+            self.save_config()
+
+        except json.JSONDecodeError as e:
+            print(f"Error decoding config file: {str(e)}")
+            self.lyrics_mapping = {}
+            # Create backup of corrupted config
+            try:
+                backup_path = f"{self.config_file}.bak"
+                if os.path.exists(self.config_file):
+                    import shutil
+                    shutil.copy2(self.config_file, backup_path)
+                    print(f"Created backup of corrupted config at: {backup_path}")
+            except Exception as backup_error:
+                print(f"Failed to create config backup: {str(backup_error)}")
+        except Exception as e:
+            print(f"Unexpected error loading lyrics mappings: {str(e)}")
+            self.lyrics_mapping = {}
+
+    def show_context_menu(self, position):
+        """Show context menu for tree view items"""
+        index = self.tree_view.indexAt(position)
+        if not index.isValid():
+            return
+
+        item = self._item_from_view_index(index)
+        if not item or isinstance(item, FolderItem):
+            return
+
+        # Create context menu
+        menu = QMenu(self)
+
+        if not item.parent():  # This is a playlist or drive item
+            if item.text().endswith('.json'):  # This is a playlist
+                delete_playlist_action = menu.addAction("Verwijder playlist")
+                action = menu.exec(self.tree_view.viewport().mapToGlobal(position))
+                if action == delete_playlist_action:
+                    self.delete_playlist(item.text())
+        else:  # This is a file item
+            play_next_action = menu.addAction("Speel hierna af")
+            enqueue_action = menu.addAction("Voeg toe aan wachtrij")
+            delete_action = menu.addAction("Verwijder uit playlist")
+            action = menu.exec(self.tree_view.viewport().mapToGlobal(position))
+            if action == delete_action:
+                self.delete_track_from_playlist(item)
+            elif action in (play_next_action, enqueue_action):
+                self.queue_track(item.data(Qt.ItemDataRole.UserRole) or item.text(), action == play_next_action)
+
+    def set_shuffle(self, enabled):
+        """Shuffle the play order, or go back to list order, on from the playing track"""
+        self._apply_shuffle(self._play_queue_at_current())
+        self.config['shuffle'] = enabled
+        self.config_save_timer.start()
+        self._play_order_changed()
+
+    def _apply_shuffle(self, play_queue):
+        if self.shuffle_button.isChecked():
+            # A fixed shuffle_seed in the config plays the same orders every time
+            artist_of = self._artist_key if self.config.get('shuffle_spread_artists', True) else None
+            play_queue.shuffle(self.config.get('shuffle_seed'), artist_of)
+        else:
+            play_queue.unshuffle()
+
+    def cycle_repeat(self):
+        """Next repeat mode: off, all (the list starts over), one (the track plays again)"""
+        play_queue = self.play_queue
+        play_queue.repeat = REPEAT_MODES[(REPEAT_MODES.index(play_queue.repeat) + 1) % len(REPEAT_MODES)]
+        self.repeat_button.setText(get_text(f'repeat_{play_queue.repeat}', self.current_language))
+        self.config['repeat'] = play_queue.repeat
+        self.config_save_timer.start()
+        self._play_order_changed()
+
+    def _play_order_changed(self):
+        self.update_playlist_info()
+        # The track read ahead (or queued in the mixer) may not be the next one anymore
+        if self.current_track:
+            self.preload_next_track()
+
+    def _artist_key(self, file_path):
+        """Artist a shuffle spreads by: from the library index, else the 'Artist - Title' file name"""
+        index = self.library_index
+        if index is not None:
+            track_id = index.ids.get(file_path)
+            if track_id is not None and index.columns['artist'][track_id] >= 0:
+                return index.categories['artist'][index.columns['artist'][track_id]]
+        name = os.path.splitext(os.path.basename(file_path))[0]
+        return name.split(' - ', 1)[0].strip().lower()
+
+    def queue_track(self, file_path, play_next=False):
+        """Play a track after the current one (play_next) or after the tracks queued before it"""
+        play_queue = self._play_queue_at_current()
+        if play_next:
+            play_queue.play_next(file_path)
+        else:
+            play_queue.enqueue(file_path)
+        self.statusBar.showMessage(f"In de wachtrij: {os.path.basename(file_path)}")
+        self._play_order_changed()
+
+    def delete_playlist(self, playlist_name):
+        """Delete a playlist file"""
+        try:
+            # Show confirmation dialog
+            reply = QMessageBox.question(
+                self,
+                "Bevestig verwijderen",
+                f"Weet je zeker dat je de playlist '{playlist_name}' wilt verwijderen?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.No
+            )
+
+            if reply == QMessageBox.StandardButton.Yes:
+                # Get full path to playlist file
+                playlist_path = os.path.join(self.playlist_dir, playlist_name)
+
+                # Delete the file
+                if os.path.exists(playlist_path):
+                    os.remove(playlist_path)
+
+                    # Remove from combo box
+                    index = self.playlist_combo.findText(playlist_name)
+                    if index >= 0:
+                        self.playlist_combo.removeItem(index)
+
+                    # Remove from tree view
+                    for i in range(self.tree_model.rowCount()):
+                        item = self.tree_model.item(i)
+                        if item and item.text() == playlist_name:
+                            self.tree_model.removeRow(i)
+                            break
+
+                    # Clear filtered files if this was the current playlist
+                    if self.current_track and playlist_name == self.playlist_combo.currentText():
+                        self.filtered_files = []
+                        self.update_file_count()
+
+                    self.statusBar.showMessage(f"Playlist '{playlist_name}' verwijderd")
+                else:
+                    self.statusBar.showMessage(f"Playlist '{playlist_name}' niet gevonden")
+
+        except Exception as e:
+            self.show_error("Fout", f"Fout bij verwijderen playlist: {str(e)}")
+
+    def delete_track_from_playlist(self, item):
+        """Delete a track from the playlist"""
+        if not item or not item.parent():
+            return
+        if self._in_smart_playlist(item):
+            return
+
+        # Get the file path
+        file_path = item.data(Qt.ItemDataRole.UserRole)
+        if not file_path:
+            file_path = item.text()
+
+        # Show confirmation dialog
+        reply = QMessageBox.question(
+            self,
+            "Bevestig verwijderen",
+            f"Weet je zeker dat je '{os.path.basename(file_path)}' uit de playlist wilt verwijderen?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+
+        if reply == QMessageBox.StandardButton.Yes:
+            # Remove from filtered files
+            if file_path in self.filtered_files:
+                self.filtered_files.remove(file_path)
+                self.play_queue.remove(file_path)
+
+            # Remove from tree view
+            parent = item.parent()
+            if isinstance(parent, TrackListItem):
+                parent.take_track_row(item.row())
+            else:
+                parent.removeRow(item.row())
+
+            # Update status
+            self.statusBar.showMessage(f"Nummer verwijderd uit playlist")
+
+            # Update file count
+            self.update_file_count()
+
+            # If this was the current track, stop playback
+            if file_path == self.current_track:
+                self.stop_playback()
+
+    def play_on_click(self, index):
+        """Handle single click on track"""
+        item = self._item_from_view_index(index)
+        if not item or not item.parent() or isinstance(item, FolderItem):  # Skip if not a file
+            return
+
+        # Get the full path from the item's data
+        file_path = item.data(Qt.ItemDataRole.UserRole)
+        if not file_path:  # Fallback to text if no data
+            file_path = item.text()
+
+        # Update current track and load lyrics immediately
+        self.current_track = file_path
+        self.load_lyrics(file_path)  # Load lyrics immediately on selection
+        self.statusBar.showMessage(f"Selected: {os.path.basename(file_path)}")
+
+        # If we're already playing, start the new track
+        if self.is_playing:
+            self.play_selected_track_by_path(file_path)
+        else:
+            # Just update the UI to show it's selected
+            self.progress_bar.setValue(0)
+            self.current_time_label.setText("00:00")
+            self.total_time_label.setText("00:00")
+
+    def toggle_srt_display(self):
+        """Toggle the SRT display window"""
+        if not self.current_track:
+            QMessageBox.warning(self, "Waarschuwing", "Selecteer eerst een nummer")
+            return
+
+        try:
+            if self.srt_display is None or not self.srt_display.isVisible():
+                # Create and show SRT display
+                self.srt_display = SRTDisplayDialog(self, self.current_language)
+
+                # Try to load SRT file
+                srt_loaded = False
+
+                # First try mapping
+                if self.current_track in self.lyrics_mapping:
+                    mapping = self.lyrics_mapping[self.current_track]
+                    if isinstance(mapping, dict):
+                        srt_path = mapping.get('srt_path')
+                        if srt_path and isinstance(srt_path, str) and os.path.exists(srt_path):
+                            srt_loaded = self.srt_display.load_srt(srt_path)
+                    elif isinstance(mapping, str) and mapping.lower().endswith('.srt'):
+                        if os.path.exists(mapping):
+                            srt_loaded = self.srt_display.load_srt(mapping)
+
+                # If not loaded from mapping, try to find SRT file with same name
+                if not srt_loaded:
+                    base_name = os.path.splitext(os.path.basename(self.current_track))[0]
+                    srt_path = os.path.join(self.lyrics_dir, f"{base_name}.srt")
+                    if os.path.exists(srt_path):
+                        srt_loaded = self.srt_display.load_srt(srt_path)
+
+                if srt_loaded:
+                    self.srt_display.show()
+                    self.statusBar.showMessage("Karaoke venster geopend")
+                else:
+                    # Clean up SRT display if no file was found
+                    if self.srt_display:
+                        self.srt_display.close()
+                        self.srt_display.deleteLater()
+                        self.srt_display = None
+                    QMessageBox.information(self, "Geen karaoke bestand",
+                                            "Er is geen SRT bestand gevonden voor dit nummer.\n\n"
+                                            "Je kunt een SRT bestand maken via 'Bewerk Songtekst' en dan 'Koppelen'.")
+            else:
+                # Hide SRT display
+                if self.srt_display:
+                    self.srt_display.stop_display()
+                    self.srt_display.close()
+                    self.srt_display.deleteLater()
+                    self.srt_display = None
+                self.statusBar.showMessage("Karaoke venster gesloten")
+
+        except Exception as e:
+            # Clean up in case of error
+            if self.srt_display:
+                try:
+                    self.srt_display.stop_display()
+                    self.srt_display.close()
+                    self.srt_display.deleteLater()
+                except:
+                    pass
+                self.srt_display = None
+            self.show_error("Fout", "Fout bij openen karaoke venster", str(e))
+            self.statusBar.showMessage("Fout bij openen karaoke venster")
+
+    def keyPressEvent(self, event):
+        """Handle keyboard shortcuts"""
+        try:
+            key = event.key()
+
+            # Space bar for play/pause
+            if key == Qt.Key.Key_Space:
+                self.play_pause()
+
+            # Shift+Left/Right to seek 10 seconds back/forward
+            elif key == Qt.Key.Key_Left and event.modifiers() & Qt.KeyboardModifier.ShiftModifier:
+                self.seek(self.playback_position() - 10)
+            elif key == Qt.Key.Key_Right and event.modifiers() & Qt.KeyboardModifier.ShiftModifier:
+                self.seek(self.playback_position() + 10)
+
+            # Left/Right arrows for previous/next
+            elif key == Qt.Key.Key_Left:
+                self.play_previous_track()
+            elif key == Qt.Key.Key_Right:
+                self.play_next_track(skip=True)
+
+            # F for favorite
+            elif key == Qt.Key.Key_F:
+                self.toggle_favorite()
+
+            # R for shuffle
+            elif key == Qt.Key.Key_R:
+                self.shuffle_button.toggle()
+
+            # H for help
+            elif key == Qt.Key.Key_H:
+                self.show_help()
+
+            # L for language switch
+            elif key == Qt.Key.Key_L:
+                self.switch_language()
+
+            # M for mute
+            elif key == Qt.Key.Key_M:
+                self.toggle_mute()
+
+            # S for stop
+            elif key == Qt.Key.Key_S:
+                self.stop_playback()
+
+            # V for toggle view
+            elif key == Qt.Key.Key_V:
+                self.toggle_path_display()
+
+            # +/- for volume
+            elif key == Qt.Key.Key_Plus or key == Qt.Key.Key_Equal:
+                self.adjust_volume(0.1)  # Increase volume
+            elif key == Qt.Key.Key_Minus:
+                self.adjust_volume(-0.1)  # Decrease volume
+
+            else:
+                super().keyPressEvent(event)
+
+        except Exception as e:
+            print(f"Error in keyPressEvent: {str(e)}")
+            super().keyPressEvent(event)
+
+    def toggle_favorite(self):
+        """Toggle favorite status of current track"""
+        if not self.current_track:
+            return
+
+        if self.current_track in self.favorites:
+            self.favorites.remove(self.current_track)
+            self.statusBar.showMessage(get_text('favorite_removed', self.current_language))
+            self.favorite_button.setChecked(False)
+        else:
+            self.favorites.add(self.current_track)
+            self.statusBar.showMessage(get_text('favorite_added', self.current_language))
+            self.favorite_button.setChecked(True)
+
+        self.save_config()  # Save changes
+        self.update_favorites_display()
+
+    def toggle_mute(self):
+        """Toggle mute state"""
+        try:
+            if self.is_muted:
+                # Unmute
+                self.volume = self.previous_volume
+                self.is_muted = False
+                self._apply_volume()
+                self.statusBar.showMessage(f"Geluid aan (volume: {int(self.previous_volume * 100)}%)")
+            else:
+                # Mute
+                self.previous_volume = self.volume
+                self.is_muted = True
+                self._apply_volume()
+                self.statusBar.showMessage("Geluid uit")
+        except Exception as e:
+            print(f"Error in toggle_mute: {str(e)}")
+
+    def _apply_volume(self):
+        """The user volume times the ReplayGain of the playing track, on the stream and the decks"""
+        volume = 0.0 if self.is_muted else self.volume
+        self.audio.set_volume(volume * self.track_gain)
+        self.crossfade_decks.set_volume(volume)
+
+    def _track_gain(self, file_path):
+        """Volume factor that brings a track to the ReplayGain reference loudness, 1.0 while it is not analysed"""
+        if not self.config.get('replaygain', True) or self.library_index is None:
+            return 1.0
+        loudness = self.library_index.loudness(file_path)
+        if loudness is None:
+            return 1.0
+        gain, peak = loudness
+        factor = 10 ** ((gain + float(self.config.get('replaygain_preamp_db', 0.0))) / 20)
+        # The mixer cannot amplify, and the peak must not clip
+        return min(1.0, factor, 1.0 / peak if peak > 0 else 1.0)
+
+    def adjust_volume(self, delta):
+        """Adjust volume by delta (-1.0 to 1.0)"""
+        try:
+            new_volume = max(0.0, min(1.0, self.volume + delta))
+            self.volume = new_volume
+            self.is_muted = False
+            self._apply_volume()
+            self.previous_volume = new_volume
+            self.statusBar.showMessage(f"Volume: {int(new_volume * 100)}%")
+        except Exception as e:
+            print(f"Error in adjust_volume: {str(e)}")
+
+    def add_to_history(self, track):
+        """Add track to play history, moving it to the front if it is already there"""
+        self.play_history[track] = None
+        self.play_history.move_to_end(track)
+        dropped = None
+        if len(self.play_history) > self.max_history_items:
+            dropped, _ = self.play_history.popitem(last=False)  # Remove oldest if too many
+
+        # A track that just started playing exists
+        self.path_status_checker.status[track] = True
+
+        # Only touch the rows that changed, if the section has been filled already
+        if self.history_item.loaded:
+            item = self.history_rows.pop(track, None)
+            if item is not None:
+                row_items = self.history_item.takeRow(item.row())
+            else:
+                metadata = self.get_metadata(track)
+                row_items = [make_track_item(track, f"{metadata['artist']} - {metadata['title']}")]
+            self.history_item.insertRow(0, row_items)
+            self.history_rows[track] = row_items[0]
+
+            dropped_item = self.history_rows.pop(dropped, None) if dropped else None
+            if dropped_item is not None:
+                self.history_item.removeRow(dropped_item.row())
+        elif len(self.play_history) == 1:
+            # The section was empty, let the view pick up its expand arrow
+            self.history_item.emitDataChanged()
+
+        self.config_save_timer.start()
+
+    def update_history_display(self):
+        """Update the history section in the tree view"""
+        self.history_item.setText(get_text('play_history', self.current_language))
+        self.history_item.setData(get_text('play_history', self.current_language), Qt.ItemDataRole.UserRole)
+        self._reload_section(self.history_item)
+
+    def update_favorites_display(self):
+        """Update the favorites section in the tree view"""
+        self.favorites_item.setText(get_text('favorites', self.current_language))
+        self.favorites_item.setData(get_text('favorites', self.current_language), Qt.ItemDataRole.UserRole)
+        self._reload_section(self.favorites_item)
+
+    def _reload_section(self, section_item):
+        """Drop the rows of a section, refilling them right away only if it is open"""
+        section_item.reset()
+        if section_item.model() is self.tree_model and \
+                self.tree_view.isExpanded(self._view_index_from_item(section_item)):
+            self.tree_model.fetchMore(section_item.index())
+
+    def _load_favorites_rows(self):
+        """Create the rows of the favorites section"""
+        return self._make_section_rows(sorted(self.favorites))
+
+    def _load_history_rows(self):
+        """Create the rows of the history section, most recent first"""
+        rows = self._make_section_rows(reversed(self.play_history))
+        self.history_rows = {row.data(Qt.ItemDataRole.UserRole): row for row in rows}
+        return rows
+
+    def _make_section_rows(self, tracks):
+        """Create section rows, skipping tracks that are known to be missing"""
+        rows = []
+        unknown = []
+        for track in tracks:
+            exists = self.path_status_checker.status.get(track)
+            if exists is False:
+                continue
+            if exists is None:
+                unknown.append(track)
+            metadata = self.get_metadata(track)
+            rows.append(make_track_item(track, f"{metadata['artist']} - {metadata['title']}"))
+
+        # Unknown tracks are shown for now and removed once the check says they are gone
+        self.path_status_checker.check(unknown)
+        return rows
+
+    def _on_path_status_checked(self, path, exists):
+        """Remove section rows for a track that turned out to be missing"""
+        if exists:
+            return
+        self.history_rows.pop(path, None)
+        for section_item in (self.favorites_item, self.history_item):
+            for row in reversed(range(section_item.rowCount())):
+                if section_item.child(row).data(Qt.ItemDataRole.UserRole) == path:
+                    section_item.removeRow(row)
+
+    def _new_tree_model(self):
+        """Create an empty tree model that takes over the favorites and history sections"""
+        new_model = TrackTreeModel()
+        new_model.setHorizontalHeaderLabels([""])
+        for section_item in (self.favorites_item, self.history_item):
+            old_model = section_item.model()
+            if old_model is not None:
+                old_model.takeRow(section_item.row())
+            new_model.appendRow(section_item)
+        return new_model
+
+    def _clear_tree_rows(self):
+        """Remove all drive and playlist rows, keeping favorites and history"""
+        for i in reversed(range(self.tree_model.rowCount())):
+            item = self.tree_model.item(i)
+            if not item or not item.data(SECTION_ROLE):
+                self.tree_model.removeRow(i)
+
+    def dragEnterEvent(self, event):
+        """Handle drag enter event"""
+        if event.source() == self.tree_view:
+            event.acceptProposedAction()
+
+    def dropEvent(self, event):
+        """Handle drop event"""
+        if event.source() == self.tree_view:
+            # Get the source and target items
+            source_index = self.tree_view.currentIndex()
+            target_index = self.tree_view.indexAt(event.pos())
+
+            if not source_index.isValid() or not target_index.isValid():
+                return
+
+            source_item = self._item_from_view_index(source_index)
+            target_item = self._item_from_view_index(target_index)
+
+            # A smart playlist is a saved query, its order comes from the library
+            if self._in_smart_playlist(source_item):
+                return
+
+            # Only allow moving items within the same playlist
+            if source_item.parent() and target_item.parent() and source_item.parent() == target_item.parent():
+                # Get the playlist name
+                playlist_name = source_item.parent().text()
+
+                # Get the file paths
+                source_path = source_item.data(Qt.ItemDataRole.UserRole)
+                target_path = target_item.data(Qt.ItemDataRole.UserRole)
+
+                if source_path and target_path:
+                    # Update the filtered files list
+                    source_idx = self.filtered_files.index(source_path)
+                    target_idx = self.filtered_files.index(target_path)
+
+                    # Move the item
+                    self.filtered_files.insert(target_idx, self.filtered_files.pop(source_idx))
+                    self.play_queue.load(self.filtered_files, self.current_track)
+
+                    # Update the tree view
+                    source_row = source_item.row()
+                    target_row = target_item.row()
+
+                    # Move the item in the tree
+                    parent = source_item.parent()
+                    if isinstance(parent, TrackListItem):
+                        parent.move_track_row(source_row, target_row)
+                    else:
+                        parent.insertRow(target_row, parent.takeRow(source_row))
+
+                    # Save the updated playlist, the order of a folder is only changed in the view
+                    if not isinstance(parent, FolderItem):
+                        self.save_playlist(playlist_name)
+
+                    # Update status
+                    self.statusBar.showMessage(f"Nummer verplaatst in {playlist_name}")
+
+                    # Update playlist info
+                    self.update_playlist_info()
+
+    def _in_smart_playlist(self, item):
+        """True (with a message) for a track row of the shown smart playlist, saving it would replace the query by a list"""
+        parent = item.parent() if item is not None else None
+        if self.current_smart_playlist is None or parent is None or parent.parent() is not None or parent.data(SECTION_ROLE):
+            return False
+        self.statusBar.showMessage(f"'{parent.text()}' is een slimme lijst: nummers volgen de zoekvraag en "
+                                   f"kunnen niet verplaatst of verwijderd worden")
+        return True
+
+    def save_playlist(self, playlist_name):
+        """Save the current playlist to file"""
+        try:
+            playlist_path = os.path.join(self.playlist_dir, playlist_name)
+            with open(playlist_path, 'w') as f:
+                json.dump(self.filtered_files, f)
+            self.statusBar.showMessage(f"Playlist '{playlist_name}' opgeslagen")
+        except Exception as e:
+            self.statusBar.showMessage(f"Fout bij opslaan playlist: {str(e)}")
+
+    def update_playlist_info(self):
+        """Update the playlist information in the status bar"""
+        if self.current_track and self.filtered_files:
+            play_queue = self._play_queue_at_current()
+            number = play_queue.number()
+            # A track queued by hand or played from elsewhere has no number in the list
+            self.playlist_info_label.setText(f"Track {number or '-'} van {len(play_queue)}")
+
+            # Update next track info
+            if not play_queue.at_end():
+                next_track = play_queue.peek_next()
+                metadata = self.get_metadata(next_track)
+                self.next_track_label.setText(f"Volgende: {metadata['artist']} - {metadata['title']}")
+            else:
+                self.next_track_label.setText("Volgende: Einde afspeellijst")
+        else:
+            self.playlist_info_label.setText("")
+            self.next_track_label.setText("")
+
+    def cleanup_saved_files(self):
+        """Clean up saved_files.json to remove references to non-existent drives and files"""
+        try:
+            if not os.path.exists('saved_files.json'):
+                return
+            
+            with open('saved_files.json', 'r') as f:
+                loaded_saved_files = json.load(f)
+            
+            # Filter out non-existent drives and files
+            cleaned_saved_files = {}
+            for drive, files in loaded_saved_files.items():
+                try:
+                    if os.path.exists(drive):
+                        # Only keep files that still exist
+                        valid_files = [f for f in files if os.path.exists(f)]
+                        if valid_files:
+                            cleaned_saved_files[drive] = valid_files
+                        else:
+                            print(f"Drive {drive} exists but no valid files found, removing from saved files")
+                    else:
+                        print(f"Drive {drive} not found, removing from saved files")
+                except Exception as e:
+                    print(f"Error validating drive {drive}: {str(e)}")
+                    continue
+            
+            # Save cleaned version back to file
+            with open('saved_files.json', 'w') as f:
+                json.dump(cleaned_saved_files, f)
+            
+            print(f"Cleaned saved_files.json: {len(loaded_saved_files)} drives -> {len(cleaned_saved_files)} drives")
+            
+        except Exception as e:
+            print(f"Error cleaning up saved_files.json: {str(e)}")
+
+    def check_path_exists_with_timeout(self, path, timeout=1.0):
+        """Check if a path exists with a timeout"""
+        
+        path_exists = [False]
+        path_error = [None]
+        
+        def check_path():
+            try:
+                path_exists[0] = os.path.exists(path)
+            except Exception as e:
+                path_error[0] = e
+        
+        # Start path check in separate thread
+        thread = threading.Thread(target=check_path)
+        thread.daemon = True
+        thread.start()
+        
+        # Wait for the specified timeout
+        thread.join(timeout=timeout)
+        
+        if thread.is_alive():
+            print(f"Timeout checking path: {path}")
+            return False
+        
+        if path_error[0]:
+            print(f"Error checking path {path}: {str(path_error[0])}")
+            return False
+        
+        return path_exists[0]
+
+    def manual_cleanup(self):
+        """Manually clean up saved files with user confirmation and progress"""
+        try:
+            # Check if saved_files.json exists
+            if not os.path.exists('saved_files.json'):
+                QMessageBox.information(self, "Cleanup", "No saved files to clean up.")
+                return
+            
+            # Show confirmation dialog
+            reply = QMessageBox.question(
+                self,
+                "Cleanup Confirmation",
+                "This will remove references to non-existent drives and files.\n"
+                "This process may take some time if you have network drives.\n\n"
+                "Do you want to continue?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.No
+            )
+            
+            if reply == QMessageBox.StandardButton.No:
+                return
+            
+            # Load saved files
+            with open('saved_files.json', 'r') as f:
+                loaded_saved_files = json.load(f)
+            
+            # Create progress dialog
+            progress = QProgressDialog("Cleaning up saved files...", "Cancel", 0, len(loaded_saved_files), self)
+            progress.setWindowModality(Qt.WindowModality.WindowModal)
+            progress.setWindowTitle("Cleanup Progress")
+            progress.setAutoClose(True)
+            
+            # Filter out non-existent drives and files
+            cleaned_saved_files = {}
+            processed_drives = 0
+            
+            for drive, files in loaded_saved_files.items():
+                if progress.wasCanceled():
+                    break
+                
+                try:
+                    progress.setLabelText(f"Checking drive {drive}...")
+                    progress.setValue(processed_drives)
+                    QApplication.processEvents()
+                    
+                    if os.path.exists(drive):
+                        # Check files with progress updates
+                        valid_files = []
+                        for i, file in enumerate(files):
+                            if progress.wasCanceled():
+                                break
+                            
+                            # Update progress every 10 files
+                            if i % 10 == 0:
+                                progress.setLabelText(f"Checking drive {drive}... ({i}/{len(files)} files)")
+                                QApplication.processEvents()
+                            
+                            if os.path.exists(file):
+                                valid_files.append(file)
+                        
+                        if valid_files:
+                            cleaned_saved_files[drive] = valid_files
+                            print(f"Drive {drive}: {len(valid_files)} valid files kept")
+                        else:
+                            print(f"Drive {drive}: no valid files found, removing")
+                    else:
+                        print(f"Drive {drive}: not found, removing")
+                        
+                except Exception as e:
+                    print(f"Error processing drive {drive}: {str(e)}")
+                    continue
+                
+                processed_drives += 1
+            
+            progress.setValue(len(loaded_saved_files))
+            
+            if not progress.wasCanceled():
+                # Save cleaned version back to file
+                with open('saved_files.json', 'w') as f:
+                    json.dump(cleaned_saved_files, f)
+                
+                # Show results
+                removed_drives = len(loaded_saved_files) - len(cleaned_saved_files)
+                total_files_before = sum(len(files) for files in loaded_saved_files.values())
+                total_files_after = sum(len(files) for files in cleaned_saved_files.values())
+                
+                QMessageBox.information(
+                    self,
+                    "Cleanup Complete",
+                    f"Cleanup completed successfully!\n\n"
+                    f"Drives removed: {removed_drives}\n"
+                    f"Files removed: {total_files_before - total_files_after}\n"
+                    f"Remaining drives: {len(cleaned_saved_files)}\n"
+                    f"Remaining files: {total_files_after}"
+                )
+                
+                # Refresh the drive list
+                self.refresh_drives()
+            else:
+                QMessageBox.information(self, "Cleanup Cancelled", "Cleanup was cancelled by user.")
+            
+        except Exception as e:
+            QMessageBox.critical(self, "Cleanup Error", f"Error during cleanup: {str(e)}")
+            print(f"Error in manual_cleanup: {str(e)}")
+
+    def switch_language(self):
+        """Switch to the next available language"""
+        available_languages = get_available_languages()
+        current_index = available_languages.index(self.current_language)
+        next_index = (current_index + 1) % len(available_languages)
+        new_language = available_languages[next_index]
+        
+        self.current_language = new_language
+        
+        # Update window title
+        self.setWindowTitle(get_text('window_title', self.current_language))
+        
+        # Update all other UI elements (including help button)
+        self.update_ui_language()
+        
+        # Save language preference
+        self.save_config()
+        
+        # Update language status
+        self.update_language_status()
+
+    def update_ui_language(self):
+        """Update all UI elements to use the current language"""
+        try:
+            # Update window title
+            self.setWindowTitle(get_text('window_title', self.current_language))
+            
+            # Update language button (always use globe emoji)
+            self.language_button.setText("🌐")
+            self.language_button.setToolTip(get_text('language_tooltip', self.current_language))
+            
+            # Update help button
+            if hasattr(self, 'help_button'):
+                self.help_button.setText(get_text('help_button', self.current_language))
+            
+            # Update basic controls directly
+            self.drive_combo.setPlaceholderText(get_text('select_drive', self.current_language))
+            self.refresh_button.setText(get_text('refresh_drives', self.current_language))
+            self.read_button.setText(get_text('read_files', self.current_language))
+            self.toggle_view_button.setText(get_text('toggle_view', self.current_language))
+            self.folder_view_button.setText(
+                get_text('list_view' if self.show_folders else 'folder_view', self.current_language))
+            self.scan_button.setText(get_text('scan_drive', self.current_language))
+            self.cleanup_button.setText(get_text('cleanup_files', self.current_language))
+            
+            # Update lyrics directory controls
+            self.lyrics_dir_label.setText(get_text('lyrics_dir_label', self.current_language))
+            self.lyrics_dir_button.setText(get_text('change_lyrics_dir', self.current_language))
+            
+            # Update lyrics panel
+            self.lyrics_title.setText(get_text('lyrics_title', self.current_language))
+            self.edit_button.setText(get_text('edit_lyrics_button', self.current_language))
+            self.srt_button.setText(get_text('show_karaoke_button', self.current_language))
+            
+            # Update tooltips
+            self.toggle_view_button.setToolTip(get_text('toggle_view_tooltip', self.current_language))
+            self.folder_view_button.setToolTip(get_text('folder_view_tooltip', self.current_language))
+            self.scan_button.setToolTip(get_text('scan_button_tooltip', self.current_language))
+            self.read_button.setToolTip(get_text('read_button_tooltip', self.current_language))
+            self.refresh_button.setToolTip(get_text('refresh_button_tooltip', self.current_language))
+            
+            # Update playlist controls
+            self.playlist_combo.setPlaceholderText(get_text('select_playlist', self.current_language))
+            
+            # Update filter placeholders
+            self.positive_filter.setPlaceholderText(get_text('positive_filter', self.current_language))
+            self.positive_filter.setToolTip(get_text('filter_query_tooltip', self.current_language))
+            self.negative_filter.setPlaceholderText(get_text('negative_filter', self.current_language))
+            
+            # Update append checkbox
+            self.append_checkbox.setText(get_text('append_checkbox', self.current_language))
+            self.crossfade_label.setText(get_text('crossfade_label', self.current_language))
+            self.crossfade_spinbox.setToolTip(get_text('crossfade_tooltip', self.current_language))
+            self.fuzzy_checkbox.setText(get_text('fuzzy_checkbox', self.current_language))
+            self.filter_undo_button.setText(get_text('filter_undo', self.current_language))
+            self.save_smart_button.setText(get_text('save_smart_playlist', self.current_language))
+            self.save_smart_button.setToolTip(get_text('save_smart_playlist_tooltip', self.current_language))
+            self.filter_history_combo.setToolTip(get_text('filter_history_tooltip', self.current_language))
+            if self.filter_history:
+                self.filter_history[0].label = get_text('filter_history_all', self.current_language)
+                self._update_filter_history_combo()
+            
+            # Update playback controls
+            self.play_button.setText(get_text('play_button', self.current_language))
+            self.stop_button.setText(get_text('stop_button', self.current_language))
+            self.prev_button.setText(get_text('prev_button', self.current_language))
+            self.next_button.setText(get_text('next_button', self.current_language))
+            self.favorite_button.setText(get_text('favorite_button', self.current_language))
+            self.shuffle_button.setText(get_text('shuffle_button', self.current_language))
+            self.repeat_button.setText(get_text(f'repeat_{self.play_queue.repeat}', self.current_language))
+            
+            # Update tooltips
+            self.play_button.setToolTip(get_text('play_tooltip', self.current_language))
+            self.stop_button.setToolTip(get_text('stop_tooltip', self.current_language))
+            self.prev_button.setToolTip(get_text('prev_tooltip', self.current_language))
+            self.next_button.setToolTip(get_text('next_tooltip', self.current_language))
+            self.favorite_button.setToolTip(get_text('favorite_tooltip', self.current_language))
+            self.shuffle_button.setToolTip(get_text('shuffle_tooltip', self.current_language))
+            self.repeat_button.setToolTip(get_text('repeat_tooltip', self.current_language))
+            self.progress_bar.setToolTip(get_text('progress_tooltip', self.current_language))
+            for index in range(self.mixer_profile_combo.count()):
+                self.mixer_profile_combo.setItemText(
+                    index, get_text(f'mixer_{self.mixer_profile_combo.itemData(index)}', self.current_language))
+            self.mixer_profile_combo.setToolTip(get_text('mixer_profile_tooltip', self.current_language))
+            self.calibrate_button.setText(get_text('calibrate_button', self.current_language))
+            self.calibrate_button.setToolTip(get_text('calibrate_tooltip', self.current_language))
+            
+            # Update file count label
+            current_count = self.file_count_label.text().split(': ')[-1] if ': ' in self.file_count_label.text() else '0'
+            self.file_count_label.setText(get_text('files_label', self.current_language).replace('0', current_count))
+            
+            # Update status bar
+            try:
+                language_text = get_text('current_language', self.current_language, 
+                                       language_name=get_language_name(self.current_language))
+                # Fallback als placeholder niet vervangen is
+                if '{language_name}' in language_text:
+                    language_name = get_language_name(self.current_language)
+                    language_text = language_text.replace('{language_name}', language_name)
+                self.statusBar.showMessage(language_text)
+            except Exception as e:
+                print(f"Error formatting current language: {e}")
+                # Simpele fallback
+                language_name = get_language_name(self.current_language)
+                self.statusBar.showMessage(f"Current language: {language_name}")
+            
+            # Update tree view favorites and history section names
+            self.update_favorites_display()
+            self.update_history_display()
+            
+        except Exception as e:
+            print(f"Error updating UI language: {str(e)}")
+            # Continue with basic updates even if some fail
+            pass
+
+    def restore_language_status(self):
+        """Restore the language status text if no other important status is shown"""
+        if self.language_status_text:
+            current_status = self.statusBar.currentMessage()
+            # Only restore if current status is empty or contains language-related text
+            if not current_status or any(keyword in current_status.lower() for keyword in ['language', 'taal', 'sprache', 'langue']):
+                self.statusBar.showMessage(self.language_status_text)
+
+    def _on_status_message_changed(self, message):
+        if not message:
+            self.restore_language_status()
+    
+    def update_language_status(self):
+        """Update the language status text, it comes back when the status bar is empty"""
+        # Eenvoudige mapping van taal codes naar namen
+        language_names = {
+            'nl': 'Nederlands',
+            'en': 'English', 
+            'de': 'Deutsch',
+            'fr': 'Français'
+        }
+        
+        # Haal de taalnaam op uit de mapping
+        language_name = language_names.get(self.current_language, self.current_language)
+        
+        # Maak de status tekst
+        status_texts = {
+            'nl': f'Huidige taal: {language_name}',
+            'en': f'Current language: {language_name}',
+            'de': f'Aktuelle Sprache: {language_name}',
+            'fr': f'Langue actuelle: {language_name}'
+        }
+        
+        # Kies de juiste status tekst voor de huidige taal
+        status_text = status_texts.get(self.current_language, status_texts['en'])
+        
+        # Update de status
+        self.language_status_text = status_text
+        self.statusBar.showMessage(status_text)
+
+
+class ScanningDialog(QDialog):
+    def __init__(self, parent=None, drive=None, language='nl'):
+        super().__init__(parent)
+        self.language = language
+        self.setWindowTitle(get_text('scanning_title', self.language))
+        self.setModal(True)
+
+        # Create layout
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)  # Add some padding
+
+        # Create and style the label
+        label = QLabel(get_text('scanning_message', self.language, drive=drive))
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(label)
+
+        # Remove window frame and set window flags
+        self.setWindowFlags(
+            Qt.WindowType.FramelessWindowHint |  # No window frame
+            Qt.WindowType.Tool |  # Tool window (stays on top)
+            Qt.WindowType.WindowStaysOnTopHint  # Always on top
+        )
+
+        # Set background color
+        self.setStyleSheet("""
+            QDialog {
+                background-color: #2b2b2b;
+                border: 2px solid #555555;
+                border-radius: 10px;
+            }
+        """)
+
+        # Size the dialog based on content
+        self.adjustSize()
+
+        # Center the dialog in the parent window
+        if parent:
+            parent_geometry = parent.geometry()
+            dialog_geometry = self.geometry()
+            x = parent_geometry.x() + (parent_geometry.width() - dialog_geometry.width()) // 2
+            y = parent_geometry.y() + (parent_geometry.height() - dialog_geometry.height()) // 2
+            self.move(x, y)
+
+    def closeEvent(self, event):
+        event.accept()
+
+    def showEvent(self, event):
+        """Ensure dialog stays centered when shown"""
+        super().showEvent(event)
+        if self.parent():
+            parent_geometry = self.parent().geometry()
+            dialog_geometry = self.geometry()
+            x = parent_geometry.x() + (parent_geometry.width() - dialog_geometry.width()) // 2
+            y = parent_geometry.y() + (parent_geometry.height() - dialog_geometry.height()) // 2
+            self.move(x, y)
+
+
+if __name__ == "__main__":
+    try:
+        app = QApplication(sys.argv)
+        # MUSIC_PLAYER_AUDIO=null:50 plays silently on a clock 50 times faster, for tests without a sound card
+        player = MusicPlayer(create_backend(os.environ.get('MUSIC_PLAYER_AUDIO', 'pygame')))
+        player.show()
+        sys.exit(app.exec())
+    except Exception as e:
+        print(f"Error starting application: {str(e)}")
+        # Try to show a simple error dialog if possible
+        try:
+            import tkinter as tk
+            from tkinter import messagebox
+            root = tk.Tk()
+            root.withdraw()  # Hide the main window
+            messagebox.showerror("Startup Error", f"Error starting HAL's Music Player:\n{str(e)}\n\nPlease check that all required files are present.")
+            root.destroy()
+        except:
+            # If tkinter is not available, just print to console
+            print("Failed to show error dialog. Please check the console for error details.")
         sys.exit(1) 
\ No newline at end of file
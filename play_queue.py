@@ -0,0 +1,304 @@
+import random
+from collections import deque
+from typing import Callable, Dict, List, Optional, Sequence
+
+# Repeat modes
+REPEAT_OFF = 'off'
+REPEAT_ALL = 'all'
+REPEAT_ONE = 'one'
+REPEAT_MODES = (REPEAT_OFF, REPEAT_ALL, REPEAT_ONE)
+
+
+class _LiveSlots:
+    """Fenwick tree over the play positions of a list, 1 for a track still in the list, 0 for a removed one.
+
+    Counts the live positions before a position and finds the k-th live position in O(log n).
+    """
+
+    def __init__(self, size: int, flags: Optional[bytearray] = None):
+        self.size = size
+        self.flags = bytearray(b'\x01') * size if flags is None else flags
+        self.tree = [0] * (size + 1)
+        for i in range(1, size + 1):
+            self.tree[i] += self.flags[i - 1]
+            parent = i + (i & -i)
+            if parent <= size:
+                self.tree[parent] += self.tree[i]
+        self.total = sum(self.flags)
+        self.top = 1 << size.bit_length() if size else 0
+
+    def remove(self, position: int):
+        if not self.flags[position]:
+            return
+        self.flags[position] = 0
+        self.total -= 1
+        i = position + 1
+        while i <= self.size:
+            self.tree[i] -= 1
+            i += i & -i
+
+    def before(self, position: int) -> int:
+        """Live positions before position"""
+        count = 0
+        i = position
+        while i > 0:
+            count += self.tree[i]
+            i -= i & -i
+        return count
+
+    def find(self, k: int) -> int:
+        """The k-th (from 0) live position"""
+        position = 0
+        step = self.top
+        while step:
+            if position + step <= self.size and self.tree[position + step] <= k:
+                position += step
+                k -= self.tree[position]
+            step >>= 1
+        return position
+
+
+def spread_order(slots: List[int], artist_of: Callable[[int], str], rng: random.Random) -> List[int]:
+    """A random order of slots with the tracks of each artist spread evenly over it.
+
+    The tracks of an artist get evenly spaced places from a random start,
+    with a little jitter, and all places are sorted: an artist with a tenth
+    of the tracks comes back about every tenth track, never in a row while
+    others are left. O(n log n).
+    """
+    groups: Dict[str, List[int]] = {}
+    for slot in slots:
+        groups.setdefault(artist_of(slot), []).append(slot)
+    placed = []
+    for group in groups.values():
+        rng.shuffle(group)
+        step = 1.0 / len(group)
+        start = rng.random() * step
+        for i, slot in enumerate(group):
+            placed.append((start + (i + rng.uniform(-0.1, 0.1)) * step, slot))
+    placed.sort()
+    return [slot for place, slot in placed]
+
+
+class PlayQueue:
+    """The order tracks play in: the play list with a cursor, and tracks queued by hand.
+
+    The list is copied into slots once. The play order is the slots in list
+    order, or a shuffled permutation of them drawn once, so every step is
+    O(1) lookups and no track comes back before all have played. Removing a
+    track only marks its play position empty in a Fenwick tree of live
+    positions, so the number of a track (track 3 of 10) and the track at a
+    number are found in O(log n) and positions never shift. A path -> slots
+    index finds a track without a scan, also when it is in the list more
+    than once. Tracks queued with play_next or enqueue play first, then the
+    list continues after the cursor.
+    """
+
+    def __init__(self):
+        self.files = None  # The list the slots were copied from, see sync
+        self.source_length = 0
+        self.slots: List[str] = []
+        self.positions: Dict[str, List[int]] = {}  # Path -> its live slots, sorted
+        self.order: Optional[List[int]] = None  # Slot at each play position, None: list order
+        self.rank: Optional[List[int]] = None  # Play position of each slot
+        self.live = _LiveSlots(0)
+        self.cursor = -1  # Slot of the list track playing (or played last), -1 before the first
+        self.off_list = True  # The playing track is not the cursor slot: queued by hand or from elsewhere
+        self.up_next = deque()
+        self.current = None  # The track the cursor was last moved to
+        self.repeat = REPEAT_ALL
+        self.shuffled = False
+        self.random = random.Random()
+        self.artist_of: Optional[Callable[[str], str]] = None  # Spreads artists when shuffled
+
+    def sync(self, files: Sequence[str], current: Optional[str] = None):
+        """Follow the play list, copied again only when it is another list or changed length"""
+        if files is not self.files or len(files) != self.source_length:
+            self.load(files, current)
+
+    def load(self, files: Sequence[str], current: Optional[str] = None):
+        """Copy a play list, the cursor goes to current (its first slot) if it is in there"""
+        self.files = files
+        self.source_length = len(files)
+        self.slots = list(files)
+        self.positions = {}
+        for slot, path in enumerate(self.slots):
+            self.positions.setdefault(path, []).append(slot)
+        self.current = current
+        if current in self.positions:
+            self.cursor = self.positions[current][0]
+            self.off_list = False
+        else:
+            self.cursor = -1
+            self.off_list = True
+        self.order = self.rank = None
+        self.live = _LiveSlots(len(self.slots))
+        if self.shuffled:
+            self._draw_order()
+
+    def shuffle(self, seed=None, artist_of: Optional[Callable[[str], str]] = None):
+        """Play in a random order from now on, the playing track stays where it is.
+
+        The same seed gives the same orders for the same list. artist_of
+        (path -> artist) spreads the tracks of each artist over the order.
+        """
+        self.shuffled = True
+        self.random = random.Random(seed)
+        self.artist_of = artist_of
+        self._draw_order()
+
+    def unshuffle(self):
+        """Play in list order again, on from the playing track"""
+        if not self.shuffled:
+            return
+        flags = self._slot_flags()
+        self.shuffled = False
+        self.order = self.rank = None
+        self.live = _LiveSlots(len(self.slots), flags)
+
+    def _slot_flags(self) -> bytearray:
+        """Live flags by slot"""
+        if self.order is None:
+            return bytearray(self.live.flags)
+        flags = bytearray(len(self.slots))
+        for position, slot in enumerate(self.order):
+            flags[slot] = self.live.flags[position]
+        return flags
+
+    def _draw_order(self):
+        """A new permutation, starting at the cursor track so the others all follow it"""
+        flags = self._slot_flags()
+        slots = list(range(len(self.slots)))
+        if self.artist_of is not None:
+            order = spread_order(slots, lambda slot: self.artist_of(self.slots[slot]), self.random)
+        else:
+            self.random.shuffle(slots)
+            order = slots
+        if 0 <= self.cursor < len(order):
+            order.remove(self.cursor)
+            order.insert(0, self.cursor)
+        self.order = order
+        self.rank = [0] * len(order)
+        for position, slot in enumerate(order):
+            self.rank[slot] = position
+        self.live = _LiveSlots(len(order), bytearray(flags[slot] for slot in order))
+
+    def _position(self, slot: int) -> int:
+        return slot if self.rank is None or slot < 0 else self.rank[slot]
+
+    def _slot(self, position: int) -> int:
+        return position if self.order is None else self.order[position]
+
+    def __len__(self):
+        """Tracks in the list, without the ones queued by hand"""
+        return self.live.total
+
+    def __contains__(self, path):
+        return bool(self.positions.get(path))
+
+    def _is_live(self, slot: int) -> bool:
+        return 0 <= slot < len(self.slots) and bool(self.live.flags[self._position(slot)])
+
+    def number(self) -> Optional[int]:
+        """Number (from 1) of the playing track in the play order, None if it is not a list track"""
+        if self.off_list or not self._is_live(self.cursor):
+            return None
+        return self.live.before(self._position(self.cursor)) + 1
+
+    def _next_slot(self, wrap: bool = True) -> Optional[int]:
+        """The live slot after the cursor, the first one after the last if wrap"""
+        if not self.live.total:
+            return None
+        k = self.live.before(self._position(self.cursor) + 1) if self.cursor >= 0 else 0
+        if k >= self.live.total:
+            if not wrap:
+                return None
+            k = 0
+        return self._slot(self.live.find(k))
+
+    def _previous_slot(self, wrap: bool = True) -> Optional[int]:
+        """The live slot before the cursor, the last one before the first if wrap"""
+        if not self.live.total:
+            return None
+        k = self.live.before(self._position(self.cursor)) - 1 if self.cursor >= 0 else -1
+        if k < 0:
+            if not wrap:
+                return None
+            k = self.live.total - 1
+        return self._slot(self.live.find(k))
+
+    def peek_next(self, skip: bool = False) -> Optional[str]:
+        """The track that plays next, None at the end without repeat.
+
+        Repeat one plays the playing track again, unless skip (the user
+        asked for the next track).
+        """
+        if self.up_next:
+            return self.up_next[0]
+        if self.repeat == REPEAT_ONE and not skip and self.current is not None:
+            return self.current
+        slot = self._next_slot(wrap=self.repeat != REPEAT_OFF)
+        return None if slot is None else self.slots[slot]
+
+    def peek_previous(self) -> Optional[str]:
+        """The track before the playing one: the cursor track after a track from elsewhere"""
+        if self.off_list and self._is_live(self.cursor):
+            return self.slots[self.cursor]
+        slot = self._previous_slot(wrap=self.repeat != REPEAT_OFF)
+        return None if slot is None else self.slots[slot]
+
+    def at_end(self) -> bool:
+        """True if the list is done, or starts over, after the playing track"""
+        if self.up_next or self.repeat == REPEAT_ONE:
+            return False
+        slot = self._next_slot()
+        return slot is None or self._position(slot) <= self._position(self.cursor)
+
+    def move_to(self, path: str, backwards: bool = False):
+        """The track path starts playing: take it off the queue or move the cursor to its slot.
+
+        The peeked next slot (previous slot going backwards) wins, so a track
+        that is in the list twice plays its copies in turn. Otherwise the
+        cursor goes to its first slot after the cursor, or to its first slot.
+        Shuffled, starting over draws a new order.
+        """
+        self.current = path
+        if self.up_next and self.up_next[0] == path:
+            self.up_next.popleft()
+            self.off_list = True
+            return
+        nearby = (self._next_slot(), self._previous_slot())
+        for slot in reversed(nearby) if backwards else nearby:
+            if slot is not None and self.slots[slot] == path:
+                wrapped = not backwards and self._position(slot) <= self._position(self.cursor)
+                self.cursor, self.off_list = slot, False
+                if wrapped and self.shuffled and self.live.total > 1:
+                    self._draw_order()
+                return
+        slots = self.positions.get(path)
+        if not slots:
+            self.off_list = True
+            return
+        here = self._position(self.cursor)
+        after = [slot for slot in slots if self._position(slot) >= here]
+        self.cursor = min(after or slots, key=self._position)
+        self.off_list = False
+
+    def play_next(self, path: str):
+        """Play path right after the playing track"""
+        self.up_next.appendleft(path)
+
+    def enqueue(self, path: str):
+        """Play path after the tracks queued before it, before the list continues"""
+        self.up_next.append(path)
+
+    def remove(self, path: str) -> bool:
+        """Remove the first copy of path from the list, like list.remove on the play list"""
+        slots = self.positions.get(path)
+        if not slots:
+            return False
+        self.live.remove(self._position(slots.pop(0)))
+        if not slots:
+            del self.positions[path]
+        self.source_length -= 1
+        return True
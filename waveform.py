@@ -0,0 +1,79 @@
+import hashlib
+import os
+from typing import Optional
+
+import numpy as np
+
+# Buckets of an overview, a few per pixel of a wide progress bar
+BUCKETS = 2000
+
+
+def peaks(samples: np.ndarray, buckets: int = BUCKETS) -> Optional[np.ndarray]:
+    """Lowest and highest sample of each bucket, shape (buckets, 2) as floats in -1..1.
+
+    samples has shape (frames, channels), integer or float. Buckets are
+    reduced with ufunc.reduceat over the raw samples, so a track is never
+    converted or copied as a whole. Fewer frames than buckets give one
+    bucket per frame, no frames give None.
+    """
+    if samples.ndim == 1:
+        samples = samples[:, None]
+    frames = len(samples)
+    if not frames:
+        return None
+    edges = np.linspace(0, frames, min(buckets, frames) + 1).astype(np.int64)[:-1]
+    lows = np.minimum.reduceat(samples, edges, axis=0).min(axis=1)
+    highs = np.maximum.reduceat(samples, edges, axis=0).max(axis=1)
+    result = np.stack((lows, highs), axis=1).astype(np.float32)
+    if np.issubdtype(samples.dtype, np.integer):
+        result /= float(np.iinfo(samples.dtype).max) + 1
+    return np.clip(result, -1.0, 1.0)
+
+
+def resample(overview: np.ndarray, columns: int) -> np.ndarray:
+    """An overview brought to columns buckets (pixels), keeping the extremes of the buckets merged"""
+    if columns <= 0 or not len(overview):
+        return overview[:0]
+    if columns >= len(overview):
+        return overview[np.linspace(0, len(overview) - 1, columns).astype(np.int64)]
+    edges = np.linspace(0, len(overview), columns + 1).astype(np.int64)[:-1]
+    return np.stack((np.minimum.reduceat(overview[:, 0], edges),
+                     np.maximum.reduceat(overview[:, 1], edges)), axis=1)
+
+
+class WaveformCache:
+    """Overviews on disk, one small file per track, valid while the track keeps its mtime.
+
+    Files are named after a hash of the track path and hold the mtime the
+    overview was made at, so a changed track is computed and stored again
+    over its old file. Peaks are kept as int8, 4 KB per track.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _file(self, path: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(path.encode('utf-8')).hexdigest() + '.npz')
+
+    def get(self, path: str) -> Optional[np.ndarray]:
+        """The overview of path, None if there is none for its current mtime"""
+        try:
+            mtime = os.path.getmtime(path)
+            with np.load(self._file(path)) as stored:
+                if float(stored['mtime']) != mtime:
+                    return None
+                return stored['peaks'].astype(np.float32) / 127
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def put(self, path: str, overview: np.ndarray):
+        try:
+            mtime = os.path.getmtime(path)
+            os.makedirs(self.directory, exist_ok=True)
+            quantized = np.round(np.clip(overview, -1.0, 1.0) * 127).astype(np.int8)
+            temporary = self._file(path) + '.tmp'
+            with open(temporary, 'wb') as f:
+                np.savez(f, mtime=np.float64(mtime), peaks=quantized)
+            os.replace(temporary, self._file(path))
+        except OSError as e:
+            print(f"Error caching waveform: {str(e)}")